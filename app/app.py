@@ -4,8 +4,6 @@ Film öneri sistemi için Streamlit uygulaması.
 import streamlit as st
 import pandas as pd
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import sys
 import os
 import logging
@@ -15,48 +13,20 @@ from typing import Tuple
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.data_loader import DataLoader
-from src.preprocessor import Preprocessor
+from src.feature_engineer import FeatureEngineer
 from src.recommender import Recommender
 
 # Loglama ayarları
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def load_data() -> Tuple[pd.DataFrame, pd.DataFrame]:
+def load_processed_data() -> pd.DataFrame:
     """
-    Veri setlerini yükler.
+    Ön işlenmiş veri setini yükler.
     
-    Returns
-    -------
-    Tuple[pd.DataFrame, pd.DataFrame]
-        Film ve kredi veri setleri
-        
-    Raises
-    ------
-    Exception
-        Veri yükleme işlemi başarısız olduğunda
-    """
-    try:
-        data_loader = DataLoader()
-        movies_df, credits_df = data_loader.load_movie_data()
-        logger.info("Veri setleri başarıyla yüklendi.")
-        return movies_df, credits_df
-        
-    except Exception as e:
-        logger.error(f"Veri yükleme hatası: {str(e)}")
-        raise
-
-def preprocess_data(movies_df: pd.DataFrame, credits_df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Veri setlerini ön işler.
+    Kaynak veri setleri değişmediği sürece ön işlenmiş veri seti diskteki
+    artefakttan okunur; böylece her etkileşimde CSV ayrıştırma tekrarlanmaz.
     
-    Parameters
-    ----------
-    movies_df : pd.DataFrame
-        Film veri seti
-    credits_df : pd.DataFrame
-        Kredi veri seti
-        
     Returns
     -------
     pd.DataFrame
@@ -65,20 +35,16 @@ def preprocess_data(movies_df: pd.DataFrame, credits_df: pd.DataFrame) -> pd.Dat
     Raises
     ------
     Exception
-        Veri ön işleme işlemi başarısız olduğunda
+        Veri yükleme işlemi başarısız olduğunda
     """
     try:
         data_loader = DataLoader()
-        merged_df = data_loader.merge_datasets(movies_df, credits_df)
-        
-        preprocessor = Preprocessor()
-        processed_df = preprocessor.preprocess_data(merged_df)
-        
-        logger.info("Veri setleri başarıyla ön işlendi.")
+        processed_df = data_loader.load_preprocessed_data()
+        logger.info("Veri setleri başarıyla yüklendi.")
         return processed_df
         
     except Exception as e:
-        logger.error(f"Veri ön işleme hatası: {str(e)}")
+        logger.error(f"Veri yükleme hatası: {str(e)}")
         raise
 
 def main():
@@ -101,23 +67,23 @@ def main():
         """)
     
     try:
-        # Veri setlerini yükle
-        movies_df, credits_df = load_data()
-        
-        # Veri setlerini ön işle
-        processed_df = preprocess_data(movies_df, credits_df)
-        
-        # TF-IDF vektörlerini oluştur
-        tfidf = TfidfVectorizer(stop_words='english')
-        tfidf_matrix = tfidf.fit_transform(processed_df['overview'].fillna(''))
-        similarity_matrix = cosine_similarity(tfidf_matrix, tfidf_matrix)
+        # Güncel bir öneri tablosu varsa öneriler tablodan okunur; veri seti
+        # ve özellik matrisleri hiç yüklenmez
+        recommendation_table = DataLoader().load_recommendation_table()
+        recommender = Recommender(recommendation_table)
         
-        # Öneri sistemini başlat
-        recommender = Recommender()
+        if recommendation_table is not None:
+            movie_list = recommendation_table.titles.tolist()
+        else:
+            # Ön işlenmiş veri setini yükle
+            processed_df = load_processed_data()
+            
+            # TF-IDF vektörleri üzerinden en yakın komşu indeksini oluştur
+            similarity_index = FeatureEngineer().build_tfidf_index(processed_df)
+            movie_list = processed_df['title'].tolist()
 
         # Film seçimi
         st.markdown("### 🎯 Film Seçimi")
-        movie_list = processed_df['title'].tolist()
         selected_movie = st.selectbox(
             "Beğendiğiniz bir filmi seçin:",
             movie_list,
@@ -127,12 +93,15 @@ def main():
 
         if selected_movie:
             with st.spinner("Film önerileri hazırlanıyor..."):
-                recommendations = recommender.get_content_based_recommendations(
-                    selected_movie,
-                    processed_df,
-                    similarity_matrix,
-                    top_n=5
-                )
+                if recommendation_table is not None:
+                    recommendations = recommender.get_precomputed_recommendations(selected_movie, top_n=5)
+                else:
+                    recommendations = recommender.get_content_based_recommendations(
+                        selected_movie,
+                        processed_df,
+                        similarity_index,
+                        top_n=5
+                    )
                 
                 # Önerileri göster
                 st.markdown(f"### 🎬 '{selected_movie}' için Öneriler")
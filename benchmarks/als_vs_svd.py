@@ -0,0 +1,84 @@
+"""
+ALS ve surprise SVD eğiticilerini eğitim süresi ve test RMSE'si açısından karşılaştıran betik.
+
+Kullanım:
+    python benchmarks/als_vs_svd.py --ratings data/ratings.csv --factors 50 100 --jobs 1 4
+
+Puanlar rastgele eğitim/test kümelerine ayrılır; her iki model de aynı
+eğitim kümesinde eğitilir ve test kümesindeki tahminler, öneri sisteminin
+kullandığı LatentFactorScorer üzerinden hesaplanır.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from surprise import Dataset, Reader, SVD
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.als import AlternatingLeastSquares
+from src.cf_scoring import LatentFactorScorer
+from src.ratings_store import RatingsMatrix
+
+
+def split(ratings: RatingsMatrix, test_size: float, seed: int):
+    """Puanları rastgele eğitim matrisi ve test çiftlerine ayırır."""
+    df = ratings.to_frame()
+    rng = np.random.default_rng(seed)
+    is_test = rng.random(len(df)) < test_size
+    return RatingsMatrix.from_frame(df[~is_test]), df[is_test]
+
+
+def rmse(scorer: LatentFactorScorer, test) -> float:
+    predictions = scorer.predict_pairs(test['userId'].tolist(), test['movieId'].tolist())
+    return float(np.sqrt(np.mean((test['rating'].to_numpy() - predictions) ** 2)))
+
+
+def train_svd(train: RatingsMatrix, n_factors: int, n_epochs: int, seed: int) -> LatentFactorScorer:
+    data = Dataset.load_from_df(train.to_frame(raw_ids=False), Reader(rating_scale=train.rating_scale))
+    model = SVD(n_factors=n_factors, n_epochs=n_epochs, random_state=seed)
+    model.fit(data.build_full_trainset())
+    return LatentFactorScorer.from_surprise(model, train)
+
+
+def train_als(train: RatingsMatrix, n_factors: int, n_iterations: int, regularization: float,
+              n_jobs: int, seed: int) -> LatentFactorScorer:
+    model = AlternatingLeastSquares(
+        n_factors=n_factors, n_iterations=n_iterations, regularization=regularization,
+        n_jobs=n_jobs, random_state=seed
+    )
+    return model.fit(train).to_scorer(train)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--ratings', default=os.path.join('data', 'ratings.csv'))
+    parser.add_argument('--test-size', type=float, default=0.2)
+    parser.add_argument('--factors', type=int, nargs='+', default=[50, 100])
+    parser.add_argument('--iterations', type=int, default=15)
+    parser.add_argument('--svd-epochs', type=int, default=20)
+    parser.add_argument('--regularization', type=float, default=0.1)
+    parser.add_argument('--jobs', type=int, nargs='+', default=[1, os.cpu_count() or 1])
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    train, test = split(RatingsMatrix.from_csv(args.ratings), args.test_size, args.seed)
+    print(f"eğitim: {train.nnz} puan, test: {len(test)} puan")
+    print(f"{'model':<22} {'faktör':>7} {'süre (sn)':>10} {'test RMSE':>10}")
+
+    for n_factors in args.factors:
+        started = time.perf_counter()
+        scorer = train_svd(train, n_factors, args.svd_epochs, args.seed)
+        print(f"{'svd':<22} {n_factors:>7} {time.perf_counter() - started:>10.2f} {rmse(scorer, test):>10.4f}")
+
+        for n_jobs in sorted(set(args.jobs)):
+            started = time.perf_counter()
+            scorer = train_als(train, n_factors, args.iterations, args.regularization, n_jobs, args.seed)
+            label = f"als (n_jobs={n_jobs})"
+            print(f"{label:<22} {n_factors:>7} {time.perf_counter() - started:>10.2f} {rmse(scorer, test):>10.4f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Seri ve paralel ön işleme arasındaki kesişim noktasını ölçen betik.
+
+Kullanım:
+    python benchmarks/preprocessing_crossover.py --sizes 5000 20000 80000 --jobs 2 4
+
+Gerçek veri seti satırları çoğaltılarak istenen boyutlara ulaşılır; her boyut
+için seri ve paralel süreler ile paralel çıktının seri çıktıyla aynı olup
+olmadığı raporlanır.
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data_loader import DataLoader
+from src.preprocessor import Preprocessor
+
+
+def load_merged(data_dir: str = None) -> pd.DataFrame:
+    """Ham film ve kredi verilerini birleştirir."""
+    data_loader = DataLoader(data_dir)
+    movies_df, credits_df = data_loader.load_movie_data()
+    return data_loader.merge_datasets(movies_df, credits_df)
+
+
+def scale(df: pd.DataFrame, n_rows: int) -> pd.DataFrame:
+    """Veri setini satırları tekrarlayarak n_rows satıra çıkarır."""
+    repeats = -(-n_rows // len(df))
+    copies = []
+    for i in range(repeats):
+        copy = df.copy()
+        # Kopyaların film kimlikleri çakışmasın
+        copy['movie_id'] = copy['movie_id'] + i * (df['movie_id'].max() + 1)
+        copies.append(copy)
+    return pd.concat(copies, ignore_index=True).iloc[:n_rows]
+
+
+def time_preprocessing(df: pd.DataFrame, n_jobs: int, repeat: int) -> (float, pd.DataFrame):
+    """En iyi süreyi ve son çıktıyı döndürür."""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        preprocessor = Preprocessor(n_jobs=n_jobs, parallel_min_rows=0)
+        started = time.perf_counter()
+        result = preprocessor.preprocess_data(df.copy())
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--data-dir', default=None)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000, 20000, 50000, 100000])
+    parser.add_argument('--jobs', type=int, nargs='+', default=[2, 4, os.cpu_count() or 1])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    base = load_merged(args.data_dir)
+    jobs = sorted(set(j for j in args.jobs if j > 1))
+    print(f"{'satır':>8} {'seri (sn)':>10} " + ' '.join(f"{f'n_jobs={j}':>12}" for j in jobs))
+
+    crossover = {}
+    for n_rows in args.sizes:
+        df = scale(base, n_rows)
+        serial_time, serial_result = time_preprocessing(df, 1, args.repeat)
+        cells = []
+        for n_jobs in jobs:
+            parallel_time, parallel_result = time_preprocessing(df, n_jobs, args.repeat)
+            pd.testing.assert_frame_equal(serial_result, parallel_result, check_exact=True)
+            if parallel_time < serial_time:
+                crossover.setdefault(n_jobs, n_rows)
+            cells.append(f"{parallel_time:>12.3f}")
+        print(f"{n_rows:>8} {serial_time:>10.3f} " + ' '.join(cells))
+
+    for n_jobs in jobs:
+        point = crossover.get(n_jobs)
+        print(f"n_jobs={n_jobs}: " + (f"paralel yol {point} satırdan itibaren daha hızlı"
+                                       if point else "ölçülen boyutlarda paralel yol daha hızlı değil"))
+
+
+if __name__ == '__main__':
+    main()
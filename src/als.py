@@ -0,0 +1,544 @@
+"""
+Gizli faktör modelini alternatif en küçük kareler (ALS) ile paralel eğiten sınıf.
+"""
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+from scipy import sparse
+
+from .cf_scoring import LatentFactorScorer
+from .ratings_store import RatingsMatrix
+
+# Tek bir iş parçacığı görevinde çözülen satır sayısı
+ALS_BLOCK_ROWS = 512
+
+# Bu sayıya kadar puanı olan satırların normal denklemleri benzer uzunluktaki
+# satırlarla sıfır dolgulu toplu matris çarpımlarıyla kurulur; daha uzun
+# satırlar kendi BLAS çarpımlarıyla kurulur
+ALS_PADDED_MAX_RATINGS = 64
+
+
+class Regularization(NamedTuple):
+    """Kullanıcı ve öğe tarafındaki faktör ve sapma terimlerinin L2 katsayıları."""
+    user_factors: float
+    user_biases: float
+    item_factors: float
+    item_biases: float
+
+    @classmethod
+    def from_surprise(cls, model) -> 'Regularization':
+        """surprise.SVD modelinin reg_pu, reg_bu, reg_qi ve reg_bi katsayıları."""
+        return cls(model.reg_pu, model.reg_bu, model.reg_qi, model.reg_bi)
+
+
+class ALSIteration(NamedTuple):
+    """Bir ALS iterasyonunun özeti."""
+    iteration: int
+    loss: float
+    elapsed: float
+
+
+class AlternatingLeastSquares:
+    """
+    Kullanıcı ve öğe faktörlerini sırayla kapalı formda çözen ALS eğiticisi.
+
+    Açık geri bildirimde (implicit=False) model surprise.SVD ile aynıdır:
+    r̂_ui = mu + b_u + b_i + p_u · q_i. Sapmalar faktör vektörlerine sabit
+    1 sütunu eklenerek aynı en küçük kareler çözümüne katılır.
+
+    Örtük geri bildirimde (implicit=True) puanlar güven ağırlığına
+    (c_ui = 1 + alpha · r_ui) dönüştürülür ve tüm kullanıcı × öğe çiftleri
+    üzerinde tercih (p_ui = 1 puanlanmışsa, aksi halde 0) tahmin edilir.
+
+    Her yarım adımda satırlar bloklara ayrılır ve bloklar bir iş parçacığı
+    havuzunda çözülür; blok içindeki k×k sistemler tek bir toplu
+    np.linalg.solve çağrısıyla çözülür.
+
+    Attributes
+    ----------
+    n_factors : int
+        Gizli faktör sayısı
+    regularization : Union[float, Regularization]
+        L2 düzenlileştirme katsayısı (tüm terimler için tek değer veya
+        terim başına katsayılar)
+    n_iterations : int
+        En fazla iterasyon sayısı
+    implicit : bool
+        Örtük geri bildirim modunun kullanılıp kullanılmayacağı
+    alpha : float
+        Örtük modda güven katsayısı
+    tol : float
+        İterasyonlar arası kayıp iyileşmesi bu değerin altına düşünce durulur
+    n_jobs : int
+        İş parçacığı sayısı
+    random_state : Optional[int]
+        Faktör başlangıç değerleri için tohum
+    rating_scale : Optional[Tuple[float, float]]
+        Tahminlerin kırpıldığı puan aralığı (örtük modda None)
+    history_ : List[ALSIteration]
+        Eğitim sırasında her iterasyonun kaybı ve süresi
+    logger : logging.Logger
+        Loglama için logger nesnesi
+    """
+
+    def __init__(
+        self,
+        n_factors: int = 100,
+        regularization: Union[float, Regularization] = 0.1,
+        n_iterations: int = 15,
+        implicit: bool = False,
+        alpha: float = 40.0,
+        tol: float = 1e-4,
+        n_jobs: Optional[int] = None,
+        block_rows: int = ALS_BLOCK_ROWS,
+        random_state: Optional[int] = None
+    ):
+        """
+        AlternatingLeastSquares sınıfının başlatıcı metodu.
+
+        Parameters
+        ----------
+        n_factors : int, optional
+            Gizli faktör sayısı, by default 100
+        regularization : Union[float, Regularization], optional
+            L2 düzenlileştirme katsayısı veya terim başına katsayılar,
+            by default 0.1
+        n_iterations : int, optional
+            En fazla iterasyon sayısı, by default 15
+        implicit : bool, optional
+            Örtük geri bildirim modu, by default False
+        alpha : float, optional
+            Örtük modda güven katsayısı, by default 40.0
+        tol : float, optional
+            Erken durdurma eşiği, by default 1e-4
+        n_jobs : Optional[int], optional
+            İş parçacığı sayısı, by default None (CPU çekirdek sayısı)
+        block_rows : int, optional
+            Görev başına çözülen satır sayısı, by default ALS_BLOCK_ROWS
+        random_state : Optional[int], optional
+            Tohum değeri, by default None
+        """
+        self.n_factors = n_factors
+        self.regularization = regularization
+        self.n_iterations = n_iterations
+        self.implicit = implicit
+        self.alpha = alpha
+        self.tol = tol
+        self.n_jobs = max(1, n_jobs or os.cpu_count() or 1)
+        self.block_rows = max(1, block_rows)
+        self.random_state = random_state
+
+        self.global_mean = 0.0
+        self.rating_scale = None
+        self.user_factors = None
+        self.item_factors = None
+        self.user_biases = None
+        self.item_biases = None
+        self.history_ = []
+        self.logger = logging.getLogger(__name__)
+
+    def fit(self, ratings: RatingsMatrix) -> 'AlternatingLeastSquares':
+        """
+        Modeli puan matrisi üzerinde eğitir.
+
+        Parameters
+        ----------
+        ratings : RatingsMatrix
+            Eğitim puanları
+
+        Returns
+        -------
+        AlternatingLeastSquares
+            Eğitilmiş model
+        """
+        try:
+            csr = ratings.csr.astype(np.float64)
+            csc_t = ratings.csc.T.tocsr().astype(np.float64)
+            n_users, n_items = csr.shape
+
+            rng = np.random.default_rng(self.random_state)
+            self.user_factors = rng.normal(0, 0.1, (n_users, self.n_factors))
+            self.item_factors = rng.normal(0, 0.1, (n_items, self.n_factors))
+            self.user_biases = np.zeros(n_users)
+            self.item_biases = np.zeros(n_items)
+            self.global_mean = 0.0 if self.implicit or csr.nnz == 0 else float(csr.data.mean())
+            self.rating_scale = None if self.implicit else ratings.rating_scale
+            self.history_ = []
+
+            mode = 'örtük' if self.implicit else 'açık'
+            self.logger.info(
+                f"ALS eğitimi başlıyor ({mode} geri bildirim): {n_users} kullanıcı, {n_items} öğe, "
+                f"{csr.nnz} puan, {self.n_factors} faktör, {self.n_jobs} iş parçacığı."
+            )
+            started = time.perf_counter()
+
+            with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+                for iteration in range(1, self.n_iterations + 1):
+                    if self.implicit:
+                        self.user_factors = self._solve_implicit(executor, csr, self.item_factors, users=True)
+                        self.item_factors = self._solve_implicit(executor, csc_t, self.user_factors, users=False)
+                        loss = self._implicit_loss(csr)
+                    else:
+                        self.user_factors, self.user_biases = self._solve_explicit(
+                            executor, csr, self.item_factors, self.item_biases, users=True
+                        )
+                        self.item_factors, self.item_biases = self._solve_explicit(
+                            executor, csc_t, self.user_factors, self.user_biases, users=False
+                        )
+                        loss = self._explicit_rmse(csr)
+
+                    elapsed = time.perf_counter() - started
+                    self.history_.append(ALSIteration(iteration, loss, elapsed))
+                    self.logger.info(
+                        f"ALS iterasyon {iteration}/{self.n_iterations}: "
+                        f"{'kayıp' if self.implicit else 'eğitim RMSE'} {loss:.5f}, {elapsed:.2f} sn."
+                    )
+
+                    if len(self.history_) > 1:
+                        previous = self.history_[-2].loss
+                        if abs(previous - loss) <= self.tol * max(abs(previous), 1.0):
+                            self.logger.info(f"ALS {iteration}. iterasyonda yakınsadı.")
+                            break
+
+            return self
+
+        except Exception as e:
+            self.logger.error(f"ALS eğitim hatası: {str(e)}")
+            raise
+
+    @classmethod
+    def from_scorer(cls, scorer: LatentFactorScorer, **params) -> 'AlternatingLeastSquares':
+        """
+        Başka bir yöntemle (ör. surprise.SVD) eğitilmiş açık geri bildirim
+        faktörlerinden, partial_fit ile güncellenebilen bir model oluşturur.
+
+        Puanlayıcının ID sırası, partial_fit'e verilecek puan matrisinin kod
+        sırasıyla aynı olmalıdır (LatentFactorScorer.from_surprise(model,
+        ratings) bu koşulu sağlar).
+
+        Fold-in kaynak modelin amaç fonksiyonunu çözmelidir; surprise.SVD
+        için regularization=Regularization.from_surprise(model) verilir.
+        SVD'nin SGD amacı düzenlileştirmeyi her puan için bir kez ekler, yani
+        ALS-WR'deki gibi satırın puan sayısıyla ölçekler; böylece puanları
+        değişmemiş bir satırın yeniden çözümü SVD faktörünü yeniden üretir.
+
+        Parameters
+        ----------
+        scorer : LatentFactorScorer
+            Kaynak puanlayıcı
+        **params
+            AlternatingLeastSquares parametreleri (ör. regularization)
+
+        Returns
+        -------
+        AlternatingLeastSquares
+            Faktörleri puanlayıcının kopyası olan model
+        """
+        model = cls(n_factors=scorer.user_factors.shape[1], implicit=False, **params)
+        model.global_mean = scorer.global_mean
+        model.rating_scale = scorer.rating_scale
+        model.user_factors = scorer.user_factors.copy()
+        model.item_factors = scorer.item_factors.copy()
+        model.user_biases = scorer.user_biases.copy()
+        model.item_biases = scorer.item_biases.copy()
+        return model
+
+    def partial_fit(
+        self,
+        ratings: RatingsMatrix,
+        users: Optional[np.ndarray] = None,
+        items: Optional[np.ndarray] = None
+    ) -> 'AlternatingLeastSquares':
+        """
+        Yalnızca verilen kullanıcı ve filmlerin faktörlerini, diğer tarafı
+        sabit tutarak yeniden çözer (fold-in).
+
+        Puan matrisine sonradan eklenen kullanıcı ve filmler için faktör
+        satırları sıfırla başlatılır. Önce filmler, ardından güncellenen film
+        faktörleriyle kullanıcılar çözülür; her satır için tek bir k×k sistem
+        çözüldüğü için maliyet yalnızca etkilenen puan sayısına bağlıdır.
+
+        Faktörler kopyalar üzerinde güncellenip sonra yerine konur; to_scorer
+        ile oluşturulmuş ve eş zamanlı okunan puanlayıcılar değişmez.
+
+        Parameters
+        ----------
+        ratings : RatingsMatrix
+            Güncel puan matrisi (eğitimdeki kodlar korunmuş olmalıdır)
+        users : Optional[np.ndarray], optional
+            Yeniden çözülecek kullanıcı kodları, by default None
+        items : Optional[np.ndarray], optional
+            Yeniden çözülecek film kodları, by default None
+
+        Returns
+        -------
+        AlternatingLeastSquares
+            Güncellenmiş model
+
+        Raises
+        ------
+        ValueError
+            Model henüz eğitilmediğinde
+        """
+        if self.user_factors is None:
+            raise ValueError("ALS modeli eğitilmedi. Önce fit() çağrılmalı.")
+
+        self._grow(ratings.n_users, ratings.n_items)
+        users = np.unique(np.asarray(users if users is not None else [], dtype=np.int64))
+        items = np.unique(np.asarray(items if items is not None else [], dtype=np.int64))
+        started = time.perf_counter()
+        user_factors, user_biases = self.user_factors.copy(), self.user_biases.copy()
+        item_factors, item_biases = self.item_factors.copy(), self.item_biases.copy()
+
+        # Yalnızca etkilenen satır ve sütunlar okunur; tam matris birleştirilmez
+        with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+            if len(items):
+                item_lines = ratings.item_matrix(items)
+                if self.implicit:
+                    item_factors[items] = self._solve_implicit(executor, item_lines, user_factors, users=False)
+                else:
+                    item_factors[items], item_biases[items] = self._solve_explicit(
+                        executor, item_lines, user_factors, user_biases, users=False
+                    )
+            if len(users):
+                user_lines = ratings.user_matrix(users)
+                if self.implicit:
+                    user_factors[users] = self._solve_implicit(executor, user_lines, item_factors, users=True)
+                else:
+                    user_factors[users], user_biases[users] = self._solve_explicit(
+                        executor, user_lines, item_factors, item_biases, users=True
+                    )
+
+        self.user_factors, self.user_biases = user_factors, user_biases
+        self.item_factors, self.item_biases = item_factors, item_biases
+
+        self.logger.info(
+            f"ALS fold-in: {len(users)} kullanıcı, {len(items)} film güncellendi "
+            f"({time.perf_counter() - started:.3f} sn)."
+        )
+        return self
+
+    def to_scorer(self, ratings: RatingsMatrix) -> LatentFactorScorer:
+        """
+        Eğitilmiş faktörlerden puanlayıcı oluşturur.
+
+        Puanlayıcı faktör dizilerini modelle paylaşır; fit ve partial_fit bu
+        dizileri yerinde değiştirmez, yenilerini oluşturup yerine koyar.
+        Puanlanmış öğeler matristen satır satır okunur; ek puanlar için tam
+        matris birleştirilmez.
+
+        Parameters
+        ----------
+        ratings : RatingsMatrix
+            Modelin eğitildiği puan matrisi (ID eşlemeleri ve puanlanmış öğeler)
+
+        Returns
+        -------
+        LatentFactorScorer
+            Açık modda puan ölçeğine kırpılan, örtük modda kırpılmayan puanlayıcı
+
+        Raises
+        ------
+        ValueError
+            Model henüz eğitilmediğinde
+        """
+        if self.user_factors is None:
+            raise ValueError("ALS modeli eğitilmedi. Önce fit() çağrılmalı.")
+        return LatentFactorScorer(
+            self.global_mean, self.user_factors, self.item_factors,
+            self.user_biases, self.item_biases,
+            ratings.user_ids, ratings.item_ids,
+            rating_scale=self.rating_scale,
+            rated=ratings
+        )
+
+    def _grow(self, n_users: int, n_items: int) -> None:
+        """Yeni kullanıcı ve filmler için sıfır faktör ve sapma satırları ekler."""
+        extra_users = n_users - self.user_factors.shape[0]
+        if extra_users > 0:
+            self.user_factors = np.vstack([self.user_factors, np.zeros((extra_users, self.n_factors))])
+            self.user_biases = np.concatenate([self.user_biases, np.zeros(extra_users)])
+        extra_items = n_items - self.item_factors.shape[0]
+        if extra_items > 0:
+            self.item_factors = np.vstack([self.item_factors, np.zeros((extra_items, self.n_factors))])
+            self.item_biases = np.concatenate([self.item_biases, np.zeros(extra_items)])
+
+    def _regularization(self) -> Regularization:
+        """Tek değer verilmişse tüm terimler için aynı katsayıyı kullanır."""
+        if isinstance(self.regularization, Regularization):
+            return self.regularization
+        return Regularization(*(4 * [float(self.regularization)]))
+
+    def _blocks(self, rows: np.ndarray) -> List[np.ndarray]:
+        return [rows[start:start + self.block_rows] for start in range(0, len(rows), self.block_rows)]
+
+    def _normal_equations(
+        self,
+        matrix: sparse.csr_matrix,
+        rows: np.ndarray,
+        design: np.ndarray,
+        fixed_biases: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Verilen satırlar için Σ w·y·yᵀ ve Σ v·y toplamlarını hesaplar.
+
+        Açık modda (fixed_biases verildiğinde) w = 1, v = r - mu - b; örtük
+        modda w = c - 1, v = c. Az puanlı satırlar puan sayıları en fazla √2
+        kat farklı gruplara ayrılır; her grubun puanları sıfır ağırlıkla
+        grubun en uzun satırına doldurulur ve Gram matrisleri tek bir toplu
+        np.matmul çağrısıyla hesaplanır. ALS_PADDED_MAX_RATINGS üzerindeki
+        satırlar kendi BLAS çarpımlarıyla kurulur. Her iki yol da GIL'i
+        bıraktığı için bloklar iş parçacıkları arasında paralel ilerler.
+        """
+        size = design.shape[1]
+        lhs = np.zeros((len(rows), size, size))
+        rhs = np.zeros((len(rows), size))
+        starts = matrix.indptr[rows]
+        counts = matrix.indptr[rows + 1] - starts
+
+        short = np.flatnonzero((counts > 0) & (counts <= ALS_PADDED_MAX_RATINGS))
+        groups = np.floor(2 * np.log2(counts[short])).astype(np.int64)
+        for group in np.unique(groups):
+            members = short[groups == group]
+            width = int(counts[members].max())
+            offsets = np.arange(width)
+            mask = offsets < counts[members, np.newaxis]
+            # Doldurma konumları satırın ilk puanını gösterir ve sıfır ağırlık alır
+            positions = np.where(mask, starts[members, np.newaxis] + offsets, starts[members, np.newaxis])
+            cols = matrix.indices[positions]
+            weights, targets = self._weights(matrix.data[positions], cols, fixed_biases)
+            weights = mask if weights is None else weights * mask
+            y = design[cols]
+            y_t = y.transpose(0, 2, 1)
+            lhs[members] = np.matmul(y_t, y * weights[..., np.newaxis])
+            rhs[members] = np.matmul(y_t, (targets * mask)[..., np.newaxis])[..., 0]
+
+        for i in np.flatnonzero(counts > ALS_PADDED_MAX_RATINGS):
+            lo, hi = starts[i], starts[i] + counts[i]
+            cols = matrix.indices[lo:hi]
+            weights, targets = self._weights(matrix.data[lo:hi], cols, fixed_biases)
+            y = design[cols]
+            lhs[i] = (y.T @ y) if weights is None else (y.T * weights) @ y
+            rhs[i] = y.T @ targets
+        return lhs, rhs
+
+    def _weights(
+        self,
+        values: np.ndarray,
+        cols: np.ndarray,
+        fixed_biases: Optional[np.ndarray]
+    ) -> Tuple[Optional[np.ndarray], np.ndarray]:
+        """Puanlardan normal denklemlerin w ağırlıklarını (açık modda None, yani 1) ve v hedeflerini hesaplar."""
+        if fixed_biases is not None:
+            return None, values - self.global_mean - fixed_biases[cols]
+        confidence = 1.0 + self.alpha * values
+        return confidence - 1.0, confidence
+
+    def _solve_explicit(
+        self,
+        executor: ThreadPoolExecutor,
+        matrix: sparse.csr_matrix,
+        fixed_factors: np.ndarray,
+        fixed_biases: np.ndarray,
+        users: bool,
+        rows: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Karşı taraf sabitken satırların faktörlerini ve sapmalarını çözer.
+
+        Bilinmeyen [p_u, b_u], sabit taraf [Q, 1] ve hedef r_ui - mu - b_i
+        olmak üzere düzenlileştirilmiş en küçük kareler problemidir.
+        Düzenlileştirme satırın puan sayısıyla ölçeklenir (ALS-WR). users
+        satırların kullanıcı mı öğe mi olduğunu belirtir; rows verilmezse
+        tüm satırlar çözülür.
+        """
+        rows = np.arange(matrix.shape[0]) if rows is None else np.asarray(rows)
+        design = np.hstack([fixed_factors, np.ones((fixed_factors.shape[0], 1))])
+        regularization = self._regularization()
+        if users:
+            penalty = np.append(np.full(self.n_factors, regularization.user_factors), regularization.user_biases)
+        else:
+            penalty = np.append(np.full(self.n_factors, regularization.item_factors), regularization.item_biases)
+        counts = np.maximum(np.diff(matrix.indptr), 1)
+        solution = np.empty((len(rows), design.shape[1]))
+
+        def solve(offset: int, block: np.ndarray) -> None:
+            lhs, rhs = self._normal_equations(matrix, block, design, fixed_biases)
+            lhs += counts[block][:, np.newaxis, np.newaxis] * np.diag(penalty)
+            solution[offset:offset + len(block)] = np.linalg.solve(lhs, rhs[..., np.newaxis])[..., 0]
+
+        blocks = self._blocks(rows)
+        list(executor.map(solve, range(0, len(rows), self.block_rows), blocks))
+        return solution[:, :-1], solution[:, -1]
+
+    def _solve_implicit(
+        self,
+        executor: ThreadPoolExecutor,
+        matrix: sparse.csr_matrix,
+        fixed_factors: np.ndarray,
+        users: bool,
+        rows: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Karşı taraf sabitken satırların faktörlerini örtük modelle çözer.
+
+        (YᵀY + Y_Iᵀ (C_u - I) Y_I + λI) x_u = Y_Iᵀ C_u p_u; YᵀY her yarım
+        adımda bir kez hesaplanır. users satırların kullanıcı mı öğe mi
+        olduğunu belirtir; rows verilmezse tüm satırlar çözülür.
+        """
+        rows = np.arange(matrix.shape[0]) if rows is None else np.asarray(rows)
+        regularization = self._regularization()
+        penalty = regularization.user_factors if users else regularization.item_factors
+        gram = fixed_factors.T @ fixed_factors + penalty * np.eye(self.n_factors)
+        solution = np.empty((len(rows), self.n_factors))
+
+        def solve(offset: int, block: np.ndarray) -> None:
+            lhs, rhs = self._normal_equations(matrix, block, fixed_factors)
+            lhs += gram
+            solution[offset:offset + len(block)] = np.linalg.solve(lhs, rhs[..., np.newaxis])[..., 0]
+
+        blocks = self._blocks(rows)
+        list(executor.map(solve, range(0, len(rows), self.block_rows), blocks))
+        return solution
+
+    def _observed_predictions(self, matrix: sparse.csr_matrix) -> np.ndarray:
+        """Gözlenen (kullanıcı, öğe) çiftleri için p_u · q_i değerlerini döndürür."""
+        rows = np.repeat(np.arange(matrix.shape[0]), np.diff(matrix.indptr))
+        cols = matrix.indices
+        dots = np.empty(len(cols))
+        chunk = 1 << 20
+        for start in range(0, len(cols), chunk):
+            stop = start + chunk
+            dots[start:stop] = np.einsum(
+                'ij,ij->i', self.user_factors[rows[start:stop]], self.item_factors[cols[start:stop]]
+            )
+        return dots
+
+    def _explicit_rmse(self, matrix: sparse.csr_matrix) -> float:
+        """Eğitim kümesi üzerindeki RMSE."""
+        if matrix.nnz == 0:
+            return 0.0
+        rows = np.repeat(np.arange(matrix.shape[0]), np.diff(matrix.indptr))
+        predictions = (self._observed_predictions(matrix) + self.global_mean
+                       + self.user_biases[rows] + self.item_biases[matrix.indices])
+        return float(np.sqrt(np.mean((matrix.data - predictions) ** 2)))
+
+    def _implicit_loss(self, matrix: sparse.csr_matrix) -> float:
+        """
+        Örtük modelin düzenlileştirilmiş ağırlıklı kaybı (gözlem başına).
+
+        Tüm çiftler üzerindeki Σ (x·y)² terimi tr((XᵀX)(YᵀY)) ile, gözlenen
+        çiftlerin katkısı yalnızca nnz eleman üzerinden hesaplanır.
+        """
+        dots = self._observed_predictions(matrix)
+        confidence = 1.0 + self.alpha * matrix.data
+        total = np.sum((self.user_factors.T @ self.user_factors) * (self.item_factors.T @ self.item_factors))
+        total += np.sum(confidence * (1.0 - dots) ** 2 - dots ** 2)
+        regularization = self._regularization()
+        total += regularization.user_factors * np.sum(self.user_factors ** 2)
+        total += regularization.item_factors * np.sum(self.item_factors ** 2)
+        return float(total / max(matrix.nnz, 1))
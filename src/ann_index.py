@@ -0,0 +1,300 @@
+"""
+TF-IDF ve sayım vektörleri üzerinde yaklaşık en yakın komşu aramasını yöneten sınıf.
+"""
+import logging
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+from sklearn.preprocessing import normalize
+
+from .neighbor_index import top_k
+
+# İmza hesaplanırken tek seferde projekte edilecek satır sayısı
+PROJECTION_CHUNK_ROWS = 65536
+
+
+class LSHIndex:
+    """
+    Rastgele hiper düzlem projeksiyonu (SimHash) ile kosinüs benzerliği için
+    yaklaşık en yakın komşu indeksi.
+
+    Her tablo, vektörleri n_bits uzunluğunda bir imzaya çevirir; aynı kovaya
+    düşen filmler aday olarak toplanır ve adaylar tam kosinüs skoruyla yeniden
+    sıralanır. Doğruluk/gecikme dengesi tablo sayısı, imza uzunluğu ve sorgu
+    anındaki n_probes ile ayarlanır: daha fazla tablo veya yoklama daha yüksek
+    isabet, daha kısa imza daha büyük kovalar demektir.
+
+    Attributes
+    ----------
+    n_tables : int
+        Hash tablosu sayısı
+    n_bits : int
+        Tablo başına imza uzunluğu (en fazla 63)
+    n_probes : int
+        Varsayılan çoklu yoklama sayısı; imzada en belirsiz n_probes bit
+        tek tek çevrilerek komşu kovalar da taranır
+    max_candidates : Optional[int]
+        Yeniden sıralanacak en fazla aday sayısı
+    seed : int
+        Hiper düzlemler için rastgelelik tohumu
+    logger : logging.Logger
+        Loglama için logger nesnesi
+    """
+
+    def __init__(
+        self,
+        n_tables: int = 16,
+        n_bits: int = 12,
+        n_probes: int = 2,
+        max_candidates: Optional[int] = None,
+        seed: int = 42
+    ):
+        """
+        LSHIndex sınıfının başlatıcı metodu.
+
+        Parameters
+        ----------
+        n_tables : int, optional
+            Hash tablosu sayısı, by default 16
+        n_bits : int, optional
+            Tablo başına imza uzunluğu, by default 12
+        n_probes : int, optional
+            Varsayılan çoklu yoklama sayısı, by default 2
+        max_candidates : Optional[int], optional
+            Yeniden sıralanacak en fazla aday sayısı, by default None
+        seed : int, optional
+            Rastgelelik tohumu, by default 42
+        """
+        if not 1 <= n_bits <= 63:
+            raise ValueError("n_bits 1 ile 63 arasında olmalıdır")
+        self.n_tables = n_tables
+        self.n_bits = n_bits
+        self.n_probes = n_probes
+        self.max_candidates = max_candidates
+        self.seed = seed
+        self.logger = logging.getLogger(__name__)
+
+        self.features = None
+        self.hyperplanes = None
+        self.sorted_codes = None
+        self.sorted_ids = None
+
+    def build(self, matrix: sparse.spmatrix) -> 'LSHIndex':
+        """
+        Özellik matrisinden indeksi oluşturur.
+
+        Parameters
+        ----------
+        matrix : sparse.spmatrix
+            (N, D) boyutlu özellik matrisi
+
+        Returns
+        -------
+        LSHIndex
+            Oluşturulan indeks (zincirleme kullanım için)
+        """
+        try:
+            self.features = normalize(sparse.csr_matrix(matrix, dtype=np.float32), norm='l2', copy=False)
+            n_rows, n_dims = self.features.shape
+
+            rng = np.random.default_rng(self.seed)
+            self.hyperplanes = rng.standard_normal(
+                (n_dims, self.n_tables * self.n_bits), dtype=np.float32
+            )
+
+            codes = np.empty((self.n_tables, n_rows), dtype=np.uint64)
+            for start in range(0, n_rows, PROJECTION_CHUNK_ROWS):
+                stop = min(start + PROJECTION_CHUNK_ROWS, n_rows)
+                codes[:, start:stop] = self._encode(self._project(self.features[start:stop])).T
+
+            # Her tablo için kodları sırala; kovalar ikili arama ile bulunur
+            self.sorted_ids = np.argsort(codes, axis=1, kind='stable').astype(np.int32)
+            self.sorted_codes = np.take_along_axis(codes, self.sorted_ids, axis=1)
+
+            self.logger.info(
+                f"LSH indeksi oluşturuldu ({n_rows} film, {self.n_tables} tablo, {self.n_bits} bit)."
+            )
+            return self
+
+        except Exception as e:
+            self.logger.error(f"LSH indeksi oluşturma hatası: {str(e)}")
+            raise
+
+    def __len__(self) -> int:
+        return 0 if self.features is None else self.features.shape[0]
+
+    def query(
+        self,
+        idx: int,
+        n: int = 10,
+        n_probes: Optional[int] = None,
+        mask: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        İndeksteki bir filmin yaklaşık en benzer n komşusunu döndürür.
+
+        Parameters
+        ----------
+        idx : int
+            Filmin satır indeksi
+        n : int, optional
+            Döndürülecek komşu sayısı, by default 10
+        n_probes : Optional[int], optional
+            Çoklu yoklama sayısı, by default None (indeks varsayılanı)
+        mask : Optional[np.ndarray], optional
+            (N,) boyutlu, seçilebilecek filmleri gösteren bool maske; adaylar
+            skorlanmadan önce süzülür, by default None
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Komşu satır indeksleri ve kosinüs skorları
+        """
+        return self._search(self.features[idx], n, n_probes, exclude=idx, mask=mask)
+
+    def query_vector(
+        self,
+        vector: sparse.spmatrix,
+        n: int = 10,
+        n_probes: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        İndekste bulunmayan bir vektörün yaklaşık en benzer n komşusunu döndürür.
+
+        Parameters
+        ----------
+        vector : sparse.spmatrix
+            (1, D) boyutlu özellik vektörü
+        n : int, optional
+            Döndürülecek komşu sayısı, by default 10
+        n_probes : Optional[int], optional
+            Çoklu yoklama sayısı, by default None (indeks varsayılanı)
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Komşu satır indeksleri ve kosinüs skorları
+        """
+        vector = normalize(sparse.csr_matrix(vector, dtype=np.float32), norm='l2')
+        return self._search(vector, n, n_probes)
+
+    def save(self, path: str) -> None:
+        """
+        İndeksi .npz dosyasına kaydeder.
+
+        Parameters
+        ----------
+        path : str
+            Hedef dosya yolu
+        """
+        np.savez(
+            Path(path),
+            params=np.array([self.n_tables, self.n_bits, self.n_probes,
+                             -1 if self.max_candidates is None else self.max_candidates,
+                             self.seed]),
+            hyperplanes=self.hyperplanes,
+            sorted_codes=self.sorted_codes,
+            sorted_ids=self.sorted_ids,
+            features_data=self.features.data,
+            features_indices=self.features.indices,
+            features_indptr=self.features.indptr,
+            features_shape=np.asarray(self.features.shape),
+        )
+        self.logger.info(f"LSH indeksi kaydedildi: {path}")
+
+    @classmethod
+    def load(cls, path: str) -> 'LSHIndex':
+        """
+        Kaydedilmiş indeksi yükler.
+
+        Parameters
+        ----------
+        path : str
+            İndeks dosyasının yolu
+
+        Returns
+        -------
+        LSHIndex
+            Yüklenen indeks
+        """
+        with np.load(Path(path)) as data:
+            n_tables, n_bits, n_probes, max_candidates, seed = (int(v) for v in data['params'])
+            index = cls(
+                n_tables=n_tables,
+                n_bits=n_bits,
+                n_probes=n_probes,
+                max_candidates=None if max_candidates < 0 else max_candidates,
+                seed=seed,
+            )
+            index.hyperplanes = data['hyperplanes']
+            index.sorted_codes = data['sorted_codes']
+            index.sorted_ids = data['sorted_ids']
+            index.features = sparse.csr_matrix(
+                (data['features_data'], data['features_indices'], data['features_indptr']),
+                shape=tuple(data['features_shape'])
+            )
+        return index
+
+    def _project(self, rows: sparse.csr_matrix) -> np.ndarray:
+        """Satırları hiper düzlemlere projekte eder: (n, n_tables, n_bits)."""
+        projected = np.asarray(rows @ self.hyperplanes)
+        return projected.reshape(rows.shape[0], self.n_tables, self.n_bits)
+
+    def _encode(self, projected: np.ndarray) -> np.ndarray:
+        """Projeksiyon işaretlerini tablo başına tamsayı imzalara çevirir."""
+        weights = np.left_shift(np.uint64(1), np.arange(self.n_bits, dtype=np.uint64))
+        bits = (projected > 0).astype(np.uint64)
+        return (bits * weights).sum(axis=2, dtype=np.uint64)
+
+    def _search(
+        self,
+        vector: sparse.csr_matrix,
+        n: int,
+        n_probes: Optional[int],
+        exclude: Optional[int] = None,
+        mask: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Aday kovaları toplar ve adayları tam kosinüs skoruyla sıralar."""
+        if self.features is None:
+            raise ValueError("LSH indeksi oluşturulmadı. Önce build() çağrılmalı.")
+        n_probes = self.n_probes if n_probes is None else n_probes
+
+        projected = self._project(vector)[0]
+        codes = self._encode(projected[np.newaxis])[0]
+
+        # Sıfıra en yakın projeksiyonlar en belirsiz bitlerdir; önce onlar çevrilir
+        probe_codes = [codes]
+        if n_probes > 0:
+            uncertain = np.argsort(np.abs(projected), axis=1)[:, :n_probes]
+            for p in range(uncertain.shape[1]):
+                flips = np.left_shift(np.uint64(1), uncertain[:, p].astype(np.uint64))
+                probe_codes.append(codes ^ flips)
+
+        buckets = []
+        for table in range(self.n_tables):
+            table_codes = self.sorted_codes[table]
+            for probe in probe_codes:
+                lo = np.searchsorted(table_codes, probe[table], side='left')
+                hi = np.searchsorted(table_codes, probe[table], side='right')
+                if hi > lo:
+                    buckets.append(self.sorted_ids[table, lo:hi])
+
+        if not buckets:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        candidates, hits = np.unique(np.concatenate(buckets), return_counts=True)
+        if exclude is not None:
+            keep = candidates != exclude
+            candidates, hits = candidates[keep], hits[keep]
+        if mask is not None:
+            keep = mask[candidates]
+            candidates, hits = candidates[keep], hits[keep]
+        if self.max_candidates is not None and len(candidates) > self.max_candidates:
+            # En çok tabloda çakışan adaylar tercih edilir
+            candidates = np.sort(candidates[top_k(hits, self.max_candidates)[0]])
+
+        scores = np.asarray((self.features[candidates] @ vector.T).todense()).ravel()
+        order, values = top_k(scores, n)
+        return candidates[order], values
@@ -1,25 +1,56 @@
 """
 Hız sınırlama ve hata yönetimi ile TMDB API için güvenli istemci.
 """
-import time
 import logging
-from typing import Dict, Any, Optional
+import time
+from functools import partial
+from typing import Dict, Any, Optional, Sequence
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .async_api_client import RETRY_BACKOFF_FACTOR, RETRY_TOTAL, retry_backoff, tmdb_auth
 from .config import settings, validate_api_key
+from .details_cache import MovieDetailsCache
+from .rate_limiter import RATE_LIMIT_MAX_WAIT, RateLimitExceeded, SingleFlight, TokenBucket, parse_retry_after
+from .tmdb_normalizer import DEFAULT_APPEND, bundle_cache_language, bundle_params, normalize_movie, split_bundle
 
 logger = logging.getLogger(__name__)
 
 class TMDBClient:
     """Hız sınırlama ve hata yönetimi ile TMDB API istemcisi."""
     
-    def __init__(self):
-        """TMDB API istemcisini başlat."""
+    def __init__(
+        self,
+        details_cache: Optional[MovieDetailsCache] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        max_wait: float = RATE_LIMIT_MAX_WAIT
+    ):
+        """
+        TMDB API istemcisini başlat.
+        
+        Parametreler
+        -----------
+        details_cache : Optional[MovieDetailsCache]
+            Film detaylarının önbelleği. None ise süreçte paylaşılan
+            varsayılan önbellek kullanılır.
+        rate_limiter : Optional[TokenBucket]
+            İstek hızını sınırlayan jeton kovası. None ise süreçteki tüm
+            istemcilerin paylaştığı kova kullanılır.
+        max_wait : float
+            Bir isteğin hız sınırı için bekleyebileceği en uzun süre
+            (saniye); aşılacaksa istek beklemeden RateLimitExceeded fırlatır.
+        """
         self.api_key = validate_api_key()
         self.base_url = settings.TMDB_API_BASE_URL
         self.session = self._create_session()
+        self._auth_params, auth_headers = tmdb_auth(self.api_key)
+        self.session.headers.update(auth_headers)
+        self.details_cache = details_cache or MovieDetailsCache.default()
+        self.rate_limiter = rate_limiter or TokenBucket.default()
+        self.max_wait = max_wait
+        # Aynı endpoint ve parametrelerle eş zamanlı GET istekleri tek istekte birleştirilir
+        self.in_flight = SingleFlight.default()
         
     def _create_session(self) -> requests.Session:
         """
@@ -32,11 +63,12 @@ class TMDBClient:
         """
         session = requests.Session()
         
-        # Yeniden deneme stratejisini yapılandır
+        # Yeniden deneme stratejisini yapılandır; 429 yanıtları jeton kovasını
+        # atlamamak için burada değil _send içinde kova üzerinden yeniden denenir
         retry_strategy = Retry(
-            total=3,  # yeniden deneme sayısı
-            backoff_factor=1,  # yeniden denemeler arasında 1, 2, 4 saniye bekle
-            status_forcelist=[429, 500, 502, 503, 504]  # yeniden denenecek HTTP durum kodları
+            total=RETRY_TOTAL,  # yeniden deneme sayısı
+            backoff_factor=RETRY_BACKOFF_FACTOR,  # yeniden denemeler arasında 1, 2, 4 saniye bekle
+            status_forcelist=[500, 502, 503, 504]  # yeniden denenecek HTTP durum kodları
         )
         
         adapter = HTTPAdapter(max_retries=retry_strategy)
@@ -55,6 +87,11 @@ class TMDBClient:
         """
         Hız sınırlama ve hata yönetimi ile API isteği yap.
         
+        İstek göndermeden önce paylaşılan jeton kovasından hak alınır ve
+        yanıtın X-RateLimit-* başlıkları kovaya yansıtılır. Aynı endpoint ve
+        parametrelerle uçuşta olan bir GET isteği varsa yeni istek
+        yapılmaz, onun sonucu paylaşılır.
+        
         Parametreler
         -----------
         endpoint : str
@@ -75,52 +112,141 @@ class TMDBClient:
         ------
         requests.exceptions.RequestException
             İstek başarısız olursa
+        RateLimitExceeded
+            Hız sınırı için max_wait'ten uzun beklemek gerekirse
+        """
+        params = dict(params or {})
+        send = partial(self._send, endpoint, method, params, data)
+        if method.upper() != "GET" or data is not None:
+            return send()
+        key = (self.base_url, endpoint.lstrip('/'), tuple(sorted((k, str(v)) for k, v in params.items())))
+        return self.in_flight.do(key, send)
+    
+    def _send(
+        self,
+        endpoint: str,
+        method: str,
+        params: Dict[str, Any],
+        data: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Hız sınırlayıcıdan hak alıp isteği gönderir.
+        
+        429 yanıtında Retry-After kovaya yansıtılır ve istek en fazla
+        RETRY_TOTAL kez, her denemede kovadan yeniden hak alınarak tekrarlanır;
+        böylece bekleme max_wait'e tabidir ve diğer isteklerle paylaşılır.
+        Retry-After yoksa urllib3 Retry'daki üstel bekleme kullanılır.
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        # API anahtarını parametrelere ekle (v4 anahtarları oturum başlığında)
+        params = {**params, **self._auth_params}
         
-        # API anahtarını parametrelere ekle
-        params = params or {}
-        params["api_key"] = self.api_key
-        
-        try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=data,
-                timeout=10  # 10 saniyelik zaman aşımı
-            )
-            response.raise_for_status()
-            
-            # Hız sınırlama - API limitlerine uy
-            if "X-RateLimit-Remaining" in response.headers:
-                remaining = int(response.headers["X-RateLimit-Remaining"])
-                if remaining < 10:  # Kalan istek sayısı 10'dan azsa
-                    reset_time = int(response.headers.get("X-RateLimit-Reset", 60))
-                    logger.warning(f"Hız limiti neredeyse aşıldı. {reset_time} saniye bekleniyor.")
-                    time.sleep(reset_time)
+        for attempt in range(RETRY_TOTAL + 1):
+            if not self.rate_limiter.acquire(timeout=self.max_wait):
+                retry_after = self.rate_limiter.wait_time()
+                logger.warning(f"TMDB hız sınırı: istek {retry_after:.1f} saniye beklemek yerine reddedildi.")
+                raise RateLimitExceeded(retry_after)
             
-            return response.json()
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=data,
+                    timeout=10  # 10 saniyelik zaman aşımı
+                )
+                # Hız sınırlama - kalan hak ve Retry-After paylaşılan kovaya yansıtılır
+                self.rate_limiter.update_from_headers(response.headers, response.status_code)
+                if response.status_code != 429 or attempt == RETRY_TOTAL:
+                    response.raise_for_status()
+                    return response.json()
+                
+            except requests.exceptions.RequestException as e:
+                logger.error(f"API isteği başarısız oldu: {str(e)}")
+                raise
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"API isteği başarısız oldu: {str(e)}")
-            raise
+            logger.warning(f"TMDB 429 döndürdü ({endpoint}), istek hız sınırlayıcı üzerinden yeniden denenecek.")
+            if parse_retry_after(response.headers.get('Retry-After')) is None:
+                time.sleep(retry_backoff(attempt))
     
-    def get_movie_details(self, movie_id: int) -> Dict[str, Any]:
+    def get_movie_details(self, movie_id: int, language: str = "en-US") -> Dict[str, Any]:
         """
         TMDB API'den film detaylarını al.
         
+        Detaylar önbellekten sunulur; süresi dolmuş kayıtlar arka planda
+        yenilenir ve TMDB'ye ulaşılamadığında eski kayıt döndürülür.
+        
         Parametreler
         -----------
         movie_id : int
             TMDB film ID'si
+        language : str, optional
+            Detayların dili, varsayılan "en-US"
             
         Dönüşler
         -------
         Dict[str, Any]
             Film detayları
         """
-        return self._make_request(f"movie/{movie_id}")
+        return self.details_cache.get(
+            movie_id, language,
+            lambda: self._make_request(f"movie/{movie_id}", params={"language": language})
+        )
+    
+    def get_movie_bundle(
+        self,
+        movie_id: int,
+        language: str = "en-US",
+        append: Sequence[str] = DEFAULT_APPEND
+    ) -> Dict[str, Any]:
+        """
+        Film detaylarını ve ek yanıtları tek istekte al.
+        
+        TMDB'nin append_to_response parametresiyle detaylar, oyuncu/ekip,
+        anahtar kelimeler ve görseller tek bir HTTP isteğiyle döner. Yanıt
+        önbelleğe alınır; detay kısmı get_movie_details'in önbellek
+        kaydını da günceller.
+        
+        Parametreler
+        -----------
+        movie_id : int
+            TMDB film ID'si
+        language : str, optional
+            Detayların dili, varsayılan "en-US"
+        append : Sequence[str], optional
+            Ek yanıtlar, varsayılan ("credits", "keywords", "images")
+            
+        Dönüşler
+        -------
+        Dict[str, Any]
+            Film detayları; her ek yanıt kendi anahtarı altında
+        """
+        params = bundle_params(language, append)
+        
+        def fetch() -> Dict[str, Any]:
+            bundle = self._make_request(f"movie/{movie_id}", params=params)
+            self.details_cache.put(movie_id, language, split_bundle(bundle, append))
+            return bundle
+        
+        return self.details_cache.get(movie_id, bundle_cache_language(language, append), fetch)
+    
+    def get_movie_record(self, movie_id: int, language: str = "en-US") -> Dict[str, Any]:
+        """
+        Filmi tek istekte alıp Preprocessor'ın beklediği katalog satırına dönüştür.
+        
+        Parametreler
+        -----------
+        movie_id : int
+            TMDB film ID'si
+        language : str, optional
+            Detayların dili, varsayılan "en-US"
+            
+        Dönüşler
+        -------
+        Dict[str, Any]
+            DataLoader.merge_datasets çıktısıyla aynı sütunlu satır
+        """
+        return normalize_movie(self.get_movie_bundle(movie_id, language))
     
     def search_movies(self, query: str) -> Dict[str, Any]:
         """
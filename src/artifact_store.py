@@ -0,0 +1,350 @@
+"""
+Ön işlenmiş film kataloğunu diskte saklayan artefakt deposunu yöneten sınıf ve sürümlü artefakt dizinleri.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
+
+import numpy as np
+import pandas as pd
+
+# Artefakt dosya düzeni değiştiğinde artırılmalıdır
+ARTIFACT_FORMAT_VERSION = 1
+
+# İçeriği ön işleme çıktısını etkileyen kaynak dosyalar (src dizinine göre)
+PREPROCESSING_MODULES = ('data_loader.py', 'json_parser.py', 'preprocessor.py')
+
+# Sürümlü artefakt dizininde yayımlanmış sürümün adını tutan işaretçi dosyası
+CURRENT_POINTER = 'CURRENT'
+
+# Sürüm dizini adları: v<yazım zamanı (ns)>-<süreç kimliği>; ad sırası yazım sırasıdır
+VERSION_DIR_PATTERN = re.compile(r'^v\d{20}-\d+$')
+
+T = TypeVar('T')
+
+
+class ArtifactStore:
+    """
+    Ön işlenmiş veri setlerini Parquet formatında saklayan ve kaynak dosyaların
+    içerik özetine göre geçersiz kılan sınıf.
+
+    Her artefakt, kaynak CSV dosyalarının içerik özeti ile ön işleme kodunun
+    özetinden türetilen bir anahtarla saklanır. Kaynaklardan biri veya kod
+    değiştiğinde anahtar da değişir ve artefakt yeniden oluşturulur.
+
+    Attributes
+    ----------
+    artifact_dir : Path
+        Artefaktların saklandığı dizin
+    logger : logging.Logger
+        Loglama için logger nesnesi
+    """
+
+    def __init__(self, artifact_dir: str):
+        """
+        ArtifactStore sınıfının başlatıcı metodu.
+
+        Parameters
+        ----------
+        artifact_dir : str
+            Artefaktların saklanacağı dizin
+        """
+        self.artifact_dir = Path(artifact_dir)
+        self.logger = logging.getLogger(__name__)
+
+    def compute_key(self, source_paths: Iterable[Path]) -> str:
+        """
+        Kaynak dosyalar ve ön işleme kodu için içerik anahtarı hesaplar.
+
+        Parameters
+        ----------
+        source_paths : Iterable[Path]
+            Artefaktın türetildiği kaynak dosyalar
+
+        Returns
+        -------
+        str
+            Onaltılık içerik anahtarı
+        """
+        digest = hashlib.sha256()
+        digest.update(f"format:{ARTIFACT_FORMAT_VERSION}".encode())
+        digest.update(f"code:{self._code_version()}".encode())
+        for path in source_paths:
+            digest.update(f"{Path(path).name}:{self._file_digest(Path(path))}".encode())
+        return digest.hexdigest()
+
+    def load(self, name: str, key: str) -> Optional[pd.DataFrame]:
+        """
+        Anahtarı eşleşen artefaktı yükler.
+
+        Parameters
+        ----------
+        name : str
+            Artefakt adı
+        key : str
+            Beklenen içerik anahtarı
+
+        Returns
+        -------
+        Optional[pd.DataFrame]
+            Artefakt güncel ise DataFrame, aksi halde None
+        """
+        manifest = self._read_manifest(name)
+        data_path = self._data_path(name)
+        if manifest is None or manifest.get('key') != key or not data_path.exists():
+            return None
+
+        try:
+            df = pd.read_parquet(data_path)
+            # Parquet liste sütunlarını numpy dizisi, eksik değerleri None olarak döndürür
+            for column in manifest.get('list_columns', []):
+                df[column] = df[column].map(lambda x: list(x) if x is not None else x)
+            for column in manifest.get('object_columns', []):
+                df[column] = df[column].where(df[column].notna(), np.nan)
+            df.attrs['catalog_version'] = key
+
+            self.logger.info(f"'{name}' artefaktı önbellekten yüklendi.")
+            return df
+
+        except Exception as e:
+            self.logger.warning(f"'{name}' artefaktı okunamadı, yeniden oluşturulacak: {str(e)}")
+            return None
+
+    def save(self, name: str, key: str, df: pd.DataFrame) -> None:
+        """
+        DataFrame'i artefakt olarak kaydeder.
+
+        Parameters
+        ----------
+        name : str
+            Artefakt adı
+        key : str
+            Artefaktın içerik anahtarı
+        df : pd.DataFrame
+            Kaydedilecek veri seti
+        """
+        try:
+            self.artifact_dir.mkdir(parents=True, exist_ok=True)
+
+            object_columns = [c for c in df.columns if df[c].dtype == object]
+            list_columns = [c for c in object_columns if self._is_list_column(df[c])]
+
+            # Önce geçici dosyaya yaz, sonra atomik olarak yerine taşı
+            data_path = self._data_path(name)
+            tmp_path = data_path.with_suffix('.parquet.tmp')
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, data_path)
+
+            manifest = {
+                'key': key,
+                'format_version': ARTIFACT_FORMAT_VERSION,
+                'rows': len(df),
+                'list_columns': list_columns,
+                'object_columns': [c for c in object_columns if c not in list_columns],
+            }
+            manifest_path = self._manifest_path(name)
+            tmp_manifest = manifest_path.with_suffix('.json.tmp')
+            tmp_manifest.write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+            os.replace(tmp_manifest, manifest_path)
+            df.attrs['catalog_version'] = key
+
+            self.logger.info(f"'{name}' artefaktı kaydedildi ({len(df)} satır).")
+
+        except Exception as e:
+            # Artefakt yazılamasa bile çağıran taraf hesaplanmış veriyle devam edebilir
+            self.logger.warning(f"'{name}' artefaktı kaydedilemedi: {str(e)}")
+
+    def load_or_build(
+        self,
+        name: str,
+        source_paths: List[Path],
+        builder: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """
+        Güncel artefaktı yükler, yoksa veya eskimişse yeniden oluşturur.
+
+        Parameters
+        ----------
+        name : str
+            Artefakt adı
+        source_paths : List[Path]
+            Artefaktın türetildiği kaynak dosyalar
+        builder : Callable[[], pd.DataFrame]
+            Artefakt eskidiğinde veri setini yeniden üreten fonksiyon
+
+        Returns
+        -------
+        pd.DataFrame
+            Güncel veri seti
+        """
+        key = self.compute_key(source_paths)
+        df = self.load(name, key)
+        if df is not None:
+            return df
+
+        self.logger.info(f"'{name}' artefaktı eksik veya eskimiş, yeniden oluşturuluyor.")
+        df = builder()
+        self.save(name, key, df)
+        return df
+
+    def _file_digest(self, path: Path) -> str:
+        """
+        Dosyanın SHA-256 özetini döndürür.
+
+        Dosya boyutu ve değiştirilme zamanı değişmediyse önceden hesaplanmış
+        özet yeniden kullanılır; böylece büyük CSV'ler her çalıştırmada
+        yeniden okunmaz.
+        """
+        stat = path.stat()
+        signature = [stat.st_size, stat.st_mtime_ns]
+        digests = self._read_digest_cache()
+        entry = digests.get(str(path.resolve()))
+        if entry is not None and entry.get('signature') == signature:
+            return entry['sha256']
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+
+        digests[str(path.resolve())] = {'signature': signature, 'sha256': digest.hexdigest()}
+        self._write_digest_cache(digests)
+        return digest.hexdigest()
+
+    def _code_version(self) -> str:
+        """Ön işleme kodunun içerik özetini döndürür."""
+        src_dir = Path(__file__).resolve().parent
+        digest = hashlib.sha256()
+        for module in PREPROCESSING_MODULES:
+            digest.update((src_dir / module).read_bytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _is_list_column(series: pd.Series) -> bool:
+        """Sütunun ilk dolu değerinin liste olup olmadığını kontrol eder."""
+        non_null = series.dropna()
+        return len(non_null) > 0 and isinstance(non_null.iloc[0], list)
+
+    def _data_path(self, name: str) -> Path:
+        return self.artifact_dir / f"{name}.parquet"
+
+    def _manifest_path(self, name: str) -> Path:
+        return self.artifact_dir / f"{name}.json"
+
+    def _read_manifest(self, name: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self._manifest_path(name).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+    def _read_digest_cache(self) -> Dict[str, Any]:
+        try:
+            return json.loads((self.artifact_dir / 'digests.json').read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+    def _write_digest_cache(self, digests: Dict[str, Any]) -> None:
+        try:
+            self.artifact_dir.mkdir(parents=True, exist_ok=True)
+            (self.artifact_dir / 'digests.json').write_text(json.dumps(digests), encoding='utf-8')
+        except OSError as e:
+            self.logger.warning(f"Dosya özeti önbelleği yazılamadı: {str(e)}")
+
+
+def current_version_dir(path: Path) -> Path:
+    """
+    Sürümlü dizinde işaretçinin gösterdiği sürüm dizinini döndürür.
+
+    İşaretçi yoksa (dosyaları doğrudan dizinde tutan eski düzen) dizinin
+    kendisi döndürülür.
+    """
+    try:
+        name = (Path(path) / CURRENT_POINTER).read_text(encoding='utf-8').strip()
+    except FileNotFoundError:
+        return Path(path)
+    return Path(path) / name
+
+
+def read_current_version(path: Path, load: Callable[[Path], T]) -> T:
+    """
+    Yayımlanmış sürümü load ile açar.
+
+    Açılış sırasında sürüm silinirse (arada birden çok yeni sürüm
+    yayımlandıysa) işaretçi yeniden okunur; işaretçi değişmediyse hata
+    çağırana iletilir.
+
+    Parameters
+    ----------
+    path : Path
+        Sürümlü dizin
+    load : Callable[[Path], T]
+        Sürüm dizinindeki dosyaları açan fonksiyon
+
+    Returns
+    -------
+    T
+        load çıktısı
+    """
+    while True:
+        version_dir = current_version_dir(path)
+        try:
+            return load(version_dir)
+        except FileNotFoundError:
+            if current_version_dir(path) == version_dir:
+                raise
+
+
+def new_version_dir(path: Path) -> Path:
+    """Sürümlü dizinde yayımlanmamış, boş bir sürüm dizini oluşturur."""
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    version_dir = path / f"v{time.time_ns():020d}-{os.getpid()}"
+    version_dir.mkdir()
+    return version_dir
+
+
+def publish_version(path: Path, version_dir: Path, keep: int = 1) -> None:
+    """
+    Sürüm dizinini işaretçi dosyasını atomik olarak değiştirerek yayımlar.
+
+    İşaretçi geçici dosyaya yazılıp os.replace ile yerine konur; dizin hiçbir
+    an eksik kalmaz ve okuyucular ya eski ya yeni sürümün tamamını görür.
+    Yeni sürümden önceki keep sürüm, dosyalarını açmakta olan okuyucular için
+    tutulur; daha eskileri ve eski düzenden kalan dosyalar silinir. Bellek
+    eşlemeli açılmış dosyalar silinse de okuyucularda geçerli kalır.
+
+    Parameters
+    ----------
+    path : Path
+        Sürümlü dizin
+    version_dir : Path
+        new_version_dir ile oluşturulup doldurulmuş sürüm dizini
+    keep : int, optional
+        Silinmeden tutulacak önceki sürüm sayısı, by default 1
+    """
+    path = Path(path)
+    tmp_pointer = path / f"{CURRENT_POINTER}.{os.getpid()}.tmp"
+    tmp_pointer.write_text(version_dir.name, encoding='utf-8')
+    os.replace(tmp_pointer, path / CURRENT_POINTER)
+
+    older = sorted(
+        entry for entry in path.iterdir()
+        if VERSION_DIR_PATTERN.match(entry.name) and entry.name < version_dir.name
+    )
+    stale = older[:max(len(older) - keep, 0)]
+    legacy = [
+        entry for entry in path.iterdir()
+        if entry.name != CURRENT_POINTER and not VERSION_DIR_PATTERN.match(entry.name)
+        and not entry.name.endswith('.tmp')
+    ]
+    for entry in stale + legacy:
+        if entry.is_dir():
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            entry.unlink(missing_ok=True)
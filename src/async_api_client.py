@@ -0,0 +1,621 @@
+"""
+Bağlantı havuzu, istek başına zaman aşımı ve yeniden deneme ile TMDB API için asenkron istemci.
+"""
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import aiohttp
+
+from .details_cache import MovieDetailsCache
+from .rate_limiter import RATE_LIMIT_MAX_WAIT, RateLimitExceeded, SingleFlight, TokenBucket, parse_retry_after
+from .tmdb_normalizer import DEFAULT_APPEND, bundle_cache_language, bundle_params, split_bundle
+
+TMDB_API_BASE_URL = "https://api.themoviedb.org/3"
+
+# Havuzda aynı anda açık tutulan en fazla bağlantı sayısı
+TMDB_POOL_SIZE = 10
+
+# Tek bir HTTP denemesinin zaman aşımı (saniye)
+TMDB_REQUEST_TIMEOUT = 10.0
+
+# TMDBClient'ın urllib3 Retry stratejisiyle aynı yeniden deneme ayarları
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 1.0
+RETRY_BACKOFF_MAX = 120.0
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# urllib3'ün Retry-After başlığına uyduğu durum kodları
+RETRY_AFTER_STATUS_CODES = frozenset({413, 429, 503})
+
+logger = logging.getLogger(__name__)
+
+
+def tmdb_auth(api_key: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Anahtar türüne göre kimlik doğrulama parametrelerini ve başlıklarını döndürür.
+
+    TMDB'nin v4 okuma erişim anahtarları (JWT) Authorization başlığıyla,
+    v3 API anahtarları api_key sorgu parametresiyle gönderilir.
+
+    Parameters
+    ----------
+    api_key : str
+        TMDB API anahtarı veya okuma erişim anahtarı
+
+    Returns
+    -------
+    Tuple[Dict[str, str], Dict[str, str]]
+        Sorgu parametreleri ve HTTP başlıkları
+    """
+    if api_key.count('.') == 2 and api_key.startswith('eyJ'):
+        return {}, {"Authorization": f"Bearer {api_key}"}
+    return {"api_key": api_key}, {}
+
+
+def retry_backoff(attempt: int, backoff_factor: float = RETRY_BACKOFF_FACTOR) -> float:
+    """
+    urllib3 Retry ile aynı üstel bekleme süresini döndürür.
+
+    İlk yeniden deneme beklemeden yapılır, sonrakiler
+    backoff_factor * 2 ** (hata sayısı - 1) saniye bekler (1 için 0, 2, 4).
+
+    Parameters
+    ----------
+    attempt : int
+        Başarısız olan denemenin sırası (0'dan başlar)
+    backoff_factor : float, optional
+        Bekleme çarpanı, by default RETRY_BACKOFF_FACTOR
+
+    Returns
+    -------
+    float
+        Beklenecek süre (saniye)
+    """
+    errors = attempt + 1
+    if errors <= 1:
+        return 0.0
+    return min(RETRY_BACKOFF_MAX, backoff_factor * 2 ** (errors - 1))
+
+
+class AsyncTMDBClient:
+    """
+    TMDB API için bağlantı havuzlu asenkron istemci.
+
+    Tüm istekler tek bir aiohttp oturumu üzerinden, en fazla pool_size
+    kalıcı (keep-alive) bağlantıyla gönderilir; havuz doluyken gelen
+    istekler bağlantı boşalana kadar sırada bekler. TMDBClient gibi
+    süreçte paylaşılan jeton kovasına ve istek birleştirmeye uyar ve
+    film detaylarını aynı önbellekten sunar.
+
+    Oturum ilk istekte, o anda çalışan olay döngüsünde açılır; istemci bu
+    nedenle tek bir olay döngüsünde kullanılmalıdır (senkron kod için
+    BackgroundLoop).
+
+    Attributes
+    ----------
+    base_url : str
+        TMDB API temel URL'si
+    pool_size : int
+        Havuzdaki en fazla bağlantı sayısı
+    timeout : float
+        Tek bir HTTP denemesinin zaman aşımı (saniye)
+    retries : int
+        Yeniden deneme sayısı
+    backoff_factor : float
+        Yeniden denemeler arasındaki üstel bekleme çarpanı
+    details_cache : MovieDetailsCache
+        Film detaylarının önbelleği
+    rate_limiter : TokenBucket
+        İstek hızını sınırlayan jeton kovası
+    max_wait : float
+        Bir isteğin hız sınırı için bekleyebileceği en uzun süre (saniye)
+    """
+
+    _defaults: Dict[Tuple, 'AsyncTMDBClient'] = {}
+    _default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        pool_size: int = TMDB_POOL_SIZE,
+        timeout: float = TMDB_REQUEST_TIMEOUT,
+        retries: int = RETRY_TOTAL,
+        backoff_factor: float = RETRY_BACKOFF_FACTOR,
+        details_cache: Optional[MovieDetailsCache] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        max_wait: float = RATE_LIMIT_MAX_WAIT
+    ):
+        """
+        AsyncTMDBClient sınıfının başlatıcı metodu.
+
+        Parameters
+        ----------
+        api_key : Optional[str], optional
+            TMDB API anahtarı, by default None (ayarlardan alınır)
+        base_url : Optional[str], optional
+            TMDB API temel URL'si (testlerde yerel sunucu), by default None
+            (ayarlardan alınır)
+        pool_size : int, optional
+            Havuzdaki en fazla bağlantı sayısı, by default TMDB_POOL_SIZE
+        timeout : float, optional
+            Tek bir HTTP denemesinin zaman aşımı (saniye),
+            by default TMDB_REQUEST_TIMEOUT
+        retries : int, optional
+            429/5xx yanıtları ve bağlantı hataları için yeniden deneme
+            sayısı, by default RETRY_TOTAL
+        backoff_factor : float, optional
+            Yeniden denemeler arasındaki üstel bekleme çarpanı,
+            by default RETRY_BACKOFF_FACTOR
+        details_cache : Optional[MovieDetailsCache], optional
+            Film detaylarının önbelleği, by default None (süreçte paylaşılan
+            varsayılan önbellek)
+        rate_limiter : Optional[TokenBucket], optional
+            Jeton kovası, by default None (süreçte paylaşılan kova)
+        max_wait : float, optional
+            Bir isteğin hız sınırı için bekleyebileceği en uzun süre
+            (saniye); aşılacaksa RateLimitExceeded fırlatılır,
+            by default RATE_LIMIT_MAX_WAIT
+        """
+        if api_key is None or base_url is None:
+            # Ayarlar yalnızca gerektiğinde yüklenir; anahtar verilen kullanımlar .env gerektirmez
+            from .config import settings, validate_api_key
+            api_key = api_key or validate_api_key()
+            base_url = base_url or settings.TMDB_API_BASE_URL
+
+        self.base_url = base_url.rstrip('/')
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.details_cache = details_cache or MovieDetailsCache.default()
+        self.rate_limiter = rate_limiter or TokenBucket.default()
+        self.max_wait = max_wait
+        self.in_flight = SingleFlight.default()
+        self.logger = logging.getLogger(__name__)
+        self._auth_params, self._auth_headers = tmdb_auth(api_key)
+        self._session = None
+
+    @classmethod
+    def default(
+        cls,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        pool_size: int = TMDB_POOL_SIZE,
+        timeout: float = TMDB_REQUEST_TIMEOUT,
+        details_cache: Optional[MovieDetailsCache] = None
+    ) -> 'AsyncTMDBClient':
+        """
+        Süreç içinde aynı ayarlarla paylaşılan istemciyi döndürür.
+
+        İstemci BackgroundLoop.default() üzerinde kullanılmak içindir ve
+        oturumu döngü kapanırken kapatılır; döngü kapandıktan sonraki ilk
+        çağrı yeni bir istemci oluşturur. Streamlit gibi her etkileşimde
+        yeniden kurulan çağıranlar böylece oturum ve bağlantı sızdırmaz.
+
+        Parameters
+        ----------
+        api_key : Optional[str], optional
+            TMDB API anahtarı, by default None (ayarlardan alınır)
+        base_url : Optional[str], optional
+            TMDB API temel URL'si, by default None (ayarlardan alınır)
+        pool_size : int, optional
+            Havuzdaki en fazla bağlantı sayısı, by default TMDB_POOL_SIZE
+        timeout : float, optional
+            Tek bir HTTP denemesinin zaman aşımı (saniye),
+            by default TMDB_REQUEST_TIMEOUT
+        details_cache : Optional[MovieDetailsCache], optional
+            Film detaylarının önbelleği, by default None (süreçte paylaşılan
+            varsayılan önbellek)
+
+        Returns
+        -------
+        AsyncTMDBClient
+            Paylaşılan istemci
+        """
+        details_cache = details_cache or MovieDetailsCache.default()
+        key = (api_key, base_url, pool_size, timeout, details_cache)
+        with cls._default_lock:
+            client = cls._defaults.get(key)
+            if client is None:
+                client = cls(api_key, base_url, pool_size, timeout, details_cache=details_cache)
+                cls._defaults[key] = client
+
+                async def close() -> None:
+                    with cls._default_lock:
+                        if cls._defaults.get(key) is client:
+                            del cls._defaults[key]
+                    await client.close()
+
+                BackgroundLoop.default().on_close(close)
+            return client
+
+    async def __aenter__(self) -> 'AsyncTMDBClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Oturumu ve havuzdaki bağlantıları kapatır."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Bağlantı havuzlu oturumu (gerekirse oluşturarak) döndürür."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"accept": "application/json", **self._auth_headers},
+                raise_for_status=False
+            )
+        return self._session
+
+    async def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Hız sınırlama, yeniden deneme ve istek birleştirme ile GET isteği yap.
+
+        Parameters
+        ----------
+        endpoint : str
+            API endpoint'i
+        params : Optional[Dict[str, Any]], optional
+            Sorgu parametreleri, by default None
+
+        Returns
+        -------
+        Dict[str, Any]
+            API yanıt verisi
+
+        Raises
+        ------
+        aiohttp.ClientError
+            İstek yeniden denemelerden sonra da başarısız olursa
+        asyncio.TimeoutError
+            Son deneme zaman aşımına uğrarsa
+        RateLimitExceeded
+            Hız sınırı için max_wait'ten uzun beklemek gerekirse
+        """
+        params = dict(params or {})
+        key = (self.base_url, endpoint.lstrip('/'), tuple(sorted((k, str(v)) for k, v in params.items())))
+        return await self.in_flight.do_async(key, lambda: self._send(endpoint, params))
+
+    async def _send(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """İsteği gönderir; 429/5xx yanıtlarını ve bağlantı hatalarını urllib3 Retry gibi yeniden dener."""
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        query = {**params, **self._auth_params}
+        session = self._get_session()
+
+        for attempt in range(self.retries + 1):
+            if not await self.rate_limiter.acquire_async(timeout=self.max_wait):
+                retry_after = self.rate_limiter.wait_time()
+                self.logger.warning(f"TMDB hız sınırı: istek {retry_after:.1f} saniye beklemek yerine reddedildi.")
+                raise RateLimitExceeded(retry_after)
+
+            try:
+                async with session.get(url, params=query) as response:
+                    self.rate_limiter.update_from_headers(response.headers, response.status)
+                    if response.status not in RETRY_STATUS_CODES or attempt == self.retries:
+                        response.raise_for_status()
+                        return await response.json()
+                    delay = None
+                    if response.status in RETRY_AFTER_STATUS_CODES:
+                        delay = parse_retry_after(response.headers.get('Retry-After'))
+                    if delay is None:
+                        delay = retry_backoff(attempt, self.backoff_factor)
+                    self.logger.warning(
+                        f"TMDB {response.status} döndürdü ({endpoint}), {delay:.1f} saniye sonra yeniden denenecek."
+                    )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt == self.retries:
+                    self.logger.error(f"API isteği başarısız oldu: {str(e) or type(e).__name__}")
+                    raise
+                delay = retry_backoff(attempt, self.backoff_factor)
+                self.logger.warning(f"TMDB isteği başarısız ({endpoint}), {delay:.1f} saniye sonra yeniden denenecek.")
+            except aiohttp.ClientResponseError as e:
+                # URL api_key içerebileceği için loglanmaz
+                self.logger.error(f"API isteği başarısız oldu ({endpoint}): {e.status} {e.message}")
+                raise
+
+            await asyncio.sleep(delay)
+
+    async def get_movie_details(self, movie_id: int, language: str = "en-US") -> Dict[str, Any]:
+        """
+        TMDB API'den film detaylarını al.
+
+        Detaylar TMDBClient ile paylaşılan önbellekten sunulur; süresi
+        dolmuş kayıtlar arka planda yenilenir.
+
+        Parameters
+        ----------
+        movie_id : int
+            TMDB film ID'si
+        language : str, optional
+            Detayların dili, by default "en-US"
+
+        Returns
+        -------
+        Dict[str, Any]
+            Film detayları
+        """
+        return await self.details_cache.get_async(
+            movie_id, language,
+            lambda: self._make_request(f"movie/{movie_id}", {"language": language})
+        )
+
+    async def get_movie_details_many(
+        self,
+        movie_ids: Sequence[int],
+        language: str = "en-US",
+        timeout: Optional[float] = None
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """
+        Birden çok filmin detaylarını havuz üzerinden eşzamanlı alır.
+
+        Parameters
+        ----------
+        movie_ids : Sequence[int]
+            TMDB film ID'leri
+        language : str, optional
+            Detayların dili, by default "en-US"
+        timeout : Optional[float], optional
+            Film başına süre (yeniden denemeler dahil); havuz sırasında
+            bekleyen filmler için sıralarına göre uzatılır, by default None
+            (yalnızca deneme başına zaman aşımı)
+
+        Returns
+        -------
+        List[Union[Dict[str, Any], BaseException]]
+            movie_ids sırasıyla film detayları; alınamayan filmler için
+            fırlatılan istisna (süresi dolanlar için asyncio.TimeoutError)
+        """
+        return await self._gather(
+            [self.get_movie_details(movie_id, language) for movie_id in movie_ids], timeout
+        )
+
+    async def get_movie_bundle(
+        self,
+        movie_id: int,
+        language: str = "en-US",
+        append: Sequence[str] = DEFAULT_APPEND,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Film detaylarını ve ek yanıtları (credits, keywords, images)
+        append_to_response ile tek istekte al.
+
+        Parameters
+        ----------
+        movie_id : int
+            TMDB film ID'si
+        language : str, optional
+            Detayların dili, by default "en-US"
+        append : Sequence[str], optional
+            Ek yanıtlar, by default DEFAULT_APPEND
+        use_cache : bool, optional
+            Yanıtın detay önbelleğinden okunup yazılıp yazılmayacağı (toplu
+            senkronizasyonda önbelleği şişirmemek için False), by default True
+
+        Returns
+        -------
+        Dict[str, Any]
+            Film detayları; her ek yanıt kendi anahtarı altında
+        """
+        params = bundle_params(language, append)
+        if not use_cache:
+            return await self._make_request(f"movie/{movie_id}", params)
+
+        async def fetch() -> Dict[str, Any]:
+            bundle = await self._make_request(f"movie/{movie_id}", params)
+            self.details_cache.put(movie_id, language, split_bundle(bundle, append))
+            return bundle
+
+        return await self.details_cache.get_async(movie_id, bundle_cache_language(language, append), fetch)
+
+    async def get_movie_bundles_many(
+        self,
+        movie_ids: Sequence[int],
+        language: str = "en-US",
+        append: Sequence[str] = DEFAULT_APPEND,
+        timeout: Optional[float] = None,
+        use_cache: bool = True
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """
+        Birden çok filmin birleşik yanıtlarını film başına tek istekle
+        eşzamanlı alır; sonuçlar get_movie_details_many gibi döner.
+
+        Parameters
+        ----------
+        movie_ids : Sequence[int]
+            TMDB film ID'leri
+        language : str, optional
+            Detayların dili, by default "en-US"
+        append : Sequence[str], optional
+            Ek yanıtlar, by default DEFAULT_APPEND
+        timeout : Optional[float], optional
+            Film başına süre, by default None
+        use_cache : bool, optional
+            Detay önbelleğinin kullanılıp kullanılmayacağı, by default True
+
+        Returns
+        -------
+        List[Union[Dict[str, Any], BaseException]]
+            movie_ids sırasıyla birleşik yanıtlar veya istisnalar
+        """
+        return await self._gather(
+            [self.get_movie_bundle(movie_id, language, append, use_cache) for movie_id in movie_ids], timeout
+        )
+
+    async def _gather(
+        self,
+        calls: List[Awaitable[Dict[str, Any]]],
+        timeout: Optional[float]
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """Çağrıları eşzamanlı yürütür; havuz sırasına göre uzatılan süreyle istisnaları yerinde döndürür."""
+        async def run(position: int, call: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+            if timeout is None:
+                return await call
+            # position. çağrı en erken position // pool_size turda bağlantı alabilir
+            return await asyncio.wait_for(call, timeout * (position // self.pool_size + 1))
+
+        return await asyncio.gather(
+            *(run(position, call) for position, call in enumerate(calls)),
+            return_exceptions=True
+        )
+
+    async def search_movies(self, query: str) -> Dict[str, Any]:
+        """
+        TMDB API'de film ara.
+
+        Parameters
+        ----------
+        query : str
+            Arama sorgusu
+
+        Returns
+        -------
+        Dict[str, Any]
+            Arama sonuçları
+        """
+        return await self._make_request("search/movie", {"query": query})
+
+    async def discover_movies(self, page: int = 1, **filters: Any) -> Dict[str, Any]:
+        """
+        discover/movie ile filtrelere uyan filmlerin bir sayfasını al.
+
+        Parameters
+        ----------
+        page : int, optional
+            Sayfa numarası (TMDB en fazla 500 sayfa döndürür), by default 1
+        **filters : Any
+            TMDB discover parametreleri (ör. primary_release_year=2020)
+
+        Returns
+        -------
+        Dict[str, Any]
+            results, page ve total_pages içeren sayfa
+        """
+        return await self._make_request("discover/movie", {**filters, "page": page})
+
+    async def get_movie_changes(self, start_date: str, end_date: str, page: int = 1) -> Dict[str, Any]:
+        """
+        Tarih aralığında değişen filmlerin bir sayfasını al.
+
+        Parameters
+        ----------
+        start_date : str
+            Başlangıç tarihi (YYYY-MM-DD)
+        end_date : str
+            Bitiş tarihi (YYYY-MM-DD); TMDB aralığı en fazla 14 gün kabul eder
+        page : int, optional
+            Sayfa numarası, by default 1
+
+        Returns
+        -------
+        Dict[str, Any]
+            results ({id, adult}), page ve total_pages içeren sayfa
+        """
+        return await self._make_request(
+            "movie/changes", {"start_date": start_date, "end_date": end_date, "page": page}
+        )
+
+
+class BackgroundLoop:
+    """
+    Senkron koddan eşyordam çalıştırmak için arka plan iş parçacığında
+    sürekli dönen olay döngüsü.
+
+    Streamlit gibi senkron çağıranlar AsyncTMDBClient'ı bu döngü üzerinden
+    kullanır; böylece bağlantı havuzu istekler arasında açık kalır. Döngü
+    kapanırken on_close ile kaydedilen eşyordamlar (ör. oturum kapatma)
+    döngüde çalıştırılır; paylaşılan döngü süreç sonunda kapatılır.
+    """
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, name: str = 'tmdb-loop'):
+        self.loop = asyncio.new_event_loop()
+        self._closers: List[Callable[[], Awaitable[Any]]] = []
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self.loop.run_forever, name=name, daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def default(cls) -> 'BackgroundLoop':
+        """Süreç içinde paylaşılan döngüyü döndürür (kapatılmışsa yenisini oluşturur)."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+                atexit.register(cls._default.close)
+            return cls._default
+
+    def on_close(self, close: Callable[[], Awaitable[Any]]) -> None:
+        """Döngü kapanırken döngüde çalıştırılacak eşyordam fonksiyonunu kaydeder."""
+        with self._lock:
+            self._closers.append(close)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Kayıtlı kapatma eşyordamlarını çalıştırır, döngüyü durdurur ve kapatır.
+
+        Parameters
+        ----------
+        timeout : Optional[float], optional
+            Kapatma eşyordamları için en fazla bekleme süresi (saniye),
+            by default 5.0
+        """
+        cls = type(self)
+        with cls._default_lock:
+            if cls._default is self:
+                cls._default = None
+        with self._lock:
+            closers, self._closers = self._closers, []
+        if self.loop.is_closed():
+            return
+
+        if closers:
+            async def close_all() -> None:
+                await asyncio.gather(*(close() for close in closers), return_exceptions=True)
+
+            try:
+                self.run(close_all(), timeout)
+            except concurrent.futures.TimeoutError:
+                logging.getLogger(__name__).warning("Arka plan döngüsü kapatılırken oturumlar zamanında kapanmadı.")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+        if not self._thread.is_alive():
+            self.loop.close()
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """
+        Eşyordamı döngüde çalıştırır ve sonucunu bekler.
+
+        Parameters
+        ----------
+        coro : Awaitable[Any]
+            Çalıştırılacak eşyordam
+        timeout : Optional[float], optional
+            En fazla bekleme süresi (saniye), by default None
+
+        Returns
+        -------
+        Any
+            Eşyordamın sonucu
+
+        Raises
+        ------
+        concurrent.futures.TimeoutError
+            Süre dolduğunda (eşyordam iptal edilir)
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
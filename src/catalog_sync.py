@@ -0,0 +1,449 @@
+"""
+TMDB kataloğunu discover/changes uç noktalarından kaldığı yerden devam edebilen toplu senkronizasyonla güncelleyen iş.
+
+Kullanım:
+    python -m src.catalog_sync discover --start-year 2017
+    python -m src.catalog_sync changes --since 2026-10-01
+"""
+import argparse
+import asyncio
+import datetime as dt
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import aiohttp
+
+from .async_api_client import AsyncTMDBClient
+from .tmdb_normalizer import normalize_movie, records_frame
+
+# Bir turda birlikte çekilen ve ardından kontrol noktasına yazılan film sayısı
+SYNC_BATCH_SIZE = 50
+
+# Ara dosyanın katalog parçasına dönüştürüldüğü film sayısı
+SYNC_SHARD_SIZE = 1000
+
+# discover ile alınan filmler için en az oy sayısı
+SYNC_MIN_VOTES = 50
+
+# TMDB'nin discover için döndürdüğü en fazla sayfa ve changes için en uzun aralık
+TMDB_MAX_PAGES = 500
+TMDB_CHANGES_WINDOW_DAYS = 14
+
+CHECKPOINT_FILE = 'checkpoint.json'
+STAGING_FILE = 'staging.jsonl'
+SHARD_PATTERN = 'shard-*.parquet'
+
+logger = logging.getLogger(__name__)
+
+
+def catalog_shard_paths(catalog_dir: str) -> List[Path]:
+    """
+    Tamamlanmış katalog parçalarını yazılma sırasıyla döndürür.
+
+    Parameters
+    ----------
+    catalog_dir : str
+        Senkronizasyon dizini
+
+    Returns
+    -------
+    List[Path]
+        Parça dosyaları; sonraki parçalar öncekilerin üzerine yazar
+    """
+    return sorted(Path(catalog_dir).glob(SHARD_PATTERN))
+
+
+class CatalogSync:
+    """
+    TMDB'den yeni veya değişmiş filmleri çekip DataLoader'ın okuduğu
+    katalog parçalarına yazan, kesintiden sonra kaldığı yerden devam eden
+    senkronizasyon işi.
+
+    Bir çalıştırma iki aşamadan oluşur. Önce listeleme birimleri (discover
+    için yıllar, changes için en fazla 14 günlük aralıklar) sayfa sayfa
+    gezilir ve bulunan film ID'leri bekleyenler listesine eklenir; sonra
+    bekleyen filmler append_to_response ile film başına tek istekte,
+    batch_size'lık turlarla eşzamanlı çekilir. İstemcinin bağlantı havuzu
+    aynı anda açık istek sayısını sınırlar.
+
+    Alınamayan filmler (404 dışındaki hatalar) bir sonraki çalıştırmanın
+    bekleyenler listesine taşınır; changes için son senkronize gün, hatalı
+    filmi bulunan ilk aralığın ötesine ilerletilmez.
+
+    İlerleme her sayfa penceresinden ve her turdan sonra kontrol noktası
+    dosyasına atomik olarak yazılır. Çekilen filmler önce ara dosyaya
+    eklenir ve shard_size'a ulaşınca Parquet parçasına dönüştürülür. İş
+    yarıda kesilirse yeniden başlatıldığında listelenmiş sayfalar ve
+    tamamlanmış turlardaki filmler tekrar istenmez; yalnızca kesinti
+    anında süren turun filmleri yeniden çekilir.
+
+    Attributes
+    ----------
+    client : AsyncTMDBClient
+        TMDB istemcisi
+    catalog_dir : Path
+        Kontrol noktası, ara dosya ve parçaların dizini
+    language : str
+        Detayların dili
+    batch_size : int
+        Bir turda çekilen film sayısı
+    shard_size : int
+        Ara dosyanın parçaya dönüştürüldüğü film sayısı
+    min_votes : int
+        discover için en az oy sayısı
+    known_ids : Optional[Set[int]]
+        changes ile yalnızca bu filmler güncellenir; None ise tüm değişenler
+    logger : logging.Logger
+        Loglama için logger nesnesi
+    """
+
+    def __init__(
+        self,
+        client: AsyncTMDBClient,
+        catalog_dir: str,
+        language: str = 'en-US',
+        batch_size: int = SYNC_BATCH_SIZE,
+        shard_size: int = SYNC_SHARD_SIZE,
+        min_votes: int = SYNC_MIN_VOTES,
+        known_ids: Optional[Iterable[int]] = None
+    ):
+        """
+        CatalogSync sınıfının başlatıcı metodu.
+
+        Parameters
+        ----------
+        client : AsyncTMDBClient
+            TMDB istemcisi (testlerde yerel sunucuya bağlı)
+        catalog_dir : str
+            Kontrol noktası, ara dosya ve parçaların dizini
+        language : str, optional
+            Detayların dili, by default 'en-US'
+        batch_size : int, optional
+            Bir turda çekilen film sayısı, by default SYNC_BATCH_SIZE
+        shard_size : int, optional
+            Ara dosyanın parçaya dönüştürüldüğü film sayısı (bir parça en
+            fazla bir tur kadar büyük olabilir), by default SYNC_SHARD_SIZE
+        min_votes : int, optional
+            discover için en az oy sayısı, by default SYNC_MIN_VOTES
+        known_ids : Optional[Iterable[int]], optional
+            changes ile güncellenecek katalog filmleri, by default None
+        """
+        self.client = client
+        self.catalog_dir = Path(catalog_dir)
+        self.language = language
+        self.batch_size = batch_size
+        self.shard_size = shard_size
+        self.min_votes = min_votes
+        self.known_ids = set(int(i) for i in known_ids) if known_ids is not None else None
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def checkpoint_path(self) -> Path:
+        return self.catalog_dir / CHECKPOINT_FILE
+
+    @property
+    def staging_path(self) -> Path:
+        return self.catalog_dir / STAGING_FILE
+
+    async def sync_discover(self, start_year: int, end_year: Optional[int] = None) -> int:
+        """
+        Yıllara bölünmüş discover sorgularıyla kataloğu doldurur.
+
+        TMDB bir sorgu için en fazla 500 sayfa döndürdüğünden her çıkış
+        yılı ayrı bir listeleme birimidir.
+
+        Parameters
+        ----------
+        start_year : int
+            İlk çıkış yılı
+        end_year : Optional[int], optional
+            Son çıkış yılı, by default None (bu yıl)
+
+        Returns
+        -------
+        int
+            Parçalara yazılan film sayısı
+        """
+        end_year = end_year or dt.date.today().year
+        units = [
+            {
+                'key': f'discover:{year}',
+                'endpoint': 'discover',
+                'params': {
+                    'primary_release_year': year,
+                    'sort_by': 'popularity.desc',
+                    'vote_count.gte': self.min_votes,
+                    'include_adult': 'false',
+                    'include_video': 'false',
+                },
+            }
+            for year in range(start_year, end_year + 1)
+        ]
+        return await self._sync('discover', units)
+
+    async def sync_changes(self, since: Optional[dt.date] = None, until: Optional[dt.date] = None) -> int:
+        """
+        Son senkronizasyondan bu yana değişen filmleri günceller.
+
+        Parameters
+        ----------
+        since : Optional[dt.date], optional
+            Başlangıç tarihi, by default None (son tamamlanan çalıştırmanın
+            eksiksiz kapsadığı son gün)
+        until : Optional[dt.date], optional
+            Bitiş tarihi, by default None (bugün)
+
+        Returns
+        -------
+        int
+            Parçalara yazılan film sayısı
+
+        Raises
+        ------
+        ValueError
+            since verilmediğinde ve daha önce tamamlanmış bir çalıştırma yoksa
+        """
+        if since is None:
+            last_synced = (self._load_checkpoint() or {}).get('last_synced')
+            if last_synced is None:
+                raise ValueError("İlk changes senkronizasyonu için başlangıç tarihi (since) verilmelidir.")
+            since = dt.date.fromisoformat(last_synced)
+        until = until or dt.date.today()
+
+        units = []
+        start = since
+        while start <= until:
+            end = min(until, start + dt.timedelta(days=TMDB_CHANGES_WINDOW_DAYS - 1))
+            units.append({
+                'key': f'changes:{start.isoformat()}:{end.isoformat()}',
+                'endpoint': 'changes',
+                'params': {'start_date': start.isoformat(), 'end_date': end.isoformat()},
+            })
+            start = end + dt.timedelta(days=1)
+        return await self._sync('changes', units)
+
+    async def _sync(self, mode: str, units: List[Dict[str, Any]]) -> int:
+        """Yarım kalan çalıştırmayı tamamlar, ardından yeni çalıştırmayı başlatır."""
+        checkpoint = self._load_checkpoint()
+        written = 0
+        if checkpoint is not None and not checkpoint['completed']:
+            if checkpoint['mode'] == mode and [u['key'] for u in checkpoint['units']] == [u['key'] for u in units]:
+                self.logger.info(f"Yarım kalan {mode} senkronizasyonu kaldığı yerden sürdürülüyor.")
+                return await self._run(checkpoint)
+            self.logger.info(f"Önce yarım kalan {checkpoint['mode']} senkronizasyonu tamamlanıyor.")
+            written += await self._run(checkpoint)
+            checkpoint = self._load_checkpoint()
+
+        checkpoint = {
+            'mode': mode,
+            'started_at': dt.date.today().isoformat(),
+            'completed': False,
+            'units': [{**unit, 'next_page': 1, 'total_pages': None, 'movie_ids': []} for unit in units],
+            # Önceki çalıştırmada alınamayan filmler yeniden denenir
+            'pending_ids': list((checkpoint or {}).get('failed_ids', [])),
+            'done_ids': [],
+            'failed_ids': [],
+            'shard_seq': (checkpoint or {}).get('shard_seq', 0),
+            'last_synced': (checkpoint or {}).get('last_synced'),
+        }
+        self._save_checkpoint(checkpoint)
+        return written + await self._run(checkpoint)
+
+    async def _run(self, checkpoint: Dict[str, Any]) -> int:
+        """Listeleme ve çekme aşamalarını kontrol noktasından devam ettirir."""
+        self.catalog_dir.mkdir(parents=True, exist_ok=True)
+        # Ara dosyaya yazılmış ama kontrol noktasına geçmemiş filmler tekrar çekilmez
+        staged = self._staged_ids()
+        done = set(checkpoint['done_ids']) | staged
+        checkpoint['pending_ids'] = [i for i in checkpoint['pending_ids'] if i not in done]
+        checkpoint['pending_ids'].extend(i for i in checkpoint.pop('failed_ids', []) if i not in done)
+        checkpoint['failed_ids'] = []
+        checkpoint['done_ids'] = sorted(done)
+
+        for unit in checkpoint['units']:
+            await self._list_unit(checkpoint, unit)
+
+        written = 0
+        while checkpoint['pending_ids']:
+            batch = checkpoint['pending_ids'][:self.batch_size]
+            written += await self._fetch_batch(checkpoint, batch)
+
+        self._roll_staging(checkpoint, force=True)
+        checkpoint['completed'] = True
+        checkpoint['last_synced'] = self._last_synced(checkpoint)
+        self._save_checkpoint(checkpoint)
+        self.logger.info(
+            f"{checkpoint['mode']} senkronizasyonu tamamlandı: {written} film yazıldı, "
+            f"{len(checkpoint['failed_ids'])} film alınamadı."
+        )
+        return written
+
+    @staticmethod
+    def _last_synced(checkpoint: Dict[str, Any]) -> Optional[str]:
+        """
+        Tamamlanan çalıştırmadan sonra changes'in başlayacağı günü belirler.
+
+        changes için son aralığın bitiş günüdür; bir aralıkta alınamayan
+        film varsa o aralığın başlangıç günüdür, böylece aralık sonraki
+        çalıştırmada yeniden listelenir. discover çalıştırmaları başladıkları
+        günü kaydeder.
+        """
+        if checkpoint['mode'] != 'changes':
+            return checkpoint['started_at']
+        failed = set(checkpoint['failed_ids'])
+        last_synced = checkpoint.get('last_synced')
+        for unit in checkpoint['units']:
+            if failed.intersection(unit.get('movie_ids', ())):
+                return unit['params']['start_date']
+            last_synced = unit['params']['end_date']
+        return last_synced
+
+    async def _list_unit(self, checkpoint: Dict[str, Any], unit: Dict[str, Any]) -> None:
+        """Bir listeleme biriminin kalan sayfalarını havuz boyutunda pencerelerle gezer."""
+        while unit['total_pages'] is None or unit['next_page'] <= unit['total_pages']:
+            if unit['total_pages'] is None:
+                pages = [unit['next_page']]
+            else:
+                last = min(unit['total_pages'], unit['next_page'] + self.client.pool_size - 1)
+                pages = list(range(unit['next_page'], last + 1))
+
+            responses = await asyncio.gather(*(self._list_page(unit, page) for page in pages))
+
+            known = set(checkpoint['pending_ids']) | set(checkpoint['done_ids'])
+            for response in responses:
+                for item in response.get('results', []):
+                    movie_id = item.get('id')
+                    if movie_id is None or item.get('adult') or movie_id in known:
+                        continue
+                    if unit['endpoint'] == 'changes' and self.known_ids is not None and movie_id not in self.known_ids:
+                        continue
+                    checkpoint['pending_ids'].append(movie_id)
+                    unit.setdefault('movie_ids', []).append(movie_id)
+                    known.add(movie_id)
+
+            unit['total_pages'] = min(TMDB_MAX_PAGES, responses[0].get('total_pages') or 0)
+            unit['next_page'] = pages[-1] + 1
+            self._save_checkpoint(checkpoint)
+        self.logger.info(f"{unit['key']} listelendi ({unit['total_pages']} sayfa).")
+
+    async def _list_page(self, unit: Dict[str, Any], page: int) -> Dict[str, Any]:
+        if unit['endpoint'] == 'discover':
+            return await self.client.discover_movies(page, **unit['params'])
+        return await self.client.get_movie_changes(page=page, **unit['params'])
+
+    async def _fetch_batch(self, checkpoint: Dict[str, Any], batch: List[int]) -> int:
+        """Bir turu çeker, ara dosyaya ekler ve kontrol noktasını günceller."""
+        results = await self.client.get_movie_bundles_many(batch, self.language, use_cache=False)
+
+        rows = []
+        for movie_id, result in zip(batch, results):
+            if isinstance(result, aiohttp.ClientResponseError) and result.status == 404:
+                # TMDB'den silinmiş filmler tekrar denenmez
+                self.logger.info(f"Film {movie_id} TMDB'de bulunamadı, atlanıyor.")
+            elif isinstance(result, BaseException):
+                self.logger.warning(f"Film {movie_id} alınamadı, sonraki çalıştırmada tekrar denenecek: {result!r}")
+                checkpoint['failed_ids'].append(movie_id)
+            else:
+                rows.append(normalize_movie(result))
+
+        if rows:
+            with open(self.staging_path, 'a', encoding='utf-8') as f:
+                f.writelines(json.dumps(row) + '\n' for row in rows)
+                f.flush()
+                os.fsync(f.fileno())
+
+        finished = set(batch)
+        checkpoint['pending_ids'] = [i for i in checkpoint['pending_ids'] if i not in finished]
+        checkpoint['done_ids'].extend(i for i in batch if i not in checkpoint['failed_ids'])
+        self._roll_staging(checkpoint)
+        self._save_checkpoint(checkpoint)
+        return len(rows)
+
+    def _roll_staging(self, checkpoint: Dict[str, Any], force: bool = False) -> None:
+        """Ara dosya shard_size'a ulaştıysa (veya force ise) yeni bir parçaya dönüştürür."""
+        rows = self._read_staging()
+        if not rows or (len(rows) < self.shard_size and not force):
+            return
+
+        checkpoint['shard_seq'] += 1
+        shard_path = self.catalog_dir / f"shard-{checkpoint['shard_seq']:06d}.parquet"
+        tmp_path = shard_path.with_suffix('.parquet.tmp')
+        records_frame(rows).to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, shard_path)
+        # Parça yazıldıktan sonra kesilirse aynı satırlar sonraki parçaya tekrar yazılır; yenisi kazanır
+        self._save_checkpoint(checkpoint)
+        self.staging_path.unlink()
+        self.logger.info(f"{shard_path.name} yazıldı ({len(rows)} film).")
+
+    def _read_staging(self) -> List[Dict[str, Any]]:
+        if not self.staging_path.exists():
+            return []
+        rows = []
+        with open(self.staging_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    rows.append(json.loads(line))
+                except ValueError:
+                    # Yazılırken kesilen son satır atlanır; film tekrar çekilir
+                    self.logger.warning("Ara dosyada yarım satır atlandı.")
+        return rows
+
+    def _staged_ids(self) -> Set[int]:
+        return {row['movie_id'] for row in self._read_staging()}
+
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self.checkpoint_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+    def _save_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        """Kontrol noktasını geçici dosya üzerinden atomik olarak yazar."""
+        self.catalog_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_suffix('.json.tmp')
+        tmp_path.write_text(json.dumps(checkpoint), encoding='utf-8')
+        os.replace(tmp_path, self.checkpoint_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('mode', choices=('discover', 'changes'))
+    parser.add_argument('--data-dir', default=None)
+    parser.add_argument('--start-year', type=int, default=dt.date.today().year)
+    parser.add_argument('--end-year', type=int, default=None)
+    parser.add_argument('--since', type=dt.date.fromisoformat, default=None)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--batch-size', type=int, default=SYNC_BATCH_SIZE)
+    parser.add_argument('--shard-size', type=int, default=SYNC_SHARD_SIZE)
+    parser.add_argument('--min-votes', type=int, default=SYNC_MIN_VOTES)
+    args = parser.parse_args()
+
+    from .data_loader import DataLoader
+
+    logging.basicConfig(level=logging.INFO)
+    data_loader = DataLoader(args.data_dir)
+    known_ids = None
+    if args.mode == 'changes':
+        # Yeni filmler discover ile gelir; changes yalnızca katalogdaki filmleri günceller
+        known_ids = data_loader.load_preprocessed_data()['movie_id'].tolist()
+
+    async def run() -> int:
+        async with AsyncTMDBClient(pool_size=args.concurrency) as client:
+            sync = CatalogSync(
+                client, data_loader.catalog_dir,
+                batch_size=args.batch_size, shard_size=args.shard_size,
+                min_votes=args.min_votes, known_ids=known_ids
+            )
+            if args.mode == 'discover':
+                return await sync.sync_discover(args.start_year, args.end_year)
+            return await sync.sync_changes(args.since)
+
+    written = asyncio.run(run())
+    logger.info(f"Senkronizasyon bitti: {written} film. Katalog bir sonraki yüklemede yeniden oluşturulacak.")
+
+
+if __name__ == '__main__':
+    main()
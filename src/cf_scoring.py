@@ -0,0 +1,308 @@
+"""
+Eğitilmiş gizli faktör modellerinden işbirlikçi filtreleme skorlarını vektörel olarak hesaplayan sınıf.
+"""
+import logging
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from .neighbor_index import top_k
+from .ratings_store import RatingsMatrix
+
+# Toplu puanlamada tek seferde işlenen kullanıcı sayısı
+SCORING_BATCH_USERS = 256
+
+
+class LatentFactorScorer:
+    """
+    Kullanıcı ve öğe faktör matrisleri ile sapmalarından tahmini puanları
+    tek bir matris çarpımıyla hesaplayan sınıf.
+
+    r̂_ui = mu + b_u + b_i + p_u · q_i
+
+    surprise.SVD.predict ile aynı sonucu verir: bilinmeyen kullanıcılar için
+    b_u ve p_u · q_i terimleri, bilinmeyen öğeler için b_i ve p_u · q_i
+    terimleri atlanır; tahminler puan ölçeğine kırpılır.
+
+    Attributes
+    ----------
+    global_mean : float
+        Tüm puanların ortalaması (mu)
+    user_factors : np.ndarray
+        (n_users, n_factors) boyutlu kullanıcı faktörleri
+    item_factors : np.ndarray
+        (n_items, n_factors) boyutlu öğe faktörleri
+    user_biases : np.ndarray
+        (n_users,) boyutlu kullanıcı sapmaları
+    item_biases : np.ndarray
+        (n_items,) boyutlu öğe sapmaları
+    user_ids : pd.Index
+        Faktör satırlarına karşılık gelen ham kullanıcı ID'leri
+    item_ids : pd.Index
+        Faktör satırlarına karşılık gelen ham öğe ID'leri
+    rating_scale : Optional[Tuple[float, float]]
+        Tahminlerin kırpıldığı puan aralığı; None ise kırpılmaz
+    rated : Optional[Union[sparse.csr_matrix, RatingsMatrix]]
+        (n_users, n_items) boyutlu, kullanıcıların puanladığı öğeler
+    logger : logging.Logger
+        Loglama için logger nesnesi
+    """
+
+    def __init__(
+        self,
+        global_mean: float,
+        user_factors: np.ndarray,
+        item_factors: np.ndarray,
+        user_biases: np.ndarray,
+        item_biases: np.ndarray,
+        user_ids: Sequence,
+        item_ids: Sequence,
+        rating_scale: Optional[Tuple[float, float]] = (1, 5),
+        rated: Optional[Union[sparse.csr_matrix, RatingsMatrix]] = None
+    ):
+        """
+        LatentFactorScorer sınıfının başlatıcı metodu.
+
+        Parameters
+        ----------
+        global_mean : float
+            Tüm puanların ortalaması
+        user_factors : np.ndarray
+            (n_users, n_factors) boyutlu kullanıcı faktörleri
+        item_factors : np.ndarray
+            (n_items, n_factors) boyutlu öğe faktörleri
+        user_biases : np.ndarray
+            Kullanıcı sapmaları
+        item_biases : np.ndarray
+            Öğe sapmaları
+        user_ids : Sequence
+            Faktör satırlarının ham kullanıcı ID'leri
+        item_ids : Sequence
+            Faktör satırlarının ham öğe ID'leri
+        rating_scale : Optional[Tuple[float, float]], optional
+            Puan aralığı; None ise tahminler kırpılmaz (örtük geri bildirim),
+            by default (1, 5)
+        rated : Optional[Union[sparse.csr_matrix, RatingsMatrix]], optional
+            Kullanıcıların puanladığı öğeler; öneri üretirken maskelenir.
+            RatingsMatrix verildiğinde yalnızca istenen kullanıcıların
+            satırları okunur, by default None
+        """
+        self.global_mean = float(global_mean)
+        self.user_factors = np.asarray(user_factors, dtype=np.float64)
+        self.item_factors = np.asarray(item_factors, dtype=np.float64)
+        self.user_biases = np.asarray(user_biases, dtype=np.float64)
+        self.item_biases = np.asarray(item_biases, dtype=np.float64)
+        self.user_ids = pd.Index(user_ids)
+        self.item_ids = pd.Index(item_ids)
+        self.rating_scale = rating_scale
+        self.rated = rated
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def from_surprise(cls, model, ratings: Optional[RatingsMatrix] = None) -> 'LatentFactorScorer':
+        """
+        Eğitilmiş surprise.SVD modelinden puanlayıcı oluşturur.
+
+        Parameters
+        ----------
+        model : surprise.SVD
+            fit() ile eğitilmiş model
+        ratings : Optional[RatingsMatrix], optional
+            Model, RatingsMatrix.to_frame(raw_ids=False) ile yoğun kodlar
+            üzerinde eğitildiyse ilgili puan matrisi. Verildiğinde faktörler
+            matrisin kod sırasına dizilir, ham ID'ler ve puanlanmış öğeler
+            matristen alınır, by default None
+
+        Returns
+        -------
+        LatentFactorScorer
+            Modelin faktörlerini ve eğitim kümesindeki puanlanmış öğeleri
+            içeren puanlayıcı
+
+        Raises
+        ------
+        ValueError
+            Model sapma terimleri olmadan eğitildiğinde
+        """
+        if not model.biased:
+            raise ValueError("Yalnızca sapmalı (biased=True) SVD modelleri desteklenir.")
+        trainset = model.trainset
+        if ratings is not None:
+            user_order = [trainset.to_inner_uid(u) for u in range(ratings.n_users)]
+            item_order = [trainset.to_inner_iid(i) for i in range(ratings.n_items)]
+            return cls(
+                trainset.global_mean,
+                model.pu[user_order], model.qi[item_order],
+                model.bu[user_order], model.bi[item_order],
+                ratings.user_ids, ratings.item_ids, trainset.rating_scale, ratings
+            )
+
+        user_ids = [trainset.to_raw_uid(u) for u in range(trainset.n_users)]
+        item_ids = [trainset.to_raw_iid(i) for i in range(trainset.n_items)]
+
+        # Eğitim kümesindeki (kullanıcı, öğe) çiftleri iç ID'lerle CSR'a dönüştürülür
+        indptr = np.zeros(trainset.n_users + 1, dtype=np.int64)
+        np.cumsum([len(trainset.ur[u]) for u in range(trainset.n_users)], out=indptr[1:])
+        indices = np.fromiter(
+            (i for u in range(trainset.n_users) for i, _ in trainset.ur[u]),
+            dtype=np.int32, count=indptr[-1]
+        )
+        rated = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=bool), indices, indptr),
+            shape=(trainset.n_users, trainset.n_items)
+        )
+
+        return cls(
+            trainset.global_mean, model.pu, model.qi, model.bu, model.bi,
+            user_ids, item_ids, trainset.rating_scale, rated
+        )
+
+    @property
+    def n_users(self) -> int:
+        return self.user_factors.shape[0]
+
+    @property
+    def n_items(self) -> int:
+        return self.item_factors.shape[0]
+
+    def score_users(self, users: Sequence) -> np.ndarray:
+        """
+        Kullanıcıların tüm öğeler için tahmini puanlarını hesaplar.
+
+        Parameters
+        ----------
+        users : Sequence
+            Ham kullanıcı ID'leri
+
+        Returns
+        -------
+        np.ndarray
+            (len(users), n_items) boyutlu, puan ölçeğine kırpılmış tahminler
+        """
+        rows = self.user_ids.get_indexer(list(users))
+        return self._score_rows(rows)
+
+    def predict(self, user, items: Sequence) -> np.ndarray:
+        """
+        Bir kullanıcının verilen öğeler için tahmini puanlarını hesaplar.
+
+        Parameters
+        ----------
+        user
+            Ham kullanıcı ID'si
+        items : Sequence
+            Ham öğe ID'leri
+
+        Returns
+        -------
+        np.ndarray
+            (len(items),) boyutlu tahminler
+        """
+        items = list(items)
+        return self.predict_pairs([user] * len(items), items)
+
+    def predict_pairs(self, users: Sequence, items: Sequence) -> np.ndarray:
+        """
+        (kullanıcı, öğe) çiftlerinin tahmini puanlarını hesaplar.
+
+        Parameters
+        ----------
+        users : Sequence
+            Ham kullanıcı ID'leri
+        items : Sequence
+            Ham öğe ID'leri (users ile aynı uzunlukta)
+
+        Returns
+        -------
+        np.ndarray
+            (len(users),) boyutlu tahminler
+        """
+        rows = self.user_ids.get_indexer(list(users))
+        cols = self.item_ids.get_indexer(list(items))
+        known_users, known_items = rows >= 0, cols >= 0
+        safe_rows = np.where(known_users, rows, 0)
+        safe_cols = np.where(known_items, cols, 0)
+
+        scores = np.full(len(cols), self.global_mean)
+        scores += np.where(known_users, self.user_biases[safe_rows], 0.0)
+        scores += np.where(known_items, self.item_biases[safe_cols], 0.0)
+        dots = np.einsum('ij,ij->i', self.user_factors[safe_rows], self.item_factors[safe_cols])
+        scores += np.where(known_users & known_items, dots, 0.0)
+        return self._clip(scores)
+
+    def recommend(
+        self,
+        users: Sequence,
+        n: int = 10,
+        exclude_rated: bool = True,
+        batch_size: int = SCORING_BATCH_USERS
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Kullanıcılar için puanlamadıkları en yüksek tahminli n öğeyi seçer.
+
+        Parameters
+        ----------
+        users : Sequence
+            Ham kullanıcı ID'leri
+        n : int, optional
+            Kullanıcı başına önerilecek öğe sayısı, by default 10
+        exclude_rated : bool, optional
+            Kullanıcının puanladığı öğelerin dışlanıp dışlanmayacağı,
+            by default True
+        batch_size : int, optional
+            Tek seferde puanlanan kullanıcı sayısı, by default SCORING_BATCH_USERS
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            (len(users), n) boyutlu ham öğe ID'leri ve tahminler. Önerilecek
+            yeterli öğe kalmadığında ilgili skorlar -inf olur.
+        """
+        rows = self.user_ids.get_indexer(list(users))
+        n = max(0, min(n, self.n_items))
+        item_ids = self.item_ids.to_numpy()
+
+        ids, scores = [], []
+        for start in range(0, len(rows), batch_size):
+            chunk = rows[start:start + batch_size]
+            chunk_scores = self._score_rows(chunk)
+
+            if exclude_rated and self.rated is not None:
+                # Puanlanmış öğeler seçimden çıkarılır
+                known = np.flatnonzero(chunk >= 0)
+                mask = self._rated_rows(chunk[known]).tocoo()
+                chunk_scores[known[mask.row], mask.col] = -np.inf
+
+            cols, values = top_k(chunk_scores, n)
+            ids.append(item_ids[cols])
+            scores.append(values)
+
+        if not ids:
+            return np.empty((0, n), dtype=item_ids.dtype), np.empty((0, n))
+        return np.vstack(ids), np.vstack(scores)
+
+    def _rated_rows(self, rows: np.ndarray) -> sparse.csr_matrix:
+        """Kullanıcı satırlarının puanladığı öğeleri döndürür."""
+        if isinstance(self.rated, RatingsMatrix):
+            return self.rated.user_matrix(rows)
+        return self.rated[rows]
+
+    def _score_rows(self, rows: np.ndarray) -> np.ndarray:
+        """Faktör satırları için tüm öğelerin tahminlerini hesaplar (-1: bilinmeyen)."""
+        known = rows >= 0
+        safe_rows = np.where(known, rows, 0)
+
+        scores = self.user_factors[safe_rows] @ self.item_factors.T
+        scores += self.user_biases[safe_rows][:, np.newaxis]
+        # Bilinmeyen kullanıcılar için yalnızca mu + b_i kullanılır
+        scores[~known] = 0.0
+        scores += self.global_mean + self.item_biases[np.newaxis, :]
+        return self._clip(scores)
+
+    def _clip(self, scores: np.ndarray) -> np.ndarray:
+        """Tahminleri puan ölçeğine yerinde kırpar."""
+        if self.rating_scale is None:
+            return scores
+        return np.clip(scores, *self.rating_scale, out=scores)
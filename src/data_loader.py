@@ -3,10 +3,15 @@ Veri yükleme ve başlangıç veri işleme işlemlerini yöneten sınıf.
 """
 import pandas as pd
 from pathlib import Path
-from typing import Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
 import logging
 import os
 
+from .artifact_store import ArtifactStore
+from .catalog_sync import catalog_shard_paths
+from .preprocessor import Preprocessor
+from .recommendation_table import RecommendationTable
+
 class DataLoader:
     """
     Film verilerini yükleyen ve başlangıç işlemlerini gerçekleştiren sınıf.
@@ -15,6 +20,8 @@ class DataLoader:
     ----------
     data_dir : Path
         Veri dosyalarının bulunduğu dizin
+    artifact_store : ArtifactStore
+        Ön işlenmiş veri setlerinin saklandığı artefakt deposu
     logger : logging.Logger
         Loglama için logger nesnesi
     """
@@ -35,8 +42,34 @@ class DataLoader:
             self.data_dir = project_root / "data"
         else:
             self.data_dir = Path(data_dir)
+        self.artifact_store = ArtifactStore(self.data_dir / "artifacts")
         self.logger = logging.getLogger(__name__)
         
+    @property
+    def movie_source_paths(self) -> Tuple[Path, Path]:
+        """Film ve kredi CSV dosyalarının yolları."""
+        return self.data_dir / "tmdb_5000_movies.csv", self.data_dir / "tmdb_5000_credits.csv"
+
+    @property
+    def catalog_dir(self) -> Path:
+        """TMDB senkronizasyonunun kontrol noktası ve katalog parçalarının dizini."""
+        return self.data_dir / "catalog"
+
+    @property
+    def catalog_sources(self) -> List[Path]:
+        """Kataloğu oluşturan kaynak CSV dosyaları ve senkronize edilmiş parçalar."""
+        return list(self.movie_source_paths) + catalog_shard_paths(self.catalog_dir)
+
+    @property
+    def catalog_version(self) -> str:
+        """Kaynak dosyalar, katalog parçaları ve ön işleme kodu için güncel katalog sürümü."""
+        return self.artifact_store.compute_key(self.catalog_sources)
+
+    @property
+    def recommendation_table_dir(self) -> Path:
+        """Önceden hesaplanmış öneri tablosunun dizini."""
+        return self.artifact_store.artifact_dir / "recommendations"
+
     def load_movie_data(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Film ve kredi verilerini yükler.
@@ -52,8 +85,7 @@ class DataLoader:
             Veri dosyaları bulunamadığında
         """
         try:
-            movies_path = self.data_dir / "tmdb_5000_movies.csv"
-            credits_path = self.data_dir / "tmdb_5000_credits.csv"
+            movies_path, credits_path = self.movie_source_paths
             
             if not movies_path.exists():
                 raise FileNotFoundError(f"Film veri dosyası bulunamadı: {movies_path}")
@@ -111,6 +143,107 @@ class DataLoader:
             self.logger.error(f"Veri birleştirme hatası: {str(e)}")
             raise
             
+    def apply_catalog_shards(self, merged_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        TMDB senkronizasyonunun yazdığı katalog parçalarını birleştirilmiş
+        veri setinin üzerine uygular.
+        
+        Yeni filmler eklenir, değişmiş filmler güncellenir; bir film birden
+        çok kaynakta varsa en son yazılan parçadaki satır kullanılır. Filmler
+        ilk göründükleri sırada kalır.
+        
+        Parameters
+        ----------
+        merged_df : pd.DataFrame
+            merge_datasets çıktısı
+            
+        Returns
+        -------
+        pd.DataFrame
+            Güncellenmiş veri seti
+        """
+        shard_paths = catalog_shard_paths(self.catalog_dir)
+        if not shard_paths:
+            return merged_df
+            
+        shards = [pd.read_parquet(path) for path in shard_paths]
+        combined = pd.concat([merged_df, *shards], ignore_index=True)
+        order = pd.unique(combined['movie_id'])
+        latest = combined.drop_duplicates('movie_id', keep='last').set_index('movie_id')
+        result = latest.loc[order].reset_index()[merged_df.columns]
+        
+        self.logger.info(
+            f"{len(shard_paths)} katalog parçası uygulandı "
+            f"({len(result) - len(merged_df)} yeni film, toplam {len(result)})."
+        )
+        return result
+            
+    def load_preprocessed_data(self, use_cache: bool = True, n_jobs: int = 1) -> pd.DataFrame:
+        """
+        Birleştirilmiş ve ön işlenmiş film veri setini yükler.
+
+        Kaynak CSV dosyaları, katalog parçaları ve ön işleme kodu
+        değişmediyse veri seti artefakt deposundan okunur; aksi halde
+        yeniden hesaplanıp kaydedilir.
+
+        Parameters
+        ----------
+        use_cache : bool, optional
+            Artefakt deposunun kullanılıp kullanılmayacağı, by default True
+        n_jobs : int, optional
+            Ön işleme için süreç sayısı, by default 1 (seri)
+
+        Returns
+        -------
+        pd.DataFrame
+            Ön işlenmiş veri seti
+
+        Raises
+        ------
+        FileNotFoundError
+            Veri dosyaları bulunamadığında
+        """
+        def build() -> pd.DataFrame:
+            movies_df, credits_df = self.load_movie_data()
+            merged_df = self.apply_catalog_shards(self.merge_datasets(movies_df, credits_df))
+            return Preprocessor(n_jobs=n_jobs).preprocess_data(merged_df)
+
+        try:
+            if not use_cache:
+                return build()
+
+            for path in self.movie_source_paths:
+                if not path.exists():
+                    raise FileNotFoundError(f"Veri dosyası bulunamadı: {path}")
+
+            return self.artifact_store.load_or_build(
+                "processed_movies", self.catalog_sources, build
+            )
+
+        except Exception as e:
+            self.logger.error(f"Ön işlenmiş veri yükleme hatası: {str(e)}")
+            raise
+
+    def load_recommendation_table(self) -> Optional[RecommendationTable]:
+        """
+        Önceden hesaplanmış öneri tablosunu güncelse açar.
+
+        Returns
+        -------
+        Optional[RecommendationTable]
+            Tablo güncel katalog sürümüyle oluşturulduysa tablo, aksi halde None
+        """
+        try:
+            table = RecommendationTable(self.recommendation_table_dir)
+        except (FileNotFoundError, ValueError) as e:
+            self.logger.info(f"Öneri tablosu kullanılamıyor: {str(e)}")
+            return None
+
+        if table.catalog_version != self.catalog_version:
+            self.logger.warning("Öneri tablosu eskimiş, yeniden oluşturulmalı.")
+            return None
+        return table
+
     def load_user_data(self) -> pd.DataFrame:
         """
         Kullanıcı verilerini yükler.
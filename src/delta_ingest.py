@@ -0,0 +1,338 @@
+"""
+Yeni filmleri benzerlik indekslerini yeniden oluşturmadan kataloğa ekleyen artımlı alım ve sözlük kaymasında tam yeniden oluşturma.
+"""
+import logging
+import threading
+import uuid
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .feature_engineer import FeatureEngineer
+from .neighbor_index import NeighborIndex
+from .precompute import TABLE_NEIGHBORS, write_recommendation_tables
+from .preprocessor import Preprocessor
+from .recommendation_table import RecommendationTable
+from .recommender import HYBRID_CANDIDATES, HybridWeights
+from .similarity_builder import BlockwiseSimilarityBuilder
+
+# Alınan filmlerde sözlükte bulunmayan terim oranı bu eşiği aşınca tam
+# yeniden oluşturma gerekir
+MAX_OOV_RATE = 0.05
+
+# Son tam oluşturmadan bu yana eklenen veya değişen filmlerin oranı bu eşiği
+# aşınca IDF ağırlıkları ve sözlük bayatlamış sayılır
+MAX_GROWTH = 0.10
+
+# Planlanmış yeniden oluşturmanın kaymayı kontrol etme aralığı (saniye)
+REBUILD_CHECK_INTERVAL = 3600
+
+
+class DriftStats(NamedTuple):
+    """Son tam oluşturmadan bu yana yapılan artımlı alımların özeti."""
+    base_rows: int
+    added: int
+    changed: int
+    overview_oov_rate: float
+    content_oov_rate: float
+
+    @property
+    def growth(self) -> float:
+        """Eklenen ve değişen filmlerin tam oluşturmadaki kataloğa oranı."""
+        return (self.added + self.changed) / max(self.base_rows, 1)
+
+
+class DeltaResult(NamedTuple):
+    """Bir ingest çağrısının sonucu."""
+    added: int
+    changed: int
+    patched_overview: int
+    patched_metadata: int
+    overview_oov_rate: float
+    content_oov_rate: float
+
+
+class DeltaIngestor:
+    """
+    Ön işlenmiş kataloğu ve komşu indekslerini tutan, yeni filmleri tam
+    yeniden oluşturma yapmadan ekleyen sınıf.
+
+    Yalnızca yeni satırlar ön işlenir ve son tam oluşturmada eğitilen
+    (dondurulmuş) TF-IDF ve içerik sözlükleriyle vektörleştirilir.
+    Komşuları mevcut indekse karşı hesaplanır ve yeni filmin girdiği
+    mevcut top-K listeleri yerinde güncellenir (NeighborIndex.add_rows).
+
+    Dondurulmuş sözlükler yeni terimleri yok sayar ve IDF ağırlıkları eski
+    kataloğa göre kalır. Bu kayma OOV oranı ve katalog büyümesiyle izlenir;
+    eşikler aşıldığında needs_rebuild True olur ve rebuild (veya
+    start_scheduled_rebuild ile planlanmış iş) her şeyi yeniden eğitir.
+    Zaten katalogda olan filmlerin satırları güncellenir, ancak özellik
+    vektörleri tam yeniden oluşturmaya kadar eski kalır.
+
+    Attributes
+    ----------
+    movies_df : pd.DataFrame
+        İndeks satırlarıyla hizalı ön işlenmiş katalog
+    overview_index : NeighborIndex
+        Özet (TF-IDF) komşu indeksi
+    metadata_index : NeighborIndex
+        İçerik (meta veri) komşu indeksi
+    feature_engineer : FeatureEngineer
+        Dondurulmuş vektörleştiricileri tutan nesne
+    drift : DriftStats
+        Son tam oluşturmadan bu yana kayma özeti
+    logger : logging.Logger
+        Loglama için logger nesnesi
+    """
+
+    def __init__(
+        self,
+        movies_df: pd.DataFrame,
+        k: int = HYBRID_CANDIDATES,
+        similarity_builder: Optional[BlockwiseSimilarityBuilder] = None,
+        preprocessor: Optional[Preprocessor] = None,
+        max_oov_rate: float = MAX_OOV_RATE,
+        max_growth: float = MAX_GROWTH
+    ):
+        """
+        DeltaIngestor sınıfının başlatıcı metodu; indeksleri tam olarak
+        oluşturur.
+
+        Parameters
+        ----------
+        movies_df : pd.DataFrame
+            Ön işlenmiş katalog (DataLoader.load_preprocessed_data çıktısı)
+        k : int, optional
+            Film başına saklanacak komşu sayısı, by default HYBRID_CANDIDATES
+        similarity_builder : Optional[BlockwiseSimilarityBuilder], optional
+            Benzerlik hesaplamasını yürütecek nesne, by default None
+        preprocessor : Optional[Preprocessor], optional
+            Yeni satırları ön işleyecek nesne, by default None
+        max_oov_rate : float, optional
+            Tam yeniden oluşturmayı gerektiren OOV oranı, by default MAX_OOV_RATE
+        max_growth : float, optional
+            Tam yeniden oluşturmayı gerektiren katalog büyümesi,
+            by default MAX_GROWTH
+        """
+        self.k = k
+        self.similarity_builder = similarity_builder or BlockwiseSimilarityBuilder()
+        self.preprocessor = preprocessor or Preprocessor()
+        self.max_oov_rate = max_oov_rate
+        self.max_growth = max_growth
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.RLock()
+        self._rebuild_lock = threading.Lock()
+        self._rebuild_thread = None
+        self._rebuild_stop = threading.Event()
+        self._changed_total = 0
+
+        self.movies_df = movies_df.reset_index(drop=True)
+        self.feature_engineer, self.overview_index, self.metadata_index = self._build(self.movies_df)
+        self.drift = DriftStats(len(self.movies_df), 0, 0, 0.0, 0.0)
+
+    @property
+    def needs_rebuild(self) -> bool:
+        """Kayma eşiklerinden biri aşıldıysa True."""
+        drift = self.drift
+        return (
+            drift.overview_oov_rate > self.max_oov_rate
+            or drift.content_oov_rate > self.max_oov_rate
+            or drift.growth > self.max_growth
+        )
+
+    def ingest(self, merged_df: pd.DataFrame) -> DeltaResult:
+        """
+        Yeni veya değişmiş filmleri kataloğa artımlı olarak alır.
+
+        Parameters
+        ----------
+        merged_df : pd.DataFrame
+            merge_datasets çıktısıyla aynı biçimde ham satırlar (ör.
+            tmdb_normalizer.records_frame çıktısı veya bir katalog parçası)
+
+        Returns
+        -------
+        DeltaResult
+            Eklenen/değişen film ve güncellenen komşu listesi sayıları ile
+            yeni filmlerin OOV oranları
+        """
+        with self._lock:
+            batch = merged_df.drop_duplicates('movie_id', keep='last')
+            if batch.empty:
+                return DeltaResult(0, 0, 0, 0, 0.0, 0.0)
+
+            processed = self.preprocessor.preprocess_data(
+                batch.copy(), runtime_fill=self.movies_df['runtime'].mean()
+            ).reindex(columns=self.movies_df.columns).reset_index(drop=True)
+            rows = pd.Series(np.arange(len(self.movies_df)), index=self.movies_df['movie_id'])
+            rows = rows[~rows.index.duplicated()]
+            known = processed['movie_id'].isin(rows.index).to_numpy()
+            changed, new = processed[known], processed[~known]
+
+            patched_overview, patched_metadata, overview_oov, content_oov = self._append(
+                self.feature_engineer, self.overview_index, self.metadata_index, new
+            )
+
+            # Değişen filmler yerinde, yeni filmler sona gelecek şekilde satırlar seçilir
+            n_rows = len(self.movies_df)
+            take = np.arange(n_rows + len(new))
+            take[rows.loc[changed['movie_id']].to_numpy()] = n_rows + np.arange(len(changed))
+            take[n_rows:] = n_rows + len(changed) + np.arange(len(new))
+            movies_df = pd.concat([self.movies_df, changed, new], ignore_index=True)
+            movies_df = movies_df.iloc[take].reset_index(drop=True)
+            # Önbellekler (ör. ağırlıklı puanlar) eski sürümle eşleşmesin diye veri seti yeni bir sürüm alır
+            movies_df.attrs['catalog_version'] = f"delta-{uuid.uuid4().hex}"
+            self.movies_df = movies_df
+
+            drift = self.drift
+            self._changed_total += len(changed)
+            self.drift = drift._replace(
+                added=drift.added + len(new),
+                changed=drift.changed + len(changed),
+                overview_oov_rate=_running_mean(drift.overview_oov_rate, drift.added, overview_oov, len(new)),
+                content_oov_rate=_running_mean(drift.content_oov_rate, drift.added, content_oov, len(new)),
+            )
+
+        self.logger.info(
+            f"Artımlı alım: {len(new)} yeni, {len(changed)} değişen film; "
+            f"{len(patched_overview)} özet ve {len(patched_metadata)} meta veri komşu listesi güncellendi "
+            f"(OOV: özet {overview_oov:.1%}, içerik {content_oov:.1%})."
+        )
+        if self.needs_rebuild:
+            self.logger.warning(
+                f"Sözlük kayması eşiği aşıldı (büyüme {self.drift.growth:.1%}); tam yeniden oluşturma gerekli."
+            )
+        return DeltaResult(
+            len(new), len(changed), len(patched_overview), len(patched_metadata), overview_oov, content_oov
+        )
+
+    def rebuild(self) -> None:
+        """
+        Vektörleştiricileri ve indeksleri tüm katalog üzerinden yeniden
+        oluşturur.
+
+        Oluşturma kilit dışında yürür; bu sırada alınan filmler bitişte
+        yeni sözlüklerle eklenir, ardından yeni indeksler yerine konur.
+        """
+        with self._rebuild_lock:
+            with self._lock:
+                snapshot = self.movies_df
+                changed_at_snapshot = self._changed_total
+
+            feature_engineer, overview_index, metadata_index = self._build(snapshot)
+
+            with self._lock:
+                new = self.movies_df.iloc[len(snapshot):]
+                _, _, overview_oov, content_oov = self._append(
+                    feature_engineer, overview_index, metadata_index, new
+                )
+                self.feature_engineer = feature_engineer
+                self.overview_index = overview_index
+                self.metadata_index = metadata_index
+                self.drift = DriftStats(
+                    len(snapshot), len(new), self._changed_total - changed_at_snapshot,
+                    overview_oov if len(new) else 0.0, content_oov if len(new) else 0.0
+                )
+
+        self.logger.info(f"Komşu indeksleri {len(snapshot)} film üzerinden yeniden oluşturuldu.")
+
+    def start_scheduled_rebuild(self, interval_seconds: float = REBUILD_CHECK_INTERVAL, force: bool = False) -> None:
+        """
+        Kaymayı düzenli aralıklarla kontrol edip gerekirse tam yeniden
+        oluşturmayı arka plan iş parçacığında çalıştırır.
+
+        Parameters
+        ----------
+        interval_seconds : float, optional
+            Kontroller arasındaki süre, by default REBUILD_CHECK_INTERVAL
+        force : bool, optional
+            True ise kayma eşiklerine bakılmadan her aralıkta yeniden
+            oluşturulur, by default False
+        """
+        if self._rebuild_thread is not None and self._rebuild_thread.is_alive():
+            self.logger.warning("Planlanmış yeniden oluşturma zaten çalışıyor.")
+            return
+
+        self._rebuild_stop.clear()
+
+        def run():
+            while not self._rebuild_stop.wait(interval_seconds):
+                if not (force or self.needs_rebuild):
+                    continue
+                try:
+                    self.rebuild()
+                except Exception as e:
+                    self.logger.error(f"Planlanmış yeniden oluşturma hatası: {str(e)}")
+
+        self._rebuild_thread = threading.Thread(target=run, name='index-rebuild', daemon=True)
+        self._rebuild_thread.start()
+
+    def stop_scheduled_rebuild(self, timeout: Optional[float] = None) -> None:
+        """Planlanmış yeniden oluşturmayı durdurur; süren bir oluşturmanın bitmesini bekler."""
+        self._rebuild_stop.set()
+        if self._rebuild_thread is not None:
+            self._rebuild_thread.join(timeout)
+            self._rebuild_thread = None
+
+    def write_table(
+        self,
+        path: str,
+        k: int = TABLE_NEIGHBORS,
+        weights: Optional[HybridWeights] = None
+    ) -> RecommendationTable:
+        """
+        Güncel indekslerden öneri tablosunu yazar.
+
+        Parameters
+        ----------
+        path : str
+            Tablo dizini
+        k : int, optional
+            Film başına saklanacak komşu sayısı, by default TABLE_NEIGHBORS
+        weights : Optional[HybridWeights], optional
+            Hibrit skor ağırlıkları, by default None
+
+        Returns
+        -------
+        RecommendationTable
+            Yazılan tablo
+        """
+        with self._lock:
+            return write_recommendation_tables(
+                self.movies_df, path, self.overview_index, self.metadata_index, k=k,
+                rating_cache=self.feature_engineer.rating_cache, weights=weights, n_candidates=self.k
+            )
+
+    def _build(self, movies_df: pd.DataFrame) -> Tuple[FeatureEngineer, NeighborIndex, NeighborIndex]:
+        """Vektörleştiricileri eğitip iki komşu indeksini sıfırdan oluşturur."""
+        feature_engineer = FeatureEngineer(self.similarity_builder)
+        overview_index = feature_engineer.build_tfidf_index(movies_df, k=self.k)
+        metadata_index = feature_engineer.build_content_index(movies_df, k=self.k)
+        return feature_engineer, overview_index, metadata_index
+
+    def _append(
+        self,
+        feature_engineer: FeatureEngineer,
+        overview_index: NeighborIndex,
+        metadata_index: NeighborIndex,
+        new: pd.DataFrame
+    ) -> Tuple[np.ndarray, np.ndarray, float, float]:
+        """Yeni filmleri dondurulmuş sözlüklerle vektörleştirip indekslere ekler."""
+        if new.empty:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), 0.0, 0.0
+        # İki dönüşüm de indekslere dokunmadan önce yapılır; biri hata verirse indeksler değişmez
+        overview_matrix = feature_engineer.transform_overview(new)
+        content_matrix = feature_engineer.transform_content(new)
+        patched_overview = overview_index.add_rows(overview_matrix, self.similarity_builder)
+        patched_metadata = metadata_index.add_rows(content_matrix, self.similarity_builder)
+        return (
+            patched_overview, patched_metadata,
+            feature_engineer.last_overview_oov_rate_, feature_engineer.content_encoder.last_oov_rate_
+        )
+
+
+def _running_mean(mean: float, count: int, value: float, weight: int) -> float:
+    """Satır sayısıyla ağırlıklı ortalamayı günceller."""
+    total = count + weight
+    return (mean * count + value * weight) / total if total else 0.0
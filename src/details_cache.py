@@ -0,0 +1,356 @@
+"""
+TMDB film detaylarını bellek içi LRU ve kalıcı SQLite katmanlarında saklayan önbellek.
+"""
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, NamedTuple, Optional, Tuple
+
+# Önbellek dosyasının varsayılan konumu
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / "data" / "cache" / "tmdb_details.sqlite"
+
+# Bir kaydın taze sayıldığı süre (saniye)
+DETAILS_CACHE_TTL = 7 * 24 * 3600
+
+# Bellek katmanında tutulan en fazla kayıt sayısı
+DETAILS_CACHE_MEMORY_ENTRIES = 2048
+
+# Süresi dolmuş kayıtları arka planda yenileyen iş parçacığı sayısı
+DETAILS_REFRESH_WORKERS = 2
+
+CacheKey = Tuple[int, str]
+
+
+class _CacheEntry(NamedTuple):
+    payload: Dict[str, Any]
+    fetched_at: float
+
+
+class MovieDetailsCache:
+    """
+    Film detaylarını (movie_id, dil) anahtarıyla iki katmanda saklayan sınıf.
+
+    Önce bellek içi LRU katmanına, bulunamazsa SQLite katmanına bakılır.
+    Taze kayıtlar doğrudan döndürülür. Süresi dolmuş kayıtlar da beklemeden
+    döndürülür ve arka planda yenilenir (stale-while-revalidate); yenileme
+    başarısız olursa (ör. TMDB'ye ulaşılamıyorsa) eski kayıt sunulmaya
+    devam eder. Yalnızca hiç kaydı olmayan filmler için çağıran taraf
+    ağ isteğini bekler.
+
+    Attributes
+    ----------
+    path : Optional[Path]
+        SQLite dosyası; None ise yalnızca bellek katmanı kullanılır
+    ttl : float
+        Bir kaydın taze sayıldığı süre (saniye)
+    max_memory_entries : int
+        Bellek katmanındaki en fazla kayıt sayısı
+    logger : logging.Logger
+        Loglama için logger nesnesi
+    """
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        path: Optional[str] = DEFAULT_CACHE_PATH,
+        ttl: float = DETAILS_CACHE_TTL,
+        max_memory_entries: int = DETAILS_CACHE_MEMORY_ENTRIES,
+        refresh_workers: int = DETAILS_REFRESH_WORKERS,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        MovieDetailsCache sınıfının başlatıcı metodu.
+
+        Parameters
+        ----------
+        path : Optional[str], optional
+            SQLite dosyası; None ise yalnızca bellek katmanı kullanılır,
+            by default DEFAULT_CACHE_PATH
+        ttl : float, optional
+            Bir kaydın taze sayıldığı süre (saniye), by default DETAILS_CACHE_TTL
+        max_memory_entries : int, optional
+            Bellek katmanındaki en fazla kayıt sayısı,
+            by default DETAILS_CACHE_MEMORY_ENTRIES
+        refresh_workers : int, optional
+            Arka plan yenileme iş parçacığı sayısı, by default DETAILS_REFRESH_WORKERS
+        clock : Callable[[], float], optional
+            Kayıt zamanlarının okunduğu saat; kayıtlar SQLite'ta süreçler
+            arasında paylaşıldığı için duvar saatidir, by default time.time
+        """
+        self.ttl = ttl
+        self._clock = clock
+        self.max_memory_entries = max_memory_entries
+        self.logger = logging.getLogger(__name__)
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._refresh_tasks = set()
+        self._refresher = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix='details-refresh')
+        self._counters = dict.fromkeys(
+            ('memory_hits', 'disk_hits', 'misses', 'stale_hits', 'refreshes', 'refresh_errors'), 0
+        )
+
+        self.path = None
+        self._db = None
+        if path is not None:
+            try:
+                self.path = Path(path)
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS movie_details ("
+                    "movie_id INTEGER NOT NULL, language TEXT NOT NULL, "
+                    "payload TEXT NOT NULL, fetched_at REAL NOT NULL, "
+                    "PRIMARY KEY (movie_id, language))"
+                )
+                self._db.commit()
+            except (OSError, sqlite3.Error) as e:
+                # Disk katmanı açılamazsa önbellek yalnızca bellekte çalışır
+                self.logger.warning(f"Detay önbelleği dosyası açılamadı, yalnızca bellek kullanılacak: {str(e)}")
+                self.path, self._db = None, None
+
+    @classmethod
+    def default(cls) -> 'MovieDetailsCache':
+        """Süreç içinde paylaşılan, varsayılan konumdaki önbelleği döndürür."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def get(self, movie_id: int, language: str, fetch: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Film detaylarını önbellekten döndürür, yoksa fetch ile çekip saklar.
+
+        Parameters
+        ----------
+        movie_id : int
+            TMDB film ID'si
+        language : str
+            Detayların dili (ör. 'en-US')
+        fetch : Callable[[], Dict[str, Any]]
+            Detayları TMDB'den çeken fonksiyon; hata durumunda istisna fırlatmalıdır
+
+        Returns
+        -------
+        Dict[str, Any]
+            Film detayları
+
+        Raises
+        ------
+        Exception
+            Kayıt yokken fetch başarısız olduğunda fetch'in istisnası
+        """
+        key = (int(movie_id), language)
+        entry = self._lookup(key)
+
+        if entry is None:
+            self._count('misses')
+            payload = fetch()
+            self.put(movie_id, language, payload)
+            return payload
+
+        if self._clock() - entry.fetched_at > self.ttl:
+            self._count('stale_hits')
+            self._schedule_refresh(key, fetch)
+        return entry.payload
+
+    async def get_async(
+        self,
+        movie_id: int,
+        language: str,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        get'in asenkron karşılığı; fetch bir eşyordam döndürür ve süresi
+        dolmuş kayıtlar çalışan olay döngüsünde arka planda yenilenir.
+
+        Parameters
+        ----------
+        movie_id : int
+            TMDB film ID'si
+        language : str
+            Detayların dili (ör. 'en-US')
+        fetch : Callable[[], Awaitable[Dict[str, Any]]]
+            Detayları TMDB'den çeken eşyordam fonksiyonu
+
+        Returns
+        -------
+        Dict[str, Any]
+            Film detayları
+        """
+        key = (int(movie_id), language)
+        entry = self._lookup(key)
+
+        if entry is None:
+            self._count('misses')
+            payload = await fetch()
+            self.put(movie_id, language, payload)
+            return payload
+
+        if self._clock() - entry.fetched_at > self.ttl:
+            self._count('stale_hits')
+            self._schedule_refresh_async(key, fetch)
+        return entry.payload
+
+    def put(self, movie_id: int, language: str, payload: Dict[str, Any], fetched_at: Optional[float] = None) -> None:
+        """
+        Film detaylarını her iki katmana yazar.
+
+        Parameters
+        ----------
+        movie_id : int
+            TMDB film ID'si
+        language : str
+            Detayların dili
+        payload : Dict[str, Any]
+            JSON'a dönüştürülebilir film detayları
+        fetched_at : Optional[float], optional
+            Detayların çekildiği zaman, by default None (şimdi)
+        """
+        key = (int(movie_id), language)
+        entry = _CacheEntry(payload, self._clock() if fetched_at is None else fetched_at)
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO movie_details VALUES (?, ?, ?, ?)",
+                        (key[0], key[1], json.dumps(payload), entry.fetched_at)
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    self.logger.warning(f"Detay önbelleğine yazılamadı: {str(e)}")
+
+    def payloads(self, language: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Saklanan tüm film detaylarını (ör. toplu işler için) döndürür.
+
+        Parameters
+        ----------
+        language : Optional[str], optional
+            Yalnızca bu dildeki kayıtlar, by default None (tümü)
+
+        Yields
+        ------
+        Dict[str, Any]
+            Film detayları
+        """
+        with self._lock:
+            if self._db is None:
+                entries = [entry.payload for key, entry in self._memory.items() if language in (None, key[1])]
+            else:
+                query = "SELECT payload FROM movie_details"
+                params = ()
+                if language is not None:
+                    query, params = query + " WHERE language = ?", (language,)
+                entries = [json.loads(row[0]) for row in self._db.execute(query, params).fetchall()]
+        yield from entries
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """İsabet/ıska sayaçları ve katman boyutları."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats['memory_entries'] = len(self._memory)
+            stats['disk_entries'] = self._disk_size()
+        return stats
+
+    def clear(self) -> None:
+        """Her iki katmanı ve sayaçları temizler."""
+        with self._lock:
+            self._memory.clear()
+            self._counters = dict.fromkeys(self._counters, 0)
+            if self._db is not None:
+                self._db.execute("DELETE FROM movie_details")
+                self._db.commit()
+
+    def _lookup(self, key: CacheKey) -> Optional[_CacheEntry]:
+        """Kaydı önce bellekte, sonra SQLite'ta arar; disk kayıtları belleğe taşınır."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self._counters['memory_hits'] += 1
+                return entry
+            if self._db is None:
+                return None
+
+            row = self._db.execute(
+                "SELECT payload, fetched_at FROM movie_details WHERE movie_id = ? AND language = ?", key
+            ).fetchone()
+            if row is None:
+                return None
+            entry = _CacheEntry(json.loads(row[0]), row[1])
+            self._remember(key, entry)
+            self._counters['disk_hits'] += 1
+            return entry
+
+    def _remember(self, key: CacheKey, entry: _CacheEntry) -> None:
+        """Kaydı bellek katmanına ekler ve en eski kayıtları atar (kilit altında çağrılır)."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _schedule_refresh(self, key: CacheKey, fetch: Callable[[], Dict[str, Any]]) -> None:
+        """Süresi dolmuş kaydı, aynı anahtar için tek iş olacak şekilde arka planda yeniler."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self.put(key[0], key[1], fetch())
+                self._count('refreshes')
+            except Exception as e:
+                # Eski kayıt, TMDB tekrar erişilebilir olana kadar sunulmaya devam eder
+                self._count('refresh_errors')
+                self.logger.warning(f"Film {key[0]} detayları yenilenemedi, eski kayıt kullanılıyor: {str(e)}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self._refresher.submit(refresh)
+
+    def _schedule_refresh_async(self, key: CacheKey, fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> None:
+        """_schedule_refresh'in çalışan olay döngüsünde görev açan karşılığı."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        async def refresh():
+            try:
+                self.put(key[0], key[1], await fetch())
+                self._count('refreshes')
+            except Exception as e:
+                self._count('refresh_errors')
+                self.logger.warning(f"Film {key[0]} detayları yenilenemedi, eski kayıt kullanılıyor: {str(e)}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        # Görevler tamamlanana kadar çöp toplayıcıdan korunur
+        task = asyncio.get_running_loop().create_task(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _disk_size(self) -> int:
+        if self._db is None:
+            return 0
+        return self._db.execute("SELECT COUNT(*) FROM movie_details").fetchone()[0]
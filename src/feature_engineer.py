@@ -4,24 +4,49 @@
 import pandas as pd
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from typing import Tuple, List, Dict, Any
+from scipy import sparse
+from typing import Tuple, List, Dict, Any, Optional
 import logging
 
+from .neighbor_index import NeighborIndex
+from .similarity_builder import BlockwiseSimilarityBuilder
+from .vocabulary import ContentEncoder
+from .weighted_rating import WeightedRatingCache
+
 class FeatureEngineer:
     """
     Özellik mühendisliği ve benzerlik hesaplamalarını gerçekleştiren sınıf.
     
     Attributes
     ----------
+    similarity_builder : BlockwiseSimilarityBuilder
+        Benzerlik hesaplamalarını blok blok yürüten nesne
+    tfidf_vectorizer : Optional[TfidfVectorizer]
+        Son vectorize_overview çağrısında eğitilen TF-IDF vektörleştirici
+    content_encoder : ContentEncoder
+        İçerik alanlarını tamsayı kodlu sözlüklerle temsil eden nesne
+    last_overview_oov_rate_ : float
+        Son transform_overview çağrısında sözlükte bulunmayan terimlerin oranı
+    rating_cache : WeightedRatingCache
+        Ağırlıklı puanları katalog sürümüne göre saklayan önbellek
     logger : logging.Logger
         Loglama için logger nesnesi
     """
     
-    def __init__(self):
+    def __init__(self, similarity_builder: Optional[BlockwiseSimilarityBuilder] = None):
         """
         FeatureEngineer sınıfının başlatıcı metodu.
+        
+        Parameters
+        ----------
+        similarity_builder : Optional[BlockwiseSimilarityBuilder], optional
+            Benzerlik hesaplamalarını yürütecek nesne, by default None
         """
+        self.similarity_builder = similarity_builder or BlockwiseSimilarityBuilder()
+        self.tfidf_vectorizer = None
+        self.content_encoder = ContentEncoder()
+        self.last_overview_oov_rate_ = 0.0
+        self.rating_cache = WeightedRatingCache()
         self.logger = logging.getLogger(__name__)
         
     def calculate_weighted_rating(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -39,15 +64,7 @@ class FeatureEngineer:
             Ağırlıklı puanlar eklenmiş DataFrame
         """
         try:
-            C = df['vote_average'].mean()
-            m = df['vote_count'].quantile(0.9)
-            
-            def weighted_rating(x, m=m, C=C):
-                v = x['vote_count']
-                R = x['vote_average']
-                return (v/(v+m) * R) + (m/(m+v) * C)
-                
-            df['score'] = df.apply(weighted_rating, axis=1)
+            df['score'] = np.array(self.rating_cache.scores(df))
             df = df.sort_values('score', ascending=False)
             
             self.logger.info("Ağırlıklı puanlar başarıyla hesaplandı.")
@@ -85,10 +102,122 @@ class FeatureEngineer:
             self.logger.error(f"'Soup' özelliği oluşturma hatası: {str(e)}")
             raise
             
+    def vectorize_overview(self, df: pd.DataFrame) -> sparse.csr_matrix:
+        """
+        Film özetlerinden TF-IDF özellik matrisi oluşturur.
+        
+        Eğitilen vektörleştirici, yeni filmlerin transform_overview ile aynı
+        sütun uzayına dönüştürülebilmesi için saklanır.
+        
+        Parameters
+        ----------
+        df : pd.DataFrame
+            İşlenecek DataFrame
+            
+        Returns
+        -------
+        sparse.csr_matrix
+            TF-IDF özellik matrisi
+        """
+        self.tfidf_vectorizer = TfidfVectorizer(stop_words='english')
+        return self.tfidf_vectorizer.fit_transform(df['overview'].fillna(''))
+        
+    def transform_overview(self, df: pd.DataFrame) -> sparse.csr_matrix:
+        """
+        Yeni filmlerin özetlerini dondurulmuş TF-IDF sözlüğü ve IDF
+        ağırlıklarıyla vektörleştirir.
+        
+        Sözlükte olmayan terimler yok sayılır; oranları
+        last_overview_oov_rate_ özelliğinde tutulur.
+        
+        Parameters
+        ----------
+        df : pd.DataFrame
+            'overview' sütunu bulunan DataFrame
+            
+        Returns
+        -------
+        sparse.csr_matrix
+            vectorize_overview ile aynı sütunlara sahip TF-IDF matrisi
+            
+        Raises
+        ------
+        ValueError
+            Vektörleştirici henüz eğitilmediğinde
+        """
+        if self.tfidf_vectorizer is None:
+            raise ValueError("TF-IDF vektörleştirici eğitilmedi. Önce vectorize_overview() çağrılmalı.")
+        overviews = df['overview'].fillna('')
+        analyzer = self.tfidf_vectorizer.build_analyzer()
+        vocabulary = self.tfidf_vectorizer.vocabulary_
+        known_terms, total_terms = 0, 0
+        for overview in overviews:
+            terms = analyzer(overview)
+            known_terms += sum(term in vocabulary for term in terms)
+            total_terms += len(terms)
+        self.last_overview_oov_rate_ = 1.0 - known_terms / total_terms if total_terms else 0.0
+        return self.tfidf_vectorizer.transform(overviews)
+        
+    def vectorize_soup(self, df: pd.DataFrame) -> sparse.csr_matrix:
+        """
+        'Soup' özelliğinden sayım özellik matrisi oluşturur.
+        
+        Parameters
+        ----------
+        df : pd.DataFrame
+            'soup' sütunu bulunan DataFrame
+            
+        Returns
+        -------
+        sparse.csr_matrix
+            Sayım özellik matrisi
+        """
+        count = CountVectorizer(stop_words='english')
+        return count.fit_transform(df['soup'])
+            
+    def vectorize_content(self, df: pd.DataFrame) -> sparse.csr_matrix:
+        """
+        İçerik alanlarından (keywords, cast, director, genres) sayım özellik
+        matrisini 'soup' metni oluşturmadan, kodlanmış alanlardan üretir.
+        
+        Sonuç vectorize_soup ile aynıdır.
+        
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Ön işlenmiş DataFrame
+            
+        Returns
+        -------
+        sparse.csr_matrix
+            Sayım özellik matrisi
+        """
+        return self.content_encoder.fit_transform(df)
+
+    def transform_content(self, df: pd.DataFrame) -> sparse.csr_matrix:
+        """
+        Yeni filmlerin içerik alanlarını dondurulmuş sözlüklerle
+        vektörleştirir (OOV oranı content_encoder.last_oov_rate_'te).
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Ön işlenmiş DataFrame
+
+        Returns
+        -------
+        sparse.csr_matrix
+            vectorize_content ile aynı sütunlara sahip sayım matrisi
+        """
+        return self.content_encoder.transform(df)
+
     def calculate_tfidf_similarity(self, df: pd.DataFrame) -> np.ndarray:
         """
         TF-IDF tabanlı benzerlik matrisini hesaplar.
         
+        Tam N×N matris oluşturur; büyük kataloglar için build_tfidf_index
+        tercih edilmelidir.
+        
         Parameters
         ----------
         df : pd.DataFrame
@@ -100,9 +229,8 @@ class FeatureEngineer:
             TF-IDF benzerlik matrisi
         """
         try:
-            tfidf = TfidfVectorizer(stop_words='english')
-            tfidf_matrix = tfidf.fit_transform(df['overview'])
-            cosine_sim = cosine_similarity(tfidf_matrix, tfidf_matrix)
+            tfidf_matrix = self.vectorize_overview(df)
+            cosine_sim = self.similarity_builder.compute_dense(tfidf_matrix)
             
             self.logger.info("TF-IDF benzerlik matrisi başarıyla hesaplandı.")
             return cosine_sim
@@ -115,10 +243,13 @@ class FeatureEngineer:
         """
         İçerik tabanlı benzerlik matrisini hesaplar.
         
+        Tam N×N matris oluşturur; büyük kataloglar için build_content_index
+        tercih edilmelidir.
+        
         Parameters
         ----------
         df : pd.DataFrame
-            İşlenecek DataFrame
+            Ön işlenmiş DataFrame
             
         Returns
         -------
@@ -126,9 +257,8 @@ class FeatureEngineer:
             İçerik benzerlik matrisi
         """
         try:
-            count = CountVectorizer(stop_words='english')
-            count_matrix = count.fit_transform(df['soup'])
-            cosine_sim = cosine_similarity(count_matrix, count_matrix)
+            count_matrix = self.vectorize_content(df)
+            cosine_sim = self.similarity_builder.compute_dense(count_matrix)
             
             self.logger.info("İçerik benzerlik matrisi başarıyla hesaplandı.")
             return cosine_sim
@@ -137,6 +267,62 @@ class FeatureEngineer:
             self.logger.error(f"İçerik benzerlik hesaplama hatası: {str(e)}")
             raise
             
+    def build_tfidf_index(self, df: pd.DataFrame, k: int = 50) -> NeighborIndex:
+        """
+        TF-IDF vektörleri üzerinden en yakın K komşu indeksini oluşturur.
+        
+        Parameters
+        ----------
+        df : pd.DataFrame
+            İşlenecek DataFrame
+        k : int, optional
+            Film başına saklanacak komşu sayısı, by default 50
+            
+        Returns
+        -------
+        NeighborIndex
+            TF-IDF komşu indeksi
+        """
+        try:
+            index = NeighborIndex.build(
+                self.vectorize_overview(df), k=k, builder=self.similarity_builder
+            )
+            
+            self.logger.info("TF-IDF komşu indeksi başarıyla oluşturuldu.")
+            return index
+            
+        except Exception as e:
+            self.logger.error(f"TF-IDF komşu indeksi oluşturma hatası: {str(e)}")
+            raise
+            
+    def build_content_index(self, df: pd.DataFrame, k: int = 50) -> NeighborIndex:
+        """
+        İçerik sayım vektörleri üzerinden en yakın K komşu indeksini oluşturur.
+        
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Ön işlenmiş DataFrame
+        k : int, optional
+            Film başına saklanacak komşu sayısı, by default 50
+            
+        Returns
+        -------
+        NeighborIndex
+            İçerik komşu indeksi
+        """
+        try:
+            index = NeighborIndex.build(
+                self.vectorize_content(df), k=k, builder=self.similarity_builder
+            )
+            
+            self.logger.info("İçerik komşu indeksi başarıyla oluşturuldu.")
+            return index
+            
+        except Exception as e:
+            self.logger.error(f"İçerik komşu indeksi oluşturma hatası: {str(e)}")
+            raise
+            
     def create_user_preference_features(self, user_df: pd.DataFrame, movie_df: pd.DataFrame) -> pd.DataFrame:
         """
         Kullanıcı tercihlerine dayalı özellikler oluşturur.
@@ -0,0 +1,230 @@
+"""
+Tür, çıkış yılı, dil ve süre filtreleri için katalog üzerinde bit eşlem indeksleri oluşturan sınıf.
+"""
+import logging
+from typing import Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Çıkış yıllarının gruplandığı aralık (10: on yıllar)
+YEAR_BUCKET_SIZE = 10
+
+# Süre bantları: ad -> [alt sınır, üst sınır) dakika
+RUNTIME_BANDS = {
+    'short': (0, 90),
+    'medium': (90, 120),
+    'long': (120, 150),
+    'very_long': (150, np.inf),
+}
+
+
+class MovieFilter(NamedTuple):
+    """
+    Öneri filtreleri.
+
+    Bir alan içindeki değerlerden herhangi birine uyan filmler seçilir
+    (ör. genres=('drama', 'comedy') dram veya komedi); alanlar arasında
+    tüm koşullar sağlanmalıdır. Boş bırakılan alanlar filtrelemez.
+    """
+    genres: Sequence[str] = ()
+    years: Sequence[int] = ()
+    languages: Sequence[str] = ()
+    runtime_bands: Sequence[str] = ()
+
+    def is_empty(self) -> bool:
+        return not any(self)
+
+
+class FilterIndex:
+    """
+    Her filtre değeri için katalog satırlarını gösteren paketlenmiş bit
+    eşlemlerini tutan sınıf.
+
+    Bit eşlemler katalogdan bir kez oluşturulur; bir filtrenin maskesi
+    istek başına DataFrame taramak yerine birkaç vektörel bit işlemiyle
+    (alan içinde OR, alanlar arasında AND) hesaplanır. Her değer için
+    N/8 bayt yer kaplar.
+
+    Attributes
+    ----------
+    n_movies : int
+        Katalogdaki film sayısı
+    bitmaps : Dict[str, Dict[Hashable, np.ndarray]]
+        Alan adından, değerden paketlenmiş bit eşleme eşleme
+    year_bucket_size : int
+        Çıkış yıllarının gruplandığı aralık
+    runtime_bands : Dict[str, Tuple[float, float]]
+        Süre bantları
+    logger : logging.Logger
+        Loglama için logger nesnesi
+    """
+
+    def __init__(
+        self,
+        n_movies: int,
+        bitmaps: Dict[str, Dict[Hashable, np.ndarray]],
+        year_bucket_size: int = YEAR_BUCKET_SIZE,
+        runtime_bands: Optional[Dict[str, Tuple[float, float]]] = None
+    ):
+        """
+        FilterIndex sınıfının başlatıcı metodu.
+
+        Parameters
+        ----------
+        n_movies : int
+            Katalogdaki film sayısı
+        bitmaps : Dict[str, Dict[Hashable, np.ndarray]]
+            Alan adından, değerden paketlenmiş bit eşleme eşleme
+        year_bucket_size : int, optional
+            Çıkış yıllarının gruplandığı aralık, by default YEAR_BUCKET_SIZE
+        runtime_bands : Optional[Dict[str, Tuple[float, float]]], optional
+            Süre bantları, by default RUNTIME_BANDS
+        """
+        self.n_movies = n_movies
+        self.bitmaps = bitmaps
+        self.year_bucket_size = year_bucket_size
+        self.runtime_bands = runtime_bands or RUNTIME_BANDS
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def build(
+        cls,
+        df: pd.DataFrame,
+        year_bucket_size: int = YEAR_BUCKET_SIZE,
+        runtime_bands: Optional[Dict[str, Tuple[float, float]]] = None
+    ) -> 'FilterIndex':
+        """
+        Ön işlenmiş katalogdan bit eşlem indekslerini oluşturur.
+
+        Türler genres_all sütunundaki kesilmemiş listelerden alınır; genres
+        benzerlik için ilk 3 türe kesildiğinden yalnızca genres_all yoksa
+        kullanılır. release_date çıkış tarihini, original_language dil
+        kodunu ve runtime dakika cinsinden süreyi içermelidir. Katalogda olmayan sütunların alanı oluşturulmaz;
+        süresi 0 veya eksik olan filmler hiçbir süre bandına girmez.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Ön işlenmiş katalog
+        year_bucket_size : int, optional
+            Çıkış yıllarının gruplandığı aralık, by default YEAR_BUCKET_SIZE
+        runtime_bands : Optional[Dict[str, Tuple[float, float]]], optional
+            Süre bantları, by default RUNTIME_BANDS
+
+        Returns
+        -------
+        FilterIndex
+            Oluşturulan indeks (satırlar df satır sırasındadır)
+        """
+        runtime_bands = runtime_bands or RUNTIME_BANDS
+        n_movies = len(df)
+        values = {}
+
+        genre_column = 'genres_all' if 'genres_all' in df.columns else 'genres'
+        if genre_column in df.columns:
+            genres = pd.Series(list(df[genre_column].values)).explode()
+            values['genres'] = genres[genres.map(lambda g: isinstance(g, str))]
+        if 'release_date' in df.columns:
+            years = pd.Series(pd.to_datetime(df['release_date'].values, errors='coerce').year)
+            values['years'] = (years // year_bucket_size * year_bucket_size).dropna().astype(int)
+        if 'original_language' in df.columns:
+            values['languages'] = pd.Series(df['original_language'].values).dropna().str.lower()
+        if 'runtime' in df.columns:
+            runtime = pd.Series(df['runtime'].values, dtype=np.float64)
+            bands = pd.Series(np.full(n_movies, None, dtype=object))
+            for band, (low, high) in runtime_bands.items():
+                bands[(runtime > 0) & (runtime >= low) & (runtime < high)] = band
+            values['runtime_bands'] = bands.dropna()
+
+        # Serilerin etiketleri katalog satır konumlarıdır (explode etiketleri tekrarlar)
+        bitmaps = {
+            field: {
+                value: cls._pack(series.index.to_numpy()[positions], n_movies)
+                for value, positions in series.groupby(series).indices.items()
+            }
+            for field, series in values.items()
+        }
+        index = cls(n_movies, bitmaps, year_bucket_size, runtime_bands)
+        index.logger.info(
+            f"Filtre indeksi oluşturuldu ({n_movies} film, "
+            + ", ".join(f"{field}: {len(field_bitmaps)}" for field, field_bitmaps in bitmaps.items())
+            + ")."
+        )
+        return index
+
+    def __len__(self) -> int:
+        return self.n_movies
+
+    def values(self, field: str) -> List[Hashable]:
+        """Bir alan için indekste bulunan değerleri sıralı döndürür."""
+        return sorted(self.bitmaps.get(field, {}))
+
+    def mask(self, movie_filter: Optional[MovieFilter]) -> Optional[np.ndarray]:
+        """
+        Filtreye uyan filmlerin maskesini hesaplar.
+
+        Parameters
+        ----------
+        movie_filter : Optional[MovieFilter]
+            Uygulanacak filtre
+
+        Returns
+        -------
+        Optional[np.ndarray]
+            (n_movies,) boyutlu bool maske; filtre boşsa None
+
+        Raises
+        ------
+        ValueError
+            Katalogda bulunmayan bir alanla veya tanımsız bir süre bandıyla
+            filtrelendiğinde
+        """
+        if movie_filter is None or movie_filter.is_empty():
+            return None
+
+        unknown_bands = [band for band in movie_filter.runtime_bands if band not in self.runtime_bands]
+        if unknown_bands:
+            raise ValueError(
+                f"Tanımsız süre bandı: {unknown_bands}; geçerli bantlar: {list(self.runtime_bands)}."
+            )
+
+        wanted = {
+            'genres': [str(g).replace(' ', '').lower() for g in movie_filter.genres],
+            'years': sorted({int(y) // self.year_bucket_size * self.year_bucket_size for y in movie_filter.years}),
+            'languages': [str(l).lower() for l in movie_filter.languages],
+            'runtime_bands': list(movie_filter.runtime_bands),
+        }
+
+        packed = np.full((self.n_movies + 7) // 8, 0xFF, dtype=np.uint8)
+        for field, field_values in wanted.items():
+            if not field_values:
+                continue
+            if field not in self.bitmaps:
+                raise ValueError(f"Katalogda '{field}' filtresi için veri yok.")
+            field_bits = np.zeros_like(packed)
+            unseen = []
+            for value in field_values:
+                bitmap = self.bitmaps[field].get(value)
+                if bitmap is None:
+                    unseen.append(value)
+                else:
+                    np.bitwise_or(field_bits, bitmap, out=field_bits)
+            if unseen:
+                # Katalogda hiç geçmeyen değerler hiçbir filme uymaz; yazım hatalarını görünür kıl
+                self.logger.warning(f"'{field}' filtresindeki {unseen} değerleri katalogda bulunmuyor.")
+            np.bitwise_and(packed, field_bits, out=packed)
+
+        return np.unpackbits(packed, count=self.n_movies).astype(bool)
+
+    def count(self, movie_filter: Optional[MovieFilter]) -> int:
+        """Filtreye uyan film sayısını döndürür."""
+        mask = self.mask(movie_filter)
+        return self.n_movies if mask is None else int(mask.sum())
+
+    @staticmethod
+    def _pack(positions: np.ndarray, n_movies: int) -> np.ndarray:
+        """Satır konumlarını paketlenmiş bit eşleme dönüştürür."""
+        bits = np.zeros(n_movies, dtype=bool)
+        bits[positions] = True
+        return np.packbits(bits)
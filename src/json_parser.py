@@ -0,0 +1,291 @@
+"""
+JSON formatındaki film sütunlarını uzun tablolara ayrıştıran sınıf.
+"""
+import ast
+import json
+import logging
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Uzun tabloların sütunları; row, öğenin ait olduğu satırın konumudur
+LONG_TABLE_COLUMNS = ['movie_id', 'row', 'role', 'name', 'order']
+
+
+class JsonColumnParser:
+    """
+    cast, crew, keywords ve genres gibi JSON sütunlarını gerçek bir JSON
+    çözücüyle ayrıştırıp yalnızca gerekli alanları (name, job) içeren uzun
+    tablolara (movie_id, row, role, name, order) dönüştüren sınıf.
+
+    Sütunun tüm hücreleri tek bir JSON dizisi olarak çözülür; geçerli JSON
+    olmayan hücreler için hücre bazında ast.literal_eval'e geri dönülür.
+
+    Attributes
+    ----------
+    crew_jobs : Optional[Sequence[str]]
+        crew sütunundan tutulacak görevler; None ise tüm görevler tutulur
+    logger : logging.Logger
+        Loglama için logger nesnesi
+    """
+
+    def __init__(self, crew_jobs: Optional[Sequence[str]] = ('Director',)):
+        """
+        JsonColumnParser sınıfının başlatıcı metodu.
+
+        Parameters
+        ----------
+        crew_jobs : Optional[Sequence[str]], optional
+            crew sütunundan tutulacak görevler, by default ('Director',)
+        """
+        self.crew_jobs = set(crew_jobs) if crew_jobs is not None else None
+        self.logger = logging.getLogger(__name__)
+
+    def parse(
+        self,
+        df: pd.DataFrame,
+        columns: Iterable[str],
+        id_column: str = 'movie_id'
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Belirtilen sütunları uzun tablolara ayrıştırır.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Ayrıştırılacak veri seti
+        columns : Iterable[str]
+            Ayrıştırılacak JSON sütunları
+        id_column : str, optional
+            Film kimliğini içeren sütun, by default 'movie_id'
+
+        Returns
+        -------
+        Dict[str, pd.DataFrame]
+            Sütun adına göre uzun tablolar
+        """
+        try:
+            tables = {
+                column: self.parse_column(df[id_column], df[column], column)
+                for column in columns if column in df.columns
+            }
+
+            self.logger.info("JSON sütunları uzun tablolara ayrıştırıldı.")
+            return tables
+
+        except Exception as e:
+            self.logger.error(f"JSON sütunu ayrıştırma hatası: {str(e)}")
+            raise
+
+    def parse_column(self, movie_ids: pd.Series, values: pd.Series, column: str) -> pd.DataFrame:
+        """
+        Tek bir JSON sütununu uzun tabloya dönüştürür.
+
+        crew sütununda role alanı görevi (job), diğer sütunlarda sütun adını
+        taşır; order öğenin listedeki sırası, row ise hücrenin konumudur.
+        Sonuçlar row üzerinden hizalandığı için yinelenen film kimlikleri
+        birbirine karışmaz.
+
+        Parameters
+        ----------
+        movie_ids : pd.Series
+            Film kimlikleri
+        values : pd.Series
+            JSON dizisi içeren hücreler
+        column : str
+            Sütun adı
+
+        Returns
+        -------
+        pd.DataFrame
+            (movie_id, row, role, name, order) sütunlarından oluşan uzun tablo
+        """
+        is_crew = column == 'crew'
+        parsed = self.decode_fields(values, ('name', 'job') if is_crew else ('name',))
+
+        # Hücre listeleri satır, sıra, isim ve görev sütunlarına düzleştirilir
+        lengths = np.fromiter(map(len, parsed), dtype=np.int64, count=len(parsed))
+        rows = np.repeat(np.arange(len(parsed), dtype=np.int64), lengths)
+        starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        orders = (np.arange(len(rows), dtype=np.int64) - starts).astype(np.int32)
+        flat = list(chain.from_iterable(parsed))
+
+        if is_crew:
+            names = np.array([name for name, _ in flat], dtype=object)
+            roles = np.array([job for _, job in flat], dtype=object)
+            if self.crew_jobs is not None:
+                keep = pd.Series(roles, dtype=object).isin(self.crew_jobs).to_numpy()
+                rows, orders, names, roles = rows[keep], orders[keep], names[keep], roles[keep]
+        else:
+            names = np.array(flat, dtype=object)
+            roles = np.full(len(rows), column, dtype=object)
+
+        table = pd.DataFrame({
+            'movie_id': pd.Series(movie_ids.to_numpy()[rows], dtype=movie_ids.dtype),
+            'row': pd.Series(rows, dtype=np.int64),
+            'role': pd.Series(roles, dtype='category'),
+            'name': pd.Series(names, dtype=object),
+            'order': pd.Series(orders, dtype=np.int32),
+        })
+        return table[LONG_TABLE_COLUMNS]
+
+    @staticmethod
+    def clean_names(names: pd.Series) -> pd.Series:
+        """
+        İsimleri küçük harfe çevirir ve boşlukları kaldırır.
+
+        Parameters
+        ----------
+        names : pd.Series
+            İsimler
+
+        Returns
+        -------
+        pd.Series
+            Temizlenmiş isimler
+        """
+        return names.astype(str).str.replace(' ', '', regex=False).str.lower()
+
+    @classmethod
+    def top_names(
+        cls,
+        table: pd.DataFrame,
+        index: pd.Index,
+        n: Optional[int] = 3,
+        clean: bool = False
+    ) -> pd.Series:
+        """
+        Her satır için ilk n ismi liste olarak döndürür.
+
+        Parameters
+        ----------
+        table : pd.DataFrame
+            Uzun tablo
+        index : pd.Index
+            Ayrıştırılan veri setinin indeksi (sonuç bu indekse hizalanır)
+        n : Optional[int], optional
+            Satır başına isim sayısı; None ise tüm isimler, by default 3
+        clean : bool, optional
+            İsimlerin temizlenip temizlenmeyeceği, by default False
+
+        Returns
+        -------
+        pd.Series
+            index ile hizalı isim listeleri; öğe yoksa boş liste
+        """
+        top = table if n is None else table[table['order'] < n]
+        names = cls.clean_names(top['name']) if clean else top['name']
+        grouped = names.groupby(top['row'].values, sort=False).agg(list)
+
+        result = np.empty(len(index), dtype=object)
+        result[:] = [[] for _ in range(len(index))]
+        result[grouped.index.values] = grouped.values
+        return pd.Series(result, index=index)
+
+    @classmethod
+    def first_name(
+        cls,
+        table: pd.DataFrame,
+        index: pd.Index,
+        role: str,
+        clean: bool = False
+    ) -> pd.Series:
+        """
+        Her satır için verilen roldeki ilk ismi döndürür.
+
+        Parameters
+        ----------
+        table : pd.DataFrame
+            Uzun tablo
+        index : pd.Index
+            Ayrıştırılan veri setinin indeksi (sonuç bu indekse hizalanır)
+        role : str
+            Aranan rol (örneğin 'Director')
+        clean : bool, optional
+            İsmin temizlenip temizlenmeyeceği, by default False
+
+        Returns
+        -------
+        pd.Series
+            index ile hizalı isimler; bulunamazsa NaN
+        """
+        matches = table[table['role'] == role]
+        first = matches.loc[matches.groupby('row', sort=False)['order'].idxmin()]
+        names = cls.clean_names(first['name']) if clean else first['name']
+
+        result = np.full(len(index), np.nan, dtype=object)
+        result[first['row'].values] = names.values
+        return pd.Series(result, index=index)
+
+    def decode_fields(self, values: pd.Series, fields: Sequence[str]) -> List[list]:
+        """
+        Hücreleri çözerken her nesneden yalnızca verilen alanları alır.
+
+        Alanlar json çözücünün object_hook'unda operator.itemgetter ile
+        okunur; böylece tam sözlükler tutulmaz. Alanı eksik bir nesne varsa
+        sütun, eksik alanları None ile dolduran yavaş yoldan yeniden çözülür.
+
+        Parameters
+        ----------
+        values : pd.Series
+            JSON dizisi içeren hücreler
+        fields : Sequence[str]
+            Alınacak alanlar
+
+        Returns
+        -------
+        List[list]
+            Hücre başına liste; tek alan istendiyse değerler, aksi halde
+            alan sırasıyla demetler
+        """
+        getter = itemgetter(*fields)
+        try:
+            return self.decode(values, object_hook=getter)
+        except KeyError:
+            self.logger.warning(f"Bazı nesnelerde {list(fields)} alanları eksik, varsayılan None kullanılıyor.")
+            return self.decode(values, object_hook=lambda item: getter({**dict.fromkeys(fields), **item}))
+
+    def decode(
+        self,
+        values: pd.Series,
+        object_hook: Optional[Callable[[dict], Any]] = None
+    ) -> List[list]:
+        """
+        JSON dizisi içeren hücreleri Python listelerine çözer.
+
+        Tüm hücreler tek bir çağrıda çözülür; sütunda geçerli JSON olmayan bir
+        hücre varsa hücre bazında çözüme geri dönülür. Boş veya eksik hücreler
+        boş liste olarak döner.
+
+        Parameters
+        ----------
+        values : pd.Series
+            JSON dizisi içeren hücreler
+        object_hook : Optional[Callable[[dict], Any]], optional
+            Her JSON nesnesini çözülürken dönüştüren fonksiyon (json.loads'taki
+            gibi); literal geri dönüşünde liste öğelerine uygulanır,
+            by default None
+
+        Returns
+        -------
+        List[list]
+            Çözülmüş listeler
+        """
+        cells = [x if isinstance(x, str) and x.strip() else '[]' for x in values.tolist()]
+        try:
+            return json.loads('[' + ','.join(cells) + ']', object_hook=object_hook)
+        except ValueError:
+            self.logger.warning("Sütun geçerli JSON değil, hücre bazında ayrıştırılıyor.")
+            return [self._decode_cell(cell, object_hook) for cell in cells]
+
+    @staticmethod
+    def _decode_cell(cell: str, object_hook: Optional[Callable[[dict], Any]] = None) -> list:
+        """Tek bir hücreyi çözer; JSON değilse Python literal olarak dener."""
+        try:
+            return json.loads(cell, object_hook=object_hook)
+        except ValueError:
+            items = ast.literal_eval(cell)
+            return items if object_hook is None else [object_hook(item) for item in items]
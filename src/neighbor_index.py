@@ -0,0 +1,431 @@
+"""
+Filmler için en yakın K komşuyu saklayan seyrek benzerlik indeksini yöneten sınıf.
+"""
+import logging
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+from sklearn.preprocessing import normalize
+
+from .similarity_builder import BlockwiseSimilarityBuilder, SimilarityBlock
+
+
+def top_k(
+    scores: np.ndarray,
+    k: int,
+    exclude: Optional[np.ndarray] = None,
+    mask: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Her satır için en yüksek K skoru azalan sırada seçer.
+
+    Tam sıralama yerine np.argpartition kullanılır; yalnızca seçilen K eleman
+    sıralanır. Eşit skorlarda küçük indeks önce gelir; K. skora eşit
+    elemanlar sınırı aştığında da küçük indeksliler seçilir, böylece sonuç
+    yalnızca skorlara bağlıdır.
+
+    Parameters
+    ----------
+    scores : np.ndarray
+        (n_rows, n_cols) boyutlu skor matrisi veya tek boyutlu skor dizisi
+    k : int
+        Seçilecek eleman sayısı
+    exclude : Optional[np.ndarray], optional
+        Satır başına seçimden çıkarılacak sütun indeksi (ör. filmin
+        kendisi), by default None
+    mask : Optional[np.ndarray], optional
+        Seçilebilecek sütunları gösteren (n_cols,) veya (n_rows, n_cols)
+        boyutlu bool maske (ör. filtreye uyan filmler), by default None
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Seçilen sütun indeksleri ve skorları. Maske nedeniyle k'dan az
+        seçilebilir sütunu olan satırlar -inf skorlarla tamamlanır.
+    """
+    squeeze = scores.ndim == 1
+    scores = np.atleast_2d(scores)
+    k = max(0, min(k, scores.shape[1]))
+
+    if exclude is not None or mask is not None:
+        scores = np.array(scores, dtype=np.result_type(scores.dtype, np.float32))
+    if exclude is not None:
+        k = min(k, scores.shape[1] - 1)
+        scores[np.arange(scores.shape[0]), np.atleast_1d(exclude)] = -np.inf
+    if mask is not None:
+        scores[~np.broadcast_to(mask, scores.shape)] = -np.inf
+
+    if k == 0:
+        indices = np.empty((scores.shape[0], 0), dtype=np.int64)
+        values = np.empty((scores.shape[0], 0), dtype=scores.dtype)
+    else:
+        if k < scores.shape[1]:
+            part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            kth = np.take_along_axis(scores, part, axis=1).min(axis=1)[:, np.newaxis]
+            # argpartition K. skora eşit elemanlar arasından rastgele seçer; bu
+            # satırlarda eşitlerin ilk gelenleri alınır
+            ties = np.flatnonzero(np.count_nonzero(scores >= kth, axis=1) > k)
+            if len(ties):
+                above = scores[ties] > kth[ties]
+                equal = scores[ties] == kth[ties]
+                needed = k - np.count_nonzero(above, axis=1)
+                chosen = above | (equal & (np.cumsum(equal, axis=1) <= needed[:, np.newaxis]))
+                part[ties] = np.nonzero(chosen)[1].reshape(len(ties), k)
+        else:
+            part = np.tile(np.arange(scores.shape[1]), (scores.shape[0], 1))
+        part_scores = np.take_along_axis(scores, part, axis=1)
+
+        # Önce skora göre azalan, eşitlikte indekse göre artan sırala
+        order = np.lexsort((part, -part_scores), axis=1)
+        indices = np.take_along_axis(part, order, axis=1)
+        values = np.take_along_axis(part_scores, order, axis=1)
+
+    if squeeze:
+        return indices[0], values[0]
+    return indices, values
+
+
+def _sorted(features: sparse.csr_matrix) -> sparse.csr_matrix:
+    """
+    Satır içi sütun indeksleri sıralı matrisi döndürür.
+
+    Seyrek çarpımda (i, j) skoru i. satırın sütun sırasıyla toplanır;
+    indeksler sıralıyken s(i, j) ve s(j, i) aynı sırayla toplanıp bit
+    düzeyinde eşit olur.
+    """
+    return features if features.has_sorted_indices else features.sorted_indices()
+
+
+class NeighborIndex:
+    """
+    Her film için yalnızca en benzer K filmi saklayan benzerlik indeksi.
+
+    Tam N×N benzerlik matrisi yerine (indices, scores) dizileri tutulur;
+    bellek kullanımı O(N·K) ile ölçeklenir.
+
+    Attributes
+    ----------
+    indices : np.ndarray
+        (N, K) boyutlu komşu satır indeksleri
+    scores : np.ndarray
+        (N, K) boyutlu kosinüs benzerlik skorları
+    features : Optional[sparse.csr_matrix]
+        Satırları L2 normalize edilmiş özellik matrisi
+    logger : logging.Logger
+        Loglama için logger nesnesi
+    """
+
+    def __init__(
+        self,
+        indices: np.ndarray,
+        scores: np.ndarray,
+        features: Optional[sparse.csr_matrix] = None
+    ):
+        """
+        NeighborIndex sınıfının başlatıcı metodu.
+
+        Parameters
+        ----------
+        indices : np.ndarray
+            (N, K) boyutlu komşu satır indeksleri
+        scores : np.ndarray
+            (N, K) boyutlu benzerlik skorları
+        features : Optional[sparse.csr_matrix], optional
+            Satırları L2 normalize edilmiş özellik matrisi, by default None
+        """
+        self.indices = indices
+        self.scores = scores
+        self.features = features
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def build(
+        cls,
+        matrix: sparse.spmatrix,
+        k: int = 50,
+        builder: Optional[BlockwiseSimilarityBuilder] = None,
+        keep_features: bool = True
+    ) -> 'NeighborIndex':
+        """
+        Özellik matrisinden blok blok en yakın K komşu indeksini oluşturur.
+
+        Parameters
+        ----------
+        matrix : sparse.spmatrix
+            (N, D) boyutlu özellik matrisi (TF-IDF veya sayım vektörleri)
+        k : int, optional
+            Film başına saklanacak komşu sayısı, by default 50
+        builder : Optional[BlockwiseSimilarityBuilder], optional
+            Blok hesaplamasını yürütecek nesne, by default None
+        keep_features : bool, optional
+            Normalize edilmiş özellik matrisinin indekste tutulup
+            tutulmayacağı, by default True
+
+        Returns
+        -------
+        NeighborIndex
+            Oluşturulan komşu indeksi
+        """
+        features = _sorted(normalize(sparse.csr_matrix(matrix, dtype=np.float32), norm='l2', copy=False))
+        builder = builder or BlockwiseSimilarityBuilder()
+        n_rows = features.shape[0]
+        k = max(0, min(k, n_rows - 1))
+
+        indices = np.empty((n_rows, k), dtype=np.int32)
+        scores = np.empty((n_rows, k), dtype=np.float32)
+
+        def reduce_block(block: np.ndarray, start: int, stop: int) -> Tuple[np.ndarray, np.ndarray]:
+            return top_k(block, k)
+
+        def consume(block: SimilarityBlock) -> None:
+            indices[block.start:block.stop], scores[block.start:block.stop] = block.result
+
+        builder.build(features, consume, transform=reduce_block, exclude_self=True)
+
+        index = cls(indices, scores, features if keep_features else None)
+        index.logger.info(f"Komşu indeksi oluşturuldu ({n_rows} film, K={k}).")
+        return index
+
+    def add_rows(
+        self,
+        matrix: sparse.spmatrix,
+        builder: Optional[BlockwiseSimilarityBuilder] = None
+    ) -> np.ndarray:
+        """
+        Yeni filmleri indeksi yeniden oluşturmadan sona ekler.
+
+        Yeni satırların komşuları mevcut ve yeni tüm filmler arasından tam
+        kosinüsle seçilir. Mevcut filmlerin listelerine yalnızca skoru
+        listedeki K. skordan büyük olan yeni filmler girer; eşit skorda
+        küçük indeksli (eski) komşu kalır. Sütun indeksleri sıralı olduğundan
+        iki film arasındaki skor hangi satırdan hesaplanırsa hesaplansın
+        bit düzeyinde aynıdır ve top_k eşitlikleri indekse göre çözer; sonuç,
+        özellik matrislerinin alt alta eklenmesiyle sıfırdan oluşturulan
+        indeksle aynıdır. Maliyet O(M·N) olup tam yeniden oluşturmanın
+        O(N²) maliyetinden kaçınılır.
+
+        Diziler kopyalanarak güncellenir ve sonra yerine konur; eski
+        dizileri tutan okuyucular tutarlı bir görüntüyle devam eder.
+
+        Parameters
+        ----------
+        matrix : sparse.spmatrix
+            (M, D) boyutlu, indeksle aynı sütun uzayında özellik matrisi
+            (dondurulmuş vektörleştiricilerin transform çıktısı)
+        builder : Optional[BlockwiseSimilarityBuilder], optional
+            Blok boyutunu bellek bütçesine göre belirleyen nesne,
+            by default None
+
+        Returns
+        -------
+        np.ndarray
+            Komşu listesi değişen mevcut filmlerin satır indeksleri
+
+        Raises
+        ------
+        ValueError
+            Özellik matrisi saklanmadığında veya sütun sayısı uyuşmadığında
+        """
+        if self.features is None:
+            raise ValueError("Film eklemek için indeksin özellik matrisini saklaması gerekir.")
+        new_features = _sorted(normalize(sparse.csr_matrix(matrix, dtype=np.float32), norm='l2', copy=False))
+        if new_features.shape[1] != self.features.shape[1]:
+            raise ValueError(
+                f"Özellik boyutu uyuşmuyor: indeks {self.features.shape[1]}, yeni satırlar {new_features.shape[1]}."
+            )
+
+        builder = builder or BlockwiseSimilarityBuilder()
+        n_old, n_new = self.features.shape[0], new_features.shape[0]
+        k = self.n_neighbors
+        features = _sorted(sparse.vstack([self.features, new_features], format='csr'))
+        # BlockwiseSimilarityBuilder satırları yeniden normalize eder; skorların
+        # build ile bit düzeyinde aynı olması için aynısı yapılır
+        scoring = normalize(features, norm='l2', copy=True)
+        features_t = scoring.T.tocsr()
+        kth_scores = self.scores[:, -1] if k else np.full(n_old, np.inf, dtype=np.float32)
+
+        new_indices = np.empty((n_new, k), dtype=self.indices.dtype)
+        new_scores = np.empty((n_new, k), dtype=self.scores.dtype)
+        hit_rows, hit_cols, hit_scores = [], [], []
+        block_size = builder.plan_block_size(features.shape[0])
+        for start in range(0, n_new, block_size):
+            stop = min(start + block_size, n_new)
+            block = (scoring[n_old + start:n_old + stop] @ features_t).toarray()
+            block[np.arange(stop - start), n_old + np.arange(start, stop)] = -np.inf
+            new_indices[start:stop], new_scores[start:stop] = top_k(block, k)
+
+            # Mevcut filmlerin K. komşusunu geçen yeni filmler
+            new_rows, old_rows = np.nonzero(block[:, :n_old] > kth_scores)
+            hit_rows.append(old_rows)
+            hit_cols.append(n_old + start + new_rows)
+            hit_scores.append(block[new_rows, old_rows])
+
+        indices = np.concatenate([self.indices, new_indices])
+        scores = np.concatenate([self.scores, new_scores])
+        rows = np.concatenate(hit_rows) if hit_rows else np.empty(0, dtype=np.int64)
+        patched = np.unique(rows)
+        if len(patched):
+            cols, values = np.concatenate(hit_cols), np.concatenate(hit_scores)
+            # Adaylar satır başına, eşit skorlarda küçük indeks önce gelecek sırayla dizilir
+            order = np.lexsort((cols, rows))
+            rows, cols, values = rows[order], cols[order], values[order]
+            starts = np.searchsorted(rows, patched)
+            counts = np.diff(np.append(starts, len(rows)))
+            slots = np.arange(len(rows)) - np.repeat(starts, counts)
+
+            candidate_indices = np.full((len(patched), counts.max()), -1, dtype=indices.dtype)
+            candidate_scores = np.full((len(patched), counts.max()), -np.inf, dtype=scores.dtype)
+            positions = np.repeat(np.arange(len(patched)), counts)
+            candidate_indices[positions, slots] = cols
+            candidate_scores[positions, slots] = values
+
+            # Mevcut liste önde olduğu için eşit skorlarda eski (küçük indeksli) komşu kalır
+            merged_indices = np.hstack([indices[patched], candidate_indices])
+            order, scores[patched] = top_k(np.hstack([scores[patched], candidate_scores]), k)
+            indices[patched] = np.take_along_axis(merged_indices, order, axis=1)
+
+        self.indices, self.scores, self.features = indices, scores, features
+        self.logger.info(
+            f"Komşu indeksine {n_new} film eklendi; {len(patched)} mevcut filmin listesi güncellendi."
+        )
+        return patched
+
+    def __len__(self) -> int:
+        return self.indices.shape[0]
+
+    @property
+    def n_neighbors(self) -> int:
+        """Film başına saklanan komşu sayısı."""
+        return self.indices.shape[1]
+
+    def query(self, idx: int, n: int = 10, mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Bir filmin en benzer n komşusunu döndürür.
+
+        Maske verildiğinde önce saklanan K komşu maskeyle süzülür; bunlar
+        tüm katalogdaki en benzer filmler olduğu için n tanesi maskeye
+        uyuyorsa sonuç kesindir. Aksi halde maskeye uyan tüm filmler
+        özellik matrisi üzerinden tam kosinüsle taranır, böylece maskeye
+        uyan en az n film varsa her zaman n sonuç döner.
+
+        Parameters
+        ----------
+        idx : int
+            Filmin satır indeksi
+        n : int, optional
+            Döndürülecek komşu sayısı, by default 10
+        mask : Optional[np.ndarray], optional
+            (N,) boyutlu, seçilebilecek filmleri gösteren bool maske,
+            by default None
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Komşu satır indeksleri ve benzerlik skorları
+        """
+        if mask is not None:
+            return self._query_masked(idx, n, mask)
+        if n > self.n_neighbors:
+            self.logger.warning(
+                f"{n} komşu istendi ancak indeks yalnızca {self.n_neighbors} komşu saklıyor."
+            )
+        return self.indices[idx, :n], self.scores[idx, :n]
+
+    def _query_masked(self, idx: int, n: int, mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Maskeye uyan en benzer n komşuyu, gerekirse tam taramayla döndürür."""
+        neighbors = self.indices[idx]
+        keep = mask[neighbors]
+        if keep.sum() >= n or self.features is None:
+            if self.features is None and keep.sum() < n:
+                self.logger.warning("Özellik matrisi saklanmadığı için filtreli sonuçlar eksik olabilir.")
+            return neighbors[keep][:n], self.scores[idx][keep][:n]
+
+        candidates = np.flatnonzero(mask)
+        candidates = candidates[candidates != idx]
+        scores = np.asarray((self.features[candidates] @ self.features[idx].T).todense()).ravel()
+        order, values = top_k(scores, n)
+        return candidates[order], values.astype(np.float32, copy=False)
+
+    def query_batch(self, idxs: np.ndarray, n: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Birden çok filmin en benzer n komşusunu tek seferde döndürür.
+
+        Parameters
+        ----------
+        idxs : np.ndarray
+            Filmlerin satır indeksleri
+        n : int, optional
+            Film başına döndürülecek komşu sayısı, by default 10
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            (len(idxs), n) boyutlu komşu satır indeksleri ve benzerlik skorları
+        """
+        if n > self.n_neighbors:
+            self.logger.warning(
+                f"{n} komşu istendi ancak indeks yalnızca {self.n_neighbors} komşu saklıyor."
+            )
+        idxs = np.asarray(idxs, dtype=np.int64)
+        return self.indices[idxs, :n], self.scores[idxs, :n]
+
+    def to_csr(self) -> sparse.csr_matrix:
+        """
+        İndeksi (N, N) boyutlu seyrek benzerlik matrisine dönüştürür.
+
+        Returns
+        -------
+        sparse.csr_matrix
+            Her satırda yalnızca K komşu skoru bulunan seyrek matris
+        """
+        n_rows, k = self.indices.shape
+        indptr = np.arange(0, n_rows * k + 1, k, dtype=np.int64)
+        return sparse.csr_matrix(
+            (self.scores.ravel(), self.indices.ravel(), indptr), shape=(n_rows, n_rows)
+        )
+
+    def save(self, path: str) -> None:
+        """
+        İndeksi .npz dosyasına kaydeder.
+
+        Parameters
+        ----------
+        path : str
+            Hedef dosya yolu
+        """
+        arrays = {'indices': self.indices, 'scores': self.scores}
+        if self.features is not None:
+            arrays.update({
+                'features_data': self.features.data,
+                'features_indices': self.features.indices,
+                'features_indptr': self.features.indptr,
+                'features_shape': np.asarray(self.features.shape),
+            })
+        np.savez(Path(path), **arrays)
+        self.logger.info(f"Komşu indeksi kaydedildi: {path}")
+
+    @classmethod
+    def load(cls, path: str) -> 'NeighborIndex':
+        """
+        Kaydedilmiş indeksi yükler.
+
+        Parameters
+        ----------
+        path : str
+            İndeks dosyasının yolu
+
+        Returns
+        -------
+        NeighborIndex
+            Yüklenen komşu indeksi
+        """
+        with np.load(Path(path)) as data:
+            features = None
+            if 'features_data' in data:
+                features = sparse.csr_matrix(
+                    (data['features_data'], data['features_indices'], data['features_indptr']),
+                    shape=tuple(data['features_shape'])
+                )
+            return cls(data['indices'], data['scores'], features)
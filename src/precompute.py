@@ -0,0 +1,150 @@
+"""
+"X'e benzer filmler" önerilerini tüm katalog için önceden hesaplayıp öneri tablosuna yazan toplu iş.
+
+Kullanım:
+    python -m src.precompute --k 20 --candidates 50
+"""
+import argparse
+import logging
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .data_loader import DataLoader
+from .feature_engineer import FeatureEngineer
+from .neighbor_index import NeighborIndex, top_k
+from .recommendation_table import RecommendationTable
+from .recommender import HYBRID_CANDIDATES, HybridWeights, blend_hybrid_scores
+from .weighted_rating import WeightedRatingCache, scale_to_unit
+
+# Tabloda film başına saklanan varsayılan komşu sayısı
+TABLE_NEIGHBORS = 20
+
+logger = logging.getLogger(__name__)
+
+
+def build_recommendation_tables(
+    movies_df: pd.DataFrame,
+    path: str,
+    k: int = TABLE_NEIGHBORS,
+    feature_engineer: Optional[FeatureEngineer] = None,
+    weights: Optional[HybridWeights] = None,
+    n_candidates: int = HYBRID_CANDIDATES
+) -> RecommendationTable:
+    """
+    Her film için özet, meta veri ve hibrit türlerinde en yakın k komşuyu hesaplar.
+
+    Hibrit tür, meta veri indeksinden alınan n_candidates aday üzerinde
+    MovieRecommender.get_hybrid_recommendations ile aynı harmanlamayı
+    (kullanıcı olmadan: içerik benzerliği ve ağırlıklı puan) kullanır.
+
+    Parameters
+    ----------
+    movies_df : pd.DataFrame
+        Ön işlenmiş katalog
+    path : str
+        Tablo dizini
+    k : int, optional
+        Film başına saklanacak komşu sayısı, by default TABLE_NEIGHBORS
+    feature_engineer : Optional[FeatureEngineer], optional
+        İndeksleri oluşturacak nesne, by default None
+    weights : Optional[HybridWeights], optional
+        Hibrit skor ağırlıkları, by default HybridWeights()
+    n_candidates : int, optional
+        Hibrit sıralamada film başına aday sayısı, by default HYBRID_CANDIDATES
+
+    Returns
+    -------
+    RecommendationTable
+        Yazılan tablo
+    """
+    feature_engineer = feature_engineer or FeatureEngineer()
+    n_candidates = max(n_candidates, k)
+
+    overview_index = feature_engineer.build_tfidf_index(movies_df, k=k)
+    metadata_index = feature_engineer.build_content_index(movies_df, k=n_candidates)
+    return write_recommendation_tables(
+        movies_df, path, overview_index, metadata_index, k=k,
+        rating_cache=feature_engineer.rating_cache, weights=weights, n_candidates=n_candidates
+    )
+
+
+def write_recommendation_tables(
+    movies_df: pd.DataFrame,
+    path: str,
+    overview_index: NeighborIndex,
+    metadata_index: NeighborIndex,
+    k: int = TABLE_NEIGHBORS,
+    rating_cache: Optional[WeightedRatingCache] = None,
+    weights: Optional[HybridWeights] = None,
+    n_candidates: int = HYBRID_CANDIDATES
+) -> RecommendationTable:
+    """
+    Hazır komşu indekslerinden öneri tablosunu yazar.
+
+    İndeksler yeniden hesaplanmaz; DeltaIngestor gibi indeksleri yerinde
+    güncelleyen çağıranlar tabloyu bu fonksiyonla tazeler.
+
+    Parameters
+    ----------
+    movies_df : pd.DataFrame
+        İndeks satırlarıyla hizalı ön işlenmiş katalog
+    path : str
+        Tablo dizini
+    overview_index : NeighborIndex
+        Özet (TF-IDF) komşu indeksi, en az k komşulu
+    metadata_index : NeighborIndex
+        Meta veri komşu indeksi, en az n_candidates komşulu
+    k : int, optional
+        Film başına saklanacak komşu sayısı, by default TABLE_NEIGHBORS
+    rating_cache : Optional[WeightedRatingCache], optional
+        Ağırlıklı puan önbelleği, by default None
+    weights : Optional[HybridWeights], optional
+        Hibrit skor ağırlıkları, by default HybridWeights()
+    n_candidates : int, optional
+        Hibrit sıralamada film başına aday sayısı, by default HYBRID_CANDIDATES
+
+    Returns
+    -------
+    RecommendationTable
+        Yazılan tablo
+    """
+    rating_cache = rating_cache or WeightedRatingCache()
+    weights = weights or HybridWeights()
+    n_candidates = max(n_candidates, k)
+    rows = np.arange(len(movies_df))
+
+    candidates, similarity = metadata_index.query_batch(rows, n_candidates)
+    rating_scores = scale_to_unit(rating_cache.scores(movies_df))[candidates]
+    hybrid_scores = blend_hybrid_scores(weights, similarity, rating_scores)
+    # Eşit skorlarda içerik sırasında önde olan aday önce gelir
+    columns, values = top_k(hybrid_scores, k)
+
+    neighbors = {
+        'overview': overview_index.query_batch(rows, k),
+        'metadata': metadata_index.query_batch(rows, k),
+        'hybrid': (np.take_along_axis(candidates, columns, axis=1), values),
+    }
+    return RecommendationTable.write(path, movies_df, neighbors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--data-dir', default=None)
+    parser.add_argument('--output', default=None)
+    parser.add_argument('--k', type=int, default=TABLE_NEIGHBORS)
+    parser.add_argument('--candidates', type=int, default=HYBRID_CANDIDATES)
+    parser.add_argument('--jobs', type=int, default=1)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    data_loader = DataLoader(args.data_dir)
+    movies_df = data_loader.load_preprocessed_data(n_jobs=args.jobs)
+    output = Path(args.output) if args.output else data_loader.recommendation_table_dir
+    build_recommendation_tables(movies_df, output, k=args.k, n_candidates=args.candidates)
+
+
+if __name__ == '__main__':
+    main()
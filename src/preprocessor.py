@@ -3,9 +3,22 @@ Veri ön işleme işlemlerini yöneten sınıf.
 """
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional
 import logging
-import ast
+import os
+
+from .json_parser import JsonColumnParser
+
+# Paralel ön işlemenin devreye girdiği en küçük satır sayısı.
+# benchmarks/preprocessing_crossover.py ile hedef donanımda yeniden ölçülmelidir.
+PARALLEL_MIN_ROWS = 20000
+
+
+def _preprocess_partition(df: pd.DataFrame) -> pd.DataFrame:
+    """Bir bölümü alt süreçte ön işler (ProcessPoolExecutor için modül düzeyinde)."""
+    return Preprocessor().preprocess_partition(df)
+
 
 class Preprocessor:
     """
@@ -13,24 +26,52 @@ class Preprocessor:
     
     Attributes
     ----------
+    n_jobs : int
+        Paralel ön işlemede kullanılacak süreç sayısı
+    parallel_min_rows : int
+        Paralel ön işlemenin devreye girdiği en küçük satır sayısı
+    json_parser : JsonColumnParser
+        JSON sütunlarını uzun tablolara ayrıştıran nesne
     logger : logging.Logger
         Loglama için logger nesnesi
     """
     
-    def __init__(self):
+    def __init__(self, n_jobs: Optional[int] = 1, parallel_min_rows: int = PARALLEL_MIN_ROWS):
         """
         Preprocessor sınıfının başlatıcı metodu.
+        
+        Parameters
+        ----------
+        n_jobs : Optional[int], optional
+            Süreç sayısı; None ise CPU çekirdek sayısı, by default 1 (seri)
+        parallel_min_rows : int, optional
+            Paralel ön işlemenin devreye girdiği en küçük satır sayısı,
+            by default PARALLEL_MIN_ROWS
         """
+        self.n_jobs = max(1, n_jobs or os.cpu_count() or 1)
+        self.parallel_min_rows = parallel_min_rows
+        self.json_parser = JsonColumnParser()
         self.logger = logging.getLogger(__name__)
         
-    def preprocess_data(self, df: pd.DataFrame) -> pd.DataFrame:
+    def preprocess_data(self, df: pd.DataFrame, runtime_fill: Optional[float] = None) -> pd.DataFrame:
         """
         Veri setini ön işler.
         
+        Eksik değer doldurma tüm veri seti üzerinden (ör. süre ortalaması)
+        yapıldığı için her zaman seri çalışır. n_jobs > 1 ve veri seti yeterince
+        büyükse kalan adımlar bölümlere ayrılarak süreç havuzunda yürütülür;
+        bölümler özgün sırayla birleştirildiği için sonuç seri yolla aynıdır.
+        
+        Yalnızca yeni filmler işlenirken eksik süreler, küçük partinin değil
+        katalogun ortalamasıyla doldurulmalıdır (runtime_fill).
+        
         Parameters
         ----------
         df : pd.DataFrame
             İşlenecek veri seti
+        runtime_fill : Optional[float], optional
+            Eksik sürelerin doldurulacağı değer, by default None (veri
+            setinin ortalaması)
             
         Returns
         -------
@@ -44,19 +85,12 @@ class Preprocessor:
         """
         try:
             # Eksik değerleri temizle
-            df = self.clean_missing_values(df)
+            df = self.clean_missing_values(df, runtime_fill)
             
-            # JSON sütunlarını ayrıştır
-            df = self.parse_json_columns(df, ['cast', 'crew', 'keywords', 'genres'])
-            
-            # Yönetmen bilgisini çıkar
-            df = self.extract_director(df)
-            
-            # Önemli öğeleri çıkar
-            df = self.extract_top_items(df, ['cast', 'keywords', 'genres'])
-            
-            # Metin verilerini temizle
-            df = self.clean_text_data(df, ['cast', 'keywords', 'genres'])
+            if self.n_jobs > 1 and len(df) >= self.parallel_min_rows:
+                df = self._preprocess_parallel(df)
+            else:
+                df = self.preprocess_partition(df)
             
             self.logger.info("Veri ön işleme başarıyla tamamlandı.")
             return df
@@ -65,7 +99,50 @@ class Preprocessor:
             self.logger.error(f"Veri ön işleme hatası: {str(e)}")
             raise
         
-    def clean_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
+    def preprocess_partition(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Satır bazında bağımsız ön işleme adımlarını uygular.
+        
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Eksik değerleri doldurulmuş veri seti veya bir bölümü
+            
+        Returns
+        -------
+        pd.DataFrame
+            Ön işlenmiş veri seti
+        """
+        # JSON sütunlarını uzun tablolara ayrıştır
+        tables = self.build_long_tables(df)
+        
+        # Yönetmeni ve önemli öğeleri uzun tablolardan türet
+        return self.apply_long_tables(df, tables)
+        
+    def _preprocess_parallel(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Veri setini bölümlere ayırıp süreç havuzunda ön işler.
+        
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Eksik değerleri doldurulmuş veri seti
+            
+        Returns
+        -------
+        pd.DataFrame
+            Bölümleri özgün sırayla birleştirilmiş ön işlenmiş veri seti
+        """
+        bounds = np.linspace(0, len(df), self.n_jobs + 1, dtype=int)
+        partitions = [df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+        
+        with ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
+            results = list(executor.map(_preprocess_partition, partitions))
+            
+        self.logger.info(f"Veri seti {len(partitions)} bölümde paralel olarak ön işlendi.")
+        return pd.concat(results)
+        
+    def clean_missing_values(self, df: pd.DataFrame, runtime_fill: Optional[float] = None) -> pd.DataFrame:
         """
         Eksik değerleri temizler.
         
@@ -73,6 +150,9 @@ class Preprocessor:
         ----------
         df : pd.DataFrame
             İşlenecek veri seti
+        runtime_fill : Optional[float], optional
+            Eksik sürelerin doldurulacağı değer, by default None (veri
+            setinin ortalaması)
             
         Returns
         -------
@@ -88,7 +168,9 @@ class Preprocessor:
             # Eksik değerleri doldur
             df['overview'] = df['overview'].fillna('')
             df['tagline'] = df['tagline'].fillna('')
-            df['runtime'] = df['runtime'].fillna(df['runtime'].mean())
+            if runtime_fill is None:
+                runtime_fill = df['runtime'].mean()
+            df['runtime'] = df['runtime'].fillna(runtime_fill)
             df['budget'] = df['budget'].fillna(0)
             df['revenue'] = df['revenue'].fillna(0)
             
@@ -99,6 +181,74 @@ class Preprocessor:
             self.logger.error(f"Eksik değer temizleme hatası: {str(e)}")
             raise
             
+    def build_long_tables(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """
+        cast, crew, keywords ve genres sütunlarını uzun tablolara ayrıştırır.
+        
+        Parameters
+        ----------
+        df : pd.DataFrame
+            İşlenecek veri seti
+            
+        Returns
+        -------
+        Dict[str, pd.DataFrame]
+            Sütun adına göre (movie_id, row, role, name, order) tabloları
+        """
+        return self.json_parser.parse(df, ['cast', 'crew', 'keywords', 'genres'])
+        
+    def apply_long_tables(
+        self,
+        df: pd.DataFrame,
+        tables: Dict[str, pd.DataFrame],
+        n: int = 3
+    ) -> pd.DataFrame:
+        """
+        Uzun tablolardan yönetmeni ve ilk n öğeyi türetip veri setine ekler.
+        
+        cast, keywords ve genres sütunları temizlenmiş isim listeleriyle
+        değiştirilir; ham crew sütunu yönetmen çıkarıldıktan sonra atılır.
+        Filtrelerin tüm türleri görebilmesi için kesilmemiş tür listesi
+        genres_all sütununda tutulur.
+        
+        Parameters
+        ----------
+        df : pd.DataFrame
+            İşlenecek veri seti
+        tables : Dict[str, pd.DataFrame]
+            build_long_tables çıktısı
+        n : int, optional
+            Sütun başına tutulacak öğe sayısı, by default 3
+            
+        Returns
+        -------
+        pd.DataFrame
+            Yönetmen ve önemli öğeleri eklenmiş veri seti
+            
+        Raises
+        ------
+        Exception
+            Öğe çıkarma işlemi başarısız olduğunda
+        """
+        try:
+            if 'crew' in tables:
+                df['director'] = self.json_parser.first_name(tables['crew'], df.index, 'Director')
+                df = df.drop(columns=['crew'])
+                
+            if 'genres' in tables:
+                df['genres_all'] = self.json_parser.top_names(tables['genres'], df.index, n=None, clean=True)
+                
+            for column in ['cast', 'keywords', 'genres']:
+                if column in tables:
+                    df[column] = self.json_parser.top_names(tables[column], df.index, n=n, clean=True)
+                    
+            self.logger.info("Yönetmen ve önemli öğeler uzun tablolardan çıkarıldı.")
+            return df
+            
+        except Exception as e:
+            self.logger.error(f"Uzun tablo işleme hatası: {str(e)}")
+            raise
+            
     def parse_json_columns(self, df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
         """
         JSON formatındaki sütunları ayrıştırır.
@@ -123,7 +273,11 @@ class Preprocessor:
         try:
             for column in columns:
                 if column in df.columns:
-                    df[column] = df[column].apply(lambda x: ast.literal_eval(x) if isinstance(x, str) else x)
+                    values = df[column].tolist()
+                    decoded = iter(self.json_parser.decode(
+                        pd.Series([x for x in values if isinstance(x, str)], dtype=object)
+                    ))
+                    df[column] = [next(decoded) if isinstance(x, str) else x for x in values]
                 
             self.logger.info("JSON sütunları başarıyla ayrıştırıldı.")
             return df
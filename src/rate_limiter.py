@@ -0,0 +1,343 @@
+"""
+TMDB istekleri için süreç genelinde paylaşılan jeton kovası hız sınırlayıcı ve eş zamanlı aynı istekleri birleştiren yardımcı.
+"""
+import asyncio
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional
+
+# TMDB'nin belgelenen istek sınırı: 10 saniyede 40 istek
+TMDB_RATE_LIMIT = 4.0
+TMDB_BURST = 40
+
+# Bir isteğin hız sınırı için bekleyebileceği en uzun süre (saniye)
+RATE_LIMIT_MAX_WAIT = 5.0
+
+# X-RateLimit-Reset bu değerden büyükse saniye değil Unix zamanı olarak yorumlanır
+_EPOCH_THRESHOLD = 1e9
+
+
+class RateLimitExceeded(Exception):
+    """İzin verilen bekleme süresi içinde istek hakkı alınamadığında fırlatılır."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Hız sınırına ulaşıldı, {retry_after:.1f} saniye sonra tekrar deneyin.")
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """
+    İş parçacığı güvenli ve asyncio ile kullanılabilen jeton kovası.
+
+    Kova saniyede rate jetonla dolar ve en fazla capacity jeton biriktirir.
+    Her istek bir jeton harcar; jeton yoksa istek, sırası gelene kadar
+    bekleyeceği süreyi ayırtır (kova eksiye düşer), böylece bekleyenler geliş
+    sırasıyla ve toplamda sınırı aşmadan geçer. Kilit yalnızca hesap için
+    tutulur; bekleme kilit dışında, senkron çağıranlarda time.sleep,
+    asenkron çağıranlarda asyncio.sleep ile yapılır.
+
+    Sunucunun X-RateLimit-* başlıkları update_from_headers ile kovaya
+    yansıtılır: kalan hak yerel sayaçtan azsa kova ona indirilir, hak
+    bittiyse sıfırlanma zamanına kadar yeni jeton verilmez.
+
+    Attributes
+    ----------
+    rate : float
+        Saniyede eklenen jeton sayısı
+    capacity : float
+        Kovanın alabileceği en fazla jeton sayısı
+    logger : logging.Logger
+        Loglama için logger nesnesi
+    """
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        rate: float = TMDB_RATE_LIMIT,
+        capacity: float = TMDB_BURST,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        TokenBucket sınıfının başlatıcı metodu.
+
+        Parameters
+        ----------
+        rate : float, optional
+            Saniyede eklenen jeton sayısı, by default TMDB_RATE_LIMIT
+        capacity : float, optional
+            Kovanın alabileceği en fazla jeton sayısı, by default TMDB_BURST
+        clock : Callable[[], float], optional
+            Monoton saat, by default time.monotonic
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate ve capacity pozitif olmalıdır.")
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.logger = logging.getLogger(__name__)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._blocked_until = 0.0
+
+    @classmethod
+    def default(cls) -> 'TokenBucket':
+        """Süreç içindeki tüm TMDB istemcilerinin paylaştığı kovayı döndürür."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Jeton alır; gerekirse sırası gelene kadar iş parçacığını bekletir.
+
+        Parameters
+        ----------
+        tokens : float, optional
+            Harcanacak jeton sayısı, by default 1
+        timeout : Optional[float], optional
+            En fazla bekleme süresi (saniye), by default None (sınırsız)
+
+        Returns
+        -------
+        bool
+            Jeton alındıysa True; bekleme timeout'u aşacaksa jeton
+            harcanmadan False
+        """
+        delay = self._reserve(tokens, timeout)
+        if delay is None:
+            return False
+        if delay > 0:
+            time.sleep(delay)
+        return True
+
+    async def acquire_async(self, tokens: float = 1, timeout: Optional[float] = None) -> bool:
+        """
+        acquire'ın olay döngüsünü bloklamayan karşılığı.
+
+        Parameters
+        ----------
+        tokens : float, optional
+            Harcanacak jeton sayısı, by default 1
+        timeout : Optional[float], optional
+            En fazla bekleme süresi (saniye), by default None (sınırsız)
+
+        Returns
+        -------
+        bool
+            Jeton alındıysa True; bekleme timeout'u aşacaksa False
+        """
+        delay = self._reserve(tokens, timeout)
+        if delay is None:
+            return False
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return True
+
+    def wait_time(self, tokens: float = 1) -> float:
+        """Şu an istenseydi jeton için beklenecek süreyi (saniye) döndürür."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            return self._delay(now, tokens)
+
+    def update_from_headers(self, headers: Mapping[str, str], status_code: Optional[int] = None) -> None:
+        """
+        Kovayı sunucunun bildirdiği hız sınırı durumuna göre günceller.
+
+        X-RateLimit-Limit kovanın kapasitesini, X-RateLimit-Remaining kalan
+        hakkı, X-RateLimit-Reset (saniye veya Unix zamanı) hakların
+        yenileneceği anı belirtir. 429 yanıtlarında Retry-After kullanılır.
+
+        Parameters
+        ----------
+        headers : Mapping[str, str]
+            Yanıt başlıkları
+        status_code : Optional[int], optional
+            Yanıtın HTTP durum kodu, by default None
+        """
+        limit = _parse_float(headers.get('X-RateLimit-Limit'))
+        remaining = _parse_float(headers.get('X-RateLimit-Remaining'))
+        reset_in = _parse_reset(headers.get('X-RateLimit-Reset'))
+        retry_after = parse_retry_after(headers.get('Retry-After')) if status_code == 429 else None
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            if limit is not None and limit > 0:
+                self.capacity = limit
+                self._tokens = min(self._tokens, limit)
+            if remaining is not None:
+                self._tokens = min(self._tokens, remaining)
+
+            pause = None
+            if retry_after is not None:
+                pause = retry_after
+            elif remaining is not None and remaining <= 0:
+                pause = reset_in if reset_in is not None else self.capacity / self.rate
+            if pause is not None:
+                self._tokens = min(self._tokens, 0.0)
+                self._blocked_until = max(self._blocked_until, now + pause)
+                self.logger.warning(f"TMDB hız sınırına ulaşıldı, istekler {pause:.1f} saniye bekletilecek.")
+
+    def _reserve(self, tokens: float, timeout: Optional[float]) -> Optional[float]:
+        """Jetonları ayırtır ve beklenecek süreyi döndürür; timeout aşılacaksa None."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            delay = self._delay(now, tokens)
+            if timeout is not None and delay > timeout:
+                return None
+            self._tokens -= tokens
+            return delay
+
+    def _delay(self, now: float, tokens: float) -> float:
+        """Jetonların kullanılabilir olacağı ana kalan süre (kilit altında çağrılır)."""
+        blocked = max(0.0, self._blocked_until - now)
+        deficit = tokens - self._tokens
+        # Engel süresince jeton birikmediği için açık engel bittikten sonra kapanır
+        return blocked + max(0.0, deficit) / self.rate
+
+    def _refill(self, now: float) -> None:
+        """Geçen süre kadar jeton ekler (kilit altında çağrılır)."""
+        start = max(self._updated_at, self._blocked_until)
+        if now > start:
+            self._tokens = min(self.capacity, self._tokens + (now - start) * self.rate)
+        self._updated_at = max(self._updated_at, now)
+
+
+class _Call:
+    """Uçuştaki bir çağrının sonucu."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Aynı anahtarla eş zamanlı yapılan çağrıları tek çağrıda birleştiren sınıf.
+
+    Bir anahtar için ilk gelen çağıran işi yürütür; iş sürerken aynı
+    anahtarla gelenler yeni bir çağrı yapmak yerine onun sonucunu (veya
+    istisnasını) paylaşır. İş bittiğinde anahtar serbest kalır; sonuçlar
+    saklanmaz, önbellekleme çağıranın işidir. Paylaşılan sonuç aynı nesne
+    olduğundan çağıranlar onu değiştirmemelidir.
+    """
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Hashable, asyncio.Future] = {}
+
+    @classmethod
+    def default(cls) -> 'SingleFlight':
+        """Süreç içindeki tüm TMDB istemcilerinin paylaştığı örneği döndürür."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        fn'i anahtar için tek seferde çalıştırır.
+
+        Parameters
+        ----------
+        key : Hashable
+            Çağrının anahtarı (ör. endpoint ve parametreler)
+        fn : Callable[[], Any]
+            Yürütülecek iş
+
+        Returns
+        -------
+        Any
+            fn'in sonucu (birleştirilen çağıranlar için aynı nesne)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        do'nun asenkron karşılığı; aynı olay döngüsündeki eş zamanlı
+        çağıranlar tek bir görevi bekler.
+
+        Parameters
+        ----------
+        key : Hashable
+            Çağrının anahtarı
+        fn : Callable[[], Awaitable[Any]]
+            Yürütülecek eşyordamı döndüren fonksiyon
+
+        Returns
+        -------
+        Any
+            Eşyordamın sonucu
+        """
+        loop = asyncio.get_running_loop()
+        task_key = (id(loop), key)
+        task = self._tasks.get(task_key)
+        if task is None:
+            task = self._tasks[task_key] = loop.create_task(fn())
+            task.add_done_callback(lambda _: self._tasks.pop(task_key, None))
+        # Bekleyenlerden biri iptal edilirse ortak görev iptal olmaz
+        return await asyncio.shield(task)
+
+
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    """X-RateLimit-Reset değerini şu andan itibaren saniyeye çevirir."""
+    reset = _parse_float(value)
+    if reset is None:
+        return None
+    if reset > _EPOCH_THRESHOLD:
+        reset -= time.time()
+    return max(0.0, reset)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After değerini (saniye veya HTTP tarihi) saniyeye çevirir."""
+    seconds = _parse_float(value)
+    if seconds is not None:
+        return max(0.0, seconds)
+    if value is None:
+        return None
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,476 @@
+"""
+Kullanıcı puanlarını yoğun tamsayı ID eşlemeli seyrek kullanıcı × öğe matrisi olarak saklayan sınıf.
+"""
+import logging
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# Puan dosyasının sütunları ve bellekte tutuldukları tipler
+RATINGS_DTYPES = {'userId': np.int32, 'movieId': np.int32, 'rating': np.float32}
+
+# CSV dosyasının parça parça okunduğu satır sayısı
+RATINGS_CHUNK_ROWS = 1_000_000
+
+# Ek puanlar ana matristeki puanların bu oranını aştığında ana matrise katlanır
+RATINGS_DELTA_MAX_FRACTION = 0.1
+
+# Bu sayının altındaki ek puanlar ana matrisin boyutundan bağımsız olarak ekte tutulur
+RATINGS_DELTA_MIN_ROWS = 10_000
+
+
+class RatingsUpdate(NamedTuple):
+    """Yeni puanların etkilediği satır ve sütun kodları."""
+    users: np.ndarray
+    items: np.ndarray
+    new_users: np.ndarray
+    new_items: np.ndarray
+
+
+class RatingsDelta(NamedTuple):
+    """Ana matrise henüz katlanmamış puanlar (geliş sırasıyla; aynı çiftte sonuncusu geçerlidir)."""
+    rows: np.ndarray
+    cols: np.ndarray
+    values: np.ndarray
+
+
+class RatingsMatrix:
+    """
+    Puanları (n_users, n_items) boyutlu CSR matrisinde ve aynı matrisin CSC
+    kopyasında tutan sınıf.
+
+    Ham kullanıcı ve film ID'leri 0..n-1 aralığındaki yoğun kodlara eşlenir;
+    ilk yüklemede kodlar ID sırasındadır, with_ratings ile sonradan gelen
+    kullanıcı ve filmler sona eklenir, böylece var olan kodlar değişmez.
+    Bir kullanıcının puanladığı filmlere CSR, bir filmi puanlayan
+    kullanıcılara CSC üzerinden yalnızca ilgili satır/sütun okunarak
+    erişilir.
+
+    Ana matris hiç değiştirilmez. with_ratings ile gelen puanlar yalnızca
+    eklenen bir ek listesinde (delta) tutulur; user_matrix ve item_matrix
+    istenen satır ve sütunları ek puanlarla birleştirerek döndürür. Tam
+    matris (csr, csc) ilk istendiğinde birleştirilir; ek liste ana matrisin
+    RATINGS_DELTA_MAX_FRACTION oranını aştığında ana matrise katlanır.
+
+    Attributes
+    ----------
+    user_ids : np.ndarray
+        Satır koduna göre ham kullanıcı ID'leri
+    item_ids : np.ndarray
+        Sütun koduna göre ham film ID'leri
+    base_csr : sparse.csr_matrix
+        Ek puanlar hariç float32 puan matrisi
+    base_csc : sparse.csc_matrix
+        Aynı matrisin sütun sıkıştırılmış kopyası
+    delta : RatingsDelta
+        Ana matrise katlanmamış puanlar
+    logger : logging.Logger
+        Loglama için logger nesnesi
+    """
+
+    def __init__(
+        self,
+        user_ids: np.ndarray,
+        item_ids: np.ndarray,
+        csr: sparse.csr_matrix,
+        csc: Optional[sparse.csc_matrix] = None,
+        delta: Optional[RatingsDelta] = None
+    ):
+        """
+        RatingsMatrix sınıfının başlatıcı metodu.
+
+        Parameters
+        ----------
+        user_ids : np.ndarray
+            Satır koduna göre ham kullanıcı ID'leri
+        item_ids : np.ndarray
+            Sütun koduna göre ham film ID'leri
+        csr : sparse.csr_matrix
+            Ana puan matrisi; boyutu en fazla (len(user_ids), len(item_ids))
+        csc : Optional[sparse.csc_matrix], optional
+            Aynı matrisin CSC kopyası, by default None (csr'dan oluşturulur)
+        delta : Optional[RatingsDelta], optional
+            Ana matrise katlanmamış puanlar, by default None
+        """
+        self.user_ids = np.asarray(user_ids)
+        self.item_ids = np.asarray(item_ids)
+        if not (sparse.isspmatrix_csr(csr) and csr.dtype == np.float32):
+            csr = sparse.csr_matrix(csr, dtype=np.float32)
+        self.base_csr = csr
+        self.base_csc = self.base_csr.tocsc() if csc is None else csc
+        self.delta = delta or RatingsDelta(
+            np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        )
+        self._user_index = pd.Index(self.user_ids)
+        self._item_index = pd.Index(self.item_ids)
+        self._merged = None
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def from_csv(
+        cls,
+        path: str,
+        chunksize: int = RATINGS_CHUNK_ROWS,
+        dtypes: Optional[Dict[str, type]] = None
+    ) -> 'RatingsMatrix':
+        """
+        Puan CSV dosyasını parça parça ve sıkıştırılmış tiplerle okur.
+
+        Parameters
+        ----------
+        path : str
+            userId, movieId ve rating sütunlarını içeren CSV dosyası
+        chunksize : int, optional
+            Tek seferde okunan satır sayısı, by default RATINGS_CHUNK_ROWS
+        dtypes : Optional[Dict[str, type]], optional
+            Sütun tipleri, by default RATINGS_DTYPES
+
+        Returns
+        -------
+        RatingsMatrix
+            Oluşturulan puan matrisi
+        """
+        dtypes = dtypes or RATINGS_DTYPES
+        users, items, ratings = [], [], []
+        reader = pd.read_csv(Path(path), usecols=list(dtypes), dtype=dtypes, chunksize=chunksize)
+        for chunk in reader:
+            users.append(chunk['userId'].to_numpy())
+            items.append(chunk['movieId'].to_numpy())
+            ratings.append(chunk['rating'].to_numpy())
+
+        if not users:
+            return cls.from_arrays(np.empty(0, np.int32), np.empty(0, np.int32), np.empty(0, np.float32))
+        return cls.from_arrays(np.concatenate(users), np.concatenate(items), np.concatenate(ratings))
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'RatingsMatrix':
+        """
+        userId, movieId ve rating sütunlarını içeren DataFrame'den matris oluşturur.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Puan verileri
+
+        Returns
+        -------
+        RatingsMatrix
+            Oluşturulan puan matrisi
+        """
+        return cls.from_arrays(df['userId'].to_numpy(), df['movieId'].to_numpy(), df['rating'].to_numpy())
+
+    @classmethod
+    def from_arrays(cls, users: np.ndarray, items: np.ndarray, ratings: np.ndarray) -> 'RatingsMatrix':
+        """
+        (kullanıcı, film, puan) dizilerinden matris oluşturur.
+
+        Aynı (kullanıcı, film) çifti birden çok kez geçiyorsa son puan tutulur.
+
+        Parameters
+        ----------
+        users : np.ndarray
+            Ham kullanıcı ID'leri
+        items : np.ndarray
+            Ham film ID'leri
+        ratings : np.ndarray
+            Puanlar
+
+        Returns
+        -------
+        RatingsMatrix
+            Oluşturulan puan matrisi
+        """
+        user_ids, user_codes = np.unique(users, return_inverse=True)
+        item_ids, item_codes = np.unique(items, return_inverse=True)
+
+        # Her çiftin son geçtiği satır tutulur; sonuç CSR sırasındadır
+        keys = user_codes.astype(np.int64) * len(item_ids) + item_codes
+        _, last = np.unique(keys[::-1], return_index=True)
+        keep = len(keys) - 1 - last
+
+        csr = sparse.csr_matrix(
+            (np.asarray(ratings, dtype=np.float32)[keep], (user_codes[keep], item_codes[keep])),
+            shape=(len(user_ids), len(item_ids))
+        )
+        matrix = cls(user_ids, item_ids, csr)
+        matrix.logger.info(
+            f"Puan matrisi oluşturuldu ({matrix.n_users} kullanıcı, {matrix.n_items} film, "
+            f"{matrix.nnz} puan)."
+        )
+        return matrix
+
+    @property
+    def n_users(self) -> int:
+        return len(self.user_ids)
+
+    @property
+    def n_items(self) -> int:
+        return len(self.item_ids)
+
+    @property
+    def csr(self) -> sparse.csr_matrix:
+        """Ek puanlar katlanmış (n_users, n_items) boyutlu puan matrisi (ilk istendiğinde birleştirilir)."""
+        return self._merged_matrices()[0]
+
+    @property
+    def csc(self) -> sparse.csc_matrix:
+        """csr'ın sütun sıkıştırılmış kopyası."""
+        return self._merged_matrices()[1]
+
+    @property
+    def nnz(self) -> int:
+        return self.csr.nnz
+
+    @property
+    def rating_scale(self) -> Tuple[float, float]:
+        """Matristeki en küçük ve en büyük puan."""
+        if self.nnz == 0:
+            return (0.0, 0.0)
+        return float(self.csr.data.min()), float(self.csr.data.max())
+
+    def user_rows(self, users: Sequence) -> np.ndarray:
+        """Ham kullanıcı ID'lerinin satır kodlarını döndürür (bilinmeyenler -1)."""
+        return self._user_index.get_indexer(np.asarray(users))
+
+    def item_cols(self, items: Sequence) -> np.ndarray:
+        """Ham film ID'lerinin sütun kodlarını döndürür (bilinmeyenler -1)."""
+        return self._item_index.get_indexer(np.asarray(items))
+
+    def user_matrix(self, rows: Sequence[int]) -> sparse.csr_matrix:
+        """
+        Verilen kullanıcıların ek puanlarla birleştirilmiş satırlarını döndürür.
+
+        Maliyet yalnızca bu satırlardaki ve ek listedeki puan sayısına bağlıdır.
+
+        Parameters
+        ----------
+        rows : Sequence[int]
+            Satır kodları
+
+        Returns
+        -------
+        sparse.csr_matrix
+            (len(rows), n_items) boyutlu puanlar
+        """
+        if self._merged is not None:
+            return self._merged[0][np.asarray(rows, dtype=np.int64)]
+        return self._lines(self.base_csr, rows, self.delta.rows, self.delta.cols, self.n_items)
+
+    def item_matrix(self, cols: Sequence[int]) -> sparse.csr_matrix:
+        """
+        Verilen filmlerin ek puanlarla birleştirilmiş sütunlarını satır olarak döndürür.
+
+        Parameters
+        ----------
+        cols : Sequence[int]
+            Sütun kodları
+
+        Returns
+        -------
+        sparse.csr_matrix
+            (len(cols), n_users) boyutlu puanlar (puan matrisinin devriği)
+        """
+        if self._merged is not None:
+            return self._merged[1][:, np.asarray(cols, dtype=np.int64)].T.tocsr()
+        # CSC'nin devriği, sütunları satır olarak tutan bir CSR'dır
+        return self._lines(self.base_csc.T, cols, self.delta.cols, self.delta.rows, self.n_users)
+
+    def user_items(self, user) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Bir kullanıcının puanladığı filmleri döndürür.
+
+        Parameters
+        ----------
+        user
+            Ham kullanıcı ID'si
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Ham film ID'leri ve puanlar; kullanıcı bilinmiyorsa boş diziler
+        """
+        row = self.user_rows([user])[0]
+        if row < 0:
+            return self.item_ids[:0], np.empty(0, dtype=np.float32)
+        line = self.user_matrix([row])
+        return self.item_ids[line.indices], line.data
+
+    def item_users(self, item) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Bir filmi puanlayan kullanıcıları döndürür.
+
+        Parameters
+        ----------
+        item
+            Ham film ID'si
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Ham kullanıcı ID'leri ve puanlar; film bilinmiyorsa boş diziler
+        """
+        col = self.item_cols([item])[0]
+        if col < 0:
+            return self.user_ids[:0], np.empty(0, dtype=np.float32)
+        line = self.item_matrix([col])
+        return self.user_ids[line.indices], line.data
+
+    def with_ratings(
+        self,
+        users: Sequence,
+        items: Sequence,
+        ratings: Sequence
+    ) -> Tuple['RatingsMatrix', RatingsUpdate]:
+        """
+        Yeni veya değişen puanları içeren yeni bir matris döndürür.
+
+        Matrisin kendisi değiştirilmez; eski matrisi kullanan okuyucular
+        (ör. arka planda süren eğitim) tutarlı bir kopya görmeye devam eder.
+        Yeni matris ana matrisi paylaşır ve puanları yalnızca ek listesine
+        ekler; maliyet ana matristeki puan sayısına değil ek listesinin
+        boyuna bağlıdır. Yeni kullanıcı ve filmler sona eklendiği için var
+        olan kodlar ve bu kodlarla hizalı faktör matrisleri geçerli kalır.
+        Var olan bir (kullanıcı, film) çiftinin puanı yenisiyle değiştirilir.
+
+        Parameters
+        ----------
+        users : Sequence
+            Ham kullanıcı ID'leri
+        items : Sequence
+            Ham film ID'leri
+        ratings : Sequence
+            Puanlar
+
+        Returns
+        -------
+        Tuple[RatingsMatrix, RatingsUpdate]
+            Güncel matris ve etkilenen kodlar
+        """
+        users, items = np.asarray(users), np.asarray(items)
+        ratings = np.asarray(ratings, dtype=np.float32)
+
+        user_codes, new_user_ids = self._codes(self._user_index, users)
+        item_codes, new_item_ids = self._codes(self._item_index, items)
+        delta = RatingsDelta(
+            np.concatenate([self.delta.rows, user_codes]),
+            np.concatenate([self.delta.cols, item_codes]),
+            np.concatenate([self.delta.values, ratings]),
+        )
+        user_ids = np.concatenate([self.user_ids, new_user_ids]) if len(new_user_ids) else self.user_ids
+        item_ids = np.concatenate([self.item_ids, new_item_ids]) if len(new_item_ids) else self.item_ids
+
+        matrix = RatingsMatrix(user_ids, item_ids, self.base_csr, self.base_csc, delta)
+        # Ham ID eşlemeleri yalnızca yeni kullanıcı veya film geldiğinde yeniden kurulur
+        if not len(new_user_ids):
+            matrix._user_index = self._user_index
+        if not len(new_item_ids):
+            matrix._item_index = self._item_index
+        if len(delta.rows) > max(RATINGS_DELTA_MIN_ROWS, RATINGS_DELTA_MAX_FRACTION * self.base_csr.nnz):
+            matrix = matrix.compact()
+
+        update = RatingsUpdate(
+            users=np.unique(user_codes),
+            items=np.unique(item_codes),
+            new_users=np.arange(self.n_users, len(user_ids)),
+            new_items=np.arange(self.n_items, len(item_ids)),
+        )
+        matrix.logger.info(
+            f"Puan matrisi güncellendi: {len(ratings)} puan, {len(update.new_users)} yeni kullanıcı, "
+            f"{len(update.new_items)} yeni film."
+        )
+        return matrix, update
+
+    def compact(self) -> 'RatingsMatrix':
+        """
+        Ek puanları ana matrise katlanmış yeni bir matris döndürür.
+
+        Returns
+        -------
+        RatingsMatrix
+            Ek listesi boş, aynı kodlu matris (ek puan yoksa kendisi)
+        """
+        if not len(self.delta.rows) and self.base_csr.shape == (self.n_users, self.n_items):
+            return self
+        matrix = RatingsMatrix(self.user_ids, self.item_ids, self.csr, self.csc)
+        matrix._user_index, matrix._item_index = self._user_index, self._item_index
+        return matrix
+
+    def _merged_matrices(self) -> Tuple[sparse.csr_matrix, sparse.csc_matrix]:
+        """Ek puanları ana matrisle bir kez birleştirir; sonuç saklanır."""
+        if self._merged is None:
+            if not len(self.delta.rows) and self.base_csr.shape == (self.n_users, self.n_items):
+                self._merged = (self.base_csr, self.base_csc)
+            else:
+                csr = self._lines(self.base_csr, np.arange(self.n_users), self.delta.rows, self.delta.cols, self.n_items)
+                self._merged = (csr, csr.tocsc())
+        return self._merged
+
+    def _lines(
+        self,
+        base: sparse.csr_matrix,
+        codes: Sequence[int],
+        delta_major: np.ndarray,
+        delta_minor: np.ndarray,
+        n_minor: int
+    ) -> sparse.csr_matrix:
+        """
+        Ana matrisin verilen satırlarını ek puanlarla birleştirir.
+
+        Ana matris satırlarının puanları ve ek puanlar geliş sırasıyla dizilir;
+        aynı konumdaki puanlardan sonuncusu tutulur.
+        """
+        codes, inverse = np.unique(np.asarray(codes, dtype=np.int64), return_inverse=True)
+        inside = codes < base.shape[0]
+        starts = np.zeros(len(codes), dtype=np.int64)
+        counts = np.zeros(len(codes), dtype=np.int64)
+        starts[inside] = base.indptr[codes[inside]]
+        counts[inside] = base.indptr[codes[inside] + 1] - starts[inside]
+        offsets = np.cumsum(counts) - counts
+        positions = np.arange(counts.sum()) - np.repeat(offsets - starts, counts)
+
+        selected = np.flatnonzero(np.isin(delta_major, codes))
+        lines = np.concatenate([np.repeat(np.arange(len(codes)), counts), np.searchsorted(codes, delta_major[selected])])
+        minor = np.concatenate([base.indices[positions], delta_minor[selected]])
+        values = np.concatenate([base.data[positions], self.delta.values[selected]])
+
+        keys = lines * n_minor + minor
+        _, last = np.unique(keys[::-1], return_index=True)
+        keep = len(keys) - 1 - last
+        merged = sparse.csr_matrix(
+            (values[keep], (lines[keep], minor[keep])), shape=(len(codes), n_minor), dtype=np.float32
+        )
+        return merged if np.array_equal(inverse, np.arange(len(codes))) else merged[inverse]
+
+    @staticmethod
+    def _codes(index: pd.Index, raw_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Ham ID'lerin kodlarını döndürür; bilinmeyen ID'lere sona eklenecek yeni kodlar verilir."""
+        codes = index.get_indexer(raw_ids).astype(np.int64)
+        unknown = codes < 0
+        new_ids = pd.unique(raw_ids[unknown])
+        codes[unknown] = len(index) + pd.Index(new_ids).get_indexer(raw_ids[unknown])
+        return codes, new_ids
+
+    def to_frame(self, raw_ids: bool = True) -> pd.DataFrame:
+        """
+        Puanları CSR sırasıyla (userId, movieId, rating) DataFrame'ine dönüştürür.
+
+        Parameters
+        ----------
+        raw_ids : bool, optional
+            True ise ham ID'ler, False ise yoğun kodlar yazılır, by default True
+
+        Returns
+        -------
+        pd.DataFrame
+            Puan verileri
+        """
+        rows = np.repeat(np.arange(self.n_users, dtype=np.int32), np.diff(self.csr.indptr))
+        cols = self.csr.indices
+        return pd.DataFrame({
+            'userId': self.user_ids[rows] if raw_ids else rows,
+            'movieId': self.item_ids[cols] if raw_ids else cols,
+            'rating': self.csr.data,
+        })
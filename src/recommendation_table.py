@@ -0,0 +1,273 @@
+"""
+Önceden hesaplanmış film önerilerini diskte saklayan ve sabit zamanlı sorgulayan sınıf.
+"""
+import json
+import logging
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .artifact_store import new_version_dir, publish_version, read_current_version
+
+# Tablo dosya düzeni değiştiğinde artırılmalıdır
+TABLE_FORMAT_VERSION = 1
+
+# Tabloda saklanan benzerlik türleri
+TABLE_MODES = ('overview', 'metadata', 'hybrid')
+
+# Öneri kartları için katalogdan saklanan sütunlar (varsa)
+CATALOG_COLUMNS = ('movie_id', 'title', 'vote_average', 'vote_count', 'score')
+
+
+class RecommendationTable:
+    """
+    Her film ve her benzerlik türü için en yakın K komşuyu sabit genişlikli
+    .npy dosyalarında saklayan sınıf.
+
+    Komşu satırları ve skorları numpy.memmap ile salt okunur açılır; bir
+    sorgu yalnızca tek bir satırın okunmasıdır ve özellik matrisleri hiç
+    yüklenmez. Öneri kartlarını oluşturmak için gereken katalog sütunları
+    ayrı bir .npz dosyasında tutulur.
+
+    Tablo SimilarityStore gibi sürüm dizinlerine yazılır ve CURRENT
+    işaretçisi atomik olarak değiştirilir; tablo yolu hiçbir an eksik kalmaz.
+
+    Attributes
+    ----------
+    path : Path
+        Tablo dizini
+    version_dir : Path
+        Açılan sürümün dizini
+    meta : Dict[str, Any]
+        Tablo meta verisi (biçim sürümü, K, türler, katalog sürümü)
+    catalog : Dict[str, np.ndarray]
+        Satır sırasıyla katalog sütunları
+    logger : logging.Logger
+        Loglama için logger nesnesi
+    """
+
+    def __init__(self, path: str):
+        """
+        Var olan bir öneri tablosunu salt okunur olarak açar.
+
+        Parameters
+        ----------
+        path : str
+            Tablo dizini
+
+        Raises
+        ------
+        FileNotFoundError
+            Tablo dosyaları bulunamadığında
+        ValueError
+            Tablo biçimi desteklenmediğinde
+        """
+        self.path = Path(path)
+        self.logger = logging.getLogger(__name__)
+        self.version_dir, self.meta, self.catalog, self._indices, self._scores = read_current_version(
+            self.path, self._open
+        )
+
+        # Yinelenen başlık ve ID'lerde ilk satır kullanılır
+        titles = pd.Series(self.catalog['title'])
+        self._title_rows = pd.Index(titles[~titles.duplicated()].values)
+        self._title_positions = np.flatnonzero(~titles.duplicated().values)
+        ids = pd.Series(self.catalog['movie_id'])
+        self._id_rows = pd.Index(ids[~ids.duplicated()].values)
+        self._id_positions = np.flatnonzero(~ids.duplicated().values)
+
+    def _open(
+        self,
+        version_dir: Path
+    ) -> Tuple[Path, Dict[str, Any], Dict[str, np.ndarray], Dict[str, np.memmap], Dict[str, np.memmap]]:
+        """Sürüm dizinindeki meta veriyi ve kataloğu okur, komşu dosyalarını bellek eşlemeli açar."""
+        meta_path = version_dir / 'meta.json'
+        if not meta_path.exists():
+            raise FileNotFoundError(f"Öneri tablosu bulunamadı: {self.path}")
+        meta = json.loads(meta_path.read_text(encoding='utf-8'))
+        if meta.get('format_version') != TABLE_FORMAT_VERSION:
+            raise ValueError(f"Desteklenmeyen öneri tablosu sürümü: {meta.get('format_version')}")
+
+        with np.load(version_dir / 'catalog.npz') as catalog_file:
+            catalog = {name: catalog_file[name] for name in catalog_file.files}
+        indices = {mode: np.load(version_dir / f'{mode}.indices.npy', mmap_mode='r') for mode in meta['modes']}
+        scores = {mode: np.load(version_dir / f'{mode}.scores.npy', mmap_mode='r') for mode in meta['modes']}
+        return version_dir, meta, catalog, indices, scores
+
+    @classmethod
+    def write(
+        cls,
+        path: str,
+        movies_df: pd.DataFrame,
+        neighbors: Dict[str, Tuple[np.ndarray, np.ndarray]]
+    ) -> 'RecommendationTable':
+        """
+        Komşu tablolarını ve katalog sütunlarını diske yazar.
+
+        Dosyalar yeni bir sürüm dizinine yazılır ve CURRENT işaretçisi
+        atomik olarak bu sürüme çevrilir; eski tabloyu açmış okuyucular kendi
+        kopyalarıyla devam eder.
+
+        Parameters
+        ----------
+        path : str
+            Tablo dizini
+        movies_df : pd.DataFrame
+            Komşu satırlarıyla hizalı katalog (movie_id ve title sütunları zorunlu)
+        neighbors : Dict[str, Tuple[np.ndarray, np.ndarray]]
+            Tür adından (N, K) boyutlu komşu satırları ve skorlarına eşleme
+
+        Returns
+        -------
+        RecommendationTable
+            Yazılan tablo (salt okunur açılmış)
+
+        Raises
+        ------
+        ValueError
+            Bilinmeyen bir tür veya katalogla uyuşmayan boyut verildiğinde
+        """
+        unknown = set(neighbors) - set(TABLE_MODES)
+        if unknown:
+            raise ValueError(f"Bilinmeyen öneri türleri: {sorted(unknown)}. Seçenekler: {TABLE_MODES}")
+
+        k = None
+        for mode, (indices, scores) in neighbors.items():
+            if indices.shape[0] != len(movies_df) or indices.shape != scores.shape:
+                raise ValueError(f"'{mode}' tablosunun boyutu katalogla uyuşmuyor: {indices.shape}")
+            k = indices.shape[1] if k is None else min(k, indices.shape[1])
+
+        path = Path(path)
+        version_dir = new_version_dir(path)
+        try:
+            cls._write_version(version_dir, movies_df, neighbors, k)
+        except BaseException:
+            shutil.rmtree(version_dir, ignore_errors=True)
+            raise
+        publish_version(path, version_dir)
+
+        table = cls(path)
+        table.logger.info(
+            f"Öneri tablosu yazıldı: {path} ({len(movies_df)} film, K={k}, türler: {', '.join(neighbors)})."
+        )
+        return table
+
+    @staticmethod
+    def _write_version(
+        version_dir: Path,
+        movies_df: pd.DataFrame,
+        neighbors: Dict[str, Tuple[np.ndarray, np.ndarray]],
+        k: int
+    ) -> None:
+        """Komşu tablolarını, katalog sütunlarını ve meta veriyi sürüm dizinine yazar."""
+        for mode, (indices, scores) in neighbors.items():
+            np.save(version_dir / f'{mode}.indices.npy', np.ascontiguousarray(indices, dtype=np.int32))
+            np.save(version_dir / f'{mode}.scores.npy', np.ascontiguousarray(scores, dtype=np.float32))
+
+        catalog = {}
+        for column in CATALOG_COLUMNS:
+            if column in movies_df.columns:
+                values = movies_df[column].to_numpy()
+                # Başlıklar pickle gerektirmeyen sabit genişlikli unicode olarak saklanır
+                catalog[column] = values.astype(str) if column == 'title' else values
+        np.savez(version_dir / 'catalog.npz', **catalog)
+
+        meta = {
+            'format_version': TABLE_FORMAT_VERSION,
+            'modes': list(neighbors),
+            'k': k,
+            'n_movies': len(movies_df),
+            'catalog_version': movies_df.attrs.get('catalog_version'),
+        }
+        (version_dir / 'meta.json').write_text(json.dumps(meta, indent=2), encoding='utf-8')
+
+    @property
+    def modes(self) -> List[str]:
+        return list(self.meta['modes'])
+
+    @property
+    def k(self) -> int:
+        return self.meta['k']
+
+    @property
+    def catalog_version(self) -> Optional[str]:
+        return self.meta.get('catalog_version')
+
+    @property
+    def titles(self) -> np.ndarray:
+        return self.catalog['title']
+
+    def __len__(self) -> int:
+        return self.meta['n_movies']
+
+    def row(self, movie: Union[str, int]) -> int:
+        """
+        Film başlığının (str) veya ID'sinin (int) satır konumunu döndürür.
+
+        Raises
+        ------
+        KeyError
+            Film tabloda bulunamadığında
+        """
+        if isinstance(movie, str):
+            position = self._title_rows.get_indexer([movie])[0]
+            rows = self._title_positions
+        else:
+            position = self._id_rows.get_indexer([movie])[0]
+            rows = self._id_positions
+        if position < 0:
+            raise KeyError(f"Öneri tablosunda bulunamayan film: {movie}")
+        return int(rows[position])
+
+    def query(self, movie: Union[str, int], mode: str = 'overview', n: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Bir filmin önceden hesaplanmış en benzer n komşusunu döndürür.
+
+        Parameters
+        ----------
+        movie : Union[str, int]
+            Film başlığı (str) veya ID'si (int)
+        mode : str, optional
+            'overview', 'metadata' veya 'hybrid', by default 'overview'
+        n : int, optional
+            Döndürülecek komşu sayısı, by default 10
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Komşu satır konumları ve skorları
+
+        Raises
+        ------
+        KeyError
+            Film tabloda bulunamadığında
+        ValueError
+            Tür tabloda bulunmadığında
+        """
+        if mode not in self._indices:
+            raise ValueError(f"Öneri tablosunda olmayan tür: {mode}. Seçenekler: {self.modes}")
+        if n > self.k:
+            self.logger.warning(f"{n} komşu istendi ancak tablo yalnızca {self.k} komşu saklıyor.")
+        row = self.row(movie)
+        return np.asarray(self._indices[mode][row, :n]), np.asarray(self._scores[mode][row, :n])
+
+    def records(self, rows: Sequence[int]) -> List[Dict[str, Any]]:
+        """
+        Satırların katalog sütunlarını sözlük listesi olarak döndürür.
+
+        Parameters
+        ----------
+        rows : Sequence[int]
+            Satır konumları
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Her satır için sütun adından değere eşleme
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = {name: values[rows].tolist() for name, values in self.catalog.items()}
+        return [{name: columns[name][i] for name in columns} for i in range(len(rows))]
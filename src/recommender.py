@@ -3,16 +3,31 @@ Film önerilerini yöneten sınıf.
 """
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, NamedTuple, Optional, Sequence, Tuple, Union
 import logging
-import requests
+import threading
+import asyncio
 from googletrans import Translator
 import os
 from dotenv import load_dotenv
-from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
-from sklearn.metrics.pairwise import linear_kernel, cosine_similarity
+from sklearn.feature_extraction.text import TfidfVectorizer
 from surprise import Reader, Dataset, SVD
-import ast
+
+from .als import AlternatingLeastSquares, Regularization
+from .async_api_client import TMDB_API_BASE_URL, AsyncTMDBClient, BackgroundLoop
+from .ann_index import LSHIndex
+from .cf_scoring import LatentFactorScorer
+from .details_cache import MovieDetailsCache
+from .filter_index import FilterIndex, MovieFilter
+from .json_parser import JsonColumnParser
+from .neighbor_index import NeighborIndex, top_k
+from .ratings_store import RatingsMatrix, RatingsUpdate
+from .recommendation_table import RecommendationTable
+from .similarity_builder import BlockwiseSimilarityBuilder
+from .similarity_store import SimilarityStore
+from .translation_memo import TranslationMemo, translate_many
+from .vocabulary import ContentEncoder
+from .weighted_rating import WeightedRatingCache, scale_to_unit, weighted_rating
 
 # Ortam değişkenlerini yükle
 load_dotenv()
@@ -20,8 +35,90 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Yoğun benzerlik satırlarının toplu sorgularda tek seferde işlenen sayısı
+BATCH_QUERY_ROWS = 1024
+
+# Hibrit sıralamada içerik indeksinden alınan varsayılan aday sayısı
+HYBRID_CANDIDATES = 50
+
+# TMDB detaylarının eşzamanlı çekildiği bağlantı havuzu boyutu
+DETAIL_FETCH_WORKERS = 8
+
+# Bir filmin detay isteği için zaman aşımı (saniye, yeniden denemeler dahil)
+DETAIL_FETCH_TIMEOUT = 10.0
+
+# TMDB detaylarının istendiği dil
+TMDB_DETAILS_LANGUAGE = 'en-US'
+
+# Detayları alınamayan filmler için gösterilen yer tutucu
+FETCH_ERROR_DETAILS = ("https://via.placeholder.com/500x750?text=Error", "Film detayları alınamadı.")
+
+
+class HybridWeights(NamedTuple):
+    """Hibrit skoru oluşturan bileşenlerin ağırlıkları."""
+    content: float = 0.5
+    collaborative: float = 0.3
+    rating: float = 0.2
+
+
+def blend_hybrid_scores(
+    weights: HybridWeights,
+    similarity: np.ndarray,
+    rating_scores: np.ndarray,
+    cf_scores: np.ndarray = None
+) -> np.ndarray:
+    """
+    Hibrit skor bileşenlerini ağırlıklı ortalamayla birleştirir.
+
+    Tüm bileşenler [0, 1] aralığında olmalıdır; cf_scores verilmezse
+    işbirlikçi filtreleme ağırlığı toplamdan düşülür. Diziler aynı boyutta
+    olduğu sürece tek bir sorgu (K,) veya toplu sorgular (N, K) için çalışır.
+    """
+    score = weights.content * similarity + weights.rating * rating_scores
+    total_weight = weights.content + weights.rating
+    if cf_scores is not None:
+        score = score + weights.collaborative * cf_scores
+        total_weight += weights.collaborative
+    return score / total_weight if total_weight > 0 else score
+
+
+def _resolve_rows(
+    movies_df: pd.DataFrame,
+    movies: Sequence[Union[str, int]],
+    id_column: str
+) -> np.ndarray:
+    """
+    Film başlıklarını (str) veya kimliklerini (int) satır konumlarına çevirir.
+
+    Yinelenen başlıklarda ilk eşleşme kullanılır.
+
+    Raises
+    ------
+    KeyError
+        Bulunamayan başlık veya kimlik olduğunda
+    """
+    movies = list(movies)
+    is_title = np.fromiter((isinstance(m, str) for m in movies), dtype=bool, count=len(movies))
+    rows = np.full(len(movies), -1, dtype=np.int64)
+
+    for column, mask in (('title', is_title), (id_column, ~is_title)):
+        if not mask.any():
+            continue
+        values = movies_df[column]
+        first = np.flatnonzero(~values.duplicated().values)
+        positions = pd.Index(values.values[first]).get_indexer([m for m, t in zip(movies, mask) if t])
+        rows[mask] = np.where(positions >= 0, first[positions], -1)
+
+    if (rows < 0).any():
+        missing = [m for m, r in zip(movies, rows) if r < 0]
+        raise KeyError(f"Veri setinde bulunamayan filmler: {missing}")
+    return rows
+
 class MovieRecommender:
-    def __init__(self, movies_path: str, credits_path: str, ratings_path: str = None):
+    def __init__(self, movies_path: str, credits_path: str, ratings_path: str = None,
+                 n_neighbors: int = 50, similarity_builder: BlockwiseSimilarityBuilder = None,
+                 similarity_backend: str = 'exact', ann_params: Dict[str, Any] = None,
+                 hybrid_weights: HybridWeights = None):
         """
         Film önerici sınıfını başlat.
         
@@ -33,14 +130,44 @@ class MovieRecommender:
             Kredi CSV dosyasının yolu
         ratings_path : str, optional
             İşbirlikçi filtreleme için puanlama CSV dosyasının yolu
+        n_neighbors : int, optional
+            Benzerlik indekslerinde film başına saklanacak komşu sayısı
+        similarity_builder : BlockwiseSimilarityBuilder, optional
+            Benzerlik hesaplamasını blok blok ve paralel yürüten nesne
+        similarity_backend : str, optional
+            Varsayılan benzerlik arka ucu: 'exact' (kesin kosinüs) veya
+            'ann' (yaklaşık en yakın komşu)
+        ann_params : Dict[str, Any], optional
+            LSHIndex için parametreler (n_tables, n_bits, n_probes, ...)
+        hybrid_weights : HybridWeights, optional
+            Hibrit skorda içerik benzerliği, işbirlikçi filtreleme tahmini ve
+            ağırlıklı puanın varsayılan ağırlıkları
         """
         self.movies_df = None
         self.credits_df = None
-        self.ratings_df = None
-        self.cosine_sim = None
-        self.cosine_sim2 = None
+        self.ratings = None
+        self.n_neighbors = n_neighbors
+        self.similarity_builder = similarity_builder or BlockwiseSimilarityBuilder()
+        self.tfidf_vectorizer = None
+        self.content_encoder = None
+        self.overview_index = None
+        self.metadata_index = None
+        self.similarity_backend = similarity_backend
+        self.ann_params = ann_params or {}
+        self._ann_indexes = {}
         self.indices = None
+        self.id_indices = None
+        self.filter_index = None
+        self.hybrid_weights = hybrid_weights or HybridWeights()
+        self._rating_scores = None
         self.svd_model = None
+        self.als_model = None
+        self.cf_model = None
+        self.cf_scorer = None
+        self._cf_lock = threading.RLock()
+        self._pending_updates = None
+        self._retrain_thread = None
+        self._retrain_stop = threading.Event()
         
         try:
             self._load_data(movies_path, credits_path, ratings_path)
@@ -55,83 +182,60 @@ class MovieRecommender:
         self.movies_df = pd.read_csv(movies_path)
         self.credits_df = pd.read_csv(credits_path)
         self.credits_df.columns = ['id', 'title', 'cast', 'crew']
-        self.movies_df = self.movies_df.merge(self.credits_df, on='id')
+        # Both files carry a title column; keep the one from the movies file
+        self.movies_df = self.movies_df.merge(self.credits_df.drop(columns=['title']), on='id')
         
         if ratings_path:
-            self.ratings_df = pd.read_csv(ratings_path)
+            self.ratings = RatingsMatrix.from_csv(ratings_path)
 
     def _preprocess_data(self):
         """Preprocess the movie data for recommendation generation."""
         # Calculate weighted rating
-        C = self.movies_df['vote_average'].mean()
-        m = self.movies_df['vote_count'].quantile(0.9)
-        
-        def weighted_rating(x, m=m, C=C):
-            v = x['vote_count']
-            R = x['vote_average']
-            return (v/(v+m) * R) + (m/(m+v) * C)
-        
-        self.movies_df['score'] = self.movies_df.apply(weighted_rating, axis=1)
-        
-        # Process features
-        features = ['cast', 'crew', 'keywords', 'genres']
-        for feature in features:
-            self.movies_df[feature] = self.movies_df[feature].apply(ast.literal_eval)
-        
-        # Extract director
-        def get_director(x):
-            for i in x:
-                if i['job'] == 'Director':
-                    return i['name']
-            return np.nan
-        
-        self.movies_df['director'] = self.movies_df['crew'].apply(get_director)
-        
-        # Process cast, keywords, and genres
-        def get_list(x):
-            if isinstance(x, list):
-                names = [i['name'] for i in x]
-                return names[:3] if len(names) > 3 else names
-            return []
-        
-        for feature in ['cast', 'keywords', 'genres']:
-            self.movies_df[feature] = self.movies_df[feature].apply(get_list)
+        self.movies_df['score'], _, _ = weighted_rating(
+            self.movies_df['vote_count'].values, self.movies_df['vote_average'].values
+        )
         
-        # Clean data
-        def clean_data(x):
-            if isinstance(x, list):
-                return [str.lower(i.replace(" ", "")) for i in x]
-            elif isinstance(x, str):
-                return str.lower(x.replace(" ", ""))
-            return ''
+        # Parse JSON features into long (movie_id, row, role, name, order) tables
+        tables = JsonColumnParser().parse(self.movies_df, ['cast', 'crew', 'keywords', 'genres'], id_column='id')
+        index = self.movies_df.index
         
-        for feature in ['cast', 'keywords', 'director', 'genres']:
-            self.movies_df[feature] = self.movies_df[feature].apply(clean_data)
-        
-        # Create soup for content-based filtering
-        def create_soup(x):
-            return ' '.join(x['keywords']) + ' ' + ' '.join(x['cast']) + ' ' + x['director'] + ' ' + ' '.join(x['genres'])
-        
-        self.movies_df['soup'] = self.movies_df.apply(create_soup, axis=1)
+        # Extract director and the top 3 cast, keywords and genres as cleaned names
+        director = JsonColumnParser.first_name(tables['crew'], index, 'Director', clean=True)
+        self.movies_df['director'] = director.fillna('')
+        # Filters match on every genre, not just the top 3 used for similarity
+        self.movies_df['genres_all'] = JsonColumnParser.top_names(tables['genres'], index, n=None, clean=True)
+        for feature in ['cast', 'keywords', 'genres']:
+            self.movies_df[feature] = JsonColumnParser.top_names(tables[feature], index, n=3, clean=True)
+        self.movies_df = self.movies_df.drop(columns=['crew'])
         
         # Reset index
         self.movies_df = self.movies_df.reset_index()
         self.indices = pd.Series(self.movies_df.index, index=self.movies_df['title'])
+        self.id_indices = pd.Series(self.movies_df.index, index=self.movies_df['id'])
+        self.filter_index = FilterIndex.build(self.movies_df)
+        
+        # Weighted rating scaled to [0, 1] once, so hybrid ranking only gathers K values
+        self._rating_scores = scale_to_unit(self.movies_df['score'].values)
 
     def _build_similarity_matrices(self):
-        """Build similarity matrices for both overview and metadata-based recommendations."""
+        """Build top-K neighbor indexes for both overview and metadata-based recommendations."""
         # TF-IDF based similarity
-        tfidf = TfidfVectorizer(stop_words='english')
-        tfidf_matrix = tfidf.fit_transform(self.movies_df['overview'].fillna(''))
-        self.cosine_sim = linear_kernel(tfidf_matrix, tfidf_matrix)
+        self.tfidf_vectorizer = TfidfVectorizer(stop_words='english')
+        tfidf_matrix = self.tfidf_vectorizer.fit_transform(self.movies_df['overview'].fillna(''))
+        self.overview_index = NeighborIndex.build(
+            tfidf_matrix, k=self.n_neighbors, builder=self.similarity_builder
+        )
         
-        # CountVectorizer based similarity
-        count = CountVectorizer(stop_words='english')
-        count_matrix = count.fit_transform(self.movies_df['soup'])
-        self.cosine_sim2 = cosine_similarity(count_matrix, count_matrix)
+        # Metadata similarity built straight from the integer-encoded fields
+        self.content_encoder = ContentEncoder()
+        count_matrix = self.content_encoder.fit_transform(self.movies_df)
+        self.metadata_index = NeighborIndex.build(
+            count_matrix, k=self.n_neighbors, builder=self.similarity_builder
+        )
 
     def get_recommendations(self, title: str, n_recommendations: int = 10, 
-                          use_metadata: bool = True) -> List[str]:
+                          use_metadata: bool = True, backend: str = None,
+                          movie_filter: MovieFilter = None) -> List[str]:
         """
         Get movie recommendations based on a given movie title.
         
@@ -139,32 +243,225 @@ class MovieRecommender:
             title (str): Title of the movie to get recommendations for
             n_recommendations (int): Number of recommendations to return
             use_metadata (bool): Whether to use metadata-based similarity (True) or overview-based (False)
+            backend (str, optional): 'exact' or 'ann'; defaults to the recommender's similarity_backend
+            movie_filter (MovieFilter, optional): Genre, year, language and runtime filters applied
+                inside the top-K selection, so the list is only short when fewer movies match
         
         Returns:
             List[str]: List of recommended movie titles
         """
         try:
-            idx = self.indices[title]
-            sim_scores = list(enumerate(self.cosine_sim2[idx] if use_metadata else self.cosine_sim[idx]))
-            sim_scores = sorted(sim_scores, key=lambda x: x[1], reverse=True)
-            sim_scores = sim_scores[1:n_recommendations+1]
-            movie_indices = [i[0] for i in sim_scores]
+            idx = self._get_index(title)
+            mask = self.filter_index.mask(movie_filter)
+            backend = backend or self.similarity_backend
+            exact_index = self.metadata_index if use_metadata else self.overview_index
+            if backend == 'ann':
+                movie_indices, _ = self._get_ann_index(use_metadata).query(idx, n_recommendations, mask=mask)
+                if mask is not None and len(movie_indices) < n_recommendations:
+                    # Too few filtered candidates in the probed buckets
+                    movie_indices, _ = exact_index.query(idx, n_recommendations, mask=mask)
+            elif backend == 'exact':
+                movie_indices, _ = exact_index.query(idx, n_recommendations, mask=mask)
+            else:
+                raise ValueError(f"Unknown similarity backend: {backend}")
             return self.movies_df['title'].iloc[movie_indices].tolist()
         except KeyError:
             logger.error(f"Movie '{title}' not found in the dataset")
             return []
 
-    def train_collaborative_filtering(self):
-        """Train the SVD model for collaborative filtering."""
-        if self.ratings_df is None:
-            logger.warning("No ratings data provided for collaborative filtering")
+    def get_recommendations_batch(self, movies: Sequence[Union[str, int]], n_recommendations: int = 10,
+                                  use_metadata: bool = True, backend: str = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get recommendations for many movies in a single vectorized pass.
+        
+        Args:
+            movies (Sequence[Union[str, int]]): Movie titles (str) or TMDB ids (int)
+            n_recommendations (int): Number of recommendations per movie
+            use_metadata (bool): Whether to use metadata-based similarity (True) or overview-based (False)
+            backend (str, optional): 'exact' or 'ann'; defaults to the recommender's similarity_backend
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (n_queries, n_recommendations) row positions into
+            movies_df and similarity scores. ANN rows with fewer candidates are padded with -1 and NaN.
+        
+        Raises:
+            KeyError: If any of the movies is not in the dataset
+        """
+        rows = _resolve_rows(self.movies_df, movies, 'id')
+        backend = backend or self.similarity_backend
+        if backend == 'exact':
+            index = self.metadata_index if use_metadata else self.overview_index
+            return index.query_batch(rows, n_recommendations)
+        if backend != 'ann':
+            raise ValueError(f"Unknown similarity backend: {backend}")
+        
+        index = self._get_ann_index(use_metadata)
+        indices = np.full((len(rows), n_recommendations), -1, dtype=np.int64)
+        scores = np.full((len(rows), n_recommendations), np.nan, dtype=np.float32)
+        for i, idx in enumerate(rows):
+            found, values = index.query(idx, n_recommendations)
+            indices[i, :len(found)] = found
+            scores[i, :len(found)] = values
+        return indices, scores
+
+    def _get_ann_index(self, use_metadata: bool) -> LSHIndex:
+        """Return the approximate index for the given mode, building it on first use."""
+        key = 'metadata' if use_metadata else 'overview'
+        if key not in self._ann_indexes:
+            exact_index = self.metadata_index if use_metadata else self.overview_index
+            self._ann_indexes[key] = LSHIndex(**self.ann_params).build(exact_index.features)
+        return self._ann_indexes[key]
+
+    def _get_index(self, title: str) -> int:
+        """Return the row index of a title, using the first match for duplicate titles."""
+        idx = self.indices[title]
+        if isinstance(idx, pd.Series):
+            idx = idx.iloc[0]
+        return int(idx)
+
+    def _get_row(self, movie: Union[str, int]) -> int:
+        """Return the row index of a movie title (str) or TMDB id (int)."""
+        if isinstance(movie, str):
+            return self._get_index(movie)
+        idx = self.id_indices[movie]
+        if isinstance(idx, pd.Series):
+            idx = idx.iloc[0]
+        return int(idx)
+
+    def train_collaborative_filtering(self, algorithm: str = 'svd', **params):
+        """
+        Train the latent factor model for collaborative filtering.
+        
+        Training runs on a snapshot of the ratings; ratings added through
+        update_ratings() while it runs are folded into the new model before it
+        replaces the current one, so this is safe to call from a background thread.
+        
+        Args:
+            algorithm (str): 'svd' (surprise SGD) or 'als' (multi-threaded alternating least squares)
+            **params: Keyword arguments for surprise.SVD or AlternatingLeastSquares
+        """
+        if algorithm not in ('svd', 'als'):
+            raise ValueError(f"Unknown collaborative filtering algorithm: {algorithm}")
+        
+        with self._cf_lock:
+            ratings = self.ratings
+            if ratings is None:
+                logger.warning("No ratings data provided for collaborative filtering")
+                return
+            self._pending_updates = []
+        
+        try:
+            if algorithm == 'svd':
+                # Train on dense user/item codes; the scorer maps them back to raw IDs
+                reader = Reader()
+                data = Dataset.load_from_df(ratings.to_frame(raw_ids=False), reader)
+                trainset = data.build_full_trainset()
+                svd_model = SVD(**params)
+                svd_model.fit(trainset)
+                scorer = LatentFactorScorer.from_surprise(svd_model, ratings)
+                # Fold-in reuses the SVD factors through the ALS local solves with SVD's own objective
+                model = AlternatingLeastSquares.from_scorer(
+                    scorer, regularization=Regularization.from_surprise(svd_model)
+                )
+            else:
+                model = AlternatingLeastSquares(**params).fit(ratings)
+            # Training merged the snapshot's appended ratings; reuse that as the new base matrix
+            compacted = ratings.compact()
+        except Exception:
+            with self._cf_lock:
+                self._pending_updates = None
+            raise
+        
+        with self._cf_lock:
+            if self.ratings is ratings:
+                self.ratings = compacted
+            pending, self._pending_updates = self._pending_updates, None
+            if pending:
+                # Catch up with ratings that arrived while the model was training
+                model.partial_fit(
+                    self.ratings,
+                    users=np.unique(np.concatenate([update.users for update in pending])),
+                    items=np.unique(np.concatenate([update.new_items for update in pending])),
+                )
+            if algorithm == 'svd':
+                self.svd_model = svd_model
+            else:
+                self.als_model = model
+            self.cf_model = model
+            self.cf_scorer = model.to_scorer(self.ratings)
+        logger.info(f"Collaborative filtering model trained with {algorithm}")
+
+    def update_ratings(self, new_ratings: pd.DataFrame):
+        """
+        Add new or changed ratings and fold them into the current model.
+        
+        The ratings are appended to the matrix without rebuilding it, and only
+        the affected users and newly seen movies are re-solved against the
+        fixed factors of the other side, so the personalized recommendations
+        reflect the new ratings within seconds. Existing movies keep their
+        factors until the next full retrain.
+        
+        Args:
+            new_ratings (pd.DataFrame): Ratings with userId, movieId and rating columns
+        
+        Returns:
+            RatingsUpdate: Row and column codes affected by the update
+        """
+        users = new_ratings['userId'].to_numpy()
+        items = new_ratings['movieId'].to_numpy()
+        values = new_ratings['rating'].to_numpy()
+        
+        with self._cf_lock:
+            if self.ratings is None:
+                self.ratings = RatingsMatrix.from_arrays(users, items, values)
+                update = RatingsUpdate(
+                    users=np.arange(self.ratings.n_users), items=np.arange(self.ratings.n_items),
+                    new_users=np.arange(self.ratings.n_users), new_items=np.arange(self.ratings.n_items)
+                )
+            else:
+                self.ratings, update = self.ratings.with_ratings(users, items, values)
+            
+            if self._pending_updates is not None:
+                self._pending_updates.append(update)
+            if self.cf_model is not None:
+                self.cf_model.partial_fit(self.ratings, users=update.users, items=update.new_items)
+                self.cf_scorer = self.cf_model.to_scorer(self.ratings)
+        return update
+
+    def start_background_retraining(self, interval_seconds: float = 3600, algorithm: str = 'svd', **params):
+        """
+        Periodically retrain the collaborative filtering model in a daemon thread.
+        
+        Incremental updates keep being served from the fold-in model while a
+        retrain runs; the retrained model replaces it atomically when done.
+        
+        Args:
+            interval_seconds (float): Seconds to wait between retrains
+            algorithm (str): 'svd' or 'als'
+            **params: Keyword arguments for the training algorithm
+        """
+        if self._retrain_thread is not None and self._retrain_thread.is_alive():
+            logger.warning("Background retraining is already running")
             return
         
-        reader = Reader()
-        data = Dataset.load_from_df(self.ratings_df[['userId', 'movieId', 'rating']], reader)
-        trainset = data.build_full_trainset()
-        self.svd_model = SVD()
-        self.svd_model.fit(trainset)
+        self._retrain_stop.clear()
+        
+        def run():
+            while not self._retrain_stop.wait(interval_seconds):
+                try:
+                    self.train_collaborative_filtering(algorithm, **params)
+                except Exception as e:
+                    logger.error(f"Background retraining failed: {str(e)}")
+        
+        self._retrain_thread = threading.Thread(target=run, name='cf-retrain', daemon=True)
+        self._retrain_thread.start()
+
+    def stop_background_retraining(self, timeout: float = None):
+        """Stop the background retraining thread, waiting for a running retrain to finish."""
+        self._retrain_stop.set()
+        if self._retrain_thread is not None:
+            self._retrain_thread.join(timeout)
+            self._retrain_thread = None
 
     def get_collaborative_recommendations(self, user_id: int, n_recommendations: int = 10) -> List[Dict]:
         """
@@ -177,64 +474,98 @@ class MovieRecommender:
         Returns:
             List[Dict]: List of recommended movies with predicted ratings
         """
-        if self.svd_model is None:
-            logger.error("SVD model not trained. Call train_collaborative_filtering() first.")
+        if self.cf_scorer is None:
+            logger.error("Collaborative filtering model not trained. Call train_collaborative_filtering() first.")
             return []
         
-        # Get all movies the user hasn't rated
-        user_ratings = self.ratings_df[self.ratings_df['userId'] == user_id]
-        all_movies = set(self.ratings_df['movieId'].unique())
-        rated_movies = set(user_ratings['movieId'])
-        unrated_movies = all_movies - rated_movies
+        # Score every unrated movie in one matrix product and keep the top N
+        movie_ids, ratings = self.cf_scorer.recommend([user_id], n_recommendations)
+        return [
+            {'movieId': movie_id, 'predicted_rating': rating}
+            for movie_id, rating in zip(movie_ids[0].tolist(), ratings[0].tolist())
+            if np.isfinite(rating)
+        ]
+
+    def get_collaborative_recommendations_batch(self, user_ids: Sequence[int],
+                                                n_recommendations: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get collaborative filtering recommendations for many users at once.
         
-        # Predict ratings for unrated movies
-        predictions = []
-        for movie_id in unrated_movies:
-            pred = self.svd_model.predict(user_id, movie_id)
-            predictions.append({
-                'movieId': movie_id,
-                'predicted_rating': pred.est
-            })
+        Args:
+            user_ids (Sequence[int]): IDs of the users to get recommendations for
+            n_recommendations (int): Number of recommendations per user
         
-        # Sort by predicted rating and return top N
-        predictions.sort(key=lambda x: x['predicted_rating'], reverse=True)
-        return predictions[:n_recommendations]
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (n_users, n_recommendations) movie IDs and predicted
+            ratings. Slots left empty because a user has rated almost every movie score -inf.
+        """
+        if self.cf_scorer is None:
+            raise ValueError("Collaborative filtering model not trained. Call train_collaborative_filtering() first.")
+        return self.cf_scorer.recommend(user_ids, n_recommendations)
 
-    def get_hybrid_recommendations(self, title: str, user_id: int = None, 
-                                 n_recommendations: int = 10) -> List[Dict]:
+    def get_hybrid_recommendations(self, title: Union[str, int], user_id: int = None,
+                                   n_recommendations: int = 10, weights: HybridWeights = None,
+                                   n_candidates: int = HYBRID_CANDIDATES,
+                                   use_metadata: bool = True) -> List[Dict]:
         """
         Get hybrid recommendations combining content-based and collaborative filtering.
         
+        Candidates are the movie's nearest neighbors in the content index. Each
+        candidate gets a weighted blend of its content similarity, the user's
+        predicted rating (scaled to [0, 1] by the rating scale) and its weighted
+        rating (scaled to [0, 1] over the catalog). Without a user or a trained
+        model the collaborative weight is dropped. The work per request is
+        proportional to the number of candidates, not the catalog size.
+        
         Args:
-            title (str): Title of the movie to get recommendations for
+            title (Union[str, int]): Title (str) or TMDB id (int) of the movie to get recommendations for
             user_id (int, optional): ID of the user for personalized recommendations
             n_recommendations (int): Number of recommendations to return
+            weights (HybridWeights, optional): Component weights; defaults to the recommender's hybrid_weights
+            n_candidates (int): Number of content neighbors to rank, capped by the index size
+            use_metadata (bool): Whether to use metadata-based similarity (True) or overview-based (False)
         
         Returns:
-            List[Dict]: List of recommended movies with scores
+            List[Dict]: Recommended movies with their id, title, blended score and score components
         """
-        # Get content-based recommendations
-        content_recs = self.get_recommendations(title, n_recommendations)
+        try:
+            idx = self._get_row(title)
+        except KeyError:
+            logger.error(f"Movie '{title}' not found in the dataset")
+            return []
         
-        if user_id is not None and self.svd_model is not None:
-            # Get collaborative filtering recommendations
-            collab_recs = self.get_collaborative_recommendations(user_id, n_recommendations)
-            
-            # Combine and rank recommendations
-            combined_recs = []
-            for movie in content_recs:
-                movie_id = self.movies_df[self.movies_df['title'] == movie]['id'].iloc[0]
-                pred = self.svd_model.predict(user_id, movie_id)
-                combined_recs.append({
-                    'title': movie,
-                    'score': pred.est
-                })
-            
-            # Sort by combined score
-            combined_recs.sort(key=lambda x: x['score'], reverse=True)
-            return combined_recs[:n_recommendations]
+        weights = weights or self.hybrid_weights
+        index = self.metadata_index if use_metadata else self.overview_index
+        n_candidates = min(max(n_candidates, n_recommendations), index.n_neighbors)
+        rows, similarity = index.query(idx, n_candidates)
+        movie_ids = self.movies_df['id'].values[rows]
+        rating_scores = self._rating_scores[rows]
+        
+        predictions, cf_scores = None, None
+        cf_scorer = self.cf_scorer
+        if user_id is not None and cf_scorer is not None:
+            predictions = cf_scorer.predict(user_id, movie_ids)
+            if cf_scorer.rating_scale is not None:
+                low, high = cf_scorer.rating_scale
+            else:
+                low, high = predictions.min(), predictions.max()
+            cf_scores = (predictions - low) / (high - low) if high > low else np.zeros_like(predictions)
         
-        return [{'title': movie, 'score': None} for movie in content_recs]
+        score = blend_hybrid_scores(weights, similarity, rating_scores, cf_scores)
+        order = np.argsort(-score, kind='stable')[:n_recommendations]
+        titles = self.movies_df['title'].values
+        weighted_ratings = self.movies_df['score'].values
+        return [
+            {
+                'id': int(movie_ids[i]),
+                'title': titles[rows[i]],
+                'score': float(score[i]),
+                'similarity': float(similarity[i]),
+                'predicted_rating': None if predictions is None else float(predictions[i]),
+                'weighted_rating': float(weighted_ratings[rows[i]]),
+            }
+            for i in order
+        ]
 
 class Recommender:
     """
@@ -248,16 +579,75 @@ class Recommender:
         TMDB API anahtarı
     translator : Translator
         Google Translate API nesnesi
+    rating_cache : WeightedRatingCache
+        Ağırlıklı puanları katalog sürümüne göre saklayan önbellek
+    recommendation_table : Optional[RecommendationTable]
+        Sunum modunda önerilerin okunduğu önceden hesaplanmış tablo
+    fetch_timeout : float
+        Bir filmin detay isteği için zaman aşımı (saniye)
+    details_cache : MovieDetailsCache
+        TMDB film detaylarının önbelleği
+    tmdb_client : AsyncTMDBClient
+        TMDB isteklerinin gönderildiği bağlantı havuzlu istemci
+    translation_memo : TranslationMemo
+        Özet çevirilerinin kalıcı belleği
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        recommendation_table: Optional[RecommendationTable] = None,
+        max_workers: int = DETAIL_FETCH_WORKERS,
+        fetch_timeout: float = DETAIL_FETCH_TIMEOUT,
+        details_cache: Optional[MovieDetailsCache] = None,
+        translation_memo: Optional[TranslationMemo] = None,
+        tmdb_client: Optional[AsyncTMDBClient] = None
+    ):
         """
         Recommender sınıfının başlatıcı metodu.
+        
+        Parameters
+        ----------
+        recommendation_table : Optional[RecommendationTable], optional
+            Verildiğinde get_precomputed_recommendations önerileri özellik
+            matrislerini yüklemeden bu tablodan okur, by default None
+        max_workers : int, optional
+            Film detaylarını eşzamanlı çeken bağlantı havuzunun boyutu,
+            by default DETAIL_FETCH_WORKERS
+        fetch_timeout : float, optional
+            Bir filmin detay isteği için zaman aşımı (saniye, yeniden
+            denemeler dahil), by default DETAIL_FETCH_TIMEOUT
+        details_cache : Optional[MovieDetailsCache], optional
+            TMDB film detaylarının önbelleği, by default None (süreçte
+            paylaşılan varsayılan önbellek)
+        translation_memo : Optional[TranslationMemo], optional
+            Özet çevirilerinin belleği, by default None (süreçte paylaşılan
+            varsayılan bellek)
+        tmdb_client : Optional[AsyncTMDBClient], optional
+            TMDB istemcisi (ör. testlerde yerel sunucuya bağlı), by default
+            None (max_workers bağlantılık havuzla süreçte paylaşılan
+            istemci; ortak döngü kapanırken kapatılır)
         """
         self.logger = logging.getLogger(__name__)
+        self.rating_cache = WeightedRatingCache()
+        self._filter_index_entry = None
+        self.recommendation_table = recommendation_table
+        self.max_workers = max_workers
+        self.fetch_timeout = fetch_timeout
+        self.details_cache = details_cache or MovieDetailsCache.default()
+        self.translation_memo = translation_memo or TranslationMemo.default()
         self.tmdb_token = os.getenv('TMDB_API_KEY')
-        if not self.tmdb_token:
+        if not self.tmdb_token and tmdb_client is None:
             raise ValueError("TMDB_API_KEY ortam değişkeni bulunamadı")
+        # Aynı ayarlı Recommender'lar (ör. Streamlit'in her yeniden çalıştırması) tek istemciyi paylaşır
+        self.tmdb_client = tmdb_client or AsyncTMDBClient.default(
+            api_key=self.tmdb_token,
+            base_url=TMDB_API_BASE_URL,
+            pool_size=max_workers,
+            timeout=fetch_timeout,
+            details_cache=self.details_cache
+        )
+        # Senkron çağrılar istemciyi bağlantıları açık tutan ortak döngüde çalıştırır
+        self._loop = BackgroundLoop.default()
         
         self.translator = Translator()
         
@@ -276,22 +666,13 @@ class Recommender:
             Ağırlıklı puanlar eklenmiş DataFrame
         """
         try:
-            # Ortalama oy değerini hesapla
-            C = df['vote_average'].mean()
-            
-            # Minimum oy sayısını hesapla (90. yüzdelik dilim)
-            m = df['vote_count'].quantile(0.9)
+            # Ağırlıklı puanları hesapla (C ve m tüm katalog üzerinden)
+            scores, m, _ = weighted_rating(df['vote_count'].values, df['vote_average'].values)
             
             # Minimum oy sayısına sahip filmleri filtrele
-            q_movies = df.copy().loc[df['vote_count'] >= m]
-            
-            # Ağırlıklı puan hesapla
-            def weighted_rating(x, m=m, C=C):
-                v = x['vote_count']
-                R = x['vote_average']
-                return (v/(v+m) * R) + (m/(m+v) * C)
-            
-            q_movies['score'] = q_movies.apply(weighted_rating, axis=1)
+            qualified = df['vote_count'].values >= m
+            q_movies = df.loc[qualified].copy()
+            q_movies['score'] = scores[qualified]
             
             # Puanlara göre sırala
             q_movies = q_movies.sort_values('score', ascending=False)
@@ -307,22 +688,35 @@ class Recommender:
         self,
         movie_title: str,
         movies_df: pd.DataFrame,
-        similarity_matrix: np.ndarray,
-        top_n: int = 5
+        similarity_matrix: Union[np.ndarray, SimilarityStore, NeighborIndex],
+        top_n: int = 5,
+        movie_filter: Optional[MovieFilter] = None,
+        filter_index: Optional[FilterIndex] = None
     ) -> List[Dict[str, Any]]:
         """
         İçerik tabanlı film önerileri oluşturur.
         
+        Filtre verildiğinde maske en yüksek K seçiminin içinde uygulanır;
+        öneri listesi yalnızca filtreye uyan film sayısı top_n'den azsa
+        kısalır.
+        
         Parameters
         ----------
         movie_title : str
             Önerilerin oluşturulacağı film başlığı
         movies_df : pd.DataFrame
             Film verilerini içeren DataFrame
-        similarity_matrix : np.ndarray
-            Benzerlik matrisi
+        similarity_matrix : Union[np.ndarray, SimilarityStore, NeighborIndex]
+            Yoğun benzerlik matrisi, bellek eşlemeli benzerlik deposu veya
+            en yakın K komşu indeksi
         top_n : int, optional
             Önerilecek film sayısı, by default 5
+        movie_filter : Optional[MovieFilter], optional
+            Tür, çıkış yılı, dil ve süre filtreleri, by default None
+        filter_index : Optional[FilterIndex], optional
+            movies_df üzerinden bir kez oluşturulmuş filtre indeksi; verilmezse
+            katalog sürümüne göre önbelleğe alınan indeks kullanılır (sürümü
+            olmayan kataloglarda her istekte yeniden oluşturulur), by default None
             
         Returns
         -------
@@ -330,31 +724,12 @@ class Recommender:
             Önerilen filmlerin bilgilerini içeren liste
         """
         try:
-            # Film indeksini bul
-            idx = movies_df[movies_df['title'] == movie_title].index[0]
-            
-            # Benzerlik skorlarını hesapla
-            sim_scores = list(enumerate(similarity_matrix[idx]))
-            sim_scores = sorted(sim_scores, key=lambda x: x[1], reverse=True)
-            sim_scores = sim_scores[1:top_n+1]
-            
-            # Önerilen filmlerin indekslerini al
-            movie_indices = [i[0] for i in sim_scores]
-            
-            # Önerilen filmlerin bilgilerini topla
-            recommendations = []
-            for idx in movie_indices:
-                movie = movies_df.iloc[idx]
-                poster, overview = self.fetch_movie_details(movie['movie_id'])
-                recommendations.append({
-                    'movie_id': movie['movie_id'],
-                    'title': movie['title'],
-                    'poster': poster,
-                    'overview': overview,
-                    'score': movie.get('score', None),
-                    'vote_average': movie['vote_average'],
-                    'vote_count': movie['vote_count']
-                })
+            mask = None
+            if movie_filter is not None and not movie_filter.is_empty():
+                filter_index = filter_index or self._filter_index(movies_df)
+                mask = filter_index.mask(movie_filter)
+            movie_indices = self._similar_indices(movie_title, movies_df, similarity_matrix, top_n, mask)
+            recommendations = self._build_recommendations([movies_df.iloc[idx] for idx in movie_indices])
                 
             self.logger.info(f"{movie_title} için {top_n} film önerisi oluşturuldu.")
             return recommendations
@@ -363,11 +738,170 @@ class Recommender:
             self.logger.error(f"İçerik tabanlı öneri oluşturma hatası: {str(e)}")
             raise
             
+    def _filter_index(self, movies_df: pd.DataFrame) -> FilterIndex:
+        """Kataloğun filtre indeksini döndürür; aynı katalog sürümü için bir kez oluşturur."""
+        version = movies_df.attrs.get('catalog_version')
+        entry = self._filter_index_entry
+        if (
+            entry is not None and version is not None and entry[0] == version
+            and (entry[1] is movies_df.index or entry[1].equals(movies_df.index))
+        ):
+            return entry[2]
+
+        filter_index = FilterIndex.build(movies_df)
+        if version is not None:
+            self._filter_index_entry = (version, movies_df.index, filter_index)
+        return filter_index
+            
+    def get_precomputed_recommendations(
+        self,
+        movie: Union[str, int],
+        mode: str = 'overview',
+        top_n: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Önerileri önceden hesaplanmış tablodan okur.
+        
+        Benzerlik hesaplanmaz; film satırı ve komşuları tablodan tek bir
+        satır okumasıyla alınır, yalnızca gösterilecek filmlerin TMDB
+        detayları çekilir.
+        
+        Parameters
+        ----------
+        movie : Union[str, int]
+            Film başlığı (str) veya ID'si (int)
+        mode : str, optional
+            'overview', 'metadata' veya 'hybrid', by default 'overview'
+        top_n : int, optional
+            Önerilecek film sayısı, by default 5
+            
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Önerilen filmlerin bilgilerini içeren liste
+            
+        Raises
+        ------
+        ValueError
+            Öneri tablosu verilmediğinde
+        """
+        if self.recommendation_table is None:
+            raise ValueError("Önceden hesaplanmış öneri tablosu yüklenmedi.")
+        try:
+            rows, _ = self.recommendation_table.query(movie, mode, top_n)
+            recommendations = self._build_recommendations(self.recommendation_table.records(rows))
+            
+            self.logger.info(f"{movie} için {len(recommendations)} öneri tablodan okundu.")
+            return recommendations
+            
+        except Exception as e:
+            self.logger.error(f"Tablodan öneri okuma hatası: {str(e)}")
+            raise
+            
+    def _similar_indices(
+        self,
+        movie_title: str,
+        movies_df: pd.DataFrame,
+        similarity_matrix: Union[np.ndarray, SimilarityStore, NeighborIndex],
+        top_n: int,
+        mask: Optional[np.ndarray] = None
+    ) -> List[int]:
+        """Filme en benzer (ve maske verilmişse maskeye uyan) top_n filmin satır konumlarını döndürür."""
+        # Film indeksini bul
+        idx = movies_df[movies_df['title'] == movie_title].index[0]
+        
+        if isinstance(similarity_matrix, NeighborIndex):
+            # Komşu indeksi doğrudan sorgula
+            movie_indices, _ = similarity_matrix.query(idx, top_n, mask=mask)
+            return list(movie_indices)
+            
+        # Filmin kendisi hariç en benzer top_n filmi seç (SimilarityStore satırları diskten okunur)
+        movie_indices, scores = top_k(np.asarray(similarity_matrix[idx]), top_n, exclude=idx, mask=mask)
+        if mask is not None:
+            # Filtreye uyan film sayısı top_n'den azsa boş kalan yerler atılır
+            movie_indices = movie_indices[np.isfinite(scores)]
+        return list(movie_indices)
+        
+    def get_recommendations_batch(
+        self,
+        movies: Sequence[Union[str, int]],
+        movies_df: pd.DataFrame,
+        similarity_matrix: Union[np.ndarray, SimilarityStore, NeighborIndex],
+        top_n: int = 5
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Birden çok film için içerik tabanlı önerileri tek seferde hesaplar.
+        
+        TMDB detayları çekilmez; toplu işler için yalnızca satır konumları ve
+        benzerlik skorları döndürülür.
+        
+        Parameters
+        ----------
+        movies : Sequence[Union[str, int]]
+            Film başlıkları (str) veya film ID'leri (int)
+        movies_df : pd.DataFrame
+            Film verilerini içeren DataFrame
+        similarity_matrix : Union[np.ndarray, SimilarityStore, NeighborIndex]
+            Yoğun benzerlik matrisi, bellek eşlemeli benzerlik deposu veya
+            en yakın K komşu indeksi
+        top_n : int, optional
+            Film başına önerilecek film sayısı, by default 5
+            
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            (n_queries, top_n) boyutlu önerilen filmlerin satır konumları ve
+            benzerlik skorları
+            
+        Raises
+        ------
+        KeyError
+            Bulunamayan başlık veya ID olduğunda
+        """
+        try:
+            rows = _resolve_rows(movies_df, movies, 'movie_id')
+            
+            if isinstance(similarity_matrix, NeighborIndex):
+                return similarity_matrix.query_batch(rows, top_n)
+                
+            # Yoğun satırlar bellek kullanımını sınırlamak için parça parça işlenir
+            indices, scores = [], []
+            for start in range(0, len(rows), BATCH_QUERY_ROWS):
+                chunk = rows[start:start + BATCH_QUERY_ROWS]
+                chunk_indices, chunk_scores = top_k(np.asarray(similarity_matrix[chunk]), top_n, exclude=chunk)
+                indices.append(chunk_indices)
+                scores.append(chunk_scores)
+                
+            self.logger.info(f"{len(rows)} film için toplu öneri oluşturuldu.")
+            if not indices:
+                return np.empty((0, top_n), dtype=np.int64), np.empty((0, top_n), dtype=np.float32)
+            return np.vstack(indices), np.vstack(scores)
+            
+        except Exception as e:
+            self.logger.error(f"Toplu öneri oluşturma hatası: {str(e)}")
+            raise
+            
+    def _build_recommendations(self, movies: Sequence[Union[pd.Series, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Film satırlarını veya tablo kayıtlarını, detayları eşzamanlı çekerek öneri sözlüklerine dönüştürür."""
+        details = self.fetch_movie_details_many([movie['movie_id'] for movie in movies])
+        return [
+            {
+                'movie_id': movie['movie_id'],
+                'title': movie['title'],
+                'poster': poster,
+                'overview': overview,
+                'score': movie.get('score', None),
+                'vote_average': movie['vote_average'],
+                'vote_count': movie['vote_count']
+            }
+            for movie, (poster, overview) in zip(movies, details)
+        ]
+            
     def get_hybrid_recommendations(
         self,
         movie_title: str,
         movies_df: pd.DataFrame,
-        similarity_matrix: np.ndarray,
+        similarity_matrix: Union[np.ndarray, SimilarityStore, NeighborIndex],
         top_n: int = 5
     ) -> List[Dict[str, Any]]:
         """
@@ -379,8 +913,9 @@ class Recommender:
             Önerilerin oluşturulacağı film başlığı
         movies_df : pd.DataFrame
             Film verilerini içeren DataFrame
-        similarity_matrix : np.ndarray
-            Benzerlik matrisi
+        similarity_matrix : Union[np.ndarray, SimilarityStore, NeighborIndex]
+            Yoğun benzerlik matrisi, bellek eşlemeli benzerlik deposu veya
+            en yakın K komşu indeksi
         top_n : int, optional
             Önerilecek film sayısı, by default 5
             
@@ -390,29 +925,22 @@ class Recommender:
             Önerilen filmlerin bilgilerini içeren liste
         """
         try:
-            # İçerik tabanlı önerileri al
-            content_recs = self.get_content_based_recommendations(
-                movie_title, movies_df, similarity_matrix, top_n=top_n*2
-            )
-            
-            # Ağırlıklı puanları hesapla
-            scored_movies = self.calculate_weighted_rating(movies_df)
-            
-            # Önerileri birleştir ve sırala
-            recommendations = []
-            for rec in content_recs:
-                movie_score = scored_movies[scored_movies['movie_id'] == rec['movie_id']]['score'].values
-                if len(movie_score) > 0:
-                    rec['weighted_score'] = movie_score[0]
-                else:
-                    rec['weighted_score'] = 0
-                recommendations.append(rec)
-                
-            # Ağırlıklı puana göre sırala
-            recommendations.sort(key=lambda x: x['weighted_score'], reverse=True)
+            # İçerik tabanlı aday filmleri al
+            candidates = self._similar_indices(movie_title, movies_df, similarity_matrix, top_n*2)
+            
+            # Ağırlıklı puanlar katalog başına bir kez hesaplanır; oy sayısı
+            # eşiğin altında kalan filmlerin puanı 0'dır
+            weighted_scores = self.rating_cache.scores(movies_df, qualified_only=True)[candidates]
+            
+            # Ağırlıklı puana göre sırala (eşitlikte içerik sırası korunur) ve
+            # yalnızca gösterilecek filmlerin detaylarını çek
+            order = np.argsort(-weighted_scores, kind='stable')[:top_n]
+            recommendations = self._build_recommendations([movies_df.iloc[candidates[i]] for i in order])
+            for rec, i in zip(recommendations, order):
+                rec['weighted_score'] = weighted_scores[i]
                 
             self.logger.info(f"{movie_title} için {top_n} hibrit öneri oluşturuldu.")
-            return recommendations[:top_n]
+            return recommendations
             
         except Exception as e:
             self.logger.error(f"Hibrit öneri oluşturma hatası: {str(e)}")
@@ -433,31 +961,78 @@ class Recommender:
             Film posteri URL'si ve özeti
         """
         try:
-            headers = {
-                "accept": "application/json",
-                "Authorization": f"Bearer {self.tmdb_token}"
-            }
+            poster_url, overview = self._movie_details(movie_id)
+            return poster_url, self.translate_text(overview)
             
-            url = f"https://api.themoviedb.org/3/movie/{movie_id}?language=en-US"
-            response = requests.get(url, headers=headers)
-            data = response.json()
+        except Exception as e:
+            self.logger.error(f"Film detayları çekme hatası: {str(e)}")
+            return FETCH_ERROR_DETAILS
             
-            # Poster URL'sini oluştur
-            if 'poster_path' in data and data['poster_path']:
-                poster_path = data['poster_path']
-                poster_url = f"https://image.tmdb.org/t/p/w500/{poster_path}"
-            else:
-                poster_url = "https://via.placeholder.com/500x750?text=No+Poster+Available"
-                
-            # Özeti al ve çevir
-            overview = data.get('overview', 'No overview available.')
-            translated_overview = self.translate_text(overview)
+    def _movie_details(self, movie_id: int) -> Tuple[str, str]:
+        """Filmin poster URL'sini ve çevrilmemiş özetini döndürür; hata durumunda istisna fırlatır."""
+        # Önbellekteki detaylar (süresi dolmuş olsa bile) ağ isteği beklenmeden kullanılır
+        data = self._loop.run(
+            self.tmdb_client.get_movie_details(movie_id, TMDB_DETAILS_LANGUAGE), timeout=self.fetch_timeout
+        )
+        return self._poster_and_overview(data)
             
-            return poster_url, translated_overview
+    @staticmethod
+    def _poster_and_overview(data: Dict[str, Any]) -> Tuple[str, str]:
+        """TMDB detaylarından poster URL'sini ve özeti çıkarır."""
+        # Poster URL'sini oluştur
+        if 'poster_path' in data and data['poster_path']:
+            poster_path = data['poster_path']
+            poster_url = f"https://image.tmdb.org/t/p/w500/{poster_path}"
+        else:
+            poster_url = "https://via.placeholder.com/500x750?text=No+Poster+Available"
             
-        except Exception as e:
-            self.logger.error(f"Film detayları çekme hatası: {str(e)}")
-            return "https://via.placeholder.com/500x750?text=Error", "Film detayları alınamadı."
+        # TMDB eksik özetleri null olarak döndürebilir; çeviri yalnızca metin alır
+        overview = data.get('overview', 'No overview available.')
+        return poster_url, overview if isinstance(overview, str) else ''
+            
+    def fetch_movie_details_many(self, movie_ids: Sequence[int]) -> List[Tuple[str, str]]:
+        """
+        Birden çok filmin detaylarını ve çevirilerini eşzamanlı çeker.
+        
+        İstekler max_workers bağlantılık havuz üzerinden eşzamanlı
+        gönderilir ve sonuçlar movie_ids sırasıyla döndürülür. Yalnızca
+        hata veren veya zamanında tamamlanmayan filmler yer tutucuyla
+        doldurulur. Her film için fetch_timeout kadar süre tanınır; havuz
+        sırasında bekleyen filmler için süre sıralarına göre uzatılır.
+        Özetler en sonda birlikte çeviri belleğine sorulur; bellekte
+        bulunmayanlar tek tek çevrilir.
+        
+        Parameters
+        ----------
+        movie_ids : Sequence[int]
+            Film ID'leri
+            
+        Returns
+        -------
+        List[Tuple[str, str]]
+            Her film için poster URL'si ve (çevrilmiş) özet
+        """
+        movie_ids = list(movie_ids)
+        results = self._loop.run(self.tmdb_client.get_movie_details_many(
+            movie_ids, TMDB_DETAILS_LANGUAGE, timeout=self.fetch_timeout
+        ))
+        
+        details = []
+        for movie_id, result in zip(movie_ids, results):
+            if isinstance(result, asyncio.TimeoutError):
+                self.logger.warning(f"Film {movie_id} detayları {self.fetch_timeout} saniyede alınamadı.")
+                details.append(FETCH_ERROR_DETAILS)
+            elif isinstance(result, BaseException):
+                self.logger.error(f"Film {movie_id} detayları çekme hatası: {str(result)}")
+                details.append(FETCH_ERROR_DETAILS)
+            else:
+                details.append(self._poster_and_overview(result))
+        
+        fetched = [i for i, item in enumerate(details) if item is not FETCH_ERROR_DETAILS]
+        overviews = self.translate_texts([details[i][1] for i in fetched])
+        for i, overview in zip(fetched, overviews):
+            details[i] = (details[i][0], overview)
+        return details
             
     def translate_text(self, text: str, target_language: str = 'tr') -> str:
         """
@@ -475,9 +1050,31 @@ class Recommender:
         str
             Çevrilmiş metin
         """
+        cached = self.translation_memo.get(text, target_language)
+        if cached is not None:
+            return cached
         try:
-            translation = self.translator.translate(text, dest=target_language)
-            return translation.text
+            translation = self.translator.translate(text, dest=target_language).text
+            self.translation_memo.put(text, target_language, translation)
+            return translation
         except Exception as e:
             self.logger.error(f"Metin çevirme hatası: {str(e)}")
-            return text 
\ No newline at end of file
+            return text
+            
+    def translate_texts(self, texts: Sequence[str], target_language: str = 'tr') -> List[str]:
+        """
+        Metinleri çeviri belleği üzerinden toplu olarak çevirir.
+        
+        Parameters
+        ----------
+        texts : Sequence[str]
+            Çevrilecek metinler
+        target_language : str, optional
+            Hedef dil kodu, by default 'tr'
+            
+        Returns
+        -------
+        List[str]
+            texts sırasıyla çeviriler; çevrilemeyen metinler özgün halleriyle
+        """
+        return translate_many(self.translator, texts, target_language, self.translation_memo) 
\ No newline at end of file
@@ -0,0 +1,236 @@
+"""
+Benzerlik hesaplamasını satır bloklarına bölerek paralel yürüten sınıf.
+"""
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, NamedTuple, Optional
+
+import numpy as np
+from scipy import sparse
+from sklearn.preprocessing import normalize
+
+# Blok başına satır başı bayt tahmini: yoğun skor satırı, argpartition için
+# negatif kopya ve int64 indeks dizisi (4 + 4 + 8 bayt / sütun)
+BYTES_PER_CELL = 16
+
+
+class SimilarityBlock(NamedTuple):
+    """Bir satır bloğu için hesaplanan sonuç."""
+    start: int
+    stop: int
+    result: Any
+
+
+class BlockProgress(NamedTuple):
+    """Blok bazında ilerleme ve verim bilgisi."""
+    block: int
+    n_blocks: int
+    rows_done: int
+    n_rows: int
+    elapsed: float
+    rows_per_second: float
+
+
+class BlockwiseSimilarityBuilder:
+    """
+    Seyrek özellik matrisinin kosinüs benzerliğini satır blokları halinde
+    hesaplayan sınıf.
+
+    Bloklar bir iş parçacığı havuzunda işlenir ve bellek bütçesini aşmayacak
+    sayıda blok aynı anda bellekte tutulur. Her bloğun sonucu sırasıyla
+    tüketiciye (top-K indirgeyici, diske yazıcı vb.) aktarılır.
+
+    Attributes
+    ----------
+    n_jobs : int
+        Eşzamanlı çalışan iş parçacığı sayısı
+    memory_budget_mb : float
+        Aynı anda bellekte tutulan blokların toplam bütçesi (MB)
+    block_size : Optional[int]
+        Sabit blok boyutu; None ise bütçeden hesaplanır
+    progress_callback : Optional[Callable[[BlockProgress], None]]
+        Her blok tamamlandığında çağrılan fonksiyon
+    logger : logging.Logger
+        Loglama için logger nesnesi
+    """
+
+    def __init__(
+        self,
+        n_jobs: Optional[int] = None,
+        memory_budget_mb: float = 256,
+        block_size: Optional[int] = None,
+        progress_callback: Optional[Callable[[BlockProgress], None]] = None
+    ):
+        """
+        BlockwiseSimilarityBuilder sınıfının başlatıcı metodu.
+
+        Parameters
+        ----------
+        n_jobs : Optional[int], optional
+            İş parçacığı sayısı, by default None (CPU çekirdek sayısı)
+        memory_budget_mb : float, optional
+            Bellek bütçesi (MB), by default 256
+        block_size : Optional[int], optional
+            Sabit blok boyutu, by default None
+        progress_callback : Optional[Callable[[BlockProgress], None]], optional
+            İlerleme bildirimi için fonksiyon, by default None
+        """
+        self.n_jobs = max(1, n_jobs or os.cpu_count() or 1)
+        self.memory_budget_mb = memory_budget_mb
+        self.block_size = block_size
+        self.progress_callback = progress_callback
+        self.logger = logging.getLogger(__name__)
+
+    def plan_block_size(self, n_cols: int) -> int:
+        """
+        Bellek bütçesine göre blok başına satır sayısını belirler.
+
+        Parameters
+        ----------
+        n_cols : int
+            Benzerlik bloğunun sütun sayısı (karşılaştırılan film sayısı)
+
+        Returns
+        -------
+        int
+            Blok başına satır sayısı
+        """
+        if self.block_size is not None:
+            return max(1, self.block_size)
+        budget_bytes = self.memory_budget_mb * 1024 * 1024
+        # Çalışan bloklar ve tüketilmeyi bekleyen bloklar için iki kat pay bırak
+        in_flight = 2 * self.n_jobs
+        return max(1, int(budget_bytes // (in_flight * BYTES_PER_CELL * max(n_cols, 1))))
+
+    def iter_blocks(
+        self,
+        matrix: sparse.spmatrix,
+        transform: Optional[Callable[[np.ndarray, int, int], Any]] = None,
+        exclude_self: bool = False
+    ) -> Iterator[SimilarityBlock]:
+        """
+        Benzerlik bloklarını satır sırasıyla üretir.
+
+        Parameters
+        ----------
+        matrix : sparse.spmatrix
+            (N, D) boyutlu özellik matrisi
+        transform : Optional[Callable[[np.ndarray, int, int], Any]], optional
+            Her yoğun blok üzerinde iş parçacığında uygulanacak fonksiyon
+            (blok, başlangıç, bitiş); None ise yoğun blok döndürülür
+        exclude_self : bool, optional
+            Filmin kendisiyle benzerliğinin -inf yapılıp yapılmayacağı,
+            by default False
+
+        Yields
+        ------
+        SimilarityBlock
+            Blok sınırları ve sonucu
+        """
+        features = normalize(sparse.csr_matrix(matrix), norm='l2', copy=True)
+        features_t = features.T.tocsr()
+        n_rows = features.shape[0]
+        block_size = self.plan_block_size(n_rows)
+        bounds = [(start, min(start + block_size, n_rows)) for start in range(0, n_rows, block_size)]
+
+        def compute(start: int, stop: int) -> Any:
+            block = (features[start:stop] @ features_t).toarray()
+            if exclude_self:
+                block[np.arange(stop - start), np.arange(start, stop)] = -np.inf
+            return transform(block, start, stop) if transform is not None else block
+
+        self.logger.info(
+            f"Benzerlik hesaplaması başlıyor: {n_rows} satır, {len(bounds)} blok, "
+            f"blok boyutu {block_size}, {self.n_jobs} iş parçacığı."
+        )
+        started = time.perf_counter()
+        rows_done = 0
+
+        with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+            pending = deque()
+            next_block = 0
+            for block_no, (start, stop) in enumerate(bounds):
+                # Bellek bütçesi için aynı anda en fazla n_jobs blok kuyrukta tutulur
+                while next_block < len(bounds) and len(pending) < self.n_jobs:
+                    pending.append(executor.submit(compute, *bounds[next_block]))
+                    next_block += 1
+
+                result = pending.popleft().result()
+                rows_done += stop - start
+                self._report(block_no, len(bounds), rows_done, n_rows, started)
+                yield SimilarityBlock(start, stop, result)
+
+        elapsed = time.perf_counter() - started
+        self.logger.info(
+            f"Benzerlik hesaplaması tamamlandı: {n_rows} satır, {elapsed:.2f} sn "
+            f"({n_rows / max(elapsed, 1e-9):.0f} satır/sn)."
+        )
+
+    def build(
+        self,
+        matrix: sparse.spmatrix,
+        consumer: Callable[[SimilarityBlock], None],
+        transform: Optional[Callable[[np.ndarray, int, int], Any]] = None,
+        exclude_self: bool = False
+    ) -> None:
+        """
+        Tüm blokları hesaplar ve her birini tüketiciye aktarır.
+
+        Parameters
+        ----------
+        matrix : sparse.spmatrix
+            (N, D) boyutlu özellik matrisi
+        consumer : Callable[[SimilarityBlock], None]
+            Her blok sonucu için çağrılan fonksiyon
+        transform : Optional[Callable[[np.ndarray, int, int], Any]], optional
+            Her yoğun blok üzerinde uygulanacak fonksiyon, by default None
+        exclude_self : bool, optional
+            Filmin kendisiyle benzerliğinin dışlanıp dışlanmayacağı,
+            by default False
+        """
+        for block in self.iter_blocks(matrix, transform=transform, exclude_self=exclude_self):
+            consumer(block)
+
+    def compute_dense(self, matrix: sparse.spmatrix) -> np.ndarray:
+        """
+        Tam yoğun benzerlik matrisini paralel olarak hesaplar.
+
+        Parameters
+        ----------
+        matrix : sparse.spmatrix
+            (N, D) boyutlu özellik matrisi
+
+        Returns
+        -------
+        np.ndarray
+            (N, N) boyutlu kosinüs benzerlik matrisi
+        """
+        n_rows = matrix.shape[0]
+        result = np.empty((n_rows, n_rows), dtype=np.result_type(matrix.dtype, np.float32))
+
+        def consume(block: SimilarityBlock) -> None:
+            result[block.start:block.stop] = block.result
+
+        self.build(matrix, consume)
+        return result
+
+    def _report(self, block: int, n_blocks: int, rows_done: int, n_rows: int, started: float) -> None:
+        """Blok ilerlemesini loglar ve geri çağırma fonksiyonuna iletir."""
+        elapsed = time.perf_counter() - started
+        progress = BlockProgress(
+            block=block + 1,
+            n_blocks=n_blocks,
+            rows_done=rows_done,
+            n_rows=n_rows,
+            elapsed=elapsed,
+            rows_per_second=rows_done / max(elapsed, 1e-9),
+        )
+        self.logger.debug(
+            f"Blok {progress.block}/{n_blocks}: {rows_done}/{n_rows} satır, "
+            f"{progress.rows_per_second:.0f} satır/sn."
+        )
+        if self.progress_callback is not None:
+            self.progress_callback(progress)
@@ -0,0 +1,217 @@
+"""
+Benzerlik matrisini süreçler arasında paylaşılan bellek eşlemeli dosyalarda saklayan sınıf.
+"""
+import json
+import logging
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+from scipy import sparse
+
+from .artifact_store import new_version_dir, publish_version, read_current_version
+from .similarity_builder import BlockwiseSimilarityBuilder, SimilarityBlock
+
+# Depo dosya düzeni değiştiğinde artırılmalıdır
+STORE_FORMAT_VERSION = 1
+
+SUPPORTED_DTYPES = ('float32', 'int8')
+
+
+class SimilarityStore:
+    """
+    N×N benzerlik matrisini diskte float32 veya simetrik int8 nicemlenmiş
+    olarak saklayan ve numpy.memmap ile salt okunur açan sınıf.
+
+    Dosya işletim sisteminin sayfa önbelleği üzerinden eşlendiği için aynı
+    depoyu açan tüm süreçler tek bir fiziksel kopyayı paylaşır. int8
+    varyantında her satır için filmin kendisi dışındaki en büyük
+    benzerlikten bir ölçek katsayısı saklanır ve satırlar okunurken
+    float32'ye geri çevrilir; köşegen satırın en büyük değerine kırpılır.
+
+    Her yazım ayrı bir sürüm dizinine yapılır ve dizindeki CURRENT işaretçisi
+    atomik olarak değiştirilir (artifact_store.publish_version); depo yolu
+    hiçbir an eksik kalmaz.
+
+    Attributes
+    ----------
+    path : Path
+        Depo dizini
+    version_dir : Path
+        Açılan sürümün dizini
+    matrix : np.memmap
+        Diskteki (N, N) boyutlu matris
+    scales : Optional[np.ndarray]
+        int8 varyantında satır başına ölçek katsayıları
+    logger : logging.Logger
+        Loglama için logger nesnesi
+    """
+
+    def __init__(self, path: str):
+        """
+        Var olan bir benzerlik deposunu salt okunur olarak açar.
+
+        Parameters
+        ----------
+        path : str
+            Depo dizini
+
+        Raises
+        ------
+        FileNotFoundError
+            Depo dosyaları bulunamadığında
+        ValueError
+            Depo biçimi desteklenmediğinde
+        """
+        self.path = Path(path)
+        self.logger = logging.getLogger(__name__)
+        self.version_dir, self.meta, self.matrix, self.scales = read_current_version(self.path, self._open)
+
+    def _open(self, version_dir: Path) -> Tuple[Path, Dict[str, Any], np.memmap, Optional[np.memmap]]:
+        """Sürüm dizinindeki meta veriyi okur ve dosyaları bellek eşlemeli açar."""
+        meta_path = version_dir / 'meta.json'
+        if not meta_path.exists():
+            raise FileNotFoundError(f"Benzerlik deposu bulunamadı: {self.path}")
+        meta = json.loads(meta_path.read_text(encoding='utf-8'))
+        if meta.get('format_version') != STORE_FORMAT_VERSION:
+            raise ValueError(f"Desteklenmeyen benzerlik deposu sürümü: {meta.get('format_version')}")
+
+        matrix = np.load(version_dir / 'matrix.npy', mmap_mode='r')
+        scales = None
+        if meta['dtype'] == 'int8':
+            scales = np.load(version_dir / 'scales.npy', mmap_mode='r')
+        return version_dir, meta, matrix, scales
+
+    @classmethod
+    def write(
+        cls,
+        matrix: sparse.spmatrix,
+        path: str,
+        dtype: str = 'float32',
+        builder: Optional[BlockwiseSimilarityBuilder] = None
+    ) -> 'SimilarityStore':
+        """
+        Özellik matrisinin kosinüs benzerliğini blok blok diske yazar.
+
+        Dosyalar yeni bir sürüm dizinine yazılır ve CURRENT işaretçisi
+        atomik olarak bu sürüme çevrilir. Eski depoyu bellek eşlemeli açmış
+        süreçler, dosyaları yerinde kesilmediği için kendi kopyalarıyla
+        tutarlı biçimde devam eder; yeni açanlar matris, ölçek ve meta verinin
+        aynı sürümünü görür ve yazım sırasında depo yolu hiç kaybolmaz.
+
+        Parameters
+        ----------
+        matrix : sparse.spmatrix
+            (N, D) boyutlu özellik matrisi
+        path : str
+            Depo dizini
+        dtype : str, optional
+            'float32' veya 'int8', by default 'float32'
+        builder : Optional[BlockwiseSimilarityBuilder], optional
+            Blok hesaplamasını yürütecek nesne, by default None
+
+        Returns
+        -------
+        SimilarityStore
+            Yazılan depo (salt okunur açılmış)
+
+        Raises
+        ------
+        ValueError
+            Desteklenmeyen veri tipi verildiğinde
+        """
+        if dtype not in SUPPORTED_DTYPES:
+            raise ValueError(f"Desteklenmeyen veri tipi: {dtype}. Seçenekler: {SUPPORTED_DTYPES}")
+
+        path = Path(path)
+        version_dir = new_version_dir(path)
+        try:
+            cls._write_version(matrix, version_dir, dtype, builder or BlockwiseSimilarityBuilder())
+        except BaseException:
+            shutil.rmtree(version_dir, ignore_errors=True)
+            raise
+        publish_version(path, version_dir)
+
+        store = cls(path)
+        store.logger.info(f"Benzerlik deposu yazıldı: {path} ({len(store)}×{len(store)}, {dtype}).")
+        return store
+
+    @staticmethod
+    def _write_version(
+        matrix: sparse.spmatrix,
+        version_dir: Path,
+        dtype: str,
+        builder: BlockwiseSimilarityBuilder
+    ) -> None:
+        """Benzerlik matrisini, ölçekleri ve meta veriyi sürüm dizinine yazar."""
+        n_rows = matrix.shape[0]
+
+        out = np.lib.format.open_memmap(version_dir / 'matrix.npy', mode='w+', dtype=dtype, shape=(n_rows, n_rows))
+        scales = np.ones(n_rows, dtype=np.float32) if dtype == 'int8' else None
+
+        def quantize(block: np.ndarray, start: int, stop: int):
+            block = block.astype(np.float32, copy=False)
+            if dtype == 'float32':
+                return block, None
+            # Simetrik nicemleme: satırdaki köşegen dışı en büyük mutlak değer
+            # 127'ye eşlenir. Köşegen (1.0) ölçeğe katılsaydı her satırın ölçeği
+            # 1/127 olur ve küçük benzerlikler birkaç düzeye sıkışırdı; köşegen
+            # 127'ye kırpılır ve satırın en büyük değeri olarak kalır.
+            magnitudes = np.abs(block)
+            rows = np.arange(stop - start)
+            magnitudes[rows, start + rows] = 0.0
+            row_scales = magnitudes.max(axis=1) / 127.0
+            row_scales[row_scales == 0] = 1.0
+            quantized = np.clip(np.rint(block / row_scales[:, np.newaxis]), -127, 127).astype(np.int8)
+            return quantized, row_scales
+
+        def consume(block: SimilarityBlock) -> None:
+            values, row_scales = block.result
+            out[block.start:block.stop] = values
+            if row_scales is not None:
+                scales[block.start:block.stop] = row_scales
+
+        builder.build(matrix, consume, transform=quantize)
+        out.flush()
+        del out
+
+        if scales is not None:
+            np.save(version_dir / 'scales.npy', scales)
+        meta = {
+            'format_version': STORE_FORMAT_VERSION,
+            'dtype': dtype,
+            'shape': [n_rows, n_rows],
+        }
+        (version_dir / 'meta.json').write_text(json.dumps(meta, indent=2), encoding='utf-8')
+
+    @property
+    def shape(self):
+        return self.matrix.shape
+
+    @property
+    def dtype(self) -> str:
+        return self.meta['dtype']
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+
+    def __getitem__(self, idx: Union[int, slice, np.ndarray]) -> np.ndarray:
+        """
+        Bir veya birden çok satırı float32 olarak döndürür.
+
+        Parameters
+        ----------
+        idx : Union[int, slice, np.ndarray]
+            Satır indeksi, dilimi veya indeks dizisi
+
+        Returns
+        -------
+        np.ndarray
+            Benzerlik satır(lar)ı
+        """
+        rows = np.asarray(self.matrix[idx], dtype=np.float32)
+        if self.scales is not None:
+            scales = np.asarray(self.scales[idx], dtype=np.float32)
+            rows = rows * (scales[..., np.newaxis] if rows.ndim > 1 else scales)
+        return rows
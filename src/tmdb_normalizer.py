@@ -0,0 +1,171 @@
+"""
+TMDB API yanıtlarını tmdb_5000 CSV dosyalarının ve Preprocessor'ın beklediği satır biçimine dönüştüren fonksiyonlar.
+"""
+import json
+from typing import Any, Dict, Iterable, Sequence
+
+import pandas as pd
+
+# Tek istekte detaylarla birlikte istenen varsayılan ek yanıtlar
+DEFAULT_APPEND = ('credits', 'keywords', 'images')
+
+# TMDB'nin append_to_response ile kabul ettiği en fazla ek yanıt sayısı
+MAX_APPEND = 20
+
+# tmdb_5000_movies.csv sütunları
+MOVIE_COLUMNS = [
+    'budget', 'genres', 'homepage', 'id', 'keywords', 'original_language', 'original_title',
+    'overview', 'popularity', 'production_companies', 'production_countries', 'release_date',
+    'revenue', 'runtime', 'spoken_languages', 'status', 'tagline', 'title', 'vote_average', 'vote_count',
+]
+
+# DataLoader.merge_datasets çıktısının, yani Preprocessor girdisinin sütunları
+MERGED_COLUMNS = [
+    'movie_id' if column == 'id' else 'title_x' if column == 'title' else column
+    for column in MOVIE_COLUMNS
+] + ['title', 'cast', 'crew']
+
+# JSON sütunlarında CSV'deki alanlar (API yanıtındaki fazlalıklar atılır)
+JSON_FIELDS = {
+    'genres': ('id', 'name'),
+    'keywords': ('id', 'name'),
+    'production_companies': ('name', 'id'),
+    'production_countries': ('iso_3166_1', 'name'),
+    'spoken_languages': ('iso_639_1', 'name'),
+    'cast': ('cast_id', 'character', 'credit_id', 'gender', 'id', 'name', 'order'),
+    'crew': ('credit_id', 'department', 'gender', 'id', 'job', 'name'),
+}
+
+
+def bundle_params(language: str, append: Sequence[str] = DEFAULT_APPEND) -> Dict[str, str]:
+    """
+    Detayları ve ek yanıtları tek istekte almak için sorgu parametrelerini oluşturur.
+
+    Parameters
+    ----------
+    language : str
+        Detayların dili (ör. 'en-US')
+    append : Sequence[str], optional
+        Ek yanıtlar, by default DEFAULT_APPEND
+
+    Returns
+    -------
+    Dict[str, str]
+        movie/{id} isteğinin sorgu parametreleri
+
+    Raises
+    ------
+    ValueError
+        TMDB'nin sınırından fazla ek yanıt istendiğinde
+    """
+    if len(append) > MAX_APPEND:
+        raise ValueError(f"append_to_response en fazla {MAX_APPEND} öğe alabilir: {len(append)}")
+    params = {"language": language, "append_to_response": ','.join(append)}
+    if 'images' in append:
+        # Görseller aksi halde yalnızca istek dilinde döner; dilsiz posterler de istenir
+        params["include_image_language"] = f"{language.split('-')[0]},null"
+    return params
+
+
+def bundle_cache_language(language: str, append: Sequence[str] = DEFAULT_APPEND) -> str:
+    """Birleşik yanıtların detay önbelleğinde saklandığı dil anahtarı."""
+    return f"{language}+{','.join(append)}"
+
+
+def split_bundle(bundle: Dict[str, Any], append: Sequence[str]) -> Dict[str, Any]:
+    """Birleşik yanıttan ek yanıtları atıp yalnızca film detaylarını döndürür."""
+    return {key: value for key, value in bundle.items() if key not in append}
+
+
+def _json_cell(items: Iterable[Dict[str, Any]], fields: Sequence[str]) -> str:
+    """Öğe listesini CSV'deki alanlarla JSON dizisine dönüştürür."""
+    return json.dumps([{field: item.get(field) for field in fields} for item in items or []])
+
+
+def normalize_movie(bundle: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Birleşik TMDB yanıtını (detaylar + credits + keywords) birleştirilmiş
+    katalog satırına dönüştürür.
+
+    Sonuç DataLoader.merge_datasets çıktısıyla aynı sütunlara ve aynı JSON
+    hücre biçimine sahiptir; Preprocessor ile doğrudan işlenebilir.
+
+    Parameters
+    ----------
+    bundle : Dict[str, Any]
+        movie/{id}?append_to_response=credits,keywords yanıtı
+
+    Returns
+    -------
+    Dict[str, Any]
+        MERGED_COLUMNS sütunlu satır
+    """
+    credits = bundle.get('credits') or {}
+    keywords = bundle.get('keywords') or {}
+    row = {
+        'budget': bundle.get('budget') or 0,
+        'genres': _json_cell(bundle.get('genres'), JSON_FIELDS['genres']),
+        'homepage': bundle.get('homepage') or None,
+        'movie_id': bundle['id'],
+        'keywords': _json_cell(keywords.get('keywords'), JSON_FIELDS['keywords']),
+        'original_language': bundle.get('original_language'),
+        'original_title': bundle.get('original_title'),
+        'overview': bundle.get('overview') or None,
+        'popularity': bundle.get('popularity'),
+        'production_companies': _json_cell(bundle.get('production_companies'), JSON_FIELDS['production_companies']),
+        'production_countries': _json_cell(bundle.get('production_countries'), JSON_FIELDS['production_countries']),
+        'release_date': bundle.get('release_date') or None,
+        'revenue': bundle.get('revenue') or 0,
+        # TMDB süresi bilinmeyen filmler için 0 döndürür; CSV'de bunlar boştur
+        'runtime': bundle.get('runtime') or None,
+        'spoken_languages': _json_cell(bundle.get('spoken_languages'), JSON_FIELDS['spoken_languages']),
+        'status': bundle.get('status'),
+        'tagline': bundle.get('tagline') or None,
+        'title_x': bundle.get('title'),
+        'vote_average': bundle.get('vote_average'),
+        'vote_count': bundle.get('vote_count'),
+        'title': bundle.get('title'),
+        'cast': _json_cell(credits.get('cast'), JSON_FIELDS['cast']),
+        'crew': _json_cell(credits.get('crew'), JSON_FIELDS['crew']),
+    }
+    return {column: row[column] for column in MERGED_COLUMNS}
+
+
+def movies_frame(bundles: Iterable[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Birleşik TMDB yanıtlarını Preprocessor'ın beklediği DataFrame'e dönüştürür.
+
+    Parameters
+    ----------
+    bundles : Iterable[Dict[str, Any]]
+        Birleşik yanıtlar
+
+    Returns
+    -------
+    pd.DataFrame
+        MERGED_COLUMNS sütunlu, merge_datasets çıktısıyla aynı biçimde veri seti
+    """
+    return records_frame(normalize_movie(bundle) for bundle in bundles)
+
+
+def records_frame(rows: Iterable[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    normalize_movie satırlarını CSV'den okunan veri setiyle aynı sütun
+    türlerine sahip DataFrame'e dönüştürür.
+
+    Parameters
+    ----------
+    rows : Iterable[Dict[str, Any]]
+        normalize_movie çıktıları
+
+    Returns
+    -------
+    pd.DataFrame
+        MERGED_COLUMNS sütunlu veri seti
+    """
+    df = pd.DataFrame(list(rows), columns=MERGED_COLUMNS)
+    for column in ('budget', 'revenue', 'vote_count'):
+        df[column] = pd.to_numeric(df[column]).fillna(0).astype('int64')
+    for column in ('popularity', 'runtime', 'vote_average'):
+        df[column] = pd.to_numeric(df[column]).astype('float64')
+    return df
@@ -0,0 +1,347 @@
+"""
+Çevirileri kaynak metnin özeti ve hedef dile göre kalıcı olarak saklayan bellek ve katalog ön çeviri işi.
+
+Kullanım:
+    python -m src.translation_memo --target tr
+"""
+import argparse
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Bellek dosyasının varsayılan konumu
+DEFAULT_MEMO_PATH = Path(__file__).resolve().parent.parent / "data" / "cache" / "translations.sqlite"
+
+# Bellek katmanında tutulan en fazla çeviri sayısı
+TRANSLATION_MEMORY_ENTRIES = 4096
+
+# Ön çeviride belleğe tek seferde yazılan en fazla çeviri sayısı
+TRANSLATION_BATCH_SIZE = 50
+
+logger = logging.getLogger(__name__)
+
+
+def text_key(text: str) -> str:
+    """Kaynak metnin SHA-256 özetini döndürür."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class TranslationMemo:
+    """
+    Çevirileri (kaynak metin özeti, hedef dil) anahtarıyla bellek içi LRU ve
+    SQLite katmanlarında saklayan sınıf.
+
+    Aynı metnin aynı dile çevirisi bir kez yapılır; sonraki istekler çeviri
+    servisine gitmeden yerel olarak karşılanır.
+
+    Attributes
+    ----------
+    path : Optional[Path]
+        SQLite dosyası; None ise yalnızca bellek katmanı kullanılır
+    max_memory_entries : int
+        Bellek katmanındaki en fazla çeviri sayısı
+    logger : logging.Logger
+        Loglama için logger nesnesi
+    """
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        path: Optional[str] = DEFAULT_MEMO_PATH,
+        max_memory_entries: int = TRANSLATION_MEMORY_ENTRIES
+    ):
+        """
+        TranslationMemo sınıfının başlatıcı metodu.
+
+        Parameters
+        ----------
+        path : Optional[str], optional
+            SQLite dosyası; None ise yalnızca bellek katmanı kullanılır,
+            by default DEFAULT_MEMO_PATH
+        max_memory_entries : int, optional
+            Bellek katmanındaki en fazla çeviri sayısı,
+            by default TRANSLATION_MEMORY_ENTRIES
+        """
+        self.max_memory_entries = max_memory_entries
+        self.logger = logging.getLogger(__name__)
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0}
+
+        self.path = None
+        self._db = None
+        if path is not None:
+            try:
+                self.path = Path(path)
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS translations ("
+                    "source_hash TEXT NOT NULL, target TEXT NOT NULL, translation TEXT NOT NULL, "
+                    "PRIMARY KEY (source_hash, target))"
+                )
+                self._db.commit()
+            except (OSError, sqlite3.Error) as e:
+                self.logger.warning(f"Çeviri belleği dosyası açılamadı, yalnızca bellek kullanılacak: {str(e)}")
+                self.path, self._db = None, None
+
+    @classmethod
+    def default(cls) -> 'TranslationMemo':
+        """Süreç içinde paylaşılan, varsayılan konumdaki çeviri belleğini döndürür."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def get_many(self, texts: Sequence[str], target: str) -> List[Optional[str]]:
+        """
+        Metinlerin saklanan çevirilerini döndürür.
+
+        Parameters
+        ----------
+        texts : Sequence[str]
+            Kaynak metinler
+        target : str
+            Hedef dil kodu
+
+        Returns
+        -------
+        List[Optional[str]]
+            texts sırasıyla çeviriler; bulunamayanlar için None
+        """
+        keys = [(text_key(text), target) for text in texts]
+        found = {}
+        with self._lock:
+            for key in keys:
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[key] = self._memory[key]
+            missing = [key for key in dict.fromkeys(keys) if key not in found]
+
+            if missing and self._db is not None:
+                for source_hash, translation in self._select(missing):
+                    key = (source_hash, target)
+                    found[key] = translation
+                    self._remember(key, translation)
+
+            hits = sum(key in found for key in keys)
+            self._counters['hits'] += hits
+            self._counters['misses'] += len(keys) - hits
+        return [found.get(key) for key in keys]
+
+    def get(self, text: str, target: str) -> Optional[str]:
+        """Metnin saklanan çevirisini döndürür; yoksa None."""
+        return self.get_many([text], target)[0]
+
+    def put_many(self, pairs: Iterable[Tuple[str, str]], target: str) -> None:
+        """
+        (kaynak metin, çeviri) çiftlerini her iki katmana yazar.
+
+        Parameters
+        ----------
+        pairs : Iterable[Tuple[str, str]]
+            Kaynak metinler ve çevirileri
+        target : str
+            Hedef dil kodu
+        """
+        rows = [(text_key(text), target, translation) for text, translation in pairs]
+        with self._lock:
+            for source_hash, _, translation in rows:
+                self._remember((source_hash, target), translation)
+            if self._db is not None and rows:
+                try:
+                    self._db.executemany("INSERT OR REPLACE INTO translations VALUES (?, ?, ?)", rows)
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    self.logger.warning(f"Çeviri belleğine yazılamadı: {str(e)}")
+
+    def put(self, text: str, target: str, translation: str) -> None:
+        """Tek bir çeviriyi saklar."""
+        self.put_many([(text, translation)], target)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """İsabet/ıska sayaçları ve katman boyutları."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats['memory_entries'] = len(self._memory)
+            stats['disk_entries'] = (
+                0 if self._db is None else self._db.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+            )
+        return stats
+
+    def _select(self, keys: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """Anahtarların SQLite'taki çevirilerini parça parça sorgular (kilit altında çağrılır)."""
+        target = keys[0][1]
+        hashes = [source_hash for source_hash, _ in keys]
+        rows = []
+        # SQLite'ın parametre sınırını aşmamak için sorgular bölünür
+        for start in range(0, len(hashes), 500):
+            chunk = hashes[start:start + 500]
+            rows.extend(self._db.execute(
+                f"SELECT source_hash, translation FROM translations WHERE target = ? "
+                f"AND source_hash IN ({', '.join('?' * len(chunk))})",
+                [target, *chunk]
+            ).fetchall())
+        return rows
+
+    def _remember(self, key: Tuple[str, str], translation: str) -> None:
+        """Çeviriyi bellek katmanına ekler ve en eski kayıtları atar (kilit altında çağrılır)."""
+        self._memory[key] = translation
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+
+def translate_many(
+    translator,
+    texts: Sequence[str],
+    target: str,
+    memo: Optional[TranslationMemo] = None
+) -> List[str]:
+    """
+    Metinleri çeviri belleği üzerinden çevirir.
+
+    Bellekte bulunan çeviriler yerel olarak döndürülür; kalan benzersiz
+    metinler tek tek çevrilir ve sonuçlar belleğe yazılır. Çevrilemeyen
+    metinler özgün halleriyle döndürülür ve belleğe yazılmaz; bir metnin
+    hatası diğerlerini etkilemez. Metin olmayan girdiler pretranslate'teki
+    gibi atlanır ve olduğu gibi döndürülür.
+
+    Parameters
+    ----------
+    translator
+        translate(text, dest=...) metoduna sahip çevirmen
+        (ör. googletrans.Translator)
+    texts : Sequence[str]
+        Kaynak metinler
+    target : str
+        Hedef dil kodu
+    memo : Optional[TranslationMemo], optional
+        Çeviri belleği, by default None (bellek kullanılmaz)
+
+    Returns
+    -------
+    List[str]
+        texts sırasıyla çeviriler
+    """
+    texts = list(texts)
+    # Metin olmayan girdiler (ör. eksik özetler için NaN) olduğu gibi döndürülür
+    positions = [i for i, t in enumerate(texts) if isinstance(t, str)]
+    translations = [None] * len(texts)
+    if memo is not None and positions:
+        for i, translation in zip(positions, memo.get_many([texts[i] for i in positions], target)):
+            translations[i] = translation
+    pending = list(dict.fromkeys(
+        texts[i] for i in positions if translations[i] is None and texts[i].strip()
+    ))
+
+    translated = _translate_each(translator, pending, target)
+    if memo is not None and translated:
+        memo.put_many(translated.items(), target)
+    return [
+        translation if translation is not None
+        else translated.get(text, text) if isinstance(text, str) else text
+        for text, translation in zip(texts, translations)
+    ]
+
+
+def pretranslate(
+    translator,
+    texts: Iterable[str],
+    target: str,
+    memo: TranslationMemo,
+    batch_size: int = TRANSLATION_BATCH_SIZE
+) -> int:
+    """
+    Metinlerin çevirilerini belleğe önceden yazar.
+
+    Parameters
+    ----------
+    translator
+        translate(text, dest=...) metoduna sahip çevirmen
+    texts : Iterable[str]
+        Kaynak metinler (ör. katalogdaki tüm film özetleri)
+    target : str
+        Hedef dil kodu
+    memo : TranslationMemo
+        Doldurulacak çeviri belleği
+    batch_size : int, optional
+        Belleğe tek seferde yazılan en fazla çeviri sayısı,
+        by default TRANSLATION_BATCH_SIZE
+
+    Returns
+    -------
+    int
+        Yeni çevrilen metin sayısı
+    """
+    texts = [t for t in dict.fromkeys(texts) if isinstance(t, str) and t.strip()]
+    missing = [t for t, tr in zip(texts, memo.get_many(texts, target)) if tr is None]
+    logger.info(f"{len(texts)} metnin {len(missing)} tanesi çevrilecek.")
+
+    added = 0
+    # İş yarıda kesilse bile yapılan çeviriler kaybolmasın diye parça parça yazılır
+    for start in range(0, len(missing), batch_size):
+        translated = _translate_each(translator, missing[start:start + batch_size], target)
+        memo.put_many(translated.items(), target)
+        added += len(translated)
+        logger.info(f"{min(start + batch_size, len(missing))}/{len(missing)} metin işlendi.")
+    return added
+
+
+def _translate_each(translator, texts: List[str], target: str) -> Dict[str, str]:
+    """
+    Metinleri tek tek çevirir; hata veren metinler atlanır.
+
+    googletrans liste girdisini de metin başına ayrı bir istekle çevirir;
+    tek tek çağırmak istek sayısını artırmaz, bir metnin hatasının diğer
+    çevirileri düşürmesini önler.
+    """
+    translated = {}
+    failed = 0
+    for text in texts:
+        try:
+            translated[text] = translator.translate(text, dest=target).text
+        except Exception as e:
+            failed += 1
+            logger.debug(f"Çeviri hatası: {str(e)}")
+    if failed:
+        logger.error(f"{len(texts)} metnin {failed} tanesi çevrilemedi.")
+    return translated
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--data-dir', default=None)
+    parser.add_argument('--memo', default=str(DEFAULT_MEMO_PATH))
+    parser.add_argument('--target', default='tr')
+    parser.add_argument('--batch-size', type=int, default=TRANSLATION_BATCH_SIZE)
+    args = parser.parse_args()
+
+    from googletrans import Translator
+
+    from .data_loader import DataLoader
+    from .details_cache import MovieDetailsCache
+
+    logging.basicConfig(level=logging.INFO)
+    movies_df = DataLoader(args.data_dir).load_preprocessed_data()
+    # Önerilerde TMDB'den gelen özetler çevrildiği için önbellekteki özetler de ısıtılır
+    texts = list(movies_df['overview'].dropna())
+    texts.extend(
+        payload.get('overview') for payload in MovieDetailsCache.default().payloads()
+    )
+
+    memo = TranslationMemo(args.memo)
+    added = pretranslate(Translator(), texts, args.target, memo, args.batch_size)
+    logger.info(f"Ön çeviri tamamlandı: {added} yeni çeviri, {memo.stats['disk_entries']} kayıt.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,271 @@
+"""
+Oyuncu, anahtar kelime, tür ve yönetmen alanlarını tamsayı kodlu sözlüklerle temsil eden sınıf.
+"""
+import itertools
+import logging
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer
+
+# İçerik özelliklerini oluşturan alanlar ('soup' sırasıyla)
+CONTENT_FIELDS = ('keywords', 'cast', 'director', 'genres')
+
+
+class EncodedField(NamedTuple):
+    """
+    Bir alanın CSR biçiminde kodlanmış hali.
+
+    vocabulary[indices[indptr[i]:indptr[i + 1]]] i. filmin öğeleridir.
+    """
+    name: str
+    vocabulary: np.ndarray
+    indptr: np.ndarray
+    indices: np.ndarray
+
+
+class ContentEncoder:
+    """
+    İçerik alanlarını alan bazında tamsayı kodlu sözlüklere dönüştüren ve
+    sayım özellik matrisini doğrudan bu temsilden oluşturan sınıf.
+
+    Her benzersiz öğe CountVectorizer'ın çözümleyicisinden yalnızca bir kez
+    geçirilir ve öğe → terim eşleme matrisi elde edilir. Özellik matrisi,
+    alan başına (film × öğe) matrisinin bu eşleme ile çarpımlarının toplamıdır;
+    sonuç 'soup' metni üzerinde CountVectorizer ile elde edilen matrisle
+    (sütun sırası dışında) aynıdır, ancak metin birleştirme ve yeniden
+    belirteçleme adımları atlanır.
+
+    Attributes
+    ----------
+    fields : Sequence[str]
+        Kodlanan alanlar
+    vocabularies_ : Dict[str, pd.Index]
+        Alan başına öğe sözlüğü (fit sonrası)
+    term_vocabulary_ : Dict[str, int]
+        Terim → sütun indeksi eşlemesi (fit sonrası)
+    last_oov_rate_ : float
+        Son transform çağrısında sözlükte bulunmayan terimlerin oranı
+    logger : logging.Logger
+        Loglama için logger nesnesi
+    """
+
+    def __init__(self, fields: Sequence[str] = CONTENT_FIELDS, stop_words: Optional[str] = 'english'):
+        """
+        ContentEncoder sınıfının başlatıcı metodu.
+
+        Parameters
+        ----------
+        fields : Sequence[str], optional
+            Kodlanacak alanlar, by default CONTENT_FIELDS
+        stop_words : Optional[str], optional
+            CountVectorizer durak kelimeleri, by default 'english'
+        """
+        self.fields = tuple(fields)
+        self.analyzer = CountVectorizer(stop_words=stop_words).build_analyzer()
+        self.vocabularies_ = {}
+        self.term_vocabulary_ = {}
+        self.last_oov_rate_ = 0.0
+        self._token_terms = {}
+        self.logger = logging.getLogger(__name__)
+
+    def encode(self, df: pd.DataFrame, fit: bool = False) -> Dict[str, EncodedField]:
+        """
+        Alanları tamsayı kodlu CSR temsiline dönüştürür.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Liste (cast, keywords, genres) veya metin (director) alanları
+            içeren veri seti
+        fit : bool, optional
+            Sözlüklerin bu veri setinden yeniden oluşturulup
+            oluşturulmayacağı, by default False
+
+        Returns
+        -------
+        Dict[str, EncodedField]
+            Alan adına göre kodlanmış alanlar. fit=False iken sözlükte
+            bulunmayan öğeler, alan sözlüğünün sonuna geçici olarak eklenir.
+        """
+        encoded = {}
+        for field in self.fields:
+            lengths, tokens = self._flatten(df[field])
+            indptr = np.zeros(len(lengths) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=indptr[1:])
+
+            if fit or field not in self.vocabularies_:
+                codes, uniques = pd.factorize(pd.Series(tokens, dtype=object), sort=False)
+                vocabulary = pd.Index(uniques, dtype=object)
+                if fit:
+                    self.vocabularies_[field] = vocabulary
+            else:
+                vocabulary = self.vocabularies_[field]
+                codes = vocabulary.get_indexer(tokens)
+                unknown = codes < 0
+                if unknown.any():
+                    extra_codes, extra = pd.factorize(pd.Series(tokens, dtype=object)[unknown], sort=False)
+                    codes[unknown] = len(vocabulary) + extra_codes
+                    vocabulary = vocabulary.append(pd.Index(extra, dtype=object))
+
+            encoded[field] = EncodedField(
+                name=field,
+                vocabulary=np.asarray(vocabulary, dtype=object),
+                indptr=indptr,
+                indices=np.asarray(codes, dtype=np.int32),
+            )
+        return encoded
+
+    def fit(self, df: pd.DataFrame) -> 'ContentEncoder':
+        """
+        Alan sözlüklerini ve terim sözlüğünü oluşturur.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            İçerik alanlarını içeren veri seti
+
+        Returns
+        -------
+        ContentEncoder
+            Eğitilmiş kodlayıcı
+        """
+        self.fit_transform(df)
+        return self
+
+    def fit_transform(self, df: pd.DataFrame) -> sparse.csr_matrix:
+        """
+        Sözlükleri oluşturur ve sayım özellik matrisini döndürür.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            İçerik alanlarını içeren veri seti
+
+        Returns
+        -------
+        sparse.csr_matrix
+            (N, n_terms) boyutlu sayım matrisi
+        """
+        try:
+            encoded = self.encode(df, fit=True)
+
+            # Her benzersiz öğe yalnızca bir kez çözümlenir
+            analyzed = {field: [self.analyzer(str(token)) for token in enc.vocabulary]
+                        for field, enc in encoded.items()}
+            terms = sorted(set(itertools.chain.from_iterable(
+                itertools.chain.from_iterable(field_terms) for field_terms in analyzed.values()
+            )))
+            self.term_vocabulary_ = {term: i for i, term in enumerate(terms)}
+            self._token_terms = {field: self._term_matrix(analyzed[field]) for field in encoded}
+
+            matrix = self.build_matrix(encoded)
+            self.logger.info(
+                f"İçerik özellik matrisi kodlanmış alanlardan oluşturuldu "
+                f"({matrix.shape[0]} film, {matrix.shape[1]} terim)."
+            )
+            return matrix
+
+        except Exception as e:
+            self.logger.error(f"İçerik kodlama hatası: {str(e)}")
+            raise
+
+    def transform(self, df: pd.DataFrame) -> sparse.csr_matrix:
+        """
+        Dondurulmuş sözlüklerle yeni filmlerin sayım matrisini oluşturur.
+
+        Sözlükte olmayan terimler CountVectorizer.transform'da olduğu gibi
+        yok sayılır; oranları last_oov_rate_ özelliğinde tutulur.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            İçerik alanlarını içeren veri seti
+
+        Returns
+        -------
+        sparse.csr_matrix
+            (N, n_terms) boyutlu sayım matrisi
+
+        Raises
+        ------
+        ValueError
+            Kodlayıcı henüz eğitilmediğinde
+        """
+        if not self.term_vocabulary_:
+            raise ValueError("ContentEncoder eğitilmedi. Önce fit() çağrılmalı.")
+        return self.build_matrix(self.encode(df))
+
+    def build_matrix(self, encoded: Dict[str, EncodedField]) -> sparse.csr_matrix:
+        """
+        Kodlanmış alanlardan sayım özellik matrisini oluşturur.
+
+        Parameters
+        ----------
+        encoded : Dict[str, EncodedField]
+            encode çıktısı
+
+        Returns
+        -------
+        sparse.csr_matrix
+            (N, n_terms) boyutlu sayım matrisi
+        """
+        n_terms = len(self.term_vocabulary_)
+        matrix = None
+        known_terms, total_terms = 0, 0
+
+        for field, enc in encoded.items():
+            token_terms = self._token_terms[field]
+            n_known = token_terms.shape[0]
+            known_per_token = np.asarray(token_terms.sum(axis=1)).ravel()
+            total_per_token = known_per_token
+            if len(enc.vocabulary) > n_known:
+                # Sözlükte olmayan öğeler çözümlenir, bilinen terimleri tutulur
+                extra = [self.analyzer(str(token)) for token in enc.vocabulary[n_known:]]
+                extra_terms = self._term_matrix(extra)
+                token_terms = sparse.vstack([token_terms, extra_terms]).tocsr()
+                known_per_token = np.concatenate([known_per_token, np.asarray(extra_terms.sum(axis=1)).ravel()])
+                total_per_token = np.concatenate([total_per_token, [len(t) for t in extra]])
+
+            occurrences_per_token = np.bincount(enc.indices, minlength=token_terms.shape[0])
+            known_terms += int(occurrences_per_token @ known_per_token)
+            total_terms += int(occurrences_per_token @ total_per_token)
+
+            n_rows = len(enc.indptr) - 1
+            occurrences = sparse.csr_matrix(
+                (np.ones(len(enc.indices), dtype=np.int64), enc.indices, enc.indptr),
+                shape=(n_rows, token_terms.shape[0])
+            )
+            product = occurrences @ token_terms
+            matrix = product if matrix is None else matrix + product
+
+        self.last_oov_rate_ = 1.0 - known_terms / total_terms if total_terms else 0.0
+        if matrix is None:
+            return sparse.csr_matrix((0, n_terms), dtype=np.int64)
+        matrix = matrix.tocsr()
+        matrix.sort_indices()
+        return matrix
+
+    def _term_matrix(self, analyzed: List[List[str]]) -> sparse.csr_matrix:
+        """Öğe → terim sayım matrisini oluşturur; bilinmeyen terimler atlanır."""
+        indptr = [0]
+        indices = []
+        for terms in analyzed:
+            indices.extend(self.term_vocabulary_[t] for t in terms if t in self.term_vocabulary_)
+            indptr.append(len(indices))
+        matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int64), np.asarray(indices, dtype=np.int32), indptr),
+            shape=(len(analyzed), len(self.term_vocabulary_))
+        )
+        matrix.sum_duplicates()
+        return matrix
+
+    @staticmethod
+    def _flatten(values: pd.Series):
+        """Alan değerlerini satır başı uzunluklar ve düz öğe listesine açar."""
+        items = [x if isinstance(x, list) else ([x] if isinstance(x, str) and x else [])
+                 for x in values.tolist()]
+        lengths = np.fromiter((len(x) for x in items), dtype=np.int64, count=len(items))
+        return lengths, list(itertools.chain.from_iterable(items))
@@ -0,0 +1,161 @@
+"""
+IMDB ağırlıklı puan formülünü vektörel olarak hesaplayan ve katalog sürümüne göre önbellekleyen sınıf.
+"""
+import logging
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# En az oy sayısı eşiğinin (m) hesaplandığı yüzdelik dilim
+VOTE_COUNT_QUANTILE = 0.9
+
+
+def weighted_rating(
+    vote_count: np.ndarray,
+    vote_average: np.ndarray,
+    quantile: float = VOTE_COUNT_QUANTILE
+) -> Tuple[np.ndarray, float, float]:
+    """
+    IMDB ağırlıklı puanını tüm filmler için tek seferde hesaplar.
+
+    WR = v / (v + m) * R + m / (v + m) * C
+
+    Parameters
+    ----------
+    vote_count : np.ndarray
+        Oy sayıları (v)
+    vote_average : np.ndarray
+        Oy ortalamaları (R)
+    quantile : float, optional
+        m eşiğinin hesaplandığı yüzdelik dilim, by default VOTE_COUNT_QUANTILE
+
+    Returns
+    -------
+    Tuple[np.ndarray, float, float]
+        Ağırlıklı puanlar, en az oy sayısı eşiği (m) ve ortalama puan (C)
+    """
+    v = np.asarray(vote_count, dtype=np.float64)
+    R = np.asarray(vote_average, dtype=np.float64)
+    # pandas ile aynı sonuç için eksik değerler atlanır
+    C = float(np.nanmean(R)) if len(R) else np.nan
+    m = float(np.nanquantile(v, quantile)) if len(v) else np.nan
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = v / (v + m) * R + m / (m + v) * C
+    return scores, m, C
+
+
+class _CacheEntry(NamedTuple):
+    index: pd.Index
+    scores: np.ndarray
+
+
+class WeightedRatingCache:
+    """
+    Ağırlıklı puan dizilerini katalog sürümüne göre saklayan sınıf.
+
+    Katalog sürümü DataFrame'in attrs['catalog_version'] alanından okunur
+    (ArtifactStore ve DeltaIngestor tarafından atanır). Aynı katalog için
+    tekrar eden istekler yeniden hesaplama yerine tek bir sözlük araması
+    maliyetindedir. Sürümü olmayan kataloglar önbelleğe alınmaz; içerik
+    özeti çıkarmak puanları yeniden hesaplamak kadar pahalı olurdu.
+
+    Attributes
+    ----------
+    quantile : float
+        m eşiğinin hesaplandığı yüzdelik dilim
+    max_entries : int
+        Saklanacak en fazla katalog sayısı
+    logger : logging.Logger
+        Loglama için logger nesnesi
+    """
+
+    def __init__(self, quantile: float = VOTE_COUNT_QUANTILE, max_entries: int = 8):
+        """
+        WeightedRatingCache sınıfının başlatıcı metodu.
+
+        Parameters
+        ----------
+        quantile : float, optional
+            m eşiğinin hesaplandığı yüzdelik dilim, by default VOTE_COUNT_QUANTILE
+        max_entries : int, optional
+            Saklanacak en fazla katalog sayısı, by default 8
+        """
+        self.quantile = quantile
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.logger = logging.getLogger(__name__)
+
+    def scores(self, df: pd.DataFrame, qualified_only: bool = False) -> np.ndarray:
+        """
+        Katalogdaki filmlerin ağırlıklı puanlarını satır sırasıyla döndürür.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            vote_count ve vote_average sütunlarını içeren katalog
+        qualified_only : bool, optional
+            True ise oy sayısı m eşiğinin altında kalan filmlerin puanı 0
+            olur, by default False
+
+        Returns
+        -------
+        np.ndarray
+            df satırlarıyla hizalı, salt okunur (N,) boyutlu puan dizisi
+        """
+        version: Optional[str] = df.attrs.get('catalog_version')
+        if version is None:
+            return self._compute(df, qualified_only)
+
+        key = (version, len(df), qualified_only)
+        entry = self._entries.get(key)
+        if entry is not None and (entry.index is df.index or entry.index.equals(df.index)):
+            self._entries.move_to_end(key)
+            return entry.scores
+
+        scores = self._compute(df, qualified_only)
+        self._entries[key] = _CacheEntry(df.index, scores)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        self.logger.info(f"Ağırlıklı puanlar hesaplandı ({len(df)} film, katalog sürümü {version}).")
+        return scores
+
+    def clear(self) -> None:
+        """Önbelleği boşaltır."""
+        self._entries.clear()
+
+    def _compute(self, df: pd.DataFrame, qualified_only: bool) -> np.ndarray:
+        """Puanları önbelleğe bakmadan hesaplar."""
+        scores, m, _ = weighted_rating(df['vote_count'].values, df['vote_average'].values, self.quantile)
+        if qualified_only:
+            scores = np.where(df['vote_count'].values >= m, scores, 0.0)
+        scores.setflags(write=False)
+        return scores
+
+
+def scale_to_unit(scores: np.ndarray) -> np.ndarray:
+    """
+    Puanları en küçük-en büyük ölçeklemeyle [0, 1] aralığına taşır.
+
+    Eksik değerler 0 olur; tüm puanlar eşitse sonuç sıfırlardan oluşur.
+
+    Parameters
+    ----------
+    scores : np.ndarray
+        Ağırlıklı puanlar
+
+    Returns
+    -------
+    np.ndarray
+        [0, 1] aralığındaki puanlar
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    if not len(scores) or np.isnan(scores).all():
+        return np.zeros_like(scores)
+    low, high = np.nanmin(scores), np.nanmax(scores)
+    scaled = (scores - low) / (high - low) if high > low else np.zeros_like(scores)
+    return np.nan_to_num(scaled)
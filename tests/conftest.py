@@ -0,0 +1,104 @@
+"""
+Testlerin paylaştığı yerel TMDB sunucusu ve istemci fixture'ları.
+"""
+import asyncio
+import threading
+from collections import Counter
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+import pytest
+from aiohttp import web
+
+from src.async_api_client import AsyncTMDBClient
+from src.details_cache import MovieDetailsCache
+from src.rate_limiter import TokenBucket
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+class StubServer:
+    """
+    Ayrı bir iş parçacığındaki olay döngüsünde çalışan yerel aiohttp sunucusu.
+
+    Yol başına işleyici tanımlanır; tanımsız yollar 404 döndürür. Gelen
+    her istek yol ve sorgu parametreleriyle kaydedilir.
+    """
+
+    def __init__(self):
+        self.handlers: Dict[str, Handler] = {}
+        self.requests: List[Tuple[str, Dict[str, str]]] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._runner = None
+        self.url = None
+
+    def start(self) -> 'StubServer':
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result(5)
+        return self
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result(5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(5)
+
+    def route(self, path: str, handler: Handler) -> None:
+        self.handlers[path] = handler
+
+    def hits(self, path: str) -> int:
+        with self._lock:
+            return sum(1 for p, _ in self.requests if p == path)
+
+    def path_counts(self) -> Counter:
+        with self._lock:
+            return Counter(p for p, _ in self.requests)
+
+    async def _start(self) -> None:
+        app = web.Application()
+        app.router.add_get('/{tail:.*}', self._dispatch)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f'http://127.0.0.1:{port}'
+
+    async def _dispatch(self, request: web.Request) -> web.StreamResponse:
+        with self._lock:
+            self.requests.append((request.path, dict(request.query)))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            handler = self.handlers.get(request.path)
+            if handler is None:
+                return web.json_response({'status_message': 'not found'}, status=404)
+            return await handler(request)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def stub_server():
+    server = StubServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def make_client(stub_server):
+    """Yerel sunucuya bağlı, önbelleksiz ve hız sınırı gevşek istemci üretir."""
+    def make(**kwargs) -> AsyncTMDBClient:
+        options = {
+            'api_key': 'test-key',
+            'base_url': stub_server.url,
+            'details_cache': MovieDetailsCache(None),
+            'rate_limiter': TokenBucket(rate=1000, capacity=1000),
+            'backoff_factor': 0.0,
+        }
+        options.update(kwargs)
+        return AsyncTMDBClient(**options)
+    return make
@@ -0,0 +1,88 @@
+"""
+ALS testleri: normal denklemlerin kurulumu, fold-in sırasında yayımlanmış puanlayıcının değişmemesi
+ve SVD faktörlerinin fold-in ile yeniden üretilmesi.
+"""
+import numpy as np
+import pytest
+from scipy import sparse
+from surprise import SVD, Dataset, Reader
+
+from src.als import ALS_PADDED_MAX_RATINGS, AlternatingLeastSquares, Regularization
+from src.cf_scoring import LatentFactorScorer
+from src.ratings_store import RatingsMatrix
+
+
+def random_ratings(n_users=60, n_items=40, n_ratings=600, seed=0):
+    rng = np.random.default_rng(seed)
+    pairs = rng.choice(n_users * n_items, n_ratings, replace=False)
+    users, items = np.divmod(pairs, n_items)
+    return RatingsMatrix.from_arrays(users + 1, items + 1, rng.integers(1, 6, n_ratings).astype(float))
+
+
+@pytest.mark.parametrize('implicit', [False, True])
+def test_normal_equations_match_per_row_products(implicit):
+    rng = np.random.default_rng(1)
+    # Puansız, az puanlı ve ALS_PADDED_MAX_RATINGS üzerindeki satırlar birlikte
+    counts = np.array([0, 1, 2, 3, 5, 7, 13, 30, ALS_PADDED_MAX_RATINGS, ALS_PADDED_MAX_RATINGS + 1, 150, 0, 4])
+    n_cols = 200
+    indices = np.concatenate([rng.choice(n_cols, c, replace=False) for c in counts])
+    indptr = np.concatenate([[0], np.cumsum(counts)])
+    matrix = sparse.csr_matrix((rng.integers(1, 6, len(indices)).astype(float), indices, indptr), (len(counts), n_cols))
+    design = rng.normal(size=(n_cols, 9))
+    fixed_biases = None if implicit else rng.normal(size=n_cols)
+    model = AlternatingLeastSquares(implicit=implicit, alpha=2.0)
+    model.global_mean = 3.0
+    rows = rng.permutation(len(counts))
+
+    lhs, rhs = model._normal_equations(matrix, rows, design, fixed_biases)
+
+    for i, row in enumerate(rows):
+        lo, hi = matrix.indptr[row], matrix.indptr[row + 1]
+        cols, values = matrix.indices[lo:hi], matrix.data[lo:hi]
+        y = design[cols]
+        if implicit:
+            weights, targets = model.alpha * values, 1.0 + model.alpha * values
+        else:
+            weights, targets = np.ones(len(cols)), values - model.global_mean - fixed_biases[cols]
+        np.testing.assert_allclose(lhs[i], (y.T * weights) @ y, atol=1e-10)
+        np.testing.assert_allclose(rhs[i], y.T @ targets, atol=1e-10)
+
+
+@pytest.mark.parametrize('implicit', [False, True])
+def test_partial_fit_does_not_touch_published_scorer(implicit):
+    ratings = random_ratings()
+    model = AlternatingLeastSquares(n_factors=8, n_iterations=3, implicit=implicit, random_state=0).fit(ratings)
+    scorer = model.to_scorer(ratings)
+    arrays = [scorer.user_factors, scorer.item_factors, scorer.user_biases, scorer.item_biases]
+    snapshot = [array.copy() for array in arrays]
+    before = scorer.predict(1, [1, 2, 3])
+
+    # Yalnızca var olan kullanıcı ve filmler: faktör dizileri büyütülmez, yerinde yazılabilir
+    updated, update = ratings.with_ratings([1, 2], [1, 3], [5.0, 1.0])
+    model.partial_fit(updated, users=update.users, items=update.items)
+
+    for array, copy in zip(arrays, snapshot):
+        np.testing.assert_array_equal(array, copy)
+    np.testing.assert_array_equal(scorer.predict(1, [1, 2, 3]), before)
+    assert not np.array_equal(model.user_factors[update.users[0]], snapshot[0][update.users[0]])
+
+
+def test_partial_fit_on_unchanged_rows_reproduces_svd_factors():
+    ratings = random_ratings(n_users=40, n_items=30, n_ratings=400)
+    # Uzun ve küçük adımlı SGD, SVD amacının durağan noktasına yaklaşır
+    svd = SVD(n_factors=2, n_epochs=5000, lr_all=0.005, reg_pu=0.3, reg_bu=0.05, reg_qi=0.2, reg_bi=0.1,
+              random_state=0)
+    svd.fit(Dataset.load_from_df(ratings.to_frame(raw_ids=False), Reader()).build_full_trainset())
+    scorer = LatentFactorScorer.from_surprise(svd, ratings)
+    users, items = np.arange(ratings.n_users), np.arange(ratings.n_items)
+
+    model = AlternatingLeastSquares.from_scorer(scorer, regularization=Regularization.from_surprise(svd))
+    model.partial_fit(ratings, users=users, items=items)
+
+    np.testing.assert_allclose(model.item_factors, scorer.item_factors, atol=0.03)
+    np.testing.assert_allclose(model.item_biases, scorer.item_biases, atol=0.03)
+    np.testing.assert_allclose(model.user_factors, scorer.user_factors, atol=0.03)
+    np.testing.assert_allclose(model.user_biases, scorer.user_biases, atol=0.03)
+    # ALS'nin varsayılan düzenlileştirmesi başka bir amacı çözer ve faktörleri kaydırır
+    default = AlternatingLeastSquares.from_scorer(scorer).partial_fit(ratings, users=users)
+    assert np.abs(default.user_factors - scorer.user_factors).max() > 0.1
@@ -0,0 +1,128 @@
+"""
+AsyncTMDBClient testleri: havuz sınırı, zaman aşımı, yeniden deneme, toplu sonuç sırası ve paylaşılan istemci.
+"""
+import asyncio
+import time
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from src.async_api_client import AsyncTMDBClient, BackgroundLoop
+from src.details_cache import MovieDetailsCache
+
+
+def serve_movie(server, movie_id, delay=0.0, responses=()):
+    """responses: sırayla dönülecek (durum kodu, başlıklar) çiftleri; bitince 200 döner."""
+    pending = list(responses)
+
+    async def handler(request):
+        await asyncio.sleep(delay)
+        if pending:
+            status, headers = pending.pop(0)
+            return web.json_response({'status_message': 'error'}, status=status, headers=headers)
+        return web.json_response({'id': movie_id, 'title': f'Movie {movie_id}'})
+
+    server.route(f'/movie/{movie_id}', handler)
+
+
+async def fetch_many(client, movie_ids, **kwargs):
+    async with client:
+        return await client.get_movie_details_many(movie_ids, **kwargs)
+
+
+def test_pool_size_limits_concurrent_connections(stub_server, make_client):
+    ids = list(range(1, 13))
+    for movie_id in ids:
+        serve_movie(stub_server, movie_id, delay=0.05)
+
+    results = asyncio.run(fetch_many(make_client(pool_size=3), ids))
+
+    assert [r['id'] for r in results] == ids
+    assert stub_server.max_active == 3
+
+
+def test_request_timeout_is_per_attempt(stub_server, make_client):
+    serve_movie(stub_server, 1, delay=0.5)
+
+    async def fetch():
+        async with make_client(timeout=0.1, retries=1) as client:
+            return await client.get_movie_details(1)
+
+    started = time.perf_counter()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(fetch())
+
+    assert time.perf_counter() - started < 0.45
+    assert stub_server.hits('/movie/1') == 2
+
+
+def test_retry_after_is_honoured_on_429(stub_server, make_client):
+    serve_movie(stub_server, 1, responses=[(429, {'Retry-After': '0.3'})])
+
+    started = time.perf_counter()
+    results = asyncio.run(fetch_many(make_client(retries=3), [1]))
+
+    assert results[0]['id'] == 1
+    assert time.perf_counter() - started >= 0.3
+    assert stub_server.hits('/movie/1') == 2
+
+
+def test_server_errors_back_off_exponentially(stub_server, make_client):
+    serve_movie(stub_server, 1, responses=[(503, {}), (502, {})])
+    serve_movie(stub_server, 2, responses=[(500, {})] * 3)
+
+    started = time.perf_counter()
+    results = asyncio.run(fetch_many(make_client(retries=2, backoff_factor=0.1), [1, 2]))
+
+    # İlk yeniden deneme beklemez, ikincisi backoff_factor * 2 saniye bekler
+    assert time.perf_counter() - started >= 0.2
+    assert results[0]['id'] == 1
+    assert isinstance(results[1], aiohttp.ClientResponseError) and results[1].status == 500
+    assert stub_server.hits('/movie/1') == 3
+    assert stub_server.hits('/movie/2') == 3
+
+
+def test_details_many_keeps_order_and_returns_errors_in_place(stub_server, make_client):
+    ids = [5, 1, 4, 2, 3]
+    for movie_id in ids:
+        # Önce istenenler daha geç yanıtlanır
+        serve_movie(stub_server, movie_id, delay=0.02 * movie_id)
+    serve_movie(stub_server, 4, responses=[(404, {})])
+
+    results = asyncio.run(fetch_many(make_client(), ids))
+
+    assert [r['id'] for r in results if isinstance(r, dict)] == [5, 1, 2, 3]
+    assert isinstance(results[2], aiohttp.ClientResponseError) and results[2].status == 404
+
+
+def test_details_many_timeout_fails_only_slow_items(stub_server, make_client):
+    serve_movie(stub_server, 1)
+    serve_movie(stub_server, 2, delay=0.5)
+    serve_movie(stub_server, 3)
+
+    results = asyncio.run(fetch_many(make_client(retries=0), [1, 2, 3], timeout=0.2))
+
+    assert results[0]['id'] == 1 and results[2]['id'] == 3
+    assert isinstance(results[1], asyncio.TimeoutError)
+
+
+def test_default_client_is_shared_and_closed_with_the_loop(stub_server):
+    serve_movie(stub_server, 1)
+    cache = MovieDetailsCache(None)
+    loop = BackgroundLoop.default()
+    try:
+        # Her Streamlit yeniden çalıştırması aynı ayarlarla aynı istemciyi alır
+        client = AsyncTMDBClient.default(api_key='test-key', base_url=stub_server.url, details_cache=cache)
+        assert AsyncTMDBClient.default(api_key='test-key', base_url=stub_server.url, details_cache=cache) is client
+        assert loop.run(client.get_movie_details(1), timeout=5)['id'] == 1
+        session = client._session
+        assert session is not None and not session.closed
+    finally:
+        loop.close()
+
+    assert session.closed and loop.loop.is_closed()
+    assert BackgroundLoop.default() is not loop
+    fresh = AsyncTMDBClient.default(api_key='test-key', base_url=stub_server.url, details_cache=cache)
+    assert fresh is not client
+    BackgroundLoop.default().close()
@@ -0,0 +1,190 @@
+"""
+CatalogSync testleri: yerel sunucuya karşı tam senkronizasyon, kesintiden devam, 404 ve yeniden deneme.
+"""
+import asyncio
+import datetime as dt
+import json
+
+import pandas as pd
+from aiohttp import web
+
+from src.catalog_sync import CHECKPOINT_FILE, CatalogSync, catalog_shard_paths
+
+
+def bundle(movie_id: int) -> dict:
+    return {
+        'id': movie_id,
+        'title': f'Movie {movie_id}',
+        'overview': f'Overview {movie_id}',
+        'genres': [{'id': 18, 'name': 'Drama'}],
+        'vote_average': 7.0,
+        'vote_count': 100,
+        'runtime': 100,
+        'credits': {
+            'cast': [{'id': 1, 'name': 'Actor', 'order': 0}],
+            'crew': [{'id': 2, 'name': 'Director', 'job': 'Director', 'department': 'Directing'}],
+        },
+        'keywords': {'keywords': [{'id': 3, 'name': 'keyword'}]},
+        'images': {'posters': []},
+    }
+
+
+def serve_discover(server, ids_by_year, per_page=10):
+    async def discover(request):
+        ids = ids_by_year.get(int(request.query['primary_release_year']), [])
+        page = int(request.query['page'])
+        total_pages = max(1, -(-len(ids) // per_page))
+        results = [{'id': i, 'adult': False} for i in ids[(page - 1) * per_page:page * per_page]]
+        return web.json_response({'page': page, 'total_pages': total_pages, 'results': results})
+    server.route('/discover/movie', discover)
+
+
+def serve_changes(server, ids_by_window):
+    async def changes(request):
+        ids = ids_by_window.get((request.query['start_date'], request.query['end_date']), [])
+        results = [{'id': i, 'adult': False} for i in ids]
+        return web.json_response({'page': 1, 'total_pages': 1, 'results': results})
+    server.route('/movie/changes', changes)
+
+
+def serve_bundles(server, ids, status=None, gate=None):
+    """status: id → durum kodu (ör. 404, 500); gate: id → yanıttan önce beklenen eşyordam fabrikası."""
+    status = status if status is not None else {}
+
+    def make_handler(movie_id):
+        async def handler(request):
+            if gate is not None and movie_id in gate:
+                await gate[movie_id]()
+            code = status.get(movie_id)
+            if code is not None:
+                return web.json_response({'status_message': 'error'}, status=code)
+            return web.json_response(bundle(movie_id))
+        return handler
+
+    for movie_id in ids:
+        server.route(f'/movie/{movie_id}', make_handler(movie_id))
+
+
+def shard_ids(catalog_dir):
+    frames = [pd.read_parquet(path) for path in catalog_shard_paths(catalog_dir)]
+    return sorted(pd.concat(frames)['movie_id'].tolist()) if frames else []
+
+
+def load_checkpoint(catalog_dir):
+    return json.loads((catalog_dir / CHECKPOINT_FILE).read_text())
+
+
+async def run_sync(make_client, catalog_dir, method, *args, **kwargs):
+    async with make_client(retries=0) as client:
+        sync = CatalogSync(client, catalog_dir, batch_size=5, shard_size=8)
+        return await getattr(sync, method)(*args, **kwargs)
+
+
+def test_full_discover_sync(stub_server, make_client, tmp_path):
+    ids_by_year = {2020: list(range(100, 123)), 2021: list(range(200, 207))}
+    all_ids = ids_by_year[2020] + ids_by_year[2021]
+    serve_discover(stub_server, ids_by_year)
+    serve_bundles(stub_server, all_ids)
+
+    written = asyncio.run(run_sync(make_client, tmp_path, 'sync_discover', 2020, 2021))
+
+    assert written == len(all_ids)
+    assert shard_ids(tmp_path) == sorted(all_ids)
+    assert len(catalog_shard_paths(tmp_path)) > 1
+    counts = stub_server.path_counts()
+    assert all(counts[f'/movie/{i}'] == 1 for i in all_ids)
+    assert counts['/discover/movie'] == 3 + 1
+    assert load_checkpoint(tmp_path)['completed']
+
+
+def test_cancelled_sync_resumes_without_refetching(stub_server, make_client, tmp_path):
+    ids = list(range(1, 21))
+    serve_discover(stub_server, {2020: ids})
+    cancelled = []
+    release = {'open': False}
+
+    async def wait_until_released():
+        # Sunucu döngüsünde beklenir; ilk çalıştırma iptal edilene kadar yanıt verilmez
+        while not release['open']:
+            await asyncio.sleep(0.01)
+
+    serve_bundles(stub_server, ids, gate={12: wait_until_released})
+
+    async def cancel_mid_batch():
+        task = asyncio.create_task(run_sync(make_client, tmp_path, 'sync_discover', 2020, 2020))
+        while stub_server.hits('/movie/12') == 0:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            cancelled.append(True)
+
+    asyncio.run(cancel_mid_batch())
+    assert cancelled
+    checkpoint = load_checkpoint(tmp_path)
+    assert not checkpoint['completed']
+    assert checkpoint['done_ids'] == list(range(1, 11))
+    listing_hits = stub_server.hits('/discover/movie')
+
+    release['open'] = True
+    written = asyncio.run(run_sync(make_client, tmp_path, 'sync_discover', 2020, 2020))
+
+    assert written == 10
+    assert shard_ids(tmp_path) == ids
+    counts = stub_server.path_counts()
+    # Tamamlanmış turlar ve listelenmiş sayfalar tekrar istenmez; yalnızca kesilen tur yeniden çekilir
+    assert all(counts[f'/movie/{i}'] == 1 for i in range(1, 11))
+    assert all(counts[f'/movie/{i}'] == 2 for i in range(11, 16))
+    assert all(counts[f'/movie/{i}'] == 1 for i in range(16, 21))
+    assert stub_server.hits('/discover/movie') == listing_hits
+
+
+def test_deleted_movies_are_dropped(stub_server, make_client, tmp_path):
+    ids = [1, 2, 3]
+    serve_discover(stub_server, {2020: ids})
+    serve_bundles(stub_server, ids, status={2: 404})
+
+    asyncio.run(run_sync(make_client, tmp_path, 'sync_discover', 2020, 2020))
+
+    assert shard_ids(tmp_path) == [1, 3]
+    assert load_checkpoint(tmp_path)['failed_ids'] == []
+
+    asyncio.run(run_sync(make_client, tmp_path, 'sync_discover', 2021, 2021))
+    assert stub_server.hits('/movie/2') == 1
+
+
+def test_failed_movies_are_retried_next_run(stub_server, make_client, tmp_path):
+    first_window = ('2026-10-01', '2026-10-01')
+    serve_changes(stub_server, {first_window: [1, 2, 3]})
+    status = {2: 500}
+    serve_bundles(stub_server, [1, 2, 3], status=status)
+
+    asyncio.run(run_sync(
+        make_client, tmp_path, 'sync_changes', dt.date(2026, 10, 1), dt.date(2026, 10, 1)
+    ))
+
+    checkpoint = load_checkpoint(tmp_path)
+    assert shard_ids(tmp_path) == [1, 3]
+    assert checkpoint['failed_ids'] == [2]
+    # Hatalı filmi olan aralığın ötesine geçilmez
+    assert checkpoint['last_synced'] == '2026-10-01'
+
+    del status[2]
+    asyncio.run(run_sync(make_client, tmp_path, 'sync_changes', until=dt.date(2026, 10, 3)))
+
+    checkpoint = load_checkpoint(tmp_path)
+    assert stub_server.hits('/movie/2') == 2
+    assert 2 in shard_ids(tmp_path)
+    assert checkpoint['failed_ids'] == []
+    assert checkpoint['last_synced'] == '2026-10-03'
+
+
+def test_last_synced_is_the_covered_until_date(stub_server, make_client, tmp_path):
+    serve_changes(stub_server, {})
+
+    asyncio.run(run_sync(
+        make_client, tmp_path, 'sync_changes', dt.date(2026, 10, 1), dt.date(2026, 10, 1)
+    ))
+
+    assert load_checkpoint(tmp_path)['last_synced'] == '2026-10-01'
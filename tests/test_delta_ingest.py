@@ -0,0 +1,84 @@
+"""
+DeltaIngestor testleri: yeni ve değişen filmlerin artımlı alımı.
+"""
+import numpy as np
+from scipy import sparse
+
+from src.delta_ingest import DeltaIngestor
+from src.feature_engineer import FeatureEngineer
+from src.neighbor_index import NeighborIndex
+from src.preprocessor import Preprocessor
+from src.tmdb_normalizer import movies_frame
+from src.weighted_rating import weighted_rating
+
+WORDS = ['space', 'love', 'war', 'heist', 'robot', 'ocean', 'family', 'secret', 'king', 'storm']
+GENRES = ['Drama', 'Comedy', 'Action', 'Horror', 'Romance']
+PEOPLE = ['Ann Lee', 'Bob Stone', 'Cem Kaya', 'Dia Moss', 'Eli Park', 'Fay Ward']
+
+
+def bundle(movie_id, rng, **overrides):
+    item = {
+        'id': movie_id,
+        'title': f'Movie {movie_id}',
+        'overview': ' '.join(rng.choice(WORDS, 6)),
+        'genres': [{'id': i, 'name': name} for i, name in enumerate(rng.choice(GENRES, 2, replace=False))],
+        'vote_average': float(rng.integers(40, 90)) / 10,
+        'vote_count': int(rng.integers(10, 500)),
+        'runtime': int(rng.integers(80, 150)),
+        'credits': {
+            'cast': [{'id': i, 'name': name, 'order': i} for i, name in enumerate(rng.choice(PEOPLE, 3, replace=False))],
+            'crew': [{'id': 9, 'name': str(rng.choice(PEOPLE)), 'job': 'Director', 'department': 'Directing'}],
+        },
+        'keywords': {'keywords': [{'id': i, 'name': w} for i, w in enumerate(rng.choice(WORDS, 2, replace=False))]},
+    }
+    item.update(overrides)
+    return item
+
+
+def test_ingest_appends_new_and_replaces_changed_movies():
+    rng = np.random.default_rng(0)
+    base_bundles = [bundle(movie_id, rng) for movie_id in range(1, 41)]
+    base = Preprocessor().preprocess_data(movies_frame(base_bundles))
+    base.attrs['catalog_version'] = 'v1'
+    ingestor = DeltaIngestor(base, k=5)
+    ingestor.feature_engineer.rating_cache.scores(ingestor.movies_df)
+    # İndeksin oluşturulduğu özellik matrisleri (fit_transform çıktıları)
+    base_overview = FeatureEngineer().vectorize_overview(ingestor.movies_df)
+    base_content = FeatureEngineer().vectorize_content(ingestor.movies_df)
+
+    changed = dict(base_bundles[4], title='Movie 5 (Director\'s Cut)', vote_count=9999)
+    twin = bundle(41, rng, overview=base_bundles[9]['overview'])
+    new = [twin] + [bundle(movie_id, rng) for movie_id in range(42, 45)]
+    result = ingestor.ingest(movies_frame([changed] + new))
+
+    assert (result.added, result.changed) == (4, 1)
+    assert result.overview_oov_rate == 0.0
+    movies = ingestor.movies_df
+    assert movies['movie_id'].tolist() == list(range(1, 45))
+    assert movies.loc[4, 'title'] == "Movie 5 (Director's Cut)"
+    assert movies.loc[4, 'vote_count'] == 9999
+    # Her alım yeni bir katalog sürümü verir; önbellekler eski kataloğun puanlarını döndürmez
+    assert movies.attrs['catalog_version'] not in (None, 'v1')
+    np.testing.assert_array_equal(
+        ingestor.feature_engineer.rating_cache.scores(movies),
+        weighted_rating(movies['vote_count'].values, movies['vote_average'].values)[0]
+    )
+
+    # Değişen filmin vektörü tam yeniden oluşturmaya kadar eski kalır; yeniler sona eklenir
+    new_rows = movies.iloc[40:]
+    for index, base_matrix, transform in (
+        (ingestor.overview_index, base_overview, ingestor.feature_engineer.transform_overview),
+        (ingestor.metadata_index, base_content, ingestor.feature_engineer.transform_content),
+    ):
+        full = NeighborIndex.build(sparse.vstack([base_matrix, transform(new_rows)]), k=5)
+        np.testing.assert_array_equal(index.indices, full.indices)
+        np.testing.assert_array_equal(index.scores, full.scores)
+
+    rows, scores = ingestor.overview_index.query(40, 1)
+    assert rows[0] == 9 and np.isclose(scores[0], 1.0)
+
+    assert ingestor.drift.added == 4 and ingestor.drift.changed == 1
+    assert ingestor.needs_rebuild
+    ingestor.rebuild()
+    assert not ingestor.needs_rebuild
+    assert len(ingestor.overview_index) == len(ingestor.metadata_index) == 44
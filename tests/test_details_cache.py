@@ -0,0 +1,148 @@
+"""
+MovieDetailsCache testleri: elle ilerletilen saatle taze ve bayat isabetler,
+tek yenileme, süre dolumu ve SQLite'tan yeniden yükleme.
+"""
+import asyncio
+import threading
+import time
+
+from src.details_cache import MovieDetailsCache
+
+TTL = 60.0
+
+
+class FakeClock:
+    """Yalnızca elle ilerletilen duvar saati."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class Fetcher:
+    """Çağrı sayısını tutan, isteğe bağlı olarak serbest bırakılana kadar bekleyen fetch."""
+
+    def __init__(self, title, release=None):
+        self.title = title
+        self.calls = 0
+        self.release = release
+
+    def __call__(self):
+        self.calls += 1
+        if self.release is not None:
+            self.release.wait(5)
+        return {'id': 1, 'title': self.title}
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'koşul zamanında sağlanmadı'
+        time.sleep(0.005)
+
+
+def test_fresh_hit_does_not_fetch():
+    clock = FakeClock()
+    cache = MovieDetailsCache(None, ttl=TTL, clock=clock)
+    first = Fetcher('v1')
+
+    assert cache.get(1, 'en-US', first) == {'id': 1, 'title': 'v1'}
+    clock.now += TTL
+    assert cache.get(1, 'en-US', Fetcher('v2'))['title'] == 'v1'
+
+    assert first.calls == 1
+    stats = cache.stats
+    assert (stats['misses'], stats['memory_hits'], stats['stale_hits'], stats['refreshes']) == (1, 1, 0, 0)
+
+
+def test_stale_hits_trigger_exactly_one_refresh():
+    clock = FakeClock()
+    cache = MovieDetailsCache(None, ttl=TTL, clock=clock)
+    cache.get(1, 'en-US', Fetcher('v1'))
+    clock.now += TTL + 1
+
+    release = threading.Event()
+    refresh = Fetcher('v2', release)
+    # Yenileme sürerken gelen bayat isabetler beklemeden eski kaydı alır ve yeni yenileme açmaz
+    assert [cache.get(1, 'en-US', refresh)['title'] for _ in range(5)] == ['v1'] * 5
+    release.set()
+    wait_for(lambda: cache.stats['refreshes'] == 1)
+
+    assert refresh.calls == 1 and cache.stats['stale_hits'] == 5
+    assert cache.get(1, 'en-US', Fetcher('v3'))['title'] == 'v2'
+
+
+def test_refreshed_entry_expires_again_after_ttl():
+    clock = FakeClock()
+    cache = MovieDetailsCache(None, ttl=TTL, clock=clock)
+    cache.get(1, 'en-US', Fetcher('v1'))
+
+    clock.now += TTL + 1
+    cache.get(1, 'en-US', Fetcher('v2'))
+    wait_for(lambda: cache.stats['refreshes'] == 1)
+
+    # Yenilenen kayıt yenileme anından itibaren TTL boyunca tazedir
+    clock.now += TTL
+    unused = Fetcher('v3')
+    assert cache.get(1, 'en-US', unused)['title'] == 'v2'
+    assert unused.calls == 0
+
+    clock.now += 1
+
+    def fail():
+        raise ConnectionError('TMDB unreachable')
+
+    # Yenileme başarısız olursa eski kayıt sunulmaya devam eder
+    assert cache.get(1, 'en-US', fail)['title'] == 'v2'
+    wait_for(lambda: cache.stats['refresh_errors'] == 1 and not cache._refreshing)
+    assert cache.get(1, 'en-US', Fetcher('v4'))['title'] == 'v2'
+    wait_for(lambda: cache.stats['refreshes'] == 2)
+    assert cache.get(1, 'en-US', Fetcher('v5'))['title'] == 'v4'
+
+
+def test_async_stale_hit_refreshes_once():
+    clock = FakeClock()
+    cache = MovieDetailsCache(None, ttl=TTL, clock=clock)
+    calls = []
+
+    async def fetch():
+        calls.append(clock.now)
+        await asyncio.sleep(0.01)
+        return {'id': 1, 'title': f'v{len(calls)}'}
+
+    async def run():
+        await cache.get_async(1, 'en-US', fetch)
+        clock.now += TTL + 1
+        stale = await asyncio.gather(*(cache.get_async(1, 'en-US', fetch) for _ in range(5)))
+        await asyncio.gather(*cache._refresh_tasks)
+        return stale, await cache.get_async(1, 'en-US', fetch)
+
+    stale, refreshed = asyncio.run(run())
+    assert [payload['title'] for payload in stale] == ['v1'] * 5
+    assert refreshed['title'] == 'v2' and len(calls) == 2
+
+
+def test_entries_reload_from_sqlite_across_instances(tmp_path):
+    path = tmp_path / 'details.sqlite'
+    clock = FakeClock()
+    writer = MovieDetailsCache(path, ttl=TTL, clock=clock)
+    writer.get(1, 'en-US', Fetcher('v1'))
+    writer.put(2, 'tr-TR', {'id': 2, 'title': 'iki'})
+
+    clock.now += TTL - 1
+    reader = MovieDetailsCache(path, ttl=TTL, clock=clock)
+    unused = Fetcher('v2')
+    assert reader.get(1, 'en-US', unused)['title'] == 'v1'
+    assert reader.get(2, 'tr-TR', unused)['title'] == 'iki'
+    assert unused.calls == 0
+    assert (reader.stats['disk_hits'], reader.stats['memory_entries']) == (2, 2)
+
+    # Çekilme zamanı da diskten okunur: ikinci örnekte de kayıt TTL sonunda bayatlar
+    clock.now += 2
+    refresh = Fetcher('v2')
+    assert reader.get(1, 'en-US', refresh)['title'] == 'v1'
+    wait_for(lambda: reader.stats['refreshes'] == 1)
+    assert refresh.calls == 1
+    assert MovieDetailsCache(path, ttl=TTL, clock=clock).get(1, 'en-US', Fetcher('v3'))['title'] == 'v2'
@@ -0,0 +1,85 @@
+"""
+FilterIndex testleri: tür filtresi ilk 3 türle sınırlı kalmaz, hatalı filtre
+değerleri sessizce boş sonuç vermez ve indeks katalog sürümü başına bir kez
+oluşturulur.
+"""
+import logging
+
+import numpy as np
+import pytest
+
+from src import recommender as recommender_module
+from src.details_cache import MovieDetailsCache
+from src.filter_index import FilterIndex, MovieFilter
+from src.preprocessor import Preprocessor
+from src.recommender import Recommender
+from src.tmdb_normalizer import movies_frame
+from src.translation_memo import TranslationMemo
+
+GENRES = ['Drama', 'Comedy', 'Action', 'Thriller', 'Horror']
+
+
+def movie(movie_id, genres):
+    return {
+        'id': movie_id,
+        'title': f'Movie {movie_id}',
+        'genres': [{'id': i, 'name': name} for i, name in enumerate(genres)],
+        'release_date': '2020-01-01',
+        'original_language': 'en',
+        'runtime': 100,
+        'credits': {'cast': [], 'crew': []},
+        'keywords': {'keywords': []},
+    }
+
+
+def test_genre_filter_matches_genres_beyond_the_top_three():
+    df = Preprocessor().preprocess_data(movies_frame([
+        movie(1, GENRES),
+        movie(2, GENRES[:3]),
+        movie(3, ['Horror']),
+    ]))
+
+    index = FilterIndex.build(df)
+    mask = index.mask(MovieFilter(genres=('Horror',)))
+
+    assert df['genres'].iloc[0] == ['drama', 'comedy', 'action']
+    np.testing.assert_array_equal(mask, [True, False, True])
+
+
+def test_unknown_runtime_band_raises_and_unseen_values_are_logged(caplog):
+    df = Preprocessor().preprocess_data(movies_frame([movie(1, GENRES[:2]), movie(2, ['Horror'])]))
+    index = FilterIndex.build(df)
+
+    with pytest.raises(ValueError, match='very-long'):
+        index.mask(MovieFilter(runtime_bands=('very-long',)))
+
+    with caplog.at_level(logging.WARNING, logger='src.filter_index'):
+        mask = index.mask(MovieFilter(genres=('Horror', 'Sci Fi'), languages=('xx',)))
+    assert not mask.any()
+    assert "'genres' filtresindeki ['scifi']" in caplog.text
+    assert "'languages' filtresindeki ['xx']" in caplog.text
+
+
+def test_recommender_builds_filter_index_once_per_catalog_version(make_client, monkeypatch):
+    df = Preprocessor().preprocess_data(movies_frame([movie(i, GENRES[i % 5:i % 5 + 2]) for i in range(1, 9)]))
+    neighbors = np.random.default_rng(0).random((len(df), len(df)))
+    recommender = Recommender(
+        details_cache=MovieDetailsCache(None), translation_memo=TranslationMemo(None), tmdb_client=make_client()
+    )
+    monkeypatch.setattr(recommender, '_build_recommendations', lambda movies: [m['title'] for m in movies])
+
+    builds = []
+    build = FilterIndex.build
+    monkeypatch.setattr(recommender_module.FilterIndex, 'build', lambda frame: builds.append(1) or build(frame))
+
+    drama = MovieFilter(genres=('Drama',))
+    df.attrs['catalog_version'] = 'v1'
+    first = recommender.get_content_based_recommendations('Movie 1', df, neighbors, 3, drama)
+    second = recommender.get_content_based_recommendations('Movie 2', df, neighbors, 3, MovieFilter(genres=('Comedy',)))
+    assert len(builds) == 1
+    assert first and all('drama' in df.loc[df['title'] == title, 'genres_all'].iloc[0] for title in first)
+    assert second
+
+    df.attrs['catalog_version'] = 'v2'
+    recommender.get_content_based_recommendations('Movie 1', df, neighbors, 3, drama)
+    assert len(builds) == 2
@@ -0,0 +1,126 @@
+"""
+JsonColumnParser testleri: uzun tablolar eski ast.literal_eval ayrıştırıcısının
+çıktısıyla karşılaştırılır.
+"""
+import ast
+import json
+
+import numpy as np
+import pandas as pd
+
+from src.json_parser import LONG_TABLE_COLUMNS, JsonColumnParser
+
+PEOPLE = ['Ann Lee', 'Bob Stone', 'Cem Kaya', 'Dia Moss', 'Eli Park', 'Fay Ward', 'Gül Su "G" Ak']
+JOBS = ['Director', 'Producer', 'Writer', 'Editor']
+GENRES = ['Drama', 'Comedy', 'Action', 'Science Fiction', 'Romance']
+
+
+def catalog(n_movies=40, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for movie_id in range(1, n_movies + 1):
+        cast = [
+            {'cast_id': i, 'character': f'Role {i}', 'credit_id': f'c{i}', 'gender': 1, 'id': i, 'name': name, 'order': i}
+            for i, name in enumerate(rng.choice(PEOPLE, rng.integers(0, 6), replace=False))
+        ]
+        crew = [
+            {'credit_id': f'k{i}', 'department': 'Crew', 'id': i, 'job': str(rng.choice(JOBS)), 'name': str(rng.choice(PEOPLE))}
+            for i in range(rng.integers(0, 5))
+        ]
+        genres = [{'id': i, 'name': name} for i, name in enumerate(rng.choice(GENRES, rng.integers(0, 4), replace=False))]
+        rows.append({
+            'movie_id': movie_id,
+            'cast': json.dumps(cast),
+            'crew': json.dumps(crew),
+            'genres': json.dumps(genres),
+        })
+    return pd.DataFrame(rows)
+
+
+def old_parse(cells):
+    """Eski ayrıştırıcı: her hücre ast.literal_eval ile tam sözlük listesine çözülür."""
+    return [ast.literal_eval(cell) for cell in cells]
+
+
+def old_director(items):
+    for item in items:
+        if item['job'] == 'Director':
+            return item['name']
+    return np.nan
+
+
+def old_top_names(items, n, clean):
+    names = [item['name'] for item in items][:n]
+    return [str.lower(name.replace(' ', '')) for name in names] if clean else names
+
+
+def test_parse_column_matches_old_parser():
+    movies_df = catalog()
+    parser = JsonColumnParser(crew_jobs=None)
+    for column in ['cast', 'crew', 'genres']:
+        table = parser.parse_column(movies_df['movie_id'], movies_df[column], column)
+        assert table.columns.tolist() == LONG_TABLE_COLUMNS
+
+        expected = [
+            (movie_id, row, item['job'] if column == 'crew' else column, item['name'], order)
+            for row, (movie_id, items) in enumerate(zip(movies_df['movie_id'], old_parse(movies_df[column])))
+            for order, item in enumerate(items)
+        ]
+        assert list(table.itertuples(index=False, name=None)) == expected
+
+
+def test_crew_jobs_keep_original_order():
+    movies_df = catalog()
+    table = JsonColumnParser().parse_column(movies_df['movie_id'], movies_df['crew'], 'crew')
+
+    expected = [
+        (row, item['name'], order)
+        for row, items in enumerate(old_parse(movies_df['crew']))
+        for order, item in enumerate(items) if item['job'] == 'Director'
+    ]
+    assert set(table['role']) <= {'Director'}
+    assert list(zip(table['row'], table['name'], table['order'])) == expected
+
+
+def test_top_names_and_first_name_match_old_parser():
+    movies_df = catalog()
+    # Yinelenen film kimlikleri ve sıralı olmayan indeks satır konumuyla hizalanır
+    movies_df['movie_id'] = movies_df['movie_id'] % 7
+    movies_df.index = np.arange(len(movies_df))[::-1] * 3
+    tables = JsonColumnParser().parse(movies_df, ['cast', 'crew', 'genres'])
+
+    for clean in (False, True):
+        for n in (1, 3, None):
+            found = JsonColumnParser.top_names(tables['cast'], movies_df.index, n=n, clean=clean)
+            assert found.index.equals(movies_df.index)
+            assert found.tolist() == [old_top_names(items, n, clean) for items in old_parse(movies_df['cast'])]
+
+    director = JsonColumnParser.first_name(tables['crew'], movies_df.index, 'Director')
+    expected = pd.Series([old_director(items) for items in old_parse(movies_df['crew'])], index=movies_df.index)
+    pd.testing.assert_series_equal(director, expected, check_dtype=False)
+    cleaned = JsonColumnParser.first_name(tables['crew'], movies_df.index, 'Director', clean=True)
+    assert cleaned.dropna().tolist() == [name.replace(' ', '').lower() for name in expected.dropna()]
+
+
+def test_literal_eval_fallback_matches_json_path():
+    movies_df = catalog(n_movies=10, seed=3)
+    # Python literal biçimindeki hücreler (tek tırnak) geçerli JSON değildir
+    literal = movies_df.copy()
+    literal['cast'] = [repr(items) for items in old_parse(movies_df['cast'])]
+    literal.loc[[2, 5], 'cast'] = [np.nan, '  ']
+    movies_df.loc[[2, 5], 'cast'] = '[]'
+    parser = JsonColumnParser()
+
+    assert parser.decode(literal['cast']) == [ast.literal_eval(cell) for cell in movies_df['cast']]
+    pd.testing.assert_frame_equal(
+        parser.parse_column(literal['movie_id'], literal['cast'], 'cast'),
+        parser.parse_column(movies_df['movie_id'], movies_df['cast'], 'cast'),
+    )
+
+
+def test_missing_fields_become_none():
+    crew = pd.Series(['[{"name": "Ann Lee", "job": "Director"}, {"job": "Director"}, {"name": "Bob Stone"}]'])
+    table = JsonColumnParser(crew_jobs=None).parse_column(pd.Series([7]), crew, 'crew')
+    assert list(zip(table['name'], table['role'], table['order'])) == [
+        ('Ann Lee', 'Director', 0), (None, 'Director', 1), ('Bob Stone', np.nan, 2),
+    ]
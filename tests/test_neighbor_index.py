@@ -0,0 +1,53 @@
+"""
+NeighborIndex testleri: eşitliklerin indekse göre çözülmesi ve artımlı eklemenin tam oluşturmayla aynı olması.
+"""
+import numpy as np
+import pytest
+from scipy import sparse
+
+from src.neighbor_index import NeighborIndex, top_k
+from src.similarity_builder import BlockwiseSimilarityBuilder
+
+
+def count_features(n_rows, n_terms=12, seed=0):
+    """Küçük sözlüklü sayım vektörleri: çok sayıda eşit skor, tekrar eden ve boş satırlar."""
+    rng = np.random.default_rng(seed)
+    dense = rng.binomial(1, 0.15, (n_rows, n_terms)) * rng.integers(1, 3, (n_rows, n_terms))
+    dense[::7] = dense[0]
+    dense[::11] = 0
+    return sparse.csr_matrix(dense.astype(np.float64))
+
+
+def test_top_k_breaks_boundary_ties_by_index():
+    scores = np.array([
+        [0.5, 0.1, 0.5, 0.9, 0.5, 0.5],
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [0.2, 0.3, 0.1, 0.4, 0.3, 0.3],
+    ])
+
+    indices, values = top_k(scores, 3)
+
+    np.testing.assert_array_equal(indices, [[3, 0, 2], [0, 1, 2], [3, 1, 4]])
+    np.testing.assert_array_equal(values, [[0.9, 0.5, 0.5], [0.0, 0.0, 0.0], [0.4, 0.3, 0.3]])
+
+    rng = np.random.default_rng(0)
+    wide = rng.choice([0.0, 0.5, 1.0], (20, 1000), p=[0.9, 0.08, 0.02]).astype(np.float32)
+    indices, _ = top_k(wide, 50)
+    expected = np.lexsort((np.tile(np.arange(1000), (20, 1)), -wide), axis=1)[:, :50]
+    np.testing.assert_array_equal(indices, expected)
+
+
+@pytest.mark.parametrize('block_size', [None, 3])
+def test_add_rows_matches_full_build(block_size):
+    builder = BlockwiseSimilarityBuilder(n_jobs=1, block_size=block_size)
+    features = count_features(120)
+    index = NeighborIndex.build(features[:80], k=10, builder=builder)
+
+    patched = index.add_rows(features[80:100], builder)
+    patched_again = index.add_rows(features[100:], builder)
+
+    full = NeighborIndex.build(features, k=10, builder=builder)
+    assert len(patched) and len(patched_again)
+    np.testing.assert_array_equal(index.indices, full.indices)
+    np.testing.assert_array_equal(index.scores, full.scores)
+    assert (index.features != full.features).nnz == 0
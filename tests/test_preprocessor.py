@@ -0,0 +1,56 @@
+"""
+Preprocessor testleri: süreç havuzunda bölümlenmiş ön işleme seri yolla aynı
+veri setini üretir.
+"""
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.preprocessor import Preprocessor
+from src.tmdb_normalizer import movies_frame
+
+GENRES = ['Drama', 'Comedy', 'Action', 'Science Fiction', 'Romance']
+PEOPLE = ['Ann Lee', 'Bob Stone', 'Cem Kaya', 'Dia Moss', 'Eli Park', 'Fay Ward']
+JOBS = ['Director', 'Producer', 'Writer']
+
+
+def bundle(movie_id, rng):
+    return {
+        'id': movie_id,
+        'title': f'Movie {movie_id}',
+        'overview': None if movie_id % 7 == 0 else f'story {movie_id}',
+        'genres': [{'id': i, 'name': name} for i, name in enumerate(rng.choice(GENRES, rng.integers(0, 5), replace=False))],
+        'release_date': f'{rng.integers(1950, 2024)}-01-01',
+        'vote_average': float(rng.integers(10, 90)) / 10,
+        'vote_count': int(rng.integers(0, 500)),
+        'runtime': None if movie_id % 11 == 0 else int(rng.integers(80, 180)),
+        'credits': {
+            'cast': [{'id': i, 'name': name, 'order': i} for i, name in enumerate(rng.choice(PEOPLE, rng.integers(0, 6), replace=False))],
+            'crew': [{'id': i, 'name': str(rng.choice(PEOPLE)), 'job': str(rng.choice(JOBS))} for i in range(rng.integers(0, 4))],
+        },
+        'keywords': {'keywords': [{'id': i, 'name': f'keyword {k}'} for i, k in enumerate(rng.integers(0, 20, rng.integers(0, 5)))]},
+    }
+
+
+def test_parallel_preprocessing_matches_serial(caplog):
+    rng = np.random.default_rng(0)
+    raw = movies_frame(bundle(movie_id, rng) for movie_id in range(1, 101))
+
+    serial = Preprocessor(n_jobs=1).preprocess_data(raw.copy())
+    with caplog.at_level(logging.INFO, logger='src.preprocessor'):
+        parallel = Preprocessor(n_jobs=3, parallel_min_rows=10).preprocess_data(raw.copy())
+
+    assert 'paralel olarak ön işlendi' in caplog.text
+    assert serial['director'].isna().any() and (serial['genres'].map(len) == 0).any()
+    pd.testing.assert_frame_equal(parallel, serial)
+
+
+def test_small_catalog_stays_serial(caplog):
+    rng = np.random.default_rng(1)
+    raw = movies_frame(bundle(movie_id, rng) for movie_id in range(1, 6))
+
+    with caplog.at_level(logging.INFO, logger='src.preprocessor'):
+        Preprocessor(n_jobs=3, parallel_min_rows=10).preprocess_data(raw)
+
+    assert 'paralel' not in caplog.text
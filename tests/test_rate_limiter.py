@@ -0,0 +1,122 @@
+"""
+Hız sınırlayıcı testleri: jeton kovasının dolması, Retry-After engeli ve
+SingleFlight'ın eş zamanlı aynı çağrıları birleştirmesi.
+"""
+import asyncio
+import threading
+
+import pytest
+
+from src.rate_limiter import SingleFlight, TokenBucket
+
+
+class CountingEvent(threading.Event):
+    """Kaç iş parçacığının beklemeye girdiğini sayan olay."""
+
+    def __init__(self):
+        super().__init__()
+        self.waiters = threading.Semaphore(0)
+
+    def wait(self, timeout=None):
+        self.waiters.release()
+        return super().wait(timeout)
+
+
+class FakeClock:
+    """Yalnızca elle ilerletilen monoton saat."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_bucket_refills_at_rate_up_to_capacity():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=4, clock=clock)
+
+    assert all(bucket.acquire(timeout=0) for _ in range(4))
+    assert not bucket.acquire(timeout=0)
+    assert bucket.wait_time() == pytest.approx(0.5)
+
+    clock.now += 1.0
+    assert bucket.acquire(timeout=0) and bucket.acquire(timeout=0)
+    assert not bucket.acquire(timeout=0)
+
+    # Uzun bekleme kovayı kapasitenin üzerine taşırmaz
+    clock.now += 60
+    assert all(bucket.acquire(timeout=0) for _ in range(4))
+    assert bucket.wait_time() == pytest.approx(0.5)
+
+
+def test_retry_after_blocks_bucket_without_refilling():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=4, clock=clock)
+
+    bucket.update_from_headers({'Retry-After': '3'}, status_code=429)
+    assert bucket.wait_time() == pytest.approx(3.5)
+    assert not bucket.acquire(timeout=3)
+
+    clock.now += 3
+    assert bucket.wait_time() == pytest.approx(0.5)
+    clock.now += 0.5
+    assert bucket.acquire(timeout=0)
+    assert not bucket.acquire(timeout=0)
+
+
+def test_single_flight_runs_concurrent_calls_once():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {'id': 1}
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do('movie/1', fetch)))
+    leader.start()
+    started.wait(5)
+    # Takipçilerin hepsi uçuştaki çağrıyı beklemeye girene kadar iş bitirilmez
+    done = flight._calls['movie/1'].done = CountingEvent()
+    followers = [threading.Thread(target=lambda: results.append(flight.do('movie/1', fetch))) for _ in range(7)]
+    for thread in followers:
+        thread.start()
+    assert all(done.waiters.acquire(timeout=5) for _ in followers)
+    # Farklı anahtar birleştirilmez
+    assert flight.do('movie/2', lambda: 'other') == 'other'
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert len(calls) == 1 and len(results) == 8
+    assert all(result is results[0] for result in results)
+    # İş bittiğinde anahtar serbest kalır; sonuç saklanmaz
+    assert flight.do('movie/1', lambda: 'fresh') == 'fresh'
+
+
+def test_single_flight_releases_key_after_error_and_joins_async_calls():
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError('boom')
+
+    with pytest.raises(ValueError):
+        flight.do('movie/1', fail)
+    assert flight.do('movie/1', lambda: 'retried') == 'retried'
+
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {'id': 1}
+
+    async def fetch_all():
+        return await asyncio.gather(*(flight.do_async('movie/1', fetch) for _ in range(5)))
+
+    results = asyncio.run(fetch_all())
+    assert len(calls) == 1 and all(result is results[0] for result in results)
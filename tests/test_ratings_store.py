@@ -0,0 +1,67 @@
+"""
+RatingsMatrix testleri: ek puanların ana matrisi yeniden kurmadan tam yeniden oluşturmayla aynı sonucu vermesi.
+"""
+import numpy as np
+
+from src import ratings_store
+from src.als import AlternatingLeastSquares
+from src.ratings_store import RatingsMatrix
+
+
+def random_batch(rng, n_ratings, n_users=50, n_items=30):
+    # Aynı çift birden çok kez gelebilir; yeni kullanıcı ve filmler de üretilir
+    return rng.integers(1, n_users, n_ratings), rng.integers(1, n_items, n_ratings), rng.integers(1, 6, n_ratings)
+
+
+def test_appended_ratings_match_full_rebuild():
+    rng = np.random.default_rng(0)
+    batches = [random_batch(rng, 300, n_users=40, n_items=25)] + [random_batch(rng, 20) for _ in range(5)]
+    matrix = RatingsMatrix.from_arrays(*batches[0])
+    base = matrix.base_csr
+    for batch in batches[1:]:
+        matrix, update = matrix.with_ratings(*batch)
+
+    # Ana matris paylaşılır, yalnızca ek liste büyür
+    assert matrix.base_csr is base and len(matrix.delta.rows) == 100
+    expected = RatingsMatrix.from_arrays(*map(np.concatenate, zip(*batches)))
+    # Tam yeniden oluşturma ID sırasındadır; satır ve sütunlar ek puanlı matrisin kodlarına dizilir
+    dense = expected.csr.toarray()[np.argsort(matrix.user_rows(expected.user_ids))]
+    dense = dense[:, np.argsort(matrix.item_cols(expected.item_ids))]
+
+    users = np.array([0, 3, matrix.n_users - 1, 3])
+    np.testing.assert_array_equal(matrix.user_matrix(users).toarray(), dense[users])
+    items = np.array([matrix.n_items - 1, 2])
+    np.testing.assert_array_equal(matrix.item_matrix(items).toarray(), dense[:, items].T)
+    np.testing.assert_array_equal(matrix.csr.toarray(), dense)
+    user, item = batches[-1][0][-1], batches[-1][1][-1]
+    assert dict(zip(*matrix.user_items(user)))[item] == batches[-1][2][-1]
+    compacted = matrix.compact()
+    assert len(compacted.delta.rows) == 0 and (compacted.csr != matrix.csr).nnz == 0
+
+
+def test_delta_is_compacted_past_the_size_limit(monkeypatch):
+    monkeypatch.setattr(ratings_store, 'RATINGS_DELTA_MIN_ROWS', 10)
+    rng = np.random.default_rng(1)
+    matrix = RatingsMatrix.from_arrays(*random_batch(rng, 200))
+    matrix, _ = matrix.with_ratings(*random_batch(rng, 10))
+    assert len(matrix.delta.rows) == 10
+    # Ana matris en fazla 200 puan içerir: 25 ek puan %10 sınırını aşar
+    matrix, _ = matrix.with_ratings(*random_batch(rng, 15))
+    assert len(matrix.delta.rows) == 0 and matrix.base_csr.shape == (matrix.n_users, matrix.n_items)
+
+
+def test_partial_fit_reads_only_appended_rows_and_matches_compacted_matrix():
+    rng = np.random.default_rng(2)
+    ratings = RatingsMatrix.from_arrays(*random_batch(rng, 400))
+    model = AlternatingLeastSquares(n_factors=6, n_iterations=2, random_state=0).fit(ratings)
+    updated, update = ratings.with_ratings([1, 7, 999], [2, 5, 3], [5.0, 1.0, 4.0])
+
+    folded = AlternatingLeastSquares.from_scorer(model.to_scorer(ratings)).partial_fit(
+        updated, users=update.users, items=update.items
+    )
+    assert updated._merged is None
+    reference = AlternatingLeastSquares.from_scorer(model.to_scorer(ratings)).partial_fit(
+        updated.compact(), users=update.users, items=update.items
+    )
+    np.testing.assert_allclose(folded.user_factors, reference.user_factors)
+    np.testing.assert_allclose(folded.item_factors, reference.item_factors)
@@ -0,0 +1,112 @@
+"""
+RecommendationTable testleri: yazma/okuma gidiş-dönüşü ve precompute komut satırı.
+"""
+import sys
+
+import numpy as np
+import pandas as pd
+
+from src import precompute
+from src.data_loader import DataLoader
+from src.feature_engineer import FeatureEngineer
+from src.recommendation_table import RecommendationTable
+from src.tmdb_normalizer import MOVIE_COLUMNS, movies_frame
+
+WORDS = ['space', 'love', 'war', 'heist', 'robot', 'ocean', 'family', 'secret', 'king', 'storm']
+GENRES = ['Drama', 'Comedy', 'Action', 'Horror', 'Romance']
+PEOPLE = ['Ann Lee', 'Bob Stone', 'Cem Kaya', 'Dia Moss', 'Eli Park', 'Fay Ward']
+
+
+def bundle(movie_id, rng):
+    return {
+        'id': movie_id,
+        'title': f'Movie {movie_id}',
+        'overview': ' '.join(rng.choice(WORDS, 6)),
+        'genres': [{'id': i, 'name': name} for i, name in enumerate(rng.choice(GENRES, 2, replace=False))],
+        'vote_average': float(rng.integers(40, 90)) / 10,
+        'vote_count': int(rng.integers(10, 500)),
+        'runtime': int(rng.integers(80, 150)),
+        'credits': {
+            'cast': [{'id': i, 'name': name, 'order': i} for i, name in enumerate(rng.choice(PEOPLE, 3, replace=False))],
+            'crew': [{'id': 9, 'name': str(rng.choice(PEOPLE)), 'job': 'Director', 'department': 'Directing'}],
+        },
+        'keywords': {'keywords': [{'id': i, 'name': w} for i, w in enumerate(rng.choice(WORDS, 2, replace=False))]},
+    }
+
+
+def write_source_csvs(data_dir, n_movies=30, seed=0):
+    """Sentetik kataloğu DataLoader'ın okuduğu iki CSV dosyasına böler."""
+    rng = np.random.default_rng(seed)
+    merged = movies_frame(bundle(movie_id, rng) for movie_id in range(1, n_movies + 1))
+    movies = merged.rename(columns={'movie_id': 'id', 'title': 'title_y', 'title_x': 'title'})
+    data_dir.mkdir(parents=True, exist_ok=True)
+    movies[MOVIE_COLUMNS].to_csv(data_dir / 'tmdb_5000_movies.csv', index=False)
+    merged[['movie_id', 'title', 'cast', 'crew']].to_csv(data_dir / 'tmdb_5000_credits.csv', index=False)
+
+
+def catalog(titles, version):
+    movies_df = pd.DataFrame({
+        'movie_id': np.arange(10, 10 + len(titles)),
+        'title': titles,
+        'vote_average': np.linspace(5, 8, len(titles)),
+        'vote_count': np.arange(len(titles)) * 10,
+    })
+    movies_df.attrs['catalog_version'] = version
+    return movies_df
+
+
+def random_neighbors(n, k, seed):
+    rng = np.random.default_rng(seed)
+    indices = np.stack([rng.permutation(n)[:k] for _ in range(n)])
+    scores = -np.sort(-rng.random((n, k)), axis=1)
+    return indices, scores
+
+
+def test_write_read_round_trip(tmp_path):
+    path = tmp_path / 'recommendations'
+    movies_df = catalog(['Alien', 'Heat', 'Alien', 'Up', 'Big'], 'v1')
+    neighbors = {mode: random_neighbors(5, 3, seed) for seed, mode in enumerate(['overview', 'hybrid'])}
+    RecommendationTable.write(path, movies_df, neighbors)
+
+    table = RecommendationTable(path)
+    assert (len(table), table.k, table.modes, table.catalog_version) == (5, 3, ['overview', 'hybrid'], 'v1')
+    for mode, (indices, scores) in neighbors.items():
+        rows, found = table.query(13, mode, n=3)
+        np.testing.assert_array_equal(rows, indices[3])
+        np.testing.assert_allclose(found, scores[3].astype(np.float32))
+    # Yinelenen başlıkta ilk satır kullanılır
+    assert table.row('Alien') == 0 and table.row(12) == 2
+    assert table.records([1, 4]) == [
+        {'movie_id': 11, 'title': 'Heat', 'vote_average': 5.75, 'vote_count': 10},
+        {'movie_id': 14, 'title': 'Big', 'vote_average': 8.0, 'vote_count': 40},
+    ]
+
+    # Yeniden yazım açık okuyucuyu bozmaz; yeni açılış yeni sürümü görür
+    RecommendationTable.write(path, catalog(['Jaws', 'Rocky'], 'v2'), {'metadata': random_neighbors(2, 1, 9)})
+    assert table.query('Heat', 'overview', n=3)[0].tolist() == neighbors['overview'][0][1].tolist()
+    reopened = RecommendationTable(path)
+    assert (len(reopened), reopened.modes, reopened.catalog_version) == (2, ['metadata'], 'v2')
+
+
+def test_precompute_cli_writes_fresh_table(tmp_path, monkeypatch):
+    data_dir = tmp_path / 'data'
+    write_source_csvs(data_dir)
+    monkeypatch.setattr(sys, 'argv', ['precompute', '--data-dir', str(data_dir), '--k', '4', '--candidates', '8'])
+
+    precompute.main()
+
+    data_loader = DataLoader(data_dir)
+    table = data_loader.load_recommendation_table()
+    assert table is not None and table.catalog_version == data_loader.catalog_version
+    movies_df = data_loader.load_preprocessed_data()
+    assert (len(table), table.k, table.modes) == (30, 4, ['overview', 'metadata', 'hybrid'])
+    assert table.titles.tolist() == movies_df['title'].tolist()
+
+    rows = np.arange(len(movies_df))
+    expected = FeatureEngineer().build_tfidf_index(movies_df, k=4).query_batch(rows, 4)
+    for row in rows:
+        found_rows, found_scores = table.query(int(movies_df['movie_id'].iloc[row]), 'overview', n=4)
+        np.testing.assert_array_equal(found_rows, expected[0][row])
+        np.testing.assert_allclose(found_scores, expected[1][row], rtol=1e-6)
+    hybrid_rows, _ = table.query('Movie 1', 'hybrid', n=4)
+    assert 0 not in hybrid_rows.tolist() and len(set(hybrid_rows.tolist())) == 4
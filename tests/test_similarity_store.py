@@ -0,0 +1,86 @@
+"""
+SimilarityStore testleri: int8 nicemlemenin sıralamayı koruması ve atomik yazım.
+"""
+import threading
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from src.similarity_store import SimilarityStore
+
+
+def tfidf_matrix(n_docs=300, n_words=30, vocabulary=800, seed=0):
+    rng = np.random.default_rng(seed)
+    # Zipf dağılımlı kelimeler gerçek özetlerdeki gibi seyrek, çarpık TF-IDF vektörleri üretir
+    words = np.minimum(rng.zipf(1.3, size=(n_docs, n_words)), vocabulary)
+    docs = [' '.join(f'w{w}' for w in row) for row in words]
+    return TfidfVectorizer().fit_transform(docs)
+
+
+def top_n_without_self(rows, n):
+    rows = np.array(rows, dtype=np.float32)
+    np.fill_diagonal(rows, -np.inf)
+    return np.argsort(-rows, axis=1, kind='stable')[:, :n]
+
+
+def test_int8_store_preserves_top_k_ranking(tmp_path):
+    matrix = tfidf_matrix()
+    exact = SimilarityStore.write(matrix, tmp_path / 'float32')
+    quantized = SimilarityStore.write(matrix, tmp_path / 'int8', dtype='int8')
+
+    # Ölçek köşegenden değil filmin kendisi dışındaki benzerliklerden gelir
+    assert len(np.unique(quantized.scales)) > len(quantized) // 2
+    assert (np.diagonal(quantized.matrix) == 127).all()
+
+    expected = top_n_without_self(exact[:], 10)
+    found = top_n_without_self(quantized[:], 10)
+    overlap = np.mean([len(set(a) & set(b)) / 10 for a, b in zip(expected, found)])
+    assert overlap >= 0.95
+    off_diagonal = ~np.eye(len(exact), dtype=bool)
+    np.testing.assert_allclose(
+        quantized[:][off_diagonal], exact[:][off_diagonal], atol=float(quantized.scales.max()) / 2 + 1e-6
+    )
+
+
+def test_rewrite_does_not_disturb_open_readers(tmp_path):
+    path = tmp_path / 'store'
+    first = SimilarityStore.write(tfidf_matrix(seed=1), path, dtype='int8')
+    before = np.array(first.matrix), np.array(first.scales)
+
+    second = SimilarityStore.write(tfidf_matrix(n_docs=200, seed=2), path, dtype='float32')
+
+    # Eski depoyu açan okuyucu kendi matrisini ve ölçeklerini görmeye devam eder
+    np.testing.assert_array_equal(first.matrix, before[0])
+    np.testing.assert_array_equal(first.scales, before[1])
+    assert second.dtype == 'float32' and len(second) == 200
+    reopened = SimilarityStore(path)
+    assert reopened.dtype == 'float32' and reopened.scales is None and len(reopened) == 200
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['store']
+
+
+def test_readers_never_see_missing_store_during_rewrites(tmp_path):
+    path = tmp_path / 'store'
+    matrices = [tfidf_matrix(n_docs=60, seed=seed) for seed in range(2)]
+    SimilarityStore.write(matrices[0], path)
+    errors, done = [], threading.Event()
+
+    def reader():
+        while not done.is_set():
+            try:
+                store = SimilarityStore(path)
+                assert store.meta['shape'] == [60, 60]
+            except Exception as e:  # noqa: BLE001 - testte her hata kaydedilir
+                errors.append(e)
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    try:
+        for i in range(20):
+            SimilarityStore.write(matrices[i % 2], path, dtype=('float32', 'int8')[i % 2])
+    finally:
+        done.set()
+        thread.join()
+
+    assert errors == []
+    # Yayımlanan sürüm ve okuyucular için tutulan bir önceki sürüm kalır
+    assert len([p for p in path.iterdir() if p.name.startswith('v')]) == 2
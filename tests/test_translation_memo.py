@@ -0,0 +1,85 @@
+"""
+Çeviri belleği testleri: tek tek çeviri, hatanın yalnızca kendi metnini
+etkilemesi ve metin olmayan özetlerin atlanması.
+"""
+import math
+from types import SimpleNamespace
+
+from aiohttp import web
+
+from src.details_cache import MovieDetailsCache
+from src.recommender import Recommender
+from src.translation_memo import TranslationMemo, pretranslate, translate_many
+
+
+class FakeTranslator:
+    """Metni büyük harfe çeviren, istenen metinlerde hata veren çevirmen."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = []
+
+    def translate(self, text, dest):
+        self.calls.append(text)
+        if text in self.failing:
+            raise ValueError('backend error')
+        return SimpleNamespace(text=text.upper())
+
+
+def test_failure_only_affects_its_own_text():
+    memo = TranslationMemo(None)
+    translator = FakeTranslator(failing={'b'})
+
+    assert translate_many(translator, ['a', 'b', 'c', 'a'], 'tr', memo) == ['A', 'b', 'C', 'A']
+    assert memo.get_many(['a', 'b', 'c'], 'tr') == ['A', None, 'C']
+
+    translator.failing.clear()
+    assert translate_many(translator, ['a', 'b', 'c'], 'tr', memo) == ['A', 'B', 'C']
+    # Saklanan çeviriler tekrar istenmez, yalnızca hata veren metin yeniden çevrilir
+    assert translator.calls == ['a', 'b', 'c', 'b']
+
+
+def test_pretranslate_stores_successful_texts(tmp_path):
+    memo = TranslationMemo(tmp_path / 'translations.sqlite')
+    texts = [f'text {i}' for i in range(7)] + ['', None, 'text 0']
+
+    added = pretranslate(FakeTranslator(failing={'text 3'}), texts, 'tr', memo, batch_size=3)
+
+    assert added == 6
+    assert memo.stats['disk_entries'] == 6
+    assert memo.get('text 3', 'tr') is None
+    assert TranslationMemo(tmp_path / 'translations.sqlite').get('text 6', 'tr') == 'TEXT 6'
+
+
+def test_translate_many_skips_non_text_entries():
+    memo = TranslationMemo(None)
+    translator = FakeTranslator()
+
+    result = translate_many(translator, ['a', None, math.nan, '', 'a'], 'tr', memo)
+
+    assert result[:2] == ['A', None] and math.isnan(result[2]) and result[3:] == ['', 'A']
+    assert translator.calls == ['a']
+
+
+def test_fetch_details_with_null_overview(stub_server, make_client):
+    overviews = {1: 'a quiet film', 2: None, 3: 42}
+
+    def route(movie_id):
+        async def handler(request):
+            return web.json_response({'id': movie_id, 'poster_path': None, 'overview': overviews[movie_id]})
+        stub_server.route(f'/movie/{movie_id}', handler)
+
+    for movie_id in overviews:
+        route(movie_id)
+    recommender = Recommender(
+        details_cache=MovieDetailsCache(None), translation_memo=TranslationMemo(None), tmdb_client=make_client()
+    )
+    recommender.translator = FakeTranslator()
+
+    try:
+        details = recommender.fetch_movie_details_many([1, 2, 3])
+    finally:
+        recommender._loop.run(recommender.tmdb_client.close())
+
+    assert [overview for _, overview in details] == ['A QUIET FILM', '', '']
+    assert recommender.translator.calls == ['a quiet film']
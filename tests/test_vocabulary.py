@@ -0,0 +1,69 @@
+"""
+ContentEncoder testleri: kodlanmış alanlardan üretilen sayım matrisi 'soup'
+metni üzerindeki CountVectorizer çıktısıyla aynıdır.
+"""
+import numpy as np
+from sklearn.feature_extraction.text import CountVectorizer
+
+from src.feature_engineer import FeatureEngineer
+from src.preprocessor import Preprocessor
+from src.tmdb_normalizer import movies_frame
+from src.vocabulary import ContentEncoder
+
+# Durak kelimeleri, tek harfli belirteçleri, tire ve sayıları içeren öğeler
+KEYWORDS = ['the end', 'sci-fi', 'new york', 'x', '1984', 'time travel', 'love', 'heist', 'a.i.', 'based on novel']
+GENRES = ['Drama', 'Comedy', 'Action', 'Science Fiction', 'Romance', 'TV Movie']
+PEOPLE = ['Ann Lee', 'Bob Stone', 'Cem Kaya', "Dia O'Moss", 'Eli Park', 'Fay Ward', 'Jean-Luc Ray']
+
+
+def bundle(movie_id, rng):
+    crew = [{'id': 9, 'name': str(rng.choice(PEOPLE)), 'job': 'Director', 'department': 'Directing'}]
+    return {
+        'id': movie_id,
+        'title': f'Movie {movie_id}',
+        'overview': 'a film',
+        'genres': [{'id': i, 'name': name} for i, name in enumerate(rng.choice(GENRES, rng.integers(0, 4), replace=False))],
+        'runtime': 100,
+        'credits': {
+            'cast': [{'id': i, 'name': name, 'order': i} for i, name in enumerate(rng.choice(PEOPLE, rng.integers(0, 5), replace=False))],
+            # Bazı filmlerin yönetmeni yoktur
+            'crew': crew if movie_id % 5 else [],
+        },
+        'keywords': {'keywords': [{'id': i, 'name': w} for i, w in enumerate(rng.choice(KEYWORDS, rng.integers(0, 5), replace=False))]},
+    }
+
+
+def catalog(ids, seed):
+    rng = np.random.default_rng(seed)
+    df = Preprocessor().preprocess_data(movies_frame(bundle(movie_id, rng) for movie_id in ids))
+    return FeatureEngineer().create_soup_feature(df)
+
+
+def test_fit_transform_matches_count_vectorizer_on_soup():
+    df = catalog(range(1, 61), seed=0)
+    assert df['director'].isna().any()
+
+    vectorizer = CountVectorizer(stop_words='english')
+    expected = vectorizer.fit_transform(df['soup'])
+    encoder = ContentEncoder()
+    found = encoder.fit_transform(df)
+
+    assert encoder.term_vocabulary_ == vectorizer.vocabulary_
+    assert found.shape == expected.shape
+    assert (found != expected).nnz == 0
+
+
+def test_transform_matches_count_vectorizer_with_frozen_vocabulary():
+    base = catalog(range(1, 31), seed=1)
+    new = catalog(range(31, 46), seed=2)
+    new.at[new.index[0], 'keywords'] = ['unseen keyword', 'love']
+    new = FeatureEngineer().create_soup_feature(new)
+
+    vectorizer = CountVectorizer(stop_words='english').fit(base['soup'])
+    encoder = ContentEncoder()
+    encoder.fit(base)
+
+    expected = vectorizer.transform(new['soup'])
+    found = encoder.transform(new)
+    assert (found != expected).nnz == 0
+    assert encoder.last_oov_rate_ > 0
@@ -0,0 +1,38 @@
+"""
+WeightedRatingCache testleri: yalnızca sürümlü kataloglar önbelleğe alınır.
+"""
+import numpy as np
+import pandas as pd
+
+from src.weighted_rating import WeightedRatingCache, weighted_rating
+
+
+def catalog(n=50, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({'vote_count': rng.integers(0, 1000, n), 'vote_average': rng.uniform(1, 10, n)})
+
+
+def test_versioned_catalog_is_served_from_cache():
+    cache = WeightedRatingCache()
+    df = catalog()
+    df.attrs['catalog_version'] = 'v1'
+
+    scores = cache.scores(df)
+
+    assert cache.scores(df) is scores
+    np.testing.assert_array_equal(scores, weighted_rating(df['vote_count'].values, df['vote_average'].values)[0])
+    # Yeni sürüm, aynı uzunlukta olsa da yeniden hesaplanır
+    changed = df.assign(vote_average=11 - df['vote_average'])
+    changed.attrs['catalog_version'] = 'v2'
+    assert not np.array_equal(cache.scores(changed), scores)
+
+
+def test_unversioned_catalog_is_not_cached():
+    cache = WeightedRatingCache()
+    df = catalog()
+
+    first = cache.scores(df)
+    df['vote_average'] = 11 - df['vote_average']
+
+    assert not np.array_equal(cache.scores(df), first)
+    assert len(cache._entries) == 0